@@ -15,8 +15,10 @@ Licensed under the Apache License, Version 2.0
 """
 
 import copy
+import hashlib
 import json
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -46,6 +48,15 @@ INLINE_DISABLE_FILE_PATTERN = re.compile(
 )
 
 
+# Parsed inline suppressions keyed by (file path, content hash), shared across
+# runs so unchanged files are never re-parsed
+_INLINE_CACHE: OrderedDict[tuple[str, str], list["Suppression"]] = OrderedDict()
+_INLINE_CACHE_SIZE = 4096
+
+# Tool key matching suppressions for any tool (used when a finding has no tool)
+_ANY_TOOL = "*"
+
+
 # =============================================================================
 # Data Structures
 # =============================================================================
@@ -376,6 +387,21 @@ class BaselineManager:
         # Not suppressed
         return SuppressionMatch(is_suppressed=False)
 
+    def build_index(self, now: datetime | None = None) -> "SuppressionIndex":
+        """Compile the current baseline into a SuppressionIndex for one run.
+
+        The index reflects the baseline at build time; rebuild it after
+        adding or removing suppressions.
+
+        Args:
+            now: Time used to evaluate expiry (defaults to now)
+
+        Returns:
+            SuppressionIndex answering is_suppressed() queries in O(1)
+
+        """
+        return SuppressionIndex(self, now)
+
     def add_suppression(
         self,
         rule_code: str,
@@ -460,6 +486,7 @@ class BaselineManager:
 
         """
         result = []
+        index = self.build_index()
 
         for finding in findings:
             rule_code = finding.get("code", "") or finding.get("rule_code", "")
@@ -467,7 +494,7 @@ class BaselineManager:
             line_number = finding.get("line_number")
             finding_tool = finding.get("tool", tool)
 
-            match = self.is_suppressed(
+            match = index.match(
                 rule_code=rule_code,
                 file_path=file_path,
                 line_number=line_number,
@@ -621,6 +648,158 @@ class BaselineManager:
         )
 
 
+# =============================================================================
+# SuppressionIndex
+# =============================================================================
+
+
+class SuppressionIndex:
+    """Baseline and inline suppressions compiled for fast lookups.
+
+    Built once per inspection run by ``BaselineManager.build_index()``.
+    Expired suppressions are dropped at build time, baseline entries are
+    hashed by (file, rule, line, tool) and (rule, tool), and each source
+    file is read at most once, with its inline comments parsed only when
+    its content hash is new. Lookups return the same match as
+    ``BaselineManager.is_suppressed``, including which entry wins when
+    several apply.
+
+    Usage:
+        index = manager.build_index()
+        for finding in findings:
+            match = index.match(finding["code"], finding["file_path"], finding["line_number"])
+    """
+
+    def __init__(self, manager: BaselineManager, now: datetime | None = None):
+        """Compile suppressions from a loaded BaselineManager.
+
+        Args:
+            manager: Manager whose baseline and project root are used
+            now: Time used to evaluate expiry (defaults to now)
+
+        """
+        self._manager = manager
+        now = now or datetime.now()
+        suppressions = manager.baseline.get("suppressions", {})
+
+        # Values are (position, suppression, match_type); the lowest position
+        # wins, matching the order of the linear scan in is_suppressed
+        self._files: dict[tuple, tuple[int, Suppression, str]] = {}
+        self._project: dict[tuple, tuple[int, Suppression, str]] = {}
+        self._rules: dict[str, Suppression] = {}
+        self._inline: dict[str, dict[tuple, tuple[int, Suppression]]] = {}
+
+        for file_path, supps in suppressions.get("files", {}).items():
+            for position, supp_dict in enumerate(supps):
+                if manager._is_expired(supp_dict, now):
+                    continue
+                line = supp_dict.get("line_number") or None
+                match_type = "baseline_line" if line else "baseline_file"
+                entry = (position, manager._dict_to_suppression(supp_dict, file_path), match_type)
+                for tool in (supp_dict.get("tool") or None, _ANY_TOOL):
+                    rule = supp_dict.get("rule_code", "").upper()
+                    self._files.setdefault((file_path, rule, line, tool), entry)
+
+        for position, supp_dict in enumerate(suppressions.get("project", [])):
+            if manager._is_expired(supp_dict, now):
+                continue
+            entry = (position, manager._dict_to_suppression(supp_dict), "baseline_project")
+            for tool in (supp_dict.get("tool") or None, _ANY_TOOL):
+                self._project.setdefault((supp_dict.get("rule_code", "").upper(), tool), entry)
+
+        for rule_code, supp_dict in suppressions.get("rules", {}).items():
+            if not manager._is_expired(supp_dict, now):
+                self._rules[rule_code] = manager._dict_to_suppression(
+                    {**supp_dict, "rule_code": rule_code},
+                )
+
+    def match(
+        self,
+        rule_code: str,
+        file_path: str | None = None,
+        line_number: int | None = None,
+        tool: str | None = None,
+    ) -> SuppressionMatch:
+        """Check if a finding should be suppressed.
+
+        Args:
+            rule_code: The rule/error code (e.g., "B001", "W291")
+            file_path: File path (relative to project root)
+            line_number: Line number in file
+            tool: Tool name (e.g., "security", "lint")
+
+        Returns:
+            SuppressionMatch indicating if suppressed and why
+
+        """
+        rule_code = rule_code.upper()
+        tools = (tool, None) if tool else (_ANY_TOOL,)
+        lines = (line_number, None) if line_number else (None,)
+
+        # 1. Inline suppressions
+        if file_path:
+            inline = self._inline_for(file_path)
+            hits = [inline.get((rule_code, line)) for line in lines]
+            best = min((hit for hit in hits if hit), default=None, key=lambda hit: hit[0])
+            if best:
+                supp = best[1]
+                match_type = "inline_file" if supp.line_number is None else "inline_exact"
+                return SuppressionMatch(is_suppressed=True, suppression=supp, match_type=match_type)
+
+        # 2. Baseline file-specific suppressions
+        if file_path:
+            hits = [self._files.get((file_path, rule_code, ln, t)) for ln in lines for t in tools]
+            best = min((hit for hit in hits if hit), default=None, key=lambda hit: hit[0])
+            if best:
+                return SuppressionMatch(is_suppressed=True, suppression=best[1], match_type=best[2])
+
+        # 3. Project-wide suppressions
+        hits = [self._project.get((rule_code, t)) for t in tools]
+        best = min((hit for hit in hits if hit), default=None, key=lambda hit: hit[0])
+        if best:
+            return SuppressionMatch(is_suppressed=True, suppression=best[1], match_type=best[2])
+
+        # 4. Rule-wide suppressions
+        supp = self._rules.get(rule_code)
+        if supp and not (tool and supp.tool and supp.tool != tool):
+            return SuppressionMatch(
+                is_suppressed=True, suppression=supp, match_type="baseline_rule"
+            )
+
+        return SuppressionMatch(is_suppressed=False)
+
+    def _inline_for(self, file_path: str) -> dict[tuple, tuple[int, Suppression]]:
+        """Get inline suppressions for a file keyed by (rule_code, line_number)."""
+        if file_path in self._inline:
+            return self._inline[file_path]
+
+        suppressions: list[Suppression] = []
+        try:
+            data = (self._manager.project_root / file_path).read_bytes()
+        except OSError:
+            data = None
+
+        if data is not None:
+            key = (file_path, hashlib.sha256(data).hexdigest())
+            cached = _INLINE_CACHE.get(key)
+            if cached is None:
+                content = data.decode("utf-8", errors="ignore")
+                cached = self._manager.parse_inline_suppressions(file_path, content)
+                _INLINE_CACHE[key] = cached
+                if len(_INLINE_CACHE) > _INLINE_CACHE_SIZE:
+                    _INLINE_CACHE.popitem(last=False)
+            else:
+                _INLINE_CACHE.move_to_end(key)
+            suppressions = cached
+            self._manager.inline_cache[file_path] = suppressions
+
+        compiled: dict[tuple, tuple[int, Suppression]] = {}
+        for position, supp in enumerate(suppressions):
+            compiled.setdefault((supp.rule_code, supp.line_number), (position, supp))
+        self._inline[file_path] = compiled
+        return compiled
+
+
 # =============================================================================
 # Convenience Functions
 # =============================================================================
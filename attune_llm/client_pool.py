@@ -0,0 +1,272 @@
+"""Shared Anthropic Client Registry
+
+Process-wide registry of ``AsyncAnthropic`` clients, so every
+``AnthropicProvider`` using the same credentials shares one HTTP connection
+pool (keep-alive, HTTP/2 when the ``h2`` package is installed) instead of
+opening its own pool and TLS sessions per provider instance.
+
+Async HTTP connections belong to the event loop that opened them, so clients
+are kept per running event loop. They are closed when the loop shuts down
+(``asyncio.run`` finalizes a registry hook before closing the loop), and the
+state of loops closed without that shutdown step is pruned on the next use.
+A client created outside any loop has no connections yet and is adopted by
+the first loop that asks for it.
+
+The registry also coalesces in-flight requests: identical calls issued
+concurrently on the same loop (e.g. by parallel agents) share one API request.
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under the Apache License, Version 2.0
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Connection pool defaults for the shared HTTP client
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 30.0  # seconds
+
+
+@dataclass
+class _LoopState:
+    """Clients and in-flight requests owned by one event loop."""
+
+    clients: dict[tuple[Any, ...], Any] = field(default_factory=dict)
+    inflight: dict[str, asyncio.Future[Any]] = field(default_factory=dict)
+    # Async generator the loop finalizes in shutdown_asyncgens()
+    shutdown_hook: Any = None
+
+
+class ClientRegistry:
+    """Registry of shared Anthropic clients with request coalescing.
+
+    Example:
+        >>> registry = get_client_registry()
+        >>> client = registry.get_anthropic_client("sk-ant-...")
+        >>> response, coalesced = await registry.coalesce(
+        ...     request_key(client, api_kwargs),
+        ...     lambda: client.messages.create(**api_kwargs),
+        ... )
+    """
+
+    def __init__(
+        self,
+        max_connections: int = MAX_CONNECTIONS,
+        max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY,
+        http2: bool | None = None,
+    ):
+        """Initialize the registry.
+
+        Args:
+            max_connections: Maximum open connections per client
+            max_keepalive_connections: Maximum idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept alive
+            http2: Enable HTTP/2 (default: when the ``h2`` package is installed)
+        """
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+
+        # Reentrant: closing a pruned loop's hook removes its state under the lock
+        self._lock = threading.RLock()
+        self._loops: dict[asyncio.AbstractEventLoop, _LoopState] = {}
+        # Clients requested outside a running loop (e.g. provider construction)
+        self._unbound = _LoopState()
+
+        self.stats = self._new_stats()
+
+    @staticmethod
+    def _new_stats() -> dict[str, int]:
+        return {"clients_created": 0, "clients_closed": 0, "requests": 0, "coalesced": 0}
+
+    def _state(self) -> _LoopState:
+        """Return the state for the running event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._unbound
+
+        with self._lock:
+            self._prune_closed_loops()
+            state = self._loops.get(loop)
+            if state is None:
+                state = self._loops[loop] = _LoopState()
+                state.shutdown_hook = self._close_at_shutdown(loop)
+                try:
+                    # Run to the first yield; this registers the generator with
+                    # the loop, which closes it during shutdown_asyncgens()
+                    state.shutdown_hook.asend(None).send(None)
+                except StopIteration:
+                    pass
+            return state
+
+    def _prune_closed_loops(self) -> None:
+        """Drop the state of loops closed without shutting down their async generators.
+
+        Their clients can no longer be closed asynchronously; dropping them
+        releases the loop and lets the transports be garbage collected.
+        """
+        for loop in [loop for loop in self._loops if loop.is_closed()]:
+            state = self._loops[loop]
+            try:
+                # Finishes the hook without awaiting anything (the loop is closed)
+                state.shutdown_hook.aclose().send(None)
+            except StopIteration:
+                pass
+            logger.debug(f"Dropped {len(state.clients)} client(s) of a closed event loop")
+
+    async def _close_at_shutdown(self, loop: asyncio.AbstractEventLoop) -> AsyncIterator[None]:
+        """Close a loop's clients when the loop finalizes its async generators."""
+        try:
+            yield
+        finally:
+            with self._lock:
+                state = self._loops.pop(loop, None)
+            if state is not None and not loop.is_closed():
+                await self._close_clients(state)
+
+    async def _close_clients(self, state: _LoopState) -> None:
+        with self._lock:
+            clients = list(state.clients.values())
+            state.clients.clear()
+        for client in clients:
+            try:
+                await client.close()
+            except Exception as e:  # noqa: BLE001
+                # INTENTIONAL: closing is best effort; one failure must not keep other pools open
+                logger.debug(f"Failed to close Anthropic client: {e}")
+        self.stats["clients_closed"] += len(clients)
+
+    def get_anthropic_client(self, api_key: str, base_url: str | None = None) -> Any:
+        """Get the shared ``AsyncAnthropic`` client for the running event loop.
+
+        Args:
+            api_key: Anthropic API key
+            base_url: Optional API base URL
+
+        Returns:
+            Shared AsyncAnthropic client
+
+        Raises:
+            ImportError: If the anthropic package is not installed
+        """
+        import anthropic
+
+        state = self._state()
+        key = (api_key, base_url, anthropic.AsyncAnthropic)
+
+        with self._lock:
+            client = state.clients.get(key)
+            if client is None and state is not self._unbound:
+                # Not connected yet, so not bound to a loop: this loop takes it over
+                client = self._unbound.clients.pop(key, None)
+                if client is not None:
+                    state.clients[key] = client
+            if client is None:
+                client = anthropic.AsyncAnthropic(
+                    api_key=api_key,
+                    base_url=base_url,
+                    http_client=self._create_http_client(anthropic),
+                )
+                state.clients[key] = client
+                self.stats["clients_created"] += 1
+                logger.debug(f"Created shared Anthropic client (http2={self.http2})")
+            return client
+
+    def _create_http_client(self, anthropic: Any) -> Any:
+        """Create a pooled keep-alive HTTP client for the Anthropic SDK."""
+        import httpx
+
+        return anthropic.DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            http2=self.http2,
+        )
+
+    async def coalesce(self, key: str, request: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """Run a request, sharing it with identical requests already in flight.
+
+        The request runs as a task, so one caller being cancelled does not
+        cancel it for the others.
+
+        Args:
+            key: Request identity (see ``request_key``)
+            request: Zero-argument callable returning the request awaitable
+
+        Returns:
+            Tuple of (result, coalesced), where coalesced is True when the
+            result came from a request started by another caller
+        """
+        state = self._state()
+        future = state.inflight.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(future), True
+
+        task = asyncio.ensure_future(request())
+        state.inflight[key] = task
+        task.add_done_callback(lambda _: state.inflight.pop(key, None))
+        self.stats["requests"] += 1
+        return await asyncio.shield(task), False
+
+    async def aclose(self) -> None:
+        """Close the clients owned by the running event loop."""
+        await self._close_clients(self._state())
+
+    def clear(self) -> None:
+        """Forget all clients and statistics (clients are not closed)."""
+        with self._lock:
+            self._loops = {}
+            self._unbound = _LoopState()
+            self.stats = self._new_stats()
+
+
+def request_key(client: Any, api_kwargs: dict[str, Any]) -> str:
+    """Identity of a request for coalescing.
+
+    Args:
+        client: Client the request is sent with
+        api_kwargs: Request parameters (model, system, messages, ...)
+
+    Returns:
+        Hex digest identifying the client and parameters
+    """
+    payload = json.dumps(api_kwargs, sort_keys=True, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{id(client)}:{digest}"
+
+
+# Global registry instance
+_registry: ClientRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Get the process-wide client registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ClientRegistry()
+    return _registry
@@ -8,10 +8,13 @@ Licensed under the Apache License, Version 2.0
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import os
 import shutil
 import subprocess
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -71,7 +74,7 @@ DEFAULT_CONFIG = {
         "types": {"enabled": True, "tool": "pyright", "weight": 90},
         "tests": {"enabled": True, "tool": "pytest", "weight": 85, "coverage_target": 80},
         "security": {"enabled": True, "tool": "bandit", "weight": 100},
-        "deps": {"enabled": True, "tool": "pip-audit", "weight": 30},
+        "deps": {"enabled": True, "tool": "pip-audit", "weight": 30, "cache_ttl": 86400},
     },
     "thresholds": DEFAULT_THRESHOLDS,
     "auto_fix": {
@@ -81,6 +84,62 @@ DEFAULT_CONFIG = {
     },
 }
 
+# Result cache location (relative to project root)
+CACHE_DIR = ".empathy/health_cache"
+
+# Directories never hashed into a check's file set
+CACHE_EXCLUDED_DIRS = {
+    ".git",
+    ".hg",
+    ".venv",
+    "venv",
+    "env",
+    "node_modules",
+    "__pycache__",
+    ".empathy",
+    ".attune",
+    ".mypy_cache",
+    ".ruff_cache",
+    ".pytest_cache",
+    ".tox",
+    ".nox",
+    "build",
+    "dist",
+    "site-packages",
+}
+
+# Tool configuration files that invalidate cached results of code checks
+CACHE_CONFIG_FILES = {
+    "pyproject.toml",
+    "setup.cfg",
+    "setup.py",
+    "tox.ini",
+    "pytest.ini",
+    "ruff.toml",
+    ".ruff.toml",
+    "mypy.ini",
+    ".mypy.ini",
+    "pyrightconfig.json",
+    ".bandit",
+    ".flake8",
+}
+
+# Dependency manifests that invalidate cached dependency audits
+CACHE_DEPS_FILES = {
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "poetry.lock",
+    "uv.lock",
+    "Pipfile.lock",
+}
+
+# Checks whose tool results are per-file and can be re-run on changed files only
+INCREMENTAL_TOOLS = {"lint": "ruff"}
+
+# Changed-file runs above this size re-run the whole check
+DEFAULT_INCREMENTAL_MAX_FILES = 200
+
 
 @dataclass
 class HealthIssue:
@@ -108,6 +167,20 @@ class HealthIssue:
             "fix_command": self.fix_command,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "HealthIssue":
+        """Create from dictionary."""
+        return cls(
+            category=CheckCategory(data["category"]),
+            file_path=data["file_path"],
+            line=data.get("line"),
+            code=data.get("code", ""),
+            message=data.get("message", ""),
+            severity=data.get("severity", "warning"),
+            fixable=data.get("fixable", False),
+            fix_command=data.get("fix_command"),
+        )
+
 
 @dataclass
 class CheckResult:
@@ -145,6 +218,19 @@ class CheckResult:
             "tool_used": self.tool_used,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "CheckResult":
+        """Create from dictionary."""
+        return cls(
+            category=CheckCategory(data["category"]),
+            status=HealthStatus(data["status"]),
+            score=data["score"],
+            issues=[HealthIssue.from_dict(i) for i in data.get("issues", [])],
+            details=dict(data.get("details", {})),
+            duration_ms=data.get("duration_ms", 0),
+            tool_used=data.get("tool_used", ""),
+        )
+
 
 @dataclass
 class HealthReport:
@@ -220,6 +306,112 @@ class HealthReport:
         }
 
 
+class CheckResultCache:
+    """Content-addressed cache of check results.
+
+    Each result is keyed by (check, tool version, check config, hash of the
+    check's file set). File contents are hashed once and reused while their
+    size and mtime are unchanged, so a lookup on a clean tree costs one
+    directory walk. The latest entry per check also keeps the per-file
+    hashes it was computed from, which lets per-file tools re-run only on
+    changed files.
+    """
+
+    def __init__(self, project_root: Path):
+        """Initialize the cache.
+
+        Args:
+            project_root: Root directory of the project
+        """
+        self.project_root = project_root
+        self.cache_dir = project_root / CACHE_DIR
+        self._manifest_path = self.cache_dir / "files.json"
+        self._manifest: dict[str, list] | None = None
+        self._entries: dict[str, dict | None] = {}
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> dict[str, str]:
+        """Hash the tracked files of the project.
+
+        Returns:
+            Mapping of relative path to content hash
+        """
+        with self._lock:
+            if self._manifest is None:
+                self._manifest = self._load_json(self._manifest_path) or {}
+
+            files: dict[str, str] = {}
+            manifest: dict[str, list] = {}
+            for rel_path, full_path in self._walk():
+                try:
+                    stat = full_path.stat()
+                except OSError:
+                    continue
+                known = self._manifest.get(rel_path)
+                if known and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+                    digest = known[2]
+                else:
+                    try:
+                        digest = hashlib.sha256(full_path.read_bytes()).hexdigest()
+                    except OSError:
+                        continue
+                manifest[rel_path] = [stat.st_mtime_ns, stat.st_size, digest]
+                files[rel_path] = digest
+
+            if manifest != self._manifest:
+                self._manifest = manifest
+                self._save_json(self._manifest_path, manifest)
+            return files
+
+    def get(self, category: str) -> dict | None:
+        """Get the latest cache entry for a check."""
+        with self._lock:
+            if category not in self._entries:
+                self._entries[category] = self._load_json(self._entry_path(category))
+            return self._entries[category]
+
+    def put(self, category: str, entry: dict) -> None:
+        """Store the latest cache entry for a check."""
+        with self._lock:
+            self._entries[category] = entry
+            self._save_json(self._entry_path(category), entry)
+
+    def _entry_path(self, category: str) -> Path:
+        return self.cache_dir / f"{category}.json"
+
+    def _walk(self):
+        """Yield (relative path, path) for Python, config and dependency files."""
+        tracked_names = CACHE_CONFIG_FILES | CACHE_DEPS_FILES
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            dirnames[:] = sorted(
+                d for d in dirnames if d not in CACHE_EXCLUDED_DIRS and not d.endswith(".egg-info")
+            )
+            for name in sorted(filenames):
+                if (
+                    name.endswith(".py")
+                    or name in tracked_names
+                    or (name.startswith("requirements") and name.endswith(".txt"))
+                ):
+                    full_path = Path(dirpath) / name
+                    yield full_path.relative_to(self.project_root).as_posix(), full_path
+
+    def _load_json(self, path: Path) -> Any:
+        try:
+            return json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _save_json(self, path: Path, data: Any) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            validated_path = _validate_file_path(str(path))
+            tmp_path = validated_path.with_name(validated_path.name + ".tmp")
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path, validated_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to write health check cache {path.name}: {e}")
+
+
 class HealthCheckRunner:
     """Run configurable health checks and aggregate results."""
 
@@ -227,16 +419,27 @@ class HealthCheckRunner:
         self,
         project_root: str = ".",
         config: dict | None = None,
+        use_cache: bool = True,
+        max_concurrency: int | None = None,
     ):
         """Initialize the health check runner.
 
         Args:
             project_root: Root directory of the project
             config: Configuration dictionary (uses defaults if not provided)
+            use_cache: Reuse results of checks whose inputs are unchanged
+            max_concurrency: Maximum checks running at once. Defaults to half
+                the CPU count (at least 1), since most tools are multi-threaded.
 
         """
         self.project_root = Path(project_root).resolve()
         self.config = {**DEFAULT_CONFIG, **(config or {})}
+        self.use_cache = use_cache
+        self.cache = CheckResultCache(self.project_root) if use_cache else None
+        self.max_concurrency = max_concurrency or max(1, (os.cpu_count() or 2) // 2)
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._files: dict[str, str] | None = None
+        self._files_lock = threading.Lock()
         self._check_handlers = {
             CheckCategory.LINT: self._run_lint_check,
             CheckCategory.FORMAT: self._run_format_check,
@@ -253,6 +456,7 @@ class HealthCheckRunner:
     async def run_all(self) -> HealthReport:
         """Run all enabled health checks."""
         report = HealthReport(project_root=str(self.project_root))
+        self._files = None  # Re-hash the tree once per run
 
         tasks = []
         for category in CheckCategory:
@@ -276,6 +480,7 @@ class HealthCheckRunner:
     async def run_quick(self) -> HealthReport:
         """Run fast checks only (lint, format, types)."""
         report = HealthReport(project_root=str(self.project_root))
+        self._files = None  # Re-hash the tree once per run
 
         quick_checks = [CheckCategory.LINT, CheckCategory.FORMAT, CheckCategory.TYPES]
         tasks = []
@@ -299,6 +504,7 @@ class HealthCheckRunner:
         """Run a specific health check."""
         check_config = self.config["checks"].get(category.value, {})
         handler = self._check_handlers.get(category)
+        self._files = None
 
         if not handler:
             return CheckResult(
@@ -326,8 +532,11 @@ class HealthCheckRunner:
         """
         start_time = datetime.now()
         try:
-            result: CheckResult = await asyncio.to_thread(handler, config)
-            result.duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            result: CheckResult = await asyncio.to_thread(
+                self._run_check_cached, category, handler, config
+            )
+            if not result.details.get("cached"):
+                result.duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
             return result
         except Exception as e:
             # INTENTIONAL: Broad exception handler for graceful degradation of optional checks
@@ -341,8 +550,166 @@ class HealthCheckRunner:
                 duration_ms=int((datetime.now() - start_time).total_seconds() * 1000),
             )
 
-    def _run_lint_check(self, config: dict) -> CheckResult:
-        """Run linting check using ruff or flake8."""
+    def _run_check_cached(self, category: CheckCategory, handler, config: dict) -> CheckResult:
+        """Run a check handler, reusing or incrementally updating cached results.
+
+        Cached results are returned without acquiring a concurrency slot.
+        """
+        if self.cache is None:
+            with self._slots:
+                return handler(config)
+
+        tool = config.get("tool", "")
+        files = self._check_files(category)
+        fingerprint = {
+            "tool": self._tool_fingerprint(tool, config),
+            "config": hashlib.sha256(
+                json.dumps(config, sort_keys=True, default=str).encode()
+            ).hexdigest(),
+        }
+        key = hashlib.sha256(
+            json.dumps([category.value, fingerprint, sorted(files.items())]).encode()
+        ).hexdigest()
+
+        entry = self.cache.get(category.value)
+        ttl = config.get("cache_ttl")
+        fresh = entry is not None and (
+            ttl is None or datetime.now().timestamp() - entry.get("created_at", 0) < ttl
+        )
+        if fresh and entry["key"] == key:
+            logger.debug(f"Health check cache hit: {category.value}")
+            result = CheckResult.from_dict(entry["result"])
+            result.details["cached"] = True
+            return result
+
+        changed: list[str] | None = None
+        removed: list[str] = []
+        if (
+            fresh
+            and INCREMENTAL_TOOLS.get(category.value) == tool
+            and entry.get("fingerprint") == fingerprint
+        ):
+            previous = entry.get("files", {})
+            changed = [path for path, digest in files.items() if previous.get(path) != digest]
+            removed = [path for path in previous if path not in files]
+            max_files = config.get("incremental_max_files", DEFAULT_INCREMENTAL_MAX_FILES)
+            if any(not path.endswith(".py") for path in changed + removed) or (
+                len(changed) + len(removed) > max_files
+            ):
+                changed = None  # Tool config changed or too much churn
+
+        if changed is None:
+            with self._slots:
+                result = handler(config)
+        else:
+            logger.debug(f"Health check {category.value}: re-checking {len(changed)} changed files")
+            result = self._run_incremental(handler, config, entry, changed, removed)
+
+        if result.status not in (HealthStatus.ERROR, HealthStatus.SKIP):
+            self.cache.put(
+                category.value,
+                {
+                    "key": key,
+                    "created_at": datetime.now().timestamp(),
+                    "fingerprint": fingerprint,
+                    "files": files,
+                    "result": result.to_dict(),
+                },
+            )
+        return result
+
+    def _run_incremental(
+        self,
+        handler,
+        config: dict,
+        entry: dict,
+        changed: list[str],
+        removed: list[str],
+    ) -> CheckResult:
+        """Re-run a per-file check on changed files and merge with cached issues."""
+        previous = CheckResult.from_dict(entry["result"])
+        stale = set(changed) | set(removed)
+        kept = [
+            issue for issue in previous.issues if self._relative_path(issue.file_path) not in stale
+        ]
+
+        if changed:
+            with self._slots:
+                partial = handler(
+                    config, targets=[str(self.project_root / path) for path in changed]
+                )
+            if partial.status == HealthStatus.ERROR:
+                return partial
+            kept.extend(partial.issues)
+
+        result = self._summarize_lint(config.get("tool", ""), kept)
+        result.details["incremental_files"] = len(changed)
+        return result
+
+    def _check_files(self, category: CheckCategory) -> dict[str, str]:
+        """Files whose contents determine a check's result."""
+        with self._files_lock:
+            if self._files is None:
+                assert self.cache is not None
+                self._files = self.cache.snapshot()
+            files = self._files
+
+        if category == CheckCategory.DEPS:
+            return {
+                path: digest
+                for path, digest in files.items()
+                if "/" not in path and (path in CACHE_DEPS_FILES or path.startswith("requirements"))
+            }
+        return files
+
+    def _tool_fingerprint(self, tool: str, config: dict) -> str:
+        """Identify the installed tool version by its executable's path and stat."""
+        tools = [tool, "dmypy"] if tool == "mypy" and config.get("daemon") else [tool]
+        parts = []
+        for name in tools:
+            path = shutil.which(name) if name else None
+            if path is None:
+                parts.append(f"{name}:missing")
+                continue
+            try:
+                stat = os.stat(path)
+                parts.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+            except OSError:
+                parts.append(path)
+        return "|".join(parts)
+
+    def _relative_path(self, file_path: str) -> str:
+        """Normalize a tool-reported path to a project-relative POSIX path."""
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = self.project_root / path
+        try:
+            return path.resolve().relative_to(self.project_root).as_posix()
+        except ValueError:
+            return Path(file_path).as_posix()
+
+    def _summarize_lint(self, tool: str, issues: list[HealthIssue]) -> CheckResult:
+        """Score lint issues into a CheckResult."""
+        score = max(0, 100 - len(issues) * 5)  # -5 per issue
+        status = HealthStatus.PASS if not issues else HealthStatus.WARN
+
+        return CheckResult(
+            category=CheckCategory.LINT,
+            status=status,
+            score=score,
+            issues=issues,
+            tool_used=tool,
+            details={"total_files_checked": len({i.file_path for i in issues}) or "all"},
+        )
+
+    def _run_lint_check(self, config: dict, targets: list[str] | None = None) -> CheckResult:
+        """Run linting check using ruff or flake8.
+
+        Args:
+            config: Check configuration
+            targets: Files to check (defaults to the whole project)
+
+        """
         tool = config.get("tool", "ruff")
         issues = []
 
@@ -357,8 +724,9 @@ class HealthCheckRunner:
 
         try:
             if tool == "ruff":
+                paths = ["--force-exclude", *targets] if targets else [str(self.project_root)]
                 result = subprocess.run(
-                    ["ruff", "check", "--output-format=json", str(self.project_root)],
+                    ["ruff", "check", "--output-format=json", *paths],
                     check=False,
                     capture_output=True,
                     text=True,
@@ -393,17 +761,7 @@ class HealthCheckRunner:
                 # Parse flake8 output...
 
             # Calculate score based on issues
-            score = max(0, 100 - len(issues) * 5)  # -5 per issue
-            status = HealthStatus.PASS if not issues else HealthStatus.WARN
-
-            return CheckResult(
-                category=CheckCategory.LINT,
-                status=status,
-                score=score,
-                issues=issues,
-                tool_used=tool,
-                details={"total_files_checked": len({i.file_path for i in issues}) or "all"},
-            )
+            return self._summarize_lint(tool, issues)
 
         except json.JSONDecodeError as e:
             # Tool output not in expected JSON format
@@ -579,8 +937,11 @@ class HealthCheckRunner:
                         pass
 
             elif tool == "mypy":
+                # The mypy daemon keeps state between runs and re-checks only changed modules
+                use_daemon = config.get("daemon", False) and self._is_tool_available("dmypy")
+                command = ["dmypy", "run", "--"] if use_daemon else ["mypy"]
                 result = subprocess.run(
-                    ["mypy", "--show-error-codes", "--no-error-summary", str(self.project_root)],
+                    [*command, "--show-error-codes", "--no-error-summary", str(self.project_root)],
                     check=False,
                     capture_output=True,
                     text=True,
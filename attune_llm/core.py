@@ -20,6 +20,7 @@ from attune.memory import (
     SecretsDetector,
     SecurityError,
 )
+from attune.models.prompt_layout import PromptLayout, Stability
 
 from .levels import EmpathyLevel
 from .providers import (
@@ -35,6 +36,16 @@ from .state import CollaborationState, PatternType, UserPattern
 logger = logging.getLogger(__name__)
 
 
+def _cache_usage(response: Any) -> dict[str, int]:
+    """Return the prompt cache token counts reported by the provider."""
+    metadata = getattr(response, "metadata", None) or {}
+    return {
+        key: metadata[key]
+        for key in ("cache_creation_tokens", "cache_read_tokens")
+        if isinstance(metadata.get(key), int)
+    }
+
+
 class EmpathyLLM:
     """Wraps any LLM provider with Attune AI levels.
 
@@ -354,14 +365,22 @@ class EmpathyLLM:
 
         return level
 
-    def _build_system_prompt(self, level: int) -> str:
+    def _build_system_prompt(
+        self, level: int, context: dict[str, Any] | None = None
+    ) -> str | list[dict[str, Any]]:
         """Build system prompt including Claude memory (if enabled).
 
         Claude memory is prepended to the level-specific prompt,
         so instructions from CLAUDE.md files affect all interactions.
 
+        A workflow system prompt in ``context["system_prompt"]`` (a string or
+        PromptLayout) is appended after them. The combined prompt is ordered
+        from stable to volatile, and Anthropic providers receive it as system
+        blocks with cache breakpoints.
+
         Args:
             level: Empathy level (1-5)
+            context: Interaction context, may carry a workflow system prompt
 
         Returns:
             Complete system prompt
@@ -371,7 +390,7 @@ class EmpathyLLM:
 
         # If Claude memory is enabled and loaded, prepend it
         if self._cached_memory:
-            return f"""{self._cached_memory}
+            base_prompt = f"""{self._cached_memory}
 
 ---
 # Attune AI Instructions
@@ -379,7 +398,24 @@ class EmpathyLLM:
 
 Follow the CLAUDE.md instructions above, then apply the Attune AI below.
 """
-        return level_prompt
+        else:
+            base_prompt = level_prompt
+
+        workflow_prompt = (context or {}).get("system_prompt")
+        if not workflow_prompt:
+            return base_prompt
+
+        model = getattr(self.provider, "model", "")
+        layout = PromptLayout(model=model if isinstance(model, str) else "")
+        layout.add(base_prompt, Stability.STATIC, "empathy")
+        if isinstance(workflow_prompt, PromptLayout):
+            layout.extend(workflow_prompt)
+        else:
+            layout.add(str(workflow_prompt), Stability.STAGE, "workflow")
+
+        if getattr(self.provider, "accepts_system_blocks", False) is True:
+            return layout.system_blocks()
+        return layout.render()
 
     def reload_memory(self):
         """Reload Claude memory files.
@@ -594,7 +630,7 @@ Follow the CLAUDE.md instructions above, then apply the Attune AI below.
         """
         generate_kwargs: dict[str, Any] = {
             "messages": [{"role": "user", "content": user_input}],
-            "system_prompt": self._build_system_prompt(1),
+            "system_prompt": self._build_system_prompt(1, context),
             "temperature": EmpathyLevel.get_temperature_recommendation(1),
             "max_tokens": EmpathyLevel.get_max_tokens_recommendation(1),
         }
@@ -606,7 +642,11 @@ Follow the CLAUDE.md instructions above, then apply the Attune AI below.
         return {
             "content": response.content,
             "proactive": False,
-            "metadata": {"tokens_used": response.tokens_used, "model": response.model},
+            "metadata": {
+                "tokens_used": response.tokens_used,
+                "model": response.model,
+                **_cache_usage(response),
+            },
         }
 
     async def _level_2_guided(
@@ -626,7 +666,7 @@ Follow the CLAUDE.md instructions above, then apply the Attune AI below.
 
         generate_kwargs: dict[str, Any] = {
             "messages": messages,
-            "system_prompt": self._build_system_prompt(2),
+            "system_prompt": self._build_system_prompt(2, context),
             "temperature": EmpathyLevel.get_temperature_recommendation(2),
             "max_tokens": EmpathyLevel.get_max_tokens_recommendation(2),
         }
@@ -641,6 +681,7 @@ Follow the CLAUDE.md instructions above, then apply the Attune AI below.
             "metadata": {
                 "tokens_used": response.tokens_used,
                 "model": response.model,
+                **_cache_usage(response),
                 "history_turns": len(messages) - 1,
             },
         }
@@ -693,7 +734,7 @@ Was this helpful? If not, I can adjust my pattern detection.
 
         generate_kwargs: dict[str, Any] = {
             "messages": messages,
-            "system_prompt": self._build_system_prompt(3),
+            "system_prompt": self._build_system_prompt(3, context),
             "temperature": EmpathyLevel.get_temperature_recommendation(3),
             "max_tokens": EmpathyLevel.get_max_tokens_recommendation(3),
         }
@@ -708,6 +749,7 @@ Was this helpful? If not, I can adjust my pattern detection.
             "metadata": {
                 "tokens_used": response.tokens_used,
                 "model": response.model,
+                **_cache_usage(response),
                 "pattern": pattern_info,
             },
         }
@@ -752,7 +794,7 @@ Use anticipatory format:
 
         generate_kwargs: dict[str, Any] = {
             "messages": messages,
-            "system_prompt": self._build_system_prompt(4),
+            "system_prompt": self._build_system_prompt(4, context),
             "temperature": EmpathyLevel.get_temperature_recommendation(4),
             "max_tokens": EmpathyLevel.get_max_tokens_recommendation(4),
         }
@@ -767,6 +809,7 @@ Use anticipatory format:
             "metadata": {
                 "tokens_used": response.tokens_used,
                 "model": response.model,
+                **_cache_usage(response),
                 "trajectory_analyzed": True,
                 "trust_level": state.trust_level,
             },
@@ -805,7 +848,7 @@ TASK:
 
         generate_kwargs: dict[str, Any] = {
             "messages": messages,
-            "system_prompt": self._build_system_prompt(5),
+            "system_prompt": self._build_system_prompt(5, context),
             "temperature": EmpathyLevel.get_temperature_recommendation(5),
             "max_tokens": EmpathyLevel.get_max_tokens_recommendation(5),
         }
@@ -820,6 +863,7 @@ TASK:
             "metadata": {
                 "tokens_used": response.tokens_used,
                 "model": response.model,
+                **_cache_usage(response),
                 "pattern_library_size": len(self.pattern_library),
                 "systems_level": True,
             },
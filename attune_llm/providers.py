@@ -13,6 +13,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+from .client_pool import get_client_registry, request_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +35,9 @@ class BaseLLMProvider(ABC):
     Provides unified interface regardless of backend.
     """
 
+    # Whether generate() accepts a list of system blocks with cache breakpoints
+    accepts_system_blocks = False
+
     def __init__(self, api_key: str | None = None, **kwargs):
         self.api_key = api_key
         self.config = kwargs
@@ -81,8 +86,17 @@ class AnthropicProvider(BaseLLMProvider):
     - Extended thinking for complex reasoning
     - Streaming for real-time output
     - Batch processing for cost optimization
+
+    Providers share pooled HTTP clients through the process-wide client
+    registry. Identical concurrent deterministic ``generate`` calls
+    (temperature 0 or unset) share one request; the callers that joined it
+    report zero token usage so the call is only counted once.
+    ``coalesce_requests=True`` also coalesces sampled requests, ``False``
+    never coalesces.
     """
 
+    accepts_system_blocks = True
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -91,6 +105,8 @@ class AnthropicProvider(BaseLLMProvider):
         use_thinking: bool = False,
         thinking_budget: int = 10000,
         use_batch: bool = False,
+        coalesce_requests: bool | None = None,
+        base_url: str | None = None,
         **kwargs,
     ):
         super().__init__(api_key, **kwargs)
@@ -99,6 +115,8 @@ class AnthropicProvider(BaseLLMProvider):
         self.use_thinking = use_thinking
         self.thinking_budget = thinking_budget
         self.use_batch = use_batch
+        self.coalesce_requests = coalesce_requests
+        self.base_url = base_url
 
         # Validate API key is provided
         if not api_key or not api_key.strip():
@@ -117,10 +135,10 @@ class AnthropicProvider(BaseLLMProvider):
 
         # Lazy import to avoid requiring anthropic if not used
         # v4.6.3: Use AsyncAnthropic for true async I/O (prevents event loop blocking)
+        # Clients come from the shared registry so providers reuse connections
         try:
-            import anthropic
-
-            self.client = anthropic.AsyncAnthropic(api_key=api_key)
+            self.client = get_client_registry().get_anthropic_client(api_key, base_url=base_url)
+            self._shared_client = self.client
         except ImportError as e:
             raise ImportError(
                 "anthropic package required. Install with: pip install anthropic",
@@ -132,10 +150,21 @@ class AnthropicProvider(BaseLLMProvider):
         else:
             self.batch_provider = None
 
+    def _get_client(self) -> Any:
+        """Return the shared client for the running event loop.
+
+        A client assigned directly to ``self.client`` is used as-is.
+        """
+        if self.client is not self._shared_client:
+            return self.client
+        client = get_client_registry().get_anthropic_client(self.api_key, base_url=self.base_url)
+        self.client = self._shared_client = client
+        return client
+
     async def generate(
         self,
         messages: list[dict[str, str]],
-        system_prompt: str | None = None,
+        system_prompt: str | list[dict[str, Any]] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 1024,
         **kwargs,
@@ -150,6 +179,9 @@ class AnthropicProvider(BaseLLMProvider):
         Prompt caching is enabled by default (use_prompt_caching=True).
         This marks system prompts with cache_control for Anthropic's cache.
         Break-even: ~3 requests with same context, 5-minute TTL.
+
+        A list of system blocks (see ``PromptLayout.system_blocks``) is sent
+        as-is, keeping its own cache breakpoints.
         """
         # Build kwargs for Anthropic
         api_kwargs = {
@@ -160,7 +192,16 @@ class AnthropicProvider(BaseLLMProvider):
         }
 
         # Enable prompt caching for system prompts (Claude-specific)
-        if system_prompt and self.use_prompt_caching:
+        if isinstance(system_prompt, list):
+            api_kwargs["system"] = (
+                system_prompt
+                if self.use_prompt_caching
+                else [
+                    {k: v for k, v in block.items() if k != "cache_control"}
+                    for block in system_prompt
+                ]
+            )
+        elif system_prompt and self.use_prompt_caching:
             api_kwargs["system"] = [
                 {
                     "type": "text",
@@ -182,10 +223,23 @@ class AnthropicProvider(BaseLLMProvider):
         api_kwargs.update(kwargs)
 
         # Call Anthropic API (async with AsyncAnthropic) with typed error handling
+        # Identical concurrent calls share one request when coalescing is enabled;
+        # by default only deterministic ones, since sampled calls should differ
+        client = self._get_client()
+        coalesce = self.coalesce_requests
+        if coalesce is None:
+            coalesce = not api_kwargs.get("temperature")
+        coalesced = False
         try:
             import anthropic
 
-            response = await self.client.messages.create(**api_kwargs)  # type: ignore[call-overload]
+            if coalesce:
+                response, coalesced = await get_client_registry().coalesce(
+                    request_key(client, api_kwargs),
+                    lambda: client.messages.create(**api_kwargs),
+                )
+            else:
+                response = await client.messages.create(**api_kwargs)  # type: ignore[call-overload]
         except anthropic.RateLimitError as e:
             logger.warning(f"Rate limited by Anthropic API: {e}")
             raise
@@ -222,9 +276,23 @@ class AnthropicProvider(BaseLLMProvider):
             "provider": "anthropic",
             "model": self.model,
         }
+        tokens_used = response.usage.input_tokens + response.usage.output_tokens
+        if coalesced:
+            # The caller that started the request reports its usage; counting it
+            # again here would bill one API call several times
+            metadata.update(
+                {
+                    "coalesced": True,
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "cache_creation_tokens": 0,
+                    "cache_read_tokens": 0,
+                }
+            )
+            tokens_used = 0
 
         # Add cache performance metrics if available
-        if hasattr(response.usage, "cache_creation_input_tokens"):
+        if not coalesced and hasattr(response.usage, "cache_creation_input_tokens"):
             cache_creation = getattr(response.usage, "cache_creation_input_tokens", 0)
             cache_read = getattr(response.usage, "cache_read_input_tokens", 0)
 
@@ -261,7 +329,7 @@ class AnthropicProvider(BaseLLMProvider):
         return LLMResponse(
             content=response_content,
             model=response.model,
-            tokens_used=response.usage.input_tokens + response.usage.output_tokens,
+            tokens_used=tokens_used,
             finish_reason=response.stop_reason,
             metadata=metadata,
         )
@@ -359,7 +427,7 @@ class AnthropicProvider(BaseLLMProvider):
         api_kwargs.update(kwargs)
 
         try:
-            async with self.client.messages.stream(**api_kwargs) as stream:
+            async with self._get_client().messages.stream(**api_kwargs) as stream:
                 async for text in stream.text_stream:
                     yield text
         except anthropic.RateLimitError as e:
@@ -519,11 +587,12 @@ class AnthropicBatchProvider:
         >>> results = await provider.wait_for_batch(batch_id)
     """
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, base_url: str | None = None):
         """Initialize batch provider.
 
         Args:
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+            base_url: Optional API base URL (e.g. a local batch endpoint for tests)
         """
         if not api_key or not api_key.strip():
             raise ValueError(
@@ -534,7 +603,10 @@ class AnthropicBatchProvider:
         try:
             import anthropic
 
-            self.client = anthropic.Anthropic(api_key=api_key)
+            if base_url:
+                self.client = anthropic.Anthropic(api_key=api_key, base_url=base_url)
+            else:
+                self.client = anthropic.Anthropic(api_key=api_key)
             self._batch_jobs: dict[str, Any] = {}
         except ImportError as e:
             raise ImportError(
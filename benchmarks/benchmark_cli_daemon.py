@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""Benchmark cold vs. warm (daemon) `attune` invocations.
+
+Runs each command as a fresh `python -m attune.cli_minimal` process, first
+without the daemon and then with ATTUNE_DAEMON=1 against a daemon started on
+a temporary socket, and reports the wall-clock time of each.
+
+Usage:
+    python benchmarks/benchmark_cli_daemon.py [--runs 5] [command ...]
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+import argparse
+import os
+import shlex
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from attune import cli_daemon
+
+DEFAULT_COMMANDS = ["version", "workflow list", "telemetry show", "cache stats"]
+
+
+def time_command(argv: list[str], env: dict[str, str], runs: int) -> list[float]:
+    """Run `attune <argv>` as a new process `runs` times and return seconds per run."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "attune.cli_minimal", *argv],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per command and mode")
+    parser.add_argument("commands", nargs="*", default=DEFAULT_COMMANDS)
+    args = parser.parse_args()
+
+    if not cli_daemon.SUPPORTED:
+        print("The CLI daemon is not supported on this platform")
+        return 1
+
+    with tempfile.TemporaryDirectory(prefix="attune-bench", dir="/tmp") as tmp:
+        sock = Path(tmp) / "daemon.sock"
+        cold_env = {k: v for k, v in os.environ.items() if k != cli_daemon.ENV_VAR}
+        warm_env = {
+            **cold_env,
+            cli_daemon.ENV_VAR: "1",
+            cli_daemon.SOCKET_ENV_VAR: str(sock),
+        }
+
+        print(f"Starting daemon on {sock}...")
+        if not cli_daemon.spawn_daemon(sock, idle_timeout=600):
+            print("Daemon failed to start")
+            return 1
+
+        try:
+            print(f"\n{'command':<24}{'cold (ms)':>12}{'warm (ms)':>12}{'speedup':>10}")
+            print("-" * 58)
+            for command in args.commands:
+                argv = shlex.split(command)
+                time_command(argv, warm_env, 1)  # Let the daemon warm this project
+                cold = statistics.median(time_command(argv, cold_env, args.runs)) * 1000
+                warm = statistics.median(time_command(argv, warm_env, args.runs)) * 1000
+                print(f"{command:<24}{cold:>12.0f}{warm:>12.0f}{cold / warm:>9.1f}x")
+
+            status = cli_daemon.request("status", sock) or {}
+            print(f"\nDaemon served {status.get('requests_served', 0)} requests")
+        finally:
+            cli_daemon.request("stop", sock)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
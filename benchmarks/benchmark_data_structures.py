@@ -149,6 +149,74 @@ def benchmark_verdict_merging() -> None:
     print(f"  Speedup: {speedup:.1f}x faster")
 
 
+def benchmark_pattern_query(size: int = 100_000, queries: int = 100) -> None:
+    """Benchmark PatternLibrary.query_patterns: full scan vs inverted index."""
+    import heapq
+    import random
+
+    from attune.pattern_library import Pattern, PatternLibrary
+
+    print("\n" + "=" * 70)
+    print("BENCHMARK: PatternLibrary.query_patterns (full scan vs inverted index)")
+    print("=" * 70)
+
+    rng = random.Random(42)
+    keys = [f"key_{i}" for i in range(50)]
+    tags = [f"tag_{i}" for i in range(200)]
+
+    library = PatternLibrary()
+    for i in range(size):
+        library.contribute_pattern(
+            f"agent_{i % 20}",
+            Pattern(
+                id=f"pat_{i}",
+                agent_id=f"agent_{i % 20}",
+                pattern_type=rng.choice(["sequential", "temporal", "conditional", "behavioral"]),
+                name=f"Pattern {i}",
+                description="Benchmark pattern",
+                confidence=rng.uniform(0.4, 1.0),
+                context={key: rng.randint(0, 9) for key in rng.sample(keys, 3)},
+                tags=rng.sample(tags, 2),
+            ),
+        )
+
+    contexts = [
+        {**{key: rng.randint(0, 9) for key in rng.sample(keys, 2)}, "tags": rng.sample(tags, 1)}
+        for _ in range(queries)
+    ]
+
+    # Previous approach: score every pattern, sort all matches
+    start = time.perf_counter()
+    for context in contexts:
+        matches = []
+        for pattern in library.patterns.values():
+            if pattern.confidence < 0.5:
+                continue
+            score, _ = library._calculate_relevance(pattern, context)
+            if score > 0.3:
+                matches.append((score, pattern.id))
+        matches.sort(key=lambda m: m[0], reverse=True)
+        _ = matches[:10]
+    scan_time = time.perf_counter() - start
+
+    # Inverted index + top-k heap
+    start = time.perf_counter()
+    for context in contexts:
+        indexed = library.query_patterns("bench_agent", context, limit=10)
+    index_time = time.perf_counter() - start
+
+    # Sanity check: both approaches agree on the last query
+    expected = heapq.nlargest(10, matches, key=lambda m: m[0])
+    assert [m.relevance_score for m in indexed] == [score for score, _ in expected]
+
+    speedup = scan_time / index_time if index_time > 0 else float("inf")
+
+    print(f"\nPatterns: {size:,} ({queries} queries)")
+    print(f"  Full scan:      {scan_time * 1000:.1f}ms")
+    print(f"  Inverted index: {index_time * 1000:.1f}ms")
+    print(f"  Speedup: {speedup:.1f}x faster")
+
+
 if __name__ == "__main__":
     print("\n🚀 Data Structure Optimization Benchmarks")
     print("Testing O(n) vs O(1) lookup patterns\n")
@@ -157,6 +225,7 @@ if __name__ == "__main__":
     benchmark_list_index()
     benchmark_role_constants()
     benchmark_verdict_merging()
+    benchmark_pattern_query()
 
     print("\n" + "=" * 70)
     print("✅ Benchmarks complete!")
@@ -0,0 +1,89 @@
+"""Benchmark socratic goal embedding search.
+
+Compares the pure-Python cosine scan with the NumPy EmbeddingMatrix
+(matrix multiply + argpartition) for SemanticGoalMatcher-sized stores.
+
+Copyright 2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from attune.socratic.embeddings import TFIDFEmbeddingProvider, VectorStore  # noqa: E402
+
+WORDS = (
+    "automate code review security scan test coverage refactor deploy pipeline "
+    "document api performance profile debug release migrate database cache"
+).split()
+
+
+def _goals(count: int) -> list[dict]:
+    rng = random.Random(42)
+    return [
+        {"goal_text": " ".join(rng.choices(WORDS, k=8)), "goal_id": f"g{i}"} for i in range(count)
+    ]
+
+
+def benchmark_embedding(count: int = 10_000) -> None:
+    """Benchmark per-text embed vs vectorized embed_batch."""
+    print("=" * 70)
+    print("BENCHMARK: TF-IDF Embedding (embed loop vs embed_batch)")
+    print("=" * 70)
+
+    provider = TFIDFEmbeddingProvider()
+    texts = [g["goal_text"] for g in _goals(count)]
+
+    start = time.perf_counter()
+    for text in texts:
+        provider.embed(text)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    provider.embed_batch(texts)
+    batch_time = time.perf_counter() - start
+
+    print(f"\nTexts: {count:,}")
+    print(f"  embed() loop: {loop_time * 1000:.0f}ms")
+    print(f"  embed_batch(): {batch_time * 1000:.0f}ms")
+
+
+def benchmark_search(sizes: tuple[int, ...] = (1_000, 10_000, 100_000), queries: int = 20) -> None:
+    """Benchmark VectorStore.search with and without the embedding matrix."""
+    print("\n" + "=" * 70)
+    print("BENCHMARK: Goal Search (pure Python vs EmbeddingMatrix)")
+    print("=" * 70)
+
+    for size in sizes:
+        store = VectorStore(provider=TFIDFEmbeddingProvider())
+        store.add_batch(_goals(size))
+        matrix = store._matrix
+
+        start = time.perf_counter()
+        for _ in range(queries):
+            store.search("automate security review", top_k=10, min_similarity=0.3)
+        fast_time = time.perf_counter() - start
+
+        store._matrix = None
+        start = time.perf_counter()
+        for _ in range(queries):
+            store.search("automate security review", top_k=10, min_similarity=0.3)
+        slow_time = time.perf_counter() - start
+        store._matrix = matrix
+
+        speedup = slow_time / fast_time if fast_time > 0 else float("inf")
+        print(f"\nGoals: {size:,} ({queries} searches)")
+        print(f"  Pure Python:     {slow_time * 1000:.1f}ms")
+        print(f"  EmbeddingMatrix: {fast_time * 1000:.1f}ms")
+        print(f"  Speedup: {speedup:.1f}x faster")
+
+
+if __name__ == "__main__":
+    print("\nSocratic Goal Embedding Benchmarks\n")
+    benchmark_embedding()
+    benchmark_search()
@@ -8,10 +8,12 @@ Agents:
     - Code Quality: Runs ruff, checks complexity
     - Documentation: Checks docstring coverage
 
-Collaboration: Parallel execution with result aggregation
+Collaboration: Parallel execution with result aggregation; tool output is
+shared through a run-scoped ArtifactBus
 Tier Strategy: Progressive (CHEAP -> CAPABLE -> PREMIUM)
 """
 
+from .artifact_bus import ArtifactBus, ToolOutput, artifact_scope, get_artifact_bus
 from .release_prep_team import (
     ReleaseAgent,
     ReleasePrepTeam,
@@ -20,8 +22,12 @@ from .release_prep_team import (
 )
 
 __all__ = [
+    "ArtifactBus",
     "ReleaseAgent",
     "ReleasePrepTeam",
     "ReleasePrepTeamWorkflow",
     "ReleaseReadinessReport",
+    "ToolOutput",
+    "artifact_scope",
+    "get_artifact_bus",
 ]
@@ -0,0 +1,287 @@
+"""Run-scoped artifact bus for release analysis tools.
+
+Release agents, their tier escalations and the release workflows all run the
+same analysis tools (bandit, ruff, pytest) on the same tree. The bus runs each
+tool at most once per (tree fingerprint, command, cwd): concurrent requesters
+wait on the same in-flight run, later requesters get the stored output, and
+parsed results are memoized next to the raw output.
+
+A bus lives for one release run. ``ReleasePrepTeam`` creates one per
+assessment and shares it with its agents; ``artifact_scope()`` makes a bus
+current for workflows called within the block.
+
+Copyright 2026 Smart-AI-Memory
+Licensed under Apache 2.0
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import subprocess
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Directories skipped when fingerprinting a tree that is not a git checkout
+_SKIP_DIRS = frozenset(
+    {".git", ".venv", "venv", "node_modules", "__pycache__", ".mypy_cache", ".ruff_cache"}
+)
+
+_current_bus: ContextVar[ArtifactBus | None] = ContextVar("artifact_bus", default=None)
+
+
+@dataclass(frozen=True)
+class ToolOutput:
+    """Raw result of one tool invocation."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+    duration: float = 0.0
+
+
+def run_tool(cmd: list[str], cwd: str = ".", timeout: float = 120) -> ToolOutput:
+    """Run a command without a shell and capture its output.
+
+    Args:
+        cmd: Command and arguments as list
+        cwd: Working directory
+        timeout: Seconds before the command is abandoned
+
+    Returns:
+        ToolOutput; returncode is -1 if the command is missing and -2 on timeout
+    """
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            cwd=cwd,
+        )
+        return ToolOutput(
+            result.returncode, result.stdout, result.stderr, time.perf_counter() - start
+        )
+    except FileNotFoundError:
+        return ToolOutput(-1, "", f"Command not found: {cmd[0]}")
+    except subprocess.TimeoutExpired:
+        return ToolOutput(
+            -2, "", f"Command timed out: {' '.join(cmd)}", time.perf_counter() - start
+        )
+
+
+def tree_fingerprint(path: str | Path = ".") -> str:
+    """Fingerprint the working tree at ``path``.
+
+    In a git checkout this is HEAD plus the status and stat of every changed
+    or untracked file, so it is cheap even for large trees. Elsewhere every
+    file's path, size and mtime is hashed.
+
+    Args:
+        path: Directory to fingerprint
+
+    Returns:
+        Hex digest identifying the current state of the tree
+    """
+    root = Path(path).resolve()
+    digest = hashlib.sha256(str(root).encode())
+
+    head = run_tool(["git", "rev-parse", "HEAD"], cwd=str(root), timeout=30)
+    status = run_tool(
+        ["git", "status", "--porcelain=v1", "-z", "--untracked-files=all", "."],
+        cwd=str(root),
+        timeout=60,
+    )
+    if head.returncode == 0 and status.returncode == 0:
+        digest.update(head.stdout.encode())
+        git_root = run_tool(["git", "rev-parse", "--show-toplevel"], cwd=str(root), timeout=30)
+        base = Path(git_root.stdout.strip() or root)
+        for entry in status.stdout.split("\0"):
+            if len(entry) < 4:
+                continue
+            digest.update(entry.encode())
+            _update_with_stat(digest, base / entry[3:])
+        return digest.hexdigest()
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in _SKIP_DIRS)
+        for name in sorted(filenames):
+            file_path = Path(dirpath) / name
+            digest.update(str(file_path.relative_to(root)).encode())
+            _update_with_stat(digest, file_path)
+    return digest.hexdigest()
+
+
+def _update_with_stat(digest: Any, path: Path) -> None:
+    try:
+        stat = path.stat()
+    except OSError:
+        digest.update(b"missing")
+        return
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+
+class ArtifactBus:
+    """Thread-safe, run-scoped store of tool outputs and parsed artifacts.
+
+    Example:
+        >>> bus = ArtifactBus()
+        >>> output = bus.run(["uv", "run", "ruff", "check", "src/"], cwd=".")
+        >>> bus.run(["uv", "run", "ruff", "check", "src/"], cwd=".") is output
+        True
+
+    Args:
+        runner: Function executing a command, ``runner(cmd, cwd, timeout)``
+            returning a ToolOutput
+        fingerprint: Function fingerprinting a directory; computed once per
+            directory for the life of the bus
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[list[str], str, float], ToolOutput] | None = None,
+        fingerprint: Callable[[str], str] | None = None,
+    ) -> None:
+        self._runner = runner or run_tool
+        self._fingerprint = fingerprint or tree_fingerprint
+        self._lock = threading.Lock()
+        self._trees: dict[str, str] = {}
+        self._outputs: dict[tuple[str, tuple[str, ...], str], Future[ToolOutput]] = {}
+        self._parsed: dict[tuple[Any, ...], Future[Any]] = {}
+
+        self.runs = 0
+        self.reused = 0
+        self.parses = 0
+        self.saved_seconds = 0.0
+
+    def _tree(self, cwd: str) -> str:
+        with self._lock:
+            tree = self._trees.get(cwd)
+        if tree is None:
+            tree = self._fingerprint(cwd)
+            with self._lock:
+                tree = self._trees.setdefault(cwd, tree)
+        return tree
+
+    def _key(self, cmd: list[str], cwd: str) -> tuple[str, tuple[str, ...], str]:
+        cwd = str(Path(cwd).resolve())
+        return (self._tree(cwd), tuple(cmd), cwd)
+
+    def _single_flight(
+        self, table: dict[Any, Future[Any]], key: Any, compute: Callable[[], Any]
+    ) -> tuple[Any, bool]:
+        """Return ``(value, computed_here)``; only the first caller computes."""
+        with self._lock:
+            future = table.get(key)
+            owner = future is None
+            if owner:
+                future = table[key] = Future()
+        if not owner:
+            return future.result(), False
+
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                table.pop(key, None)
+            future.set_exception(e)
+            raise
+        future.set_result(value)
+        return value, True
+
+    def run(self, cmd: list[str], cwd: str = ".", timeout: float = 120) -> ToolOutput:
+        """Run ``cmd`` in ``cwd`` unless this tree already has its output.
+
+        Args:
+            cmd: Command and arguments as list
+            cwd: Working directory
+            timeout: Seconds before the command is abandoned (first run only)
+
+        Returns:
+            ToolOutput shared by every requester of the same command and tree
+        """
+        output, computed = self._single_flight(
+            self._outputs, self._key(cmd, cwd), lambda: self._runner(cmd, cwd, timeout)
+        )
+        with self._lock:
+            if computed:
+                self.runs += 1
+            else:
+                self.reused += 1
+                self.saved_seconds += output.duration
+        if not computed:
+            logger.debug(f"Artifact bus reused output of {' '.join(cmd)}")
+        return output
+
+    def parsed(
+        self,
+        cmd: list[str],
+        cwd: str,
+        parser: Callable[[ToolOutput], Any],
+        name: str | None = None,
+    ) -> Any:
+        """Run ``cmd`` through the bus and memoize ``parser``'s result.
+
+        The parsed value is shared between requesters, so callers that mutate
+        it must copy it first.
+
+        Args:
+            cmd: Command and arguments as list
+            cwd: Working directory
+            parser: Deterministic function of the tool output
+            name: Cache name for the parser (defaults to its qualified name)
+
+        Returns:
+            The parsed artifact
+        """
+        key = (*self._key(cmd, cwd), name or getattr(parser, "__qualname__", repr(parser)))
+        value, computed = self._single_flight(self._parsed, key, lambda: parser(self.run(cmd, cwd)))
+        if computed:
+            with self._lock:
+                self.parses += 1
+        return value
+
+    def stats(self) -> dict[str, Any]:
+        """Return tool runs, reused outputs and the tool time saved."""
+        with self._lock:
+            return {
+                "tool_runs": self.runs,
+                "reused": self.reused,
+                "parses": self.parses,
+                "saved_seconds": round(self.saved_seconds, 3),
+            }
+
+
+def get_artifact_bus() -> ArtifactBus | None:
+    """Return the bus made current by ``artifact_scope()``, if any."""
+    return _current_bus.get()
+
+
+@contextmanager
+def artifact_scope(bus: ArtifactBus | None = None) -> Iterator[ArtifactBus]:
+    """Make a bus current for tool runs within the block.
+
+    Nested scopes reuse the outer bus unless one is passed explicitly.
+
+    Example:
+        >>> with artifact_scope() as bus:
+        ...     await workflow.execute(path=".")
+        >>> bus.stats()["reused"]
+    """
+    bus = bus or _current_bus.get() or ArtifactBus()
+    token = _current_bus.set(bus)
+    try:
+        yield bus
+    finally:
+        _current_bus.reset(token)
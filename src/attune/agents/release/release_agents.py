@@ -15,14 +15,15 @@ import json
 import logging
 import os
 import re
-import subprocess
 import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
 from attune.agents.state.store import AgentStateStore
 
+from .artifact_bus import ArtifactBus, ToolOutput, get_artifact_bus, run_tool
 from .release_models import (
     ANTHROPIC_AVAILABLE,
     DEFAULT_QUALITY_GATES,
@@ -52,19 +53,8 @@ def _run_command(cmd: list[str], cwd: str = ".") -> tuple[int, str, str]:
     Returns:
         Tuple of (return_code, stdout, stderr)
     """
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120,
-            cwd=cwd,
-        )
-        return result.returncode, result.stdout, result.stderr
-    except FileNotFoundError:
-        return -1, "", f"Command not found: {cmd[0]}"
-    except subprocess.TimeoutExpired:
-        return -2, "", f"Command timed out: {' '.join(cmd)}"
+    output = run_tool(cmd, cwd=cwd)
+    return output.returncode, output.stdout, output.stderr
 
 
 # =============================================================================
@@ -78,6 +68,8 @@ class ReleaseAgent:
     Features:
         - Progressive tier escalation on failure
         - Optional Redis heartbeats (no-op when unavailable)
+        - Tool runs shared through an ArtifactBus, so escalated tiers and
+          other agents reuse the output instead of re-running the tool
         - Real Anthropic API calls with rule-based fallback
         - Multi-strategy response parsing (never returns None)
 
@@ -85,6 +77,8 @@ class ReleaseAgent:
         agent_id: Unique identifier for this agent instance
         role: Human-readable role name
         redis_client: Optional Redis connection for coordination
+        artifact_bus: Bus shared with other agents of the same run (defaults to
+            the current ``artifact_scope()`` bus, else a private one)
     """
 
     def __init__(
@@ -93,11 +87,13 @@ class ReleaseAgent:
         role: str,
         redis_client: Any | None = None,
         state_store: AgentStateStore | None = None,
+        artifact_bus: ArtifactBus | None = None,
     ) -> None:
         self.agent_id = agent_id
         self.role = role
         self.redis = redis_client
         self.state_store = state_store
+        self.artifact_bus = artifact_bus or get_artifact_bus() or ArtifactBus()
         self.current_tier = Tier.CHEAP
         self.llm_client: Any | None = None
         self.total_cost = 0.0
@@ -156,6 +152,42 @@ class ReleaseAgent:
             # INTENTIONAL: Redis is optional
             logger.debug(f"Signal failed (non-fatal): {e}")
 
+    def _run_tool(self, cmd: list[str], cwd: str = ".") -> tuple[int, str, str]:
+        """Run an analysis tool through the artifact bus.
+
+        Args:
+            cmd: Command and arguments as list
+            cwd: Working directory
+
+        Returns:
+            Tuple of (return_code, stdout, stderr)
+        """
+        output = self.artifact_bus.run(cmd, cwd)
+        return output.returncode, output.stdout, output.stderr
+
+    def _parse_tool(
+        self,
+        cmd: list[str],
+        cwd: str,
+        parser: Callable[[str, int], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Run a tool through the artifact bus and memoize its parsed output.
+
+        Args:
+            cmd: Command and arguments as list
+            cwd: Working directory
+            parser: ``parser(stdout, returncode)`` returning findings
+
+        Returns:
+            A copy of the shared findings, safe to update
+        """
+
+        def parse(output: ToolOutput) -> dict[str, Any]:
+            return parser(output.stdout, output.returncode)
+
+        name = f"{type(self).__name__}.{parser.__name__}"
+        return dict(self.artifact_bus.parsed(cmd, cwd, parse, name=name))
+
     def _call_llm(self, prompt: str, system: str, tier: Tier) -> tuple[str, dict[str, Any]]:
         """Call LLM with tier-appropriate model.
 
@@ -331,25 +363,25 @@ class SecurityAuditorAgent(ReleaseAgent):
         self,
         redis_client: Any | None = None,
         state_store: AgentStateStore | None = None,
+        artifact_bus: ArtifactBus | None = None,
     ) -> None:
         super().__init__(
             agent_id=f"security-auditor-{uuid4().hex[:8]}",
             role="Security Auditor",
             redis_client=redis_client,
             state_store=state_store,
+            artifact_bus=artifact_bus,
         )
 
     def _execute_tier(self, codebase_path: str, tier: Tier) -> tuple[bool, dict[str, Any]]:
         """Run security analysis."""
         try:
-            # Run bandit
-            returncode, stdout, stderr = _run_command(
-                ["uv", "run", "bandit", "-r", "src/", "-f", "json", "--severity-level", "medium"],
-                cwd=codebase_path,
-            )
+            # Run bandit (once per tree; escalated tiers reuse the output)
+            cmd = ["uv", "run", "bandit", "-r", "src/", "-f", "json", "--severity-level", "medium"]
+            _returncode, stdout, _stderr = self._run_tool(cmd, cwd=codebase_path)
 
             # Parse bandit JSON output
-            findings = self._parse_bandit_output(stdout, returncode)
+            findings = self._parse_tool(cmd, codebase_path, self._parse_bandit_output)
 
             # If LLM available, enhance with classification
             if self.llm_client and LLM_MODE == "real":
@@ -459,19 +491,21 @@ class TestCoverageAgent(ReleaseAgent):
         self,
         redis_client: Any | None = None,
         state_store: AgentStateStore | None = None,
+        artifact_bus: ArtifactBus | None = None,
     ) -> None:
         super().__init__(
             agent_id=f"test-coverage-{uuid4().hex[:8]}",
             role="Test Coverage",
             redis_client=redis_client,
             state_store=state_store,
+            artifact_bus=artifact_bus,
         )
 
     def _execute_tier(self, codebase_path: str, tier: Tier) -> tuple[bool, dict[str, Any]]:
         """Run test coverage analysis."""
         try:
             # Step 1: Quick test count (--collect-only is fast)
-            returncode, stdout, stderr = _run_command(
+            returncode, stdout, stderr = self._run_tool(
                 ["uv", "run", "pytest", "--co", "-q", "--no-header"],
                 cwd=codebase_path,
             )
@@ -488,7 +522,7 @@ class TestCoverageAgent(ReleaseAgent):
                     test_count = int(count_match.group(1))
 
             # Step 2: Try actual coverage (with short timeout)
-            cov_returncode, cov_stdout, _cov_stderr = _run_command(
+            cov_returncode, cov_stdout, _cov_stderr = self._run_tool(
                 [
                     "uv",
                     "run",
@@ -590,24 +624,24 @@ class CodeQualityAgent(ReleaseAgent):
         self,
         redis_client: Any | None = None,
         state_store: AgentStateStore | None = None,
+        artifact_bus: ArtifactBus | None = None,
     ) -> None:
         super().__init__(
             agent_id=f"code-quality-{uuid4().hex[:8]}",
             role="Code Quality",
             redis_client=redis_client,
             state_store=state_store,
+            artifact_bus=artifact_bus,
         )
 
     def _execute_tier(self, codebase_path: str, tier: Tier) -> tuple[bool, dict[str, Any]]:
         """Run code quality analysis."""
         try:
-            # Run ruff check
-            returncode, stdout, stderr = _run_command(
-                ["uv", "run", "ruff", "check", "src/", "--statistics"],
-                cwd=codebase_path,
-            )
+            # Run ruff check (once per tree; escalated tiers reuse the output)
+            cmd = ["uv", "run", "ruff", "check", "src/", "--statistics"]
+            _returncode, stdout, _stderr = self._run_tool(cmd, cwd=codebase_path)
 
-            findings = self._parse_ruff_output(stdout, returncode)
+            findings = self._parse_tool(cmd, codebase_path, self._parse_ruff_output)
 
             # If LLM available, enhance with quality assessment
             if self.llm_client and LLM_MODE == "real":
@@ -714,12 +748,14 @@ class DocumentationAgent(ReleaseAgent):
         self,
         redis_client: Any | None = None,
         state_store: AgentStateStore | None = None,
+        artifact_bus: ArtifactBus | None = None,
     ) -> None:
         super().__init__(
             agent_id=f"documentation-{uuid4().hex[:8]}",
             role="Documentation",
             redis_client=redis_client,
             state_store=state_store,
+            artifact_bus=artifact_bus,
         )
 
     def _execute_tier(self, codebase_path: str, tier: Tier) -> tuple[bool, dict[str, Any]]:
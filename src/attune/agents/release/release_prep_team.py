@@ -28,6 +28,8 @@ import logging
 import time
 from typing import Any
 
+from .artifact_bus import ArtifactBus, get_artifact_bus
+
 # Re-export agent classes and helpers
 from .release_agents import (  # noqa: F401
     CodeQualityAgent,
@@ -73,16 +75,20 @@ class ReleasePrepTeam:
         - Configurable quality gates
         - Optional Redis coordination for dashboard visibility
         - Cost tracking across all agents
+        - One ArtifactBus shared by all agents, so each tool runs once per tree
 
     Args:
         quality_gates: Custom quality gate thresholds
         redis_url: Optional Redis URL for coordination
+        artifact_bus: Bus to share with other release runs (defaults to the
+            current ``artifact_scope()`` bus, else a new one)
     """
 
     def __init__(
         self,
         quality_gates: dict[str, Any] | None = None,
         redis_url: str | None = None,
+        artifact_bus: ArtifactBus | None = None,
     ) -> None:
         self.quality_gates = {**DEFAULT_QUALITY_GATES}
         if quality_gates:
@@ -109,12 +115,14 @@ class ReleasePrepTeam:
                 # INTENTIONAL: Redis is optional
                 self.redis = None
 
+        self.artifact_bus = artifact_bus or get_artifact_bus() or ArtifactBus()
+
         # Initialize agents
         self.agents: list[ReleaseAgent] = [
-            SecurityAuditorAgent(redis_client=self.redis),
-            TestCoverageAgent(redis_client=self.redis),
-            CodeQualityAgent(redis_client=self.redis),
-            DocumentationAgent(redis_client=self.redis),
+            SecurityAuditorAgent(redis_client=self.redis, artifact_bus=self.artifact_bus),
+            TestCoverageAgent(redis_client=self.redis, artifact_bus=self.artifact_bus),
+            CodeQualityAgent(redis_client=self.redis, artifact_bus=self.artifact_bus),
+            DocumentationAgent(redis_client=self.redis, artifact_bus=self.artifact_bus),
         ]
 
     def get_total_cost(self) -> float:
@@ -142,6 +150,7 @@ class ReleasePrepTeam:
         results: list[ReleaseAgentResult] = await asyncio.gather(*tasks)
 
         elapsed = time.time() - start
+        logger.info(f"Release tool runs: {self.artifact_bus.stats()}")
 
         # Evaluate quality gates
         quality_gates = self._evaluate_quality_gates(results)
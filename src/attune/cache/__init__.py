@@ -14,6 +14,9 @@ Usage:
     cache = HashOnlyCache()  # Always available
     cache = HybridCache()    # Requires sentence-transformers
 
+    # Share responses across processes (single-flight, stale-while-revalidate)
+    cache = create_cache(shared="sqlite")  # or "redis", or ATTUNE_SHARED_CACHE
+
 Copyright 2025 Smart-AI-Memory
 Licensed under the Apache License, Version 2.0
 """
@@ -23,6 +26,14 @@ from typing import Optional
 
 from .base import BaseCache, CacheEntry, CacheStats
 from .hash_only import HashOnlyCache
+from .shared import (
+    LocalBackend,
+    RedisBackend,
+    SharedCache,
+    SharedCacheBackend,
+    SQLiteBackend,
+    create_shared_backend,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,19 +49,24 @@ except ImportError:
 
 def create_cache(
     cache_type: str | None = None,
+    shared: str | None = None,
     **kwargs,
 ) -> BaseCache:
     """Create appropriate cache based on available dependencies.
 
     Auto-detects if sentence-transformers is available and creates
-    HybridCache if possible, otherwise falls back to HashOnlyCache.
+    HybridCache if possible, otherwise falls back to HashOnlyCache. The
+    cache is wrapped in a SharedCache tier unless the tier is turned off.
 
     Args:
         cache_type: Force specific cache type ("hash" | "hybrid" | None for auto).
+        shared: Shared tier backend ("local" | "sqlite" | "redis" | "off");
+            defaults to $ATTUNE_SHARED_CACHE, then "local".
         **kwargs: Additional arguments passed to cache constructor.
 
     Returns:
-        BaseCache instance (HybridCache or HashOnlyCache).
+        BaseCache instance (HybridCache or HashOnlyCache, usually wrapped
+        in SharedCache).
 
     Example:
         # Auto-detect (recommended)
@@ -63,31 +79,35 @@ def create_cache(
         cache = create_cache(cache_type="hybrid")
 
     """
-    # Force hash-only
+    local: BaseCache
     if cache_type == "hash":
+        # Force hash-only
         logger.info("Using hash-only cache (explicit)")
-        return HashOnlyCache(**kwargs)
-
-    # Force hybrid
-    if cache_type == "hybrid":
+        local = HashOnlyCache(**kwargs)
+    elif cache_type == "hybrid":
+        # Force hybrid
         if not HYBRID_AVAILABLE:
             raise ImportError(
                 "HybridCache requires sentence-transformers. "
                 "Install with: pip install empathy-framework[cache]"
             )
         logger.info("Using hybrid cache (explicit)")
-        return HybridCache(**kwargs)
-
-    # Auto-detect (default)
-    if HYBRID_AVAILABLE:
+        local = HybridCache(**kwargs)
+    elif HYBRID_AVAILABLE:
+        # Auto-detect (default)
         logger.info("Using hybrid cache (auto-detected)")
-        return HybridCache(**kwargs)
+        local = HybridCache(**kwargs)
     else:
         logger.info(
             "Using hash-only cache (sentence-transformers not available). "
             "For 70% cost savings, install with: pip install empathy-framework[cache]"
         )
-        return HashOnlyCache(**kwargs)
+        local = HashOnlyCache(**kwargs)
+
+    backend = create_shared_backend(shared)
+    if backend is None:
+        return local
+    return SharedCache(local, backend)
 
 
 def auto_setup_cache() -> None:
@@ -111,7 +131,13 @@ __all__ = [
     "CacheStats",
     "HashOnlyCache",
     "HybridCache",
+    "LocalBackend",
+    "RedisBackend",
+    "SQLiteBackend",
+    "SharedCache",
+    "SharedCacheBackend",
     "create_cache",
+    "create_shared_backend",
     "auto_setup_cache",
     "HYBRID_AVAILABLE",
 ]
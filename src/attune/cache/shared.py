@@ -0,0 +1,513 @@
+"""Shared response cache tier with single-flight and stale-while-revalidate.
+
+``HashOnlyCache`` and ``HybridCache`` live inside one process, so the MCP
+server, the CLI and parallel workflow processes each pay for the same LLM
+call, and concurrent identical misses in one process all reach the API.
+``SharedCache`` wraps a local cache with a shared backend:
+
+- Entries are stored in the backend with their freshness deadline and kept
+  for ``stale_ttl`` seconds beyond it.
+- Single-flight: before computing a missing response, callers take a lease
+  on the key (``acquire_or_wait``). Only the lease holder computes; others
+  wait until the response is stored or the lease is released or expires.
+- Stale-while-revalidate: an expired entry is served to callers while
+  another caller holds the lease and recomputes it. The first caller to see
+  the expired entry takes the lease and becomes that revalidator.
+
+Backends (``ATTUNE_SHARED_CACHE``):
+
+- ``local`` (default): ``LocalBackend``, scoped to one cache instance
+- ``sqlite``: ``SQLiteBackend`` file shared by every process of the user
+  (``ATTUNE_SHARED_CACHE_PATH``, default ``~/.empathy/cache/shared.sqlite3``)
+- ``redis``: ``RedisBackend`` using the connection from ``redis_config``
+- ``off``: no wrapping
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Protocol
+
+from .base import BaseCache, CacheStats
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None  # type: ignore
+    REDIS_AVAILABLE = False
+
+ENV_VAR = "ATTUNE_SHARED_CACHE"
+PATH_ENV_VAR = "ATTUNE_SHARED_CACHE_PATH"
+DEFAULT_STALE_TTL = 3600  # Seconds an expired entry may be served while revalidating
+DEFAULT_LEASE_TTL = 120.0  # Seconds a computing caller holds a key before others take over
+DEFAULT_WAIT_TIMEOUT = 120.0  # Seconds a caller waits for another caller's result
+_POLL_INITIAL = 0.02
+_POLL_MAX = 0.5
+
+# Compare-and-delete so a caller only ever releases its own lease
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class SharedCacheBackend(Protocol):
+    """Key/value store with expiry and set-if-absent, shared between callers."""
+
+    def get(self, key: str) -> bytes | None:
+        """Get a value, or None if missing or expired."""
+        ...
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds."""
+        ...
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """Store a value only if the key is absent; return whether it was stored."""
+        ...
+
+    def delete_if_equal(self, key: str, value: bytes) -> bool:
+        """Delete the key only if it still holds ``value``."""
+        ...
+
+
+class LocalBackend:
+    """In-memory backend (thread-safe, one process)."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, tuple[bytes, float]] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, key: str, now: float) -> bytes | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        if item[1] <= now:
+            del self._data[key]
+            return None
+        return item[0]
+
+    def get(self, key: str) -> bytes | None:
+        """Get a value, or None if missing or expired."""
+        with self._lock:
+            return self._live(key, time.monotonic())
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """Store a value only if the key is absent."""
+        with self._lock:
+            now = time.monotonic()
+            if self._live(key, now) is not None:
+                return False
+            self._data[key] = (value, now + ttl)
+            return True
+
+    def delete_if_equal(self, key: str, value: bytes) -> bool:
+        """Delete the key only if it still holds ``value``."""
+        with self._lock:
+            if self._live(key, time.monotonic()) != value:
+                return False
+            del self._data[key]
+            return True
+
+
+class SQLiteBackend:
+    """SQLite file backend shared by all processes on one machine.
+
+    Args:
+        path: Database file
+        purge_every: Purge expired rows after this many writes
+
+    """
+
+    def __init__(self, path: Path, purge_every: int = 500):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._purge_every = purge_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        # Autocommit; add() opens its own IMMEDIATE transaction
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=10.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> bytes | None:
+        """Get a value, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM entries WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, now + ttl),
+            )
+            self._writes += 1
+            if self._writes % self._purge_every == 0:
+                self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """Store a value only if the key is absent (atomic across processes)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE key = ? AND expires_at <= ?", (key, now)
+                )
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO entries (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, now + ttl),
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        return cursor.rowcount == 1
+
+    def delete_if_equal(self, key: str, value: bytes) -> bool:
+        """Delete the key only if it still holds ``value``."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE key = ? AND value = ?", (key, value)
+            )
+        return cursor.rowcount == 1
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class RedisBackend:
+    """Redis backend (``SET NX PX`` leases, compare-and-delete release).
+
+    Args:
+        client: ``redis.Redis`` client (bytes responses)
+
+    """
+
+    def __init__(self, client: Any):
+        self._client = client
+        self._release = client.register_script(_RELEASE_SCRIPT)
+
+    @classmethod
+    def from_config(cls) -> RedisBackend:
+        """Connect using the environment configuration from ``redis_config``.
+
+        Raises:
+            ImportError: If the redis package is not installed
+            ConnectionError: If Redis is not reachable
+
+        """
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis package required: pip install redis")
+        from attune.redis_config import get_redis_config
+
+        client = redis.Redis(**get_redis_config().to_redis_kwargs())
+        try:
+            client.ping()
+        except redis.RedisError as e:
+            raise ConnectionError(f"Redis not reachable: {e}") from e
+        return cls(client)
+
+    def get(self, key: str) -> bytes | None:
+        """Get a value, or None if missing or expired."""
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds."""
+        self._client.set(key, value, px=max(1, int(ttl * 1000)))
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """Store a value only if the key is absent."""
+        return bool(self._client.set(key, value, nx=True, px=max(1, int(ttl * 1000))))
+
+    def delete_if_equal(self, key: str, value: bytes) -> bool:
+        """Delete the key only if it still holds ``value``."""
+        return bool(self._release(keys=[key], args=[value]))
+
+
+def create_shared_backend(mode: str | None = None) -> SharedCacheBackend | None:
+    """Create the backend selected by ``mode`` or ``$ATTUNE_SHARED_CACHE``.
+
+    Falls back to a ``LocalBackend`` when the requested shared backend is
+    unavailable.
+
+    Returns:
+        Backend instance, or None when the shared tier is turned off
+
+    """
+    mode = (mode or os.environ.get(ENV_VAR) or "local").lower()
+    if mode in ("off", "none", "0", "false"):
+        return None
+
+    try:
+        if mode == "sqlite":
+            default = Path.home() / ".empathy" / "cache" / "shared.sqlite3"
+            return SQLiteBackend(Path(os.environ.get(PATH_ENV_VAR) or default))
+        if mode == "redis":
+            return RedisBackend.from_config()
+    except (ImportError, ConnectionError, OSError, sqlite3.Error) as e:
+        logger.warning(f"Shared cache backend '{mode}' unavailable ({e}), using local backend")
+        return LocalBackend()
+
+    if mode != "local":
+        logger.warning(f"Unknown {ENV_VAR} value '{mode}', using local backend")
+    return LocalBackend()
+
+
+class SharedCache(BaseCache):
+    """Local cache backed by a shared tier with single-flight computation.
+
+    ``get``/``put`` follow the ``BaseCache`` contract, so callers that only
+    use those keep working. Callers that compute responses should, after a
+    miss, call ``acquire_or_wait`` and compute only when it grants the lease;
+    ``put`` (or ``release`` on failure) gives the lease back.
+
+    Args:
+        local: Per-process cache consulted first
+        backend: Shared backend (defaults to ``create_shared_backend()``)
+        namespace: Key prefix in the backend
+        stale_ttl: Seconds an expired entry stays available for revalidation
+        lease_ttl: Seconds before an unreleased lease expires
+        wait_timeout: Seconds ``acquire_or_wait`` waits for another caller
+
+    Example:
+        cache = SharedCache(HashOnlyCache(), SQLiteBackend(path))
+        response = cache.get("code-review", "scan", prompt, model)
+        if response is None:
+            response, owns_lease = await cache.acquire_or_wait(
+                "code-review", "scan", prompt, model
+            )
+            if response is None:
+                response = await call_llm(prompt)
+                cache.put("code-review", "scan", prompt, model, response)
+
+    """
+
+    def __init__(
+        self,
+        local: BaseCache,
+        backend: SharedCacheBackend | None = None,
+        namespace: str = "attune:cache",
+        stale_ttl: int = DEFAULT_STALE_TTL,
+        lease_ttl: float = DEFAULT_LEASE_TTL,
+        wait_timeout: float = DEFAULT_WAIT_TIMEOUT,
+    ):
+        super().__init__(local.max_size_mb, local.default_ttl)
+        self.local = local
+        self.backend = backend if backend is not None else LocalBackend()
+        self.namespace = namespace
+        self.stale_ttl = stale_ttl
+        self.lease_ttl = lease_ttl
+        self.wait_timeout = wait_timeout
+        self.shared_hits = 0
+        self.stale_hits = 0
+        self.coalesced = 0
+        self._leases: dict[str, bytes] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose local-cache helpers (size_info, evict_expired, ...)
+        if name == "local":
+            raise AttributeError(name)
+        return getattr(self.local, name)
+
+    # ----- Backend entries -----
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        try:
+            raw = self.backend.get(f"{self.namespace}:{key}")
+        except Exception as e:  # noqa: BLE001
+            # INTENTIONAL: A failing shared tier degrades to the local cache
+            logger.debug(f"Shared cache read failed: {e}")
+            return None
+        if raw is None:
+            return None
+        try:
+            entry = json.loads(raw)
+            return entry if isinstance(entry, dict) and "response" in entry else None
+        except (ValueError, TypeError):
+            return None
+
+    def _lease_held(self, key: str) -> bool:
+        try:
+            return self.backend.get(f"{self.namespace}:lease:{key}") is not None
+        except Exception as e:  # noqa: BLE001
+            # INTENTIONAL: Treat an unreachable tier as "nobody revalidating"
+            logger.debug(f"Shared cache lease check failed: {e}")
+            return False
+
+    def _fresh(self, workflow: str, stage: str, prompt: str, model: str, key: str) -> Any | None:
+        """Return a fresh shared entry (copying it into the local cache)."""
+        entry = self._read(key)
+        if entry is None:
+            return None
+        remaining = entry.get("fresh_until", 0) - time.time()
+        if remaining <= 0:
+            return None
+        self.local.put(workflow, stage, prompt, model, entry["response"], ttl=int(remaining) or 1)
+        return entry["response"]
+
+    # ----- BaseCache -----
+
+    def get(self, workflow: str, stage: str, prompt: str, model: str) -> Any | None:
+        """Get a response from the local cache, then the shared tier.
+
+        An expired shared entry is returned while another caller holds the
+        key's lease (it is being revalidated); otherwise it counts as a miss
+        so this caller can take the lease and refresh it.
+
+        """
+        response = self.local.get(workflow, stage, prompt, model)
+        if response is not None:
+            self.stats.hits += 1
+            return response
+
+        key = self._create_cache_key(workflow, stage, prompt, model)
+        response = self._fresh(workflow, stage, prompt, model, key)
+        if response is not None:
+            self.stats.hits += 1
+            self.shared_hits += 1
+            return response
+
+        entry = self._read(key)
+        if entry is not None and self._lease_held(key):
+            self.stats.hits += 1
+            self.stale_hits += 1
+            logger.debug(f"Serving stale response for {workflow}/{stage} while revalidating")
+            return entry["response"]
+
+        self.stats.misses += 1
+        return None
+
+    def put(
+        self,
+        workflow: str,
+        stage: str,
+        prompt: str,
+        model: str,
+        response: Any,
+        ttl: int | None = None,
+    ) -> None:
+        """Store a response locally and in the shared tier, releasing any lease."""
+        ttl = ttl or self.default_ttl
+        self.local.put(workflow, stage, prompt, model, response, ttl=ttl)
+
+        key = self._create_cache_key(workflow, stage, prompt, model)
+        payload = json.dumps({"response": response, "fresh_until": time.time() + ttl})
+        try:
+            self.backend.set(
+                f"{self.namespace}:{key}", payload.encode("utf-8"), ttl + self.stale_ttl
+            )
+        except Exception as e:  # noqa: BLE001
+            # INTENTIONAL: The local cache still holds the response
+            logger.debug(f"Shared cache write failed: {e}")
+        self._release_key(key)
+
+    def clear(self) -> None:
+        """Clear the local cache (shared entries expire on their own)."""
+        self.local.clear()
+
+    def get_stats(self) -> CacheStats:
+        """Get hit/miss statistics across both tiers."""
+        return self.stats
+
+    # ----- Single-flight -----
+
+    async def acquire_or_wait(
+        self,
+        workflow: str,
+        stage: str,
+        prompt: str,
+        model: str,
+    ) -> tuple[Any | None, bool]:
+        """Take the lease for a missing key, or wait for the caller holding it.
+
+        Returns:
+            ``(response, False)`` if another caller stored the response,
+            ``(None, True)`` if this caller holds the lease and must compute
+            and ``put`` (or ``release``), ``(None, False)`` on timeout
+
+        """
+        key = self._create_cache_key(workflow, stage, prompt, model)
+        lease_key = f"{self.namespace}:lease:{key}"
+        token = uuid.uuid4().hex.encode("ascii")
+        deadline = time.monotonic() + self.wait_timeout
+        delay = _POLL_INITIAL
+        waited = False
+
+        while True:
+            try:
+                acquired = self.backend.add(lease_key, token, self.lease_ttl)
+            except Exception as e:  # noqa: BLE001
+                # INTENTIONAL: Without a working tier, compute independently
+                logger.debug(f"Shared cache lease failed: {e}")
+                return None, False
+
+            # Re-check after acquiring: the previous holder may just have finished
+            response = self._fresh(workflow, stage, prompt, model, key)
+            if acquired:
+                self._leases[key] = token
+                if response is None:
+                    return None, True
+                self._release_key(key)
+
+            if response is not None:
+                if waited:
+                    self.coalesced += 1
+                return response, False
+
+            if time.monotonic() >= deadline:
+                logger.debug(f"Timed out waiting for {workflow}/{stage}; computing")
+                return None, False
+
+            waited = True
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _POLL_MAX)
+
+    def release(self, workflow: str, stage: str, prompt: str, model: str) -> None:
+        """Give back a lease without storing a response (e.g. the call failed)."""
+        self._release_key(self._create_cache_key(workflow, stage, prompt, model))
+
+    def _release_key(self, key: str) -> None:
+        token = self._leases.pop(key, None)
+        if token is None:
+            return
+        try:
+            self.backend.delete_if_equal(f"{self.namespace}:lease:{key}", token)
+        except Exception as e:  # noqa: BLE001
+            # INTENTIONAL: The lease expires after lease_ttl anyway
+            logger.debug(f"Shared cache lease release failed: {e}")
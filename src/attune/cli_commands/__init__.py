@@ -5,4 +5,5 @@ Each module groups related commands:
 - telemetry_commands: telemetry show/savings/export/routing/models/agents/signals
 - provider_commands: provider show/set
 - utility_commands: dashboard start, setup, validate, version
+- daemon_commands: daemon start/stop/status
 """
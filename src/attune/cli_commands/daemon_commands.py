@@ -0,0 +1,74 @@
+"""Daemon CLI commands.
+
+Commands for the warm background daemon that serves ``attune`` invocations.
+
+Copyright 2026 Smart-AI-Memory
+Licensed under Apache 2.0
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from argparse import Namespace
+
+logger = logging.getLogger(__name__)
+
+
+def cmd_daemon_start(args: Namespace) -> int:
+    """Start the warm CLI daemon."""
+    from attune import cli_daemon
+
+    if not cli_daemon.SUPPORTED:
+        print("❌ The CLI daemon requires a platform with fork() and Unix sockets")
+        return 1
+
+    status = cli_daemon.request("status")
+    if status is not None:
+        print(f"✓ Daemon already running (pid {status.get('pid')})")
+        return 0
+
+    idle_timeout = getattr(args, "idle_timeout", cli_daemon.DEFAULT_IDLE_TIMEOUT)
+    if getattr(args, "foreground", False):
+        return cli_daemon.main(["--idle-timeout", str(idle_timeout)])
+
+    if not cli_daemon.spawn_daemon(idle_timeout=idle_timeout):
+        print(f"❌ Daemon did not start; see {cli_daemon.socket_path().with_suffix('.log')}")
+        return 1
+
+    print(f"✓ Daemon started on {cli_daemon.socket_path()}")
+    print(f"  Set {cli_daemon.ENV_VAR}=1 to route attune commands through it")
+    return 0
+
+
+def cmd_daemon_stop(args: Namespace) -> int:
+    """Stop the warm CLI daemon."""
+    from attune import cli_daemon
+
+    if cli_daemon.request("stop") is None:
+        print("Daemon is not running")
+        return 0
+
+    print("✓ Daemon stopped")
+    return 0
+
+
+def cmd_daemon_status(args: Namespace) -> int:
+    """Show warm CLI daemon status."""
+    from attune import cli_daemon
+
+    status = cli_daemon.request("status")
+    if status is None:
+        print("Daemon is not running")
+        return 1
+
+    print(f"Daemon running (pid {status['pid']})")
+    print(f"  Socket:          {cli_daemon.socket_path()}")
+    print(f"  Uptime:          {status['uptime']:.0f}s")
+    print(f"  Requests served: {status['requests_served']}")
+    print(f"  Idle timeout:    {status['idle_timeout']:.0f}s")
+    for project in status.get("warm_projects", []):
+        print(f"  Warm project:    {project}")
+    return 0
@@ -35,7 +35,12 @@ def cmd_dashboard_start(args: Namespace) -> int:
         print("Press Ctrl+C to stop\n")
 
         # Start dashboard
-        run_standalone_dashboard(host=host, port=port)
+        if getattr(args, "live", False):
+            from attune.dashboard import run_live_dashboard
+
+            run_live_dashboard(host=host, port=port)
+        else:
+            run_standalone_dashboard(host=host, port=port)
         return 0
 
     except KeyboardInterrupt:
@@ -0,0 +1,597 @@
+"""Warm CLI daemon for the attune command.
+
+Every ``attune`` invocation normally pays for a fresh interpreter, command
+module imports, workflow discovery and index loading. Hooks and editor
+integrations call the CLI many times per minute, so this module offers an
+opt-in pre-forking daemon:
+
+- ``CLIDaemon`` imports the CLI once, discovers workflows, and keeps the
+  model registry and per-project index parses warm. Each request is run in
+  a child ``fork()``-ed from that warm state, so commands still get an
+  isolated process (own cwd, env, singletons and ``atexit`` handlers).
+- ``forward`` is the thin client. It passes the caller's stdin/stdout/
+  stderr file descriptors over the Unix socket (``SCM_RIGHTS``) together
+  with argv, cwd and environment. Output streams straight to the caller's
+  terminal and the exit status is sent back.
+- The daemon exits after ``idle_timeout`` seconds without requests, and
+  as soon as a file under the watched package directory changes (the
+  client then runs the command cold).
+
+Enable with ``ATTUNE_DAEMON=1`` (use a running daemon) or
+``ATTUNE_DAEMON=auto`` (also start one in the background), or manage it
+with ``attune daemon start|stop|status``.
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import signal
+import socket
+import struct
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT = 900.0  # Seconds without requests before the daemon exits
+DEFAULT_START_TIMEOUT = 10.0  # Seconds to wait for a spawned daemon to listen
+ENV_VAR = "ATTUNE_DAEMON"  # "1" to use a running daemon, "auto" to also spawn one
+SOCKET_ENV_VAR = "ATTUNE_DAEMON_SOCKET"
+PACKAGE_DIR = Path(__file__).resolve().parent
+SUPPORTED = hasattr(os, "fork") and hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+# Modules imported once in the daemon so forked commands start warm
+WARM_MODULES = (
+    "attune.cli_minimal",
+    "attune.models.registry",
+    "attune.cost_tracker",
+    "attune.project_index",
+    "attune.telemetry",
+    "attune.workflows",
+)
+
+_HEADER = struct.Struct("!I")
+_PEERCRED = struct.Struct("3i")  # struct ucred: pid, uid, gid
+
+# Set in the daemon and its children so ``main`` never forwards recursively
+IN_DAEMON = False
+
+
+def socket_path() -> Path:
+    """Get the daemon socket path (``$ATTUNE_DAEMON_SOCKET`` or ~/.attune)."""
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return Path(override)
+    return Path.home() / ".attune" / "cli-daemon.sock"
+
+
+def package_fingerprint(root: Path = PACKAGE_DIR) -> tuple[int, int, int]:
+    """Summarize the Python sources under ``root`` for change detection.
+
+    Returns:
+        Tuple of (file count, newest mtime in ns, total size)
+
+    """
+    count = newest = total = 0
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    stat = entry.stat()
+                    count += 1
+                    newest = max(newest, stat.st_mtime_ns)
+                    total += stat.st_size
+    return count, newest, total
+
+
+def _send_message(conn: socket.socket, message: dict[str, Any], fds: list[int] | None = None):
+    payload = json.dumps(message).encode("utf-8")
+    data = _HEADER.pack(len(payload)) + payload
+    if fds:
+        socket.send_fds(conn, [data], fds)
+    else:
+        conn.sendall(data)
+
+
+def _recv_exact(conn: socket.socket, size: int, buffer: bytes = b"") -> bytes:
+    while len(buffer) < size:
+        chunk = conn.recv(size - len(buffer))
+        if not chunk:
+            raise ConnectionError("Connection closed mid-message")
+        buffer += chunk
+    return buffer
+
+
+def _recv_message(conn: socket.socket, maxfds: int = 0) -> tuple[dict[str, Any], list[int]]:
+    # Read exactly one message so a following one stays in the socket
+    fds: list[int] = []
+    if maxfds:
+        data, fds, _flags, _addr = socket.recv_fds(conn, _HEADER.size, maxfds)
+        if not data:
+            raise ConnectionError("Connection closed")
+    else:
+        data = b""
+    header = _recv_exact(conn, _HEADER.size, data)
+    (size,) = _HEADER.unpack(header)
+    return json.loads(_recv_exact(conn, size)), list(fds)
+
+
+def _peer_is_owner(conn: socket.socket) -> bool:
+    """Whether the connected client runs as the daemon's user.
+
+    Uses ``SO_PEERCRED`` where available (Linux); elsewhere the socket's
+    owner-only permissions are the only check.
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True
+    creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _PEERCRED.size)
+    _pid, uid, _gid = _PEERCRED.unpack(creds)
+    return uid == os.getuid()
+
+
+def _default_runner(argv: list[str]) -> int:
+    from attune.cli_minimal import main
+
+    return main(argv)
+
+
+class CLIDaemon:
+    """Pre-forking server that runs CLI commands from a warm interpreter.
+
+    Args:
+        path: Unix socket path
+        idle_timeout: Seconds without requests before exiting
+        watch_dir: Directory whose Python files invalidate the daemon
+        runner: Callable taking argv and returning an exit code
+
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        watch_dir: Path = PACKAGE_DIR,
+        runner: Callable[[list[str]], int | None] = _default_runner,
+    ):
+        self.path = Path(path) if path else socket_path()
+        self.idle_timeout = idle_timeout
+        self.watch_dir = watch_dir
+        self.runner = runner
+        self.requests_served = 0
+        self.started_at = time.time()
+        self._fingerprint = package_fingerprint(watch_dir)
+        self._warm_projects: set[str] = set()
+        self._running = False
+        self._sock: socket.socket | None = None
+
+    # ----- Warm state -----
+
+    def warm_up(self) -> None:
+        """Import the CLI and discover workflows once, before any fork."""
+        import importlib
+
+        for name in WARM_MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception as e:  # noqa: BLE001
+                # INTENTIONAL: Optional extras may be missing; commands import lazily
+                logger.debug(f"Daemon warm-up skipped {name}: {e}")
+
+        try:
+            from attune.workflows import discover_workflows
+
+            discover_workflows()
+        except Exception as e:  # noqa: BLE001
+            # INTENTIONAL: Discovery failures surface in the command itself
+            logger.debug(f"Daemon workflow discovery failed: {e}")
+
+    def warm_project(self, cwd: str) -> None:
+        """Parse the project index for ``cwd`` so later forks inherit it."""
+        index_path = Path(cwd) / ".attune" / "project_index.json"
+        if not index_path.exists():
+            return
+        try:
+            from attune.project_index.index import _read_index_file
+
+            _read_index_file(index_path)
+            self._warm_projects.add(cwd)
+        except Exception as e:  # noqa: BLE001
+            # INTENTIONAL: A broken index is reported by the command that uses it
+            logger.debug(f"Daemon could not warm index for {cwd}: {e}")
+
+    def is_stale(self) -> bool:
+        """Whether watched package files changed since the daemon started."""
+        return package_fingerprint(self.watch_dir) != self._fingerprint
+
+    # ----- Serving -----
+
+    def bind(self) -> None:
+        """Create the listening socket (owner-only permissions)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        if self.path.exists():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.path))
+                raise RuntimeError(f"A daemon is already listening on {self.path}")
+            except (ConnectionRefusedError, FileNotFoundError):
+                self.path.unlink(missing_ok=True)
+            finally:
+                probe.close()
+
+        # Create the socket owner-only from the start: clients choose the env
+        # and cwd commands run with, so no one else may connect meanwhile.
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        previous_umask = os.umask(0o077)
+        try:
+            self._sock.bind(str(self.path))
+        finally:
+            os.umask(previous_umask)
+        os.chmod(self.path, 0o600)
+        self._sock.listen(64)
+
+    def serve_forever(self) -> None:
+        """Accept requests until idle, stale, or asked to stop."""
+        global IN_DAEMON
+        IN_DAEMON = True
+        if self._sock is None:
+            self.bind()
+        # Children are reaped automatically; forked commands restore SIG_DFL
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+        self._running = True
+        last_request = time.monotonic()
+        logger.info(f"CLI daemon listening on {self.path} (pid {os.getpid()})")
+
+        try:
+            while self._running:
+                remaining = self.idle_timeout - (time.monotonic() - last_request)
+                if remaining <= 0:
+                    logger.info("CLI daemon idle timeout reached")
+                    break
+                self._sock.settimeout(min(remaining, 5.0))
+                try:
+                    conn, _ = self._sock.accept()
+                except TimeoutError:
+                    if self.is_stale():
+                        logger.info("CLI daemon package files changed; exiting")
+                        break
+                    continue
+                last_request = time.monotonic()
+                conn.settimeout(None)
+                with conn:
+                    try:
+                        self._handle(conn)
+                    except OSError as e:
+                        # The client went away (e.g. a status probe timed out)
+                        logger.debug(f"CLI daemon lost a client connection: {e}")
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop serving and remove the socket file."""
+        self._running = False
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+            self.path.unlink(missing_ok=True)
+
+    def _handle(self, conn: socket.socket) -> None:
+        if not _peer_is_owner(conn):
+            logger.warning("CLI daemon rejected a connection from another user")
+            return
+        try:
+            request, fds = _recv_message(conn, maxfds=3)
+        except (ConnectionError, ValueError, OSError) as e:
+            logger.debug(f"CLI daemon dropped malformed request: {e}")
+            return
+
+        try:
+            command = request.get("command", "run")
+            if command == "status":
+                _send_message(conn, self.status())
+            elif command == "stop":
+                _send_message(conn, {"status": "stopping"})
+                self._running = False
+            elif self.is_stale():
+                _send_message(conn, {"status": "stale"})
+                self._running = False
+            elif len(fds) != 3:
+                _send_message(conn, {"status": "error", "error": "stdio descriptors missing"})
+            else:
+                self._fork_command(conn, request, fds)
+                self.requests_served += 1
+                self.warm_project(request.get("cwd", ""))
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def status(self) -> dict[str, Any]:
+        """Describe the running daemon."""
+        return {
+            "status": "running",
+            "pid": os.getpid(),
+            "uptime": round(time.time() - self.started_at, 1),
+            "requests_served": self.requests_served,
+            "idle_timeout": self.idle_timeout,
+            "warm_projects": sorted(self._warm_projects),
+        }
+
+    def _fork_command(self, conn: socket.socket, request: dict[str, Any], fds: list[int]) -> None:
+        pid = os.fork()
+        if pid:
+            return
+
+        # ----- Child: becomes the command process -----
+        code = 1
+        try:
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            if self._sock is not None:
+                self._sock.close()
+            _send_message(conn, {"status": "started", "pid": os.getpid()})
+            code = self._run_child(request, fds)
+        except BaseException as e:  # noqa: BLE001
+            # INTENTIONAL: Nothing may escape the forked child
+            try:
+                print(f"attune daemon: {e}", file=sys.stderr)
+            except Exception:  # noqa: BLE001
+                pass
+        finally:
+            try:
+                _send_message(conn, {"status": "exited", "code": code})
+            except OSError:
+                pass
+            os._exit(code)
+
+    def _run_child(self, request: dict[str, Any], fds: list[int]) -> int:
+        # The daemon's own log handler must not leak into command output
+        logger.handlers.clear()
+        logger.propagate = True
+        logger.setLevel(logging.NOTSET)
+
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+        for fd in fds:
+            os.close(fd)
+
+        sys.stdin = open(0, encoding="utf-8", closefd=False)  # noqa: SIM115
+        sys.stdout = open(  # noqa: SIM115
+            1, "w", buffering=1 if os.isatty(1) else -1, encoding="utf-8", closefd=False
+        )
+        sys.stderr = open(2, "w", buffering=1, encoding="utf-8", closefd=False)  # noqa: SIM115
+
+        os.environ.clear()
+        os.environ.update(request.get("env", {}))
+        os.chdir(request.get("cwd", "."))
+        argv = list(request.get("argv", []))
+        sys.argv = ["attune", *argv]
+
+        import atexit
+
+        try:
+            result = self.runner(argv)
+            code = result if isinstance(result, int) else 0
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except KeyboardInterrupt:
+            code = 130
+        finally:
+            atexit._run_exitfuncs()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        return code
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+
+def _connect(path: Path, timeout: float | None = None) -> socket.socket | None:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(path))
+        return sock
+    except OSError:
+        sock.close()
+        return None
+
+
+def request(command: str, path: Path | None = None) -> dict[str, Any] | None:
+    """Send a control command ("status" or "stop") to a running daemon.
+
+    Returns:
+        The daemon's reply, or None if no daemon is listening
+
+    """
+    sock = _connect(path or socket_path(), timeout=5.0)
+    if sock is None:
+        return None
+    with sock:
+        _send_message(sock, {"command": command})
+        try:
+            reply, _ = _recv_message(sock)
+        except (ConnectionError, OSError):
+            return None
+        return reply
+
+
+def forward(
+    argv: list[str],
+    path: Path | None = None,
+    stdio: tuple[int, int, int] = (0, 1, 2),
+) -> int | None:
+    """Run a CLI command in the warm daemon.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+        path: Socket path (defaults to ``socket_path()``)
+        stdio: File descriptors to use as the command's stdin/stdout/stderr
+
+    Returns:
+        The command's exit code, or None if the caller should run the
+        command itself (no daemon, stale daemon, or unsupported platform)
+
+    """
+    if not SUPPORTED:
+        return None
+    path = path or socket_path()
+    sock = _connect(path)
+    if sock is None:
+        return None
+
+    with sock:
+        try:
+            _send_message(
+                sock,
+                {"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)},
+                fds=list(stdio),
+            )
+            reply, _ = _recv_message(sock)
+        except (ConnectionError, OSError):
+            return None
+        if reply.get("status") != "started":
+            return None
+
+        child_pid = reply.get("pid")
+        while True:
+            try:
+                reply, _ = _recv_message(sock)
+                return int(reply.get("code", 1))
+            except KeyboardInterrupt:
+                # Relay Ctrl+C to the command, then keep waiting for its exit
+                if child_pid:
+                    try:
+                        os.kill(child_pid, signal.SIGINT)
+                    except ProcessLookupError:
+                        return 130
+            except (ConnectionError, OSError):
+                return 1
+
+
+def spawn_daemon(
+    path: Path | None = None,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    wait: bool = True,
+) -> bool:
+    """Start a detached daemon process.
+
+    Args:
+        path: Socket path (defaults to ``socket_path()``)
+        idle_timeout: Seconds without requests before the daemon exits
+        wait: Block until the daemon accepts connections
+
+    Returns:
+        True if the daemon is (or, without ``wait``, was asked to be) running
+
+    """
+    import subprocess
+
+    path = path or socket_path()
+    path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    log_path = path.with_suffix(".log")
+    env = {k: v for k, v in os.environ.items() if k != ENV_VAR}
+    with open(log_path, "ab") as log:
+        subprocess.Popen(  # noqa: S603
+            [
+                sys.executable,
+                "-m",
+                "attune.cli_daemon",
+                "--socket",
+                str(path),
+                "--idle-timeout",
+                str(idle_timeout),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+            env=env,
+        )
+
+    if not wait:
+        return True
+    deadline = time.monotonic() + DEFAULT_START_TIMEOUT
+    while time.monotonic() < deadline:
+        sock = _connect(path, timeout=1.0)
+        if sock is not None:
+            sock.close()
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def maybe_forward(argv: list[str]) -> int | None:
+    """Forward to the daemon when enabled via ``ATTUNE_DAEMON``.
+
+    Returns:
+        The exit code from the daemon, or None to run the command locally
+
+    """
+    mode = os.environ.get(ENV_VAR, "").lower()
+    if IN_DAEMON or mode not in ("1", "true", "auto") or argv[:1] == ["daemon"]:
+        return None
+
+    code = forward(argv)
+    if code is None and mode == "auto" and SUPPORTED:
+        spawn_daemon(wait=False)  # Warm for the next invocation
+    return code
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the daemon in the foreground (used by ``spawn_daemon``)."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m attune.cli_daemon")
+    parser.add_argument("--socket", type=Path, default=None, help="Unix socket path")
+    parser.add_argument(
+        "--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT, help="Idle seconds"
+    )
+    parser.add_argument("--watch", type=Path, default=PACKAGE_DIR, help="Directory to watch")
+    parser.add_argument("--runner", help="Command runner as module:function")
+    args = parser.parse_args(argv)
+
+    # Configure only this module's logger: forked commands inherit the root
+    # logger and must still see the CLI's own logging defaults.
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    runner = _default_runner
+    if args.runner:
+        import importlib
+
+        module_name, _, func_name = args.runner.partition(":")
+        runner = getattr(importlib.import_module(module_name), func_name)
+
+    daemon = CLIDaemon(args.socket, args.idle_timeout, args.watch, runner)
+    try:
+        daemon.bind()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    daemon.warm_up()
+    daemon.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
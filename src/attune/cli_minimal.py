@@ -29,6 +29,9 @@ Utility commands:
     attune validate                   Validate configuration
     attune version                    Show version
 
+    attune daemon start|stop|status   Warm background daemon (opt-in with
+                                      ATTUNE_DAEMON=1 or ATTUNE_DAEMON=auto)
+
 For interactive development, use Claude Code skills:
     /dev        Developer tools (commit, review, debug, refactor)
     /testing    Run tests, coverage, generate tests
@@ -44,6 +47,11 @@ import argparse
 import logging
 import sys
 
+from attune.cli_commands.daemon_commands import (  # noqa: F401
+    cmd_daemon_start,
+    cmd_daemon_status,
+    cmd_daemon_stop,
+)
 from attune.cli_commands.provider_commands import (  # noqa: F401
     cmd_provider_set,
     cmd_provider_show,
@@ -223,6 +231,31 @@ Documentation: https://smartaimemory.com/framework-docs/
     start_parser.add_argument(
         "--port", type=int, default=8000, help="Port to bind to (default: 8000)"
     )
+    start_parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Serve a shared snapshot with ETag/304 and push updates (SSE)",
+    )
+
+    # --- Daemon commands ---
+    daemon_parser = subparsers.add_parser("daemon", help="Warm background CLI daemon")
+    daemon_sub = daemon_parser.add_subparsers(dest="daemon_command")
+
+    # daemon start
+    daemon_start_parser = daemon_sub.add_parser("start", help="Start the daemon")
+    daemon_start_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=900.0,
+        help="Exit after this many idle seconds (default: 900)",
+    )
+    daemon_start_parser.add_argument(
+        "--foreground", action="store_true", help="Run in the foreground"
+    )
+
+    # daemon stop / status
+    daemon_sub.add_parser("stop", help="Stop the daemon")
+    daemon_sub.add_parser("status", help="Show daemon status")
 
     # --- Setup command ---
     subparsers.add_parser("setup", help="Install slash commands to ~/.claude/commands/")
@@ -237,6 +270,13 @@ Documentation: https://smartaimemory.com/framework-docs/
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
+    # Opt-in warm daemon (ATTUNE_DAEMON=1|auto); falls back to running here
+    from attune.cli_daemon import maybe_forward
+
+    exit_code = maybe_forward(sys.argv[1:] if argv is None else list(argv))
+    if exit_code is not None:
+        return exit_code
+
     parser = create_parser()
     args = parser.parse_args(argv)
 
@@ -294,7 +334,18 @@ def main(argv: list[str] | None = None) -> int:
         if args.dashboard_command == "start":
             return cmd_dashboard_start(args)
         else:
-            print("Usage: attune dashboard start [--host HOST] [--port PORT]")
+            print("Usage: attune dashboard start [--host HOST] [--port PORT] [--live]")
+            return 1
+
+    elif args.command == "daemon":
+        if args.daemon_command == "start":
+            return cmd_daemon_start(args)
+        elif args.daemon_command == "stop":
+            return cmd_daemon_stop(args)
+        elif args.daemon_command == "status":
+            return cmd_daemon_status(args)
+        else:
+            print("Usage: attune daemon {start|stop|status}")
             return 1
 
     elif args.command == "setup":
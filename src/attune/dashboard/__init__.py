@@ -10,6 +10,10 @@ Usage (Simple Server - Uses Telemetry API):
     >>> from attune.dashboard import run_simple_dashboard
     >>> run_simple_dashboard(host="0.0.0.0", port=8080)
 
+Usage (Live - Shared Snapshot, ETag/304 and Server-Sent Events):
+    >>> from attune.dashboard import run_live_dashboard
+    >>> run_live_dashboard(host="0.0.0.0", port=8080)
+
 Usage (FastAPI - Requires fastapi and uvicorn):
     >>> from attune.dashboard import run_dashboard
     >>> run_dashboard(host="0.0.0.0", port=8080)
@@ -28,6 +32,8 @@ Licensed under the Apache License, Version 2.0
 
 # Standalone server - reads directly from Redis
 # Simple server - uses telemetry API classes
+# Live server - one shared snapshot for all viewers, pushed over SSE
+from .live_server import run_live_dashboard
 from .simple_server import run_simple_dashboard
 from .standalone_server import run_standalone_dashboard
 
@@ -35,7 +41,13 @@ from .standalone_server import run_standalone_dashboard
 try:
     from .app import app, run_dashboard
 
-    __all__ = ["app", "run_dashboard", "run_simple_dashboard", "run_standalone_dashboard"]
+    __all__ = [
+        "app",
+        "run_dashboard",
+        "run_live_dashboard",
+        "run_simple_dashboard",
+        "run_standalone_dashboard",
+    ]
 except ImportError:
     # FastAPI not installed
-    __all__ = ["run_simple_dashboard", "run_standalone_dashboard"]
+    __all__ = ["run_live_dashboard", "run_simple_dashboard", "run_standalone_dashboard"]
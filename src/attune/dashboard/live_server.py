@@ -0,0 +1,987 @@
+"""Live Dashboard Server - Shared Snapshot with Push Updates.
+
+The simple and standalone servers query Redis on every API request, so
+Redis load grows with the number of open browsers. This backend mode
+decouples the two:
+
+- One background ``SnapshotAggregator`` thread refreshes a shared,
+  versioned snapshot of every dashboard section on a fixed interval,
+  reading event streams incrementally with ``XREAD``.
+- A threaded HTTP server answers ``/api/*`` requests from that snapshot,
+  with ``ETag``/``If-None-Match`` support so unchanged polls get ``304``.
+- ``/api/stream`` is a Server-Sent Events endpoint that sends the full
+  snapshot on connect and then only the sections that changed.
+
+Redis work is therefore proportional to the refresh interval, not to the
+number of viewers.
+
+Usage:
+    >>> from attune.dashboard.live_server import run_live_dashboard
+    >>> run_live_dashboard(host="0.0.0.0", port=8080, source="standalone")
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import secrets
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from http.server import ThreadingHTTPServer
+from typing import Any, Protocol
+from urllib.parse import parse_qs, urlparse
+
+from attune.telemetry import (
+    ApprovalGate,
+    CoordinationSignals,
+    FeedbackLoop,
+    HeartbeatCoordinator,
+    StreamEvent,
+)
+
+from .simple_server import DashboardHandler
+
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_INTERVAL = 2.0  # Seconds between snapshot refreshes
+DEFAULT_KEEPALIVE_INTERVAL = 15.0  # Seconds between SSE keep-alive comments
+DEFAULT_MAX_EVENTS = 200  # Events retained per stream
+DEFAULT_MAX_SIGNALS = 200  # Signals retained in the snapshot
+
+SNAPSHOT_SECTIONS = (
+    "health",
+    "agents",
+    "signals",
+    "events",
+    "approvals",
+    "feedback_workflows",
+    "underperforming",
+)
+
+EVENT_STREAMS = ("workflow_progress", "agent_heartbeat", "coordination_signal")
+
+FEEDBACK_WORKFLOWS = ("code-review", "test-generation", "refactoring")
+FEEDBACK_STAGES = ("analysis", "generation", "validation")
+FEEDBACK_TIERS = ("cheap", "capable", "premium")
+
+
+class SnapshotSource(Protocol):
+    """Backend that produces dashboard sections for the aggregator."""
+
+    def collect(self) -> dict[str, Any]:
+        """Return the current data for each section in ``SNAPSHOT_SECTIONS``."""
+        ...
+
+    def respond_to_approval(self, request_id: str, approved: bool, reason: str) -> bool:
+        """Approve or reject a pending approval request."""
+        ...
+
+
+def _encode(data: Any) -> bytes:
+    return json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.sha1(body, usedforsecurity=False).hexdigest()}"'
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+# =============================================================================
+# Snapshot aggregation
+# =============================================================================
+
+
+@dataclass
+class SnapshotSection:
+    """One section of the shared snapshot.
+
+    Attributes:
+        data: JSON-serializable section payload
+        body: Encoded payload served to clients
+        etag: Strong validator derived from the source data
+        version: Snapshot version at which this section last changed
+        updated_at: When this section last changed
+    """
+
+    data: Any
+    body: bytes
+    etag: str
+    version: int
+    updated_at: datetime
+
+
+class SnapshotAggregator:
+    """Single background refresher for a shared, versioned dashboard snapshot.
+
+    Every refresh asks the source for all sections, compares each one with
+    the stored copy, and bumps the snapshot version only for sections whose
+    content changed. Readers never touch the source; they read the stored
+    sections or block in ``wait_for_change`` until the version moves.
+
+    Args:
+        source: Backend producing section data
+        refresh_interval: Seconds between refreshes
+    """
+
+    def __init__(
+        self,
+        source: SnapshotSource,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+    ):
+        self.source = source
+        self.refresh_interval = refresh_interval
+        self.epoch = secrets.token_hex(4)  # Distinguishes versions across restarts
+        self.refresh_count = 0
+        self._version = 0
+        self._sections: dict[str, SnapshotSection] = {}
+        self._changed = threading.Condition()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._refresh_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def version(self) -> int:
+        """Current snapshot version (0 before the first refresh)."""
+        return self._version
+
+    @property
+    def stopped(self) -> bool:
+        """Whether ``stop`` has been called."""
+        return self._stopped.is_set()
+
+    def start(self) -> None:
+        """Take an initial snapshot and start the background refresher."""
+        if self._thread is not None:
+            return
+        self.refresh()
+        self._thread = threading.Thread(target=self._run, name="dashboard-aggregator", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the refresher and release any waiting readers."""
+        self._stopped.set()
+        self._wake.set()
+        with self._changed:
+            self._changed.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def request_refresh(self) -> None:
+        """Wake the refresher early, e.g. after an approval was answered."""
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self.refresh_interval)
+            self._wake.clear()
+            if self._stopped.is_set():
+                break
+            self.refresh()
+
+    def refresh(self) -> list[str]:
+        """Collect all sections once and store the ones that changed.
+
+        Returns:
+            Names of the sections that changed
+        """
+        with self._refresh_lock:
+            try:
+                collected = self.source.collect()
+            except Exception as e:  # noqa: BLE001
+                # INTENTIONAL: Keep serving the last good snapshot
+                logger.warning(f"Dashboard snapshot refresh failed: {e}")
+                return []
+
+            self.refresh_count += 1
+            now = datetime.utcnow()
+            updates: dict[str, SnapshotSection] = {}
+            for name, data in collected.items():
+                digest = _encode(data)
+                etag = _etag(digest)
+                current = self._sections.get(name)
+                if current is not None and current.etag == etag:
+                    continue
+                if name == "health":
+                    # Stamp health when its content changes so the
+                    # timestamp itself does not defeat change detection.
+                    data = {**data, "timestamp": now.isoformat()}
+                updates[name] = SnapshotSection(
+                    data=data,
+                    body=json.dumps(data, default=str).encode("utf-8"),
+                    etag=etag,
+                    version=0,
+                    updated_at=now,
+                )
+
+            if not updates:
+                return []
+
+            with self._changed:
+                self._version += 1
+                for section in updates.values():
+                    section.version = self._version
+                self._sections.update(updates)
+                self._changed.notify_all()
+
+            logger.debug(f"Dashboard snapshot v{self._version}: {sorted(updates)}")
+            return list(updates)
+
+    def get(self, name: str) -> SnapshotSection | None:
+        """Get a section from the current snapshot."""
+        return self._sections.get(name)
+
+    def snapshot(self) -> tuple[int, dict[str, Any]]:
+        """Get the current version and data for every section."""
+        with self._changed:
+            return self._version, {n: s.data for n, s in self._sections.items()}
+
+    def changes_since(self, version: int) -> tuple[int, dict[str, Any]]:
+        """Get the sections that changed after ``version``.
+
+        Args:
+            version: Snapshot version the caller already has
+
+        Returns:
+            Tuple of (current version, {section: data} for changed sections)
+        """
+        with self._changed:
+            changed = {n: s.data for n, s in self._sections.items() if s.version > version}
+            return self._version, changed
+
+    def wait_for_change(self, version: int, timeout: float) -> int:
+        """Block until the snapshot moves past ``version`` or ``timeout`` expires.
+
+        Returns:
+            The current snapshot version
+        """
+        with self._changed:
+            self._changed.wait_for(
+                lambda: self._version > version or self._stopped.is_set(), timeout=timeout
+            )
+            return self._version
+
+
+# =============================================================================
+# Sources
+# =============================================================================
+
+
+class RedisStreamTail:
+    """Incremental reader for the dashboard's Redis event streams.
+
+    The first poll seeds each stream with its newest ``max_events`` entries
+    via ``XREVRANGE``. Later polls issue a single ``XREAD`` from the last
+    seen IDs, so only new entries cross the wire. A stream that returns a
+    full ``max_events`` batch has at least a whole window of new entries;
+    ``XREAD`` returns the oldest of them, so that stream is reseeded from
+    its newest entries instead of falling further behind on every poll.
+
+    Args:
+        streams: Event types to follow (stream key is ``stream:{type}``)
+        max_events: Entries retained per stream
+    """
+
+    def __init__(
+        self,
+        streams: tuple[str, ...] = EVENT_STREAMS,
+        max_events: int = DEFAULT_MAX_EVENTS,
+    ):
+        self.max_events = max_events
+        self._keys = [f"stream:{name}" for name in streams]
+        self._last_ids: dict[str, str] = {}
+        self._events: dict[str, deque[dict[str, Any]]] = {
+            key: deque(maxlen=max_events) for key in self._keys
+        }
+
+    def reset(self) -> None:
+        """Forget read positions so the next poll reseeds (e.g. after reconnect)."""
+        self._last_ids.clear()
+        for events in self._events.values():
+            events.clear()
+
+    def poll(self, client: Any) -> list[dict[str, Any]]:
+        """Read new entries and return retained events, newest first.
+
+        Args:
+            client: Redis client
+
+        Returns:
+            Event dicts in the ``/api/events`` response shape
+        """
+        if not self._last_ids:
+            for key in self._keys:
+                self._seed(client, key)
+        else:
+            response = client.xread(dict(self._last_ids), count=self.max_events) or []
+            for key, entries in response:
+                key = _decode(key)
+                if len(entries) >= self.max_events:
+                    self._seed(client, key)
+                elif entries:
+                    self._last_ids[key] = _decode(entries[-1][0])
+                    self._append(key, entries)
+
+        events = [event for stream in self._events.values() for event in stream]
+        events.sort(key=lambda e: e.get("timestamp") or "", reverse=True)
+        return events[: self.max_events]
+
+    def _seed(self, client: Any, key: str) -> None:
+        """Replace a stream's retained events with its newest entries."""
+        entries = client.xrevrange(key, count=self.max_events)
+        self._last_ids[key] = _decode(entries[0][0]) if entries else "0-0"
+        self._events[key].clear()
+        self._append(key, reversed(entries))
+
+    def _append(self, key: str, entries: Any) -> None:
+        for entry_id, fields in entries:
+            event = StreamEvent.from_redis_entry(_decode(entry_id), fields)
+            self._events[key].append(event.to_dict())
+
+
+class StandaloneSnapshotSource:
+    """Snapshot source that reads the raw Redis key layout directly.
+
+    Mirrors the data shapes of ``standalone_server`` but batches reads:
+    ``SCAN`` plus one ``MGET`` per key family instead of ``KEYS`` and a
+    ``GET`` per key, and incremental stream reads for events.
+
+    Args:
+        host: Redis host
+        port: Redis port
+        client: Pre-built Redis client (overrides host/port)
+        max_events: Events retained per stream
+        max_signals: Signals retained in the snapshot
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        client: Any = None,
+        max_events: int = DEFAULT_MAX_EVENTS,
+        max_signals: int = DEFAULT_MAX_SIGNALS,
+    ):
+        self.host = host
+        self.port = port
+        self.max_signals = max_signals
+        self._client = client
+        self._tail = RedisStreamTail(max_events=max_events)
+
+    def _get_client(self) -> Any:
+        if self._client is None and REDIS_AVAILABLE:
+            try:
+                client = redis.Redis(host=self.host, port=self.port, decode_responses=False)
+                client.ping()
+                self._client = client
+                self._tail.reset()
+            except Exception as e:  # noqa: BLE001
+                # INTENTIONAL: Dashboard runs degraded until Redis is reachable
+                logger.error(f"Failed to connect to Redis: {e}")
+        return self._client
+
+    def _load(self, client: Any, pattern: bytes) -> list[dict[str, Any]]:
+        keys = list(client.scan_iter(match=pattern, count=500))
+        if not keys:
+            return []
+        records = []
+        for key, raw in zip(keys, client.mget(keys), strict=True):
+            if not raw:
+                continue
+            try:
+                records.append(json.loads(_decode(raw)))
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse {_decode(key)}: {e}")
+        return records
+
+    def collect(self) -> dict[str, Any]:
+        """Collect every dashboard section from Redis."""
+        client = self._get_client()
+        if client is None:
+            return {
+                "health": {
+                    "status": "degraded",
+                    "redis_available": False,
+                    "active_agents": 0,
+                    "pending_approvals": 0,
+                },
+                **{name: [] for name in SNAPSHOT_SECTIONS if name != "health"},
+            }
+
+        try:
+            return self._collect(client)
+        except Exception:
+            # Drop the connection so the next refresh reconnects and reseeds
+            self._client = None
+            raise
+
+    def _collect(self, client: Any) -> dict[str, Any]:
+        agents = [
+            {
+                "agent_id": hb.get("agent_id"),
+                "status": hb.get("status"),
+                "last_seen": hb.get("timestamp"),
+                "progress": hb.get("progress", 0.0),
+                "current_task": hb.get("current_task", "Unknown"),
+                "metadata": hb.get("metadata", {}),
+            }
+            for hb in self._load(client, b"heartbeat:*")
+        ]
+        agents.sort(key=lambda a: a["agent_id"] or "")
+
+        signals = [
+            {
+                "signal_type": sig.get("signal_type"),
+                "source_agent": sig.get("source_agent"),
+                "target_agent": sig.get("target_agent"),
+                "timestamp": sig.get("timestamp"),
+                "payload": sig.get("payload", {}),
+            }
+            for sig in self._load(client, b"empathy:signal:*")
+        ]
+        signals.sort(key=lambda s: s.get("timestamp") or "", reverse=True)
+
+        approvals = [
+            {
+                "request_id": req.get("request_id"),
+                "approval_type": req.get("approval_type"),
+                "agent_id": req.get("agent_id"),
+                "context": req.get("context", {}),
+                "timestamp": req.get("timestamp"),
+                "timeout_seconds": req.get("timeout_seconds", 300),
+            }
+            for req in self._load(client, b"approval_request:*")
+        ]
+        approvals.sort(key=lambda r: r.get("timestamp") or "")
+
+        pending = sum(1 for _ in client.scan_iter(match=b"approval:pending:*", count=500))
+        feedback_workflows, underperforming = self._feedback(self._load(client, b"feedback:*"))
+
+        return {
+            "health": {
+                "status": "healthy",
+                "redis_available": True,
+                "active_agents": len(agents),
+                "pending_approvals": pending,
+            },
+            "agents": agents,
+            "signals": signals[: self.max_signals],
+            "events": self._tail.poll(client),
+            "approvals": approvals,
+            "feedback_workflows": feedback_workflows,
+            "underperforming": underperforming,
+        }
+
+    @staticmethod
+    def _feedback(entries: list[dict[str, Any]]) -> tuple[list[dict], list[dict]]:
+        by_tier: dict[tuple, list[float]] = {}
+        by_stage: dict[tuple, list[float]] = {}
+        for entry in entries:
+            workflow = entry.get("workflow_name")
+            stage = entry.get("stage_name")
+            quality = entry.get("quality_score")
+            if quality is None:
+                continue
+            by_tier.setdefault((workflow, stage, entry.get("tier")), []).append(quality)
+            by_stage.setdefault((workflow, stage), []).append(quality)
+
+        workflows = [
+            {
+                "workflow_name": workflow,
+                "stage_name": stage,
+                "tier": tier,
+                "avg_quality": sum(qualities) / len(qualities),
+                "sample_count": len(qualities),
+                "trend": 0,  # Simplified - no trend calculation
+            }
+            for (workflow, stage, tier), qualities in sorted(by_tier.items(), key=str)
+        ]
+        # All stages are kept; the threshold is applied per request.
+        stages = [
+            {
+                "workflow_name": workflow,
+                "stage_name": stage,
+                "avg_quality": sum(qualities) / len(qualities),
+                "sample_count": len(qualities),
+                "min_quality": min(qualities),
+                "max_quality": max(qualities),
+                "trend": 0,
+            }
+            for (workflow, stage), qualities in by_stage.items()
+        ]
+        stages.sort(key=lambda s: (s["avg_quality"], str(s["stage_name"])))
+        return workflows, stages
+
+    def respond_to_approval(self, request_id: str, approved: bool, reason: str) -> bool:
+        """Resolve an approval by removing its pending key."""
+        client = self._get_client()
+        if client is None:
+            return False
+        return bool(client.delete(f"approval:pending:{request_id}".encode()))
+
+
+class TelemetrySnapshotSource:
+    """Snapshot source built on the telemetry API classes.
+
+    Mirrors the data shapes of ``simple_server``. The coordinator, signal,
+    approval and feedback helpers are created once and reused for every
+    refresh instead of once per HTTP request.
+
+    Args:
+        memory: Memory backend with a Redis connection (created lazily)
+        max_events: Events retained per stream
+        max_signals: Signals retained in the snapshot
+    """
+
+    def __init__(
+        self,
+        memory: Any = None,
+        max_events: int = DEFAULT_MAX_EVENTS,
+        max_signals: int = DEFAULT_MAX_SIGNALS,
+    ):
+        self.max_signals = max_signals
+        self._memory = memory
+        self._tail = RedisStreamTail(max_events=max_events)
+        self._helpers: tuple | None = None
+
+    def _get_helpers(self) -> tuple:
+        if self._helpers is None:
+            if self._memory is None:
+                from attune.memory.short_term import RedisShortTermMemory
+
+                self._memory = RedisShortTermMemory()
+            self._helpers = (
+                HeartbeatCoordinator(memory=self._memory),
+                CoordinationSignals(memory=self._memory, agent_id="*"),
+                ApprovalGate(memory=self._memory),
+                FeedbackLoop(memory=self._memory),
+            )
+        return self._helpers
+
+    def collect(self) -> dict[str, Any]:
+        """Collect every dashboard section through the telemetry API."""
+        coordinator, signals, gate, feedback = self._get_helpers()
+        client = getattr(self._memory, "_client", None)
+        has_redis = client is not None
+
+        agents = [
+            {
+                "agent_id": hb.agent_id,
+                "display_name": hb.display_name,
+                "status": hb.status,
+                "last_seen": hb.last_beat.isoformat(),
+                "progress": hb.progress,
+                "current_task": hb.current_task,
+                "metadata": hb.metadata,
+            }
+            for hb in coordinator.get_active_agents()
+        ]
+        agents.sort(key=lambda a: a["agent_id"])
+
+        pending = gate.get_pending_approvals()
+        approvals = [
+            {
+                "request_id": req.request_id,
+                "approval_type": req.approval_type,
+                "agent_id": req.agent_id,
+                "context": req.context,
+                "timestamp": req.timestamp.isoformat(),
+                "timeout_seconds": req.timeout_seconds,
+            }
+            for req in pending
+        ]
+
+        recent_signals = [
+            {
+                "signal_type": sig.signal_type,
+                "source_agent": sig.source_agent,
+                "target_agent": sig.target_agent,
+                "timestamp": sig.timestamp.isoformat(),
+                "payload": sig.payload,
+            }
+            for sig in signals.get_pending_signals()
+        ]
+        recent_signals.sort(key=lambda s: s["timestamp"], reverse=True)
+
+        return {
+            "health": {
+                "status": "healthy" if has_redis else "degraded",
+                "redis_available": has_redis,
+                "active_agents": len(agents),
+                "pending_approvals": len(approvals),
+            },
+            "agents": agents,
+            "signals": recent_signals[: self.max_signals],
+            "events": self._tail.poll(client) if has_redis else [],
+            "approvals": approvals,
+            "feedback_workflows": self._feedback_workflows(feedback),
+            "underperforming": self._underperforming(feedback),
+        }
+
+    @staticmethod
+    def _feedback_workflows(feedback: FeedbackLoop) -> list[dict[str, Any]]:
+        results = []
+        for workflow in FEEDBACK_WORKFLOWS:
+            for stage in FEEDBACK_STAGES:
+                for tier in FEEDBACK_TIERS:
+                    stats = feedback.get_quality_stats(workflow, stage, tier=tier)
+                    if stats and stats.sample_count > 0:
+                        results.append(
+                            {
+                                "workflow_name": workflow,
+                                "stage_name": stage,
+                                "tier": tier,
+                                "avg_quality": stats.avg_quality,
+                                "sample_count": stats.sample_count,
+                                "trend": stats.recent_trend,
+                            }
+                        )
+        return results
+
+    @staticmethod
+    def _underperforming(feedback: FeedbackLoop) -> list[dict[str, Any]]:
+        # All stages are kept; the threshold is applied per request.
+        results = []
+        for workflow in FEEDBACK_WORKFLOWS:
+            for stage_name, stats in feedback.get_underperforming_stages(
+                workflow, quality_threshold=float("inf")
+            ):
+                results.append(
+                    {
+                        "workflow_name": workflow,
+                        "stage_name": stage_name,
+                        "avg_quality": stats.avg_quality,
+                        "sample_count": stats.sample_count,
+                        "min_quality": stats.min_quality,
+                        "max_quality": stats.max_quality,
+                        "trend": stats.recent_trend,
+                    }
+                )
+        results.sort(key=lambda s: (s["avg_quality"], s["stage_name"]))
+        return results
+
+    def respond_to_approval(self, request_id: str, approved: bool, reason: str) -> bool:
+        """Resolve an approval through the ApprovalGate."""
+        _, _, gate, _ = self._get_helpers()
+        return gate.respond_to_approval(
+            request_id=request_id, approved=approved, responder="dashboard", reason=reason
+        )
+
+
+# =============================================================================
+# HTTP server
+# =============================================================================
+
+
+class LiveDashboardServer(ThreadingHTTPServer):
+    """Threaded HTTP server that owns the shared snapshot aggregator."""
+
+    daemon_threads = True
+
+    def __init__(self, server_address, handler_class, aggregator: SnapshotAggregator):
+        self.aggregator = aggregator
+        super().__init__(server_address, handler_class)
+
+    def server_close(self) -> None:
+        """Stop the aggregator (ending SSE streams) and close the socket."""
+        self.aggregator.stop()
+        super().server_close()
+
+
+class LiveDashboardHandler(DashboardHandler):
+    """HTTP handler that answers from the shared snapshot.
+
+    Inherits static file serving and JSON helpers from ``DashboardHandler``;
+    no request reaches Redis except approval responses.
+    """
+
+    keepalive_interval = DEFAULT_KEEPALIVE_INTERVAL
+
+    @property
+    def aggregator(self) -> SnapshotAggregator:
+        """Aggregator shared by all requests on this server."""
+        return self.server.aggregator
+
+    def do_GET(self):
+        """Handle GET requests."""
+        parsed = urlparse(self.path)
+        path = parsed.path
+        query = parse_qs(parsed.query)
+
+        if path == "/" or path == "/index.html":
+            self.serve_file("index.html", "text/html")
+        elif path == "/static/style.css":
+            self.serve_file("style.css", "text/css")
+        elif path == "/static/app.js":
+            self.serve_file("app.js", "application/javascript")
+        elif path == "/api/stream":
+            self.api_stream()
+        elif path == "/api/health":
+            self.send_section("health")
+        elif path == "/api/agents":
+            self.send_section("agents")
+        elif path.startswith("/api/agents/"):
+            self.api_agent_detail(path.split("/")[-1])
+        elif path == "/api/signals":
+            limit = self._query_number(query, "limit", 50, int)
+            if limit is not None:
+                self.send_section("signals", lambda data: data[:limit])
+        elif path == "/api/events":
+            event_type = query.get("event_type", [None])[0]
+            limit = self._query_number(query, "limit", 100, int)
+            if limit is not None:
+                self.send_section(
+                    "events",
+                    lambda data: [
+                        e for e in data if not event_type or e["event_type"] == event_type
+                    ][:limit],
+                )
+        elif path == "/api/approvals":
+            self.send_section("approvals")
+        elif path == "/api/feedback/workflows":
+            self.send_section("feedback_workflows")
+        elif path == "/api/feedback/underperforming":
+            threshold = self._query_number(query, "threshold", 0.7, float)
+            if threshold is not None:
+                self.send_section(
+                    "underperforming",
+                    lambda data: [s for s in data if s["avg_quality"] < threshold],
+                )
+        else:
+            self.send_error(404, "Not Found")
+
+    def _query_number(
+        self, query: dict[str, list[str]], name: str, default: float, cast: type[float] | type[int]
+    ) -> float | None:
+        """Parse a numeric query parameter, answering 400 if it is malformed.
+
+        Returns:
+            The parsed value, or None after sending the error response
+        """
+        try:
+            return cast(query.get(name, [default])[0])
+        except ValueError:
+            self.send_error(400, f"Invalid {name}: expected a number")
+            return None
+
+    def _not_modified(self, etag: str) -> bool:
+        header = self.headers.get("If-None-Match")
+        if not header:
+            return False
+        candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+        return "*" in candidates or etag in candidates
+
+    def send_section(self, name: str, view=None):
+        """Send a snapshot section, honouring ``If-None-Match``.
+
+        Args:
+            name: Section name
+            view: Optional function deriving the response from section data
+        """
+        section = self.aggregator.get(name)
+        if section is None:
+            self.send_json({"error": "Snapshot not ready"}, status=503)
+            return
+
+        if view is None:
+            body, etag = section.body, section.etag
+        else:
+            body = json.dumps(view(section.data), default=str).encode("utf-8")
+            etag = _etag(body)
+
+        if self._not_modified(etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")  # CORS
+        self.end_headers()
+        self.wfile.write(body)
+
+    def api_agent_detail(self, agent_id: str):
+        """Get specific agent details from the snapshot."""
+        section = self.aggregator.get("agents")
+        agents = section.data if section else []
+        for agent in agents:
+            if agent.get("agent_id") == agent_id:
+                self.send_json(agent)
+                return
+        self.send_json({"error": f"Agent {agent_id} not found"}, status=404)
+
+    def _resume_version(self) -> int | None:
+        """Parse ``Last-Event-ID`` into a version from this server's epoch."""
+        last_id = self.headers.get("Last-Event-ID", "")
+        epoch, _, version = last_id.partition(":")
+        if epoch != self.aggregator.epoch or not version.isdigit():
+            return None
+        version_number = int(version)
+        return version_number if version_number <= self.aggregator.version else None
+
+    def _write_event(self, event: str, version: int, data: dict[str, Any]) -> None:
+        payload = json.dumps(data, default=str)
+        message = f"id: {self.aggregator.epoch}:{version}\nevent: {event}\ndata: {payload}\n\n"
+        self.wfile.write(message.encode("utf-8"))
+        self.wfile.flush()
+
+    def api_stream(self):
+        """Server-Sent Events stream of snapshot changes.
+
+        Sends a ``snapshot`` event with every section on connect (or a
+        ``delta`` when ``Last-Event-ID`` identifies a known version), then a
+        ``delta`` event with only the changed sections whenever the shared
+        snapshot moves. Idle connections get periodic keep-alive comments.
+        """
+        aggregator = self.aggregator
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.close_connection = True
+
+        try:
+            self.wfile.write(b"retry: 3000\n\n")
+            version = self._resume_version()
+            if version is None:
+                version, data = aggregator.snapshot()
+                self._write_event("snapshot", version, data)
+            else:
+                version, data = aggregator.changes_since(version)
+                if data:
+                    self._write_event("delta", version, data)
+
+            while not aggregator.stopped:
+                current = aggregator.wait_for_change(version, timeout=self.keepalive_interval)
+                if aggregator.stopped:
+                    break
+                if current == version:
+                    self.wfile.write(b": keep-alive\n\n")
+                    self.wfile.flush()
+                    continue
+                version, data = aggregator.changes_since(version)
+                self._write_event("delta", version, data)
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("Dashboard stream client disconnected")
+
+    def _respond(self, request_id: str, approved: bool, reason: str):
+        status, verb = ("approved", "approve") if approved else ("rejected", "reject")
+        try:
+            success = self.aggregator.source.respond_to_approval(request_id, approved, reason)
+        except Exception as e:  # noqa: BLE001
+            # INTENTIONAL: Report backend errors to the dashboard client
+            self.send_json({"error": str(e)}, status=500)
+            return
+
+        if success:
+            self.aggregator.request_refresh()
+            self.send_json({"status": status, "request_id": request_id})
+        else:
+            self.send_json({"error": f"Failed to {verb}"}, status=500)
+
+    def api_approve(self, request_id: str, reason: str):
+        """Approve request and refresh the snapshot."""
+        self._respond(request_id, True, reason)
+
+    def api_reject(self, request_id: str, reason: str):
+        """Reject request and refresh the snapshot."""
+        self._respond(request_id, False, reason)
+
+
+def create_live_server(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    source: str | SnapshotSource = "standalone",
+    refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+) -> LiveDashboardServer:
+    """Build a live dashboard server with a started aggregator.
+
+    Args:
+        host: Host to bind to
+        port: Port to bind to (0 picks a free port)
+        source: "standalone" (raw Redis keys), "telemetry" (telemetry API),
+            or a ``SnapshotSource`` instance
+        refresh_interval: Seconds between snapshot refreshes
+
+    Returns:
+        Server ready for ``serve_forever``
+
+    Raises:
+        ValueError: If ``source`` is an unknown name
+    """
+    if source == "standalone":
+        source = StandaloneSnapshotSource()
+    elif source == "telemetry":
+        source = TelemetrySnapshotSource()
+    elif isinstance(source, str):
+        raise ValueError(f"Unknown dashboard source: {source!r}")
+
+    aggregator = SnapshotAggregator(source, refresh_interval=refresh_interval)
+    aggregator.start()
+    return LiveDashboardServer((host, port), LiveDashboardHandler, aggregator)
+
+
+def run_live_dashboard(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    source: str = "standalone",
+    refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+):
+    """Run the live dashboard backed by a shared, push-updated snapshot.
+
+    Args:
+        host: Host to bind to (default: 127.0.0.1)
+        port: Port to bind to (default: 8000)
+        source: "standalone" (raw Redis keys) or "telemetry" (telemetry API)
+        refresh_interval: Seconds between snapshot refreshes (default: 2.0)
+
+    Example:
+        >>> from attune.dashboard.live_server import run_live_dashboard
+        >>> run_live_dashboard(host="0.0.0.0", port=8080)
+    """
+    if source == "standalone" and not REDIS_AVAILABLE:
+        print("⚠️  Warning: redis-py not installed. Install with: pip install redis")
+        print("   Dashboard will start but won't show data.")
+        print()
+
+    server = create_live_server(host, port, source=source, refresh_interval=refresh_interval)
+
+    print(f"🚀 Agent Coordination Dashboard (Live) running at http://{host}:{port}")
+    print(f"📊 Open in browser: http://{host}:{port}")
+    print(f"🔄 Shared snapshot refreshes every {refresh_interval:g}s; push updates at /api/stream")
+    print("Press Ctrl+C to stop")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n\n🛑 Shutting down dashboard...")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    run_live_dashboard()
@@ -13,7 +13,7 @@ import json
 import logging
 import threading
 from datetime import datetime
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 
@@ -430,7 +430,7 @@ def run_simple_dashboard(host: str = "127.0.0.1", port: int = 8000):
         >>> from attune.dashboard.simple_server import run_simple_dashboard
         >>> run_simple_dashboard(host="0.0.0.0", port=8080)
     """
-    server = HTTPServer((host, port), DashboardHandler)
+    server = ThreadingHTTPServer((host, port), DashboardHandler)
 
     print(f"🚀 Agent Coordination Dashboard running at http://{host}:{port}")
     print(f"📊 Open in browser: http://{host}:{port}")
@@ -14,7 +14,7 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 
@@ -530,7 +530,7 @@ def run_standalone_dashboard(host: str = "127.0.0.1", port: int = 8000):
         print("   Dashboard will start but won't show data.")
         print()
 
-    server = HTTPServer((host, port), StandaloneDashboardHandler)
+    server = ThreadingHTTPServer((host, port), StandaloneDashboardHandler)
 
     print(f"🚀 Agent Coordination Dashboard (Standalone) running at http://{host}:{port}")
     print(f"📊 Open in browser: http://{host}:{port}")
@@ -9,6 +9,8 @@ import logging
 import sys
 from typing import Any
 
+from attune.models.scheduler import Priority, llm_priority
+
 # MCP server will be implemented using stdio transport
 logger = logging.getLogger(__name__)
 
@@ -465,48 +467,54 @@ class EmpathyMCPServer:
             Tool execution result
         """
         try:
-            if tool_name == "security_audit":
-                return await self._run_security_audit(arguments)
-            elif tool_name == "bug_predict":
-                return await self._run_bug_predict(arguments)
-            elif tool_name == "code_review":
-                return await self._run_code_review(arguments)
-            elif tool_name == "test_generation":
-                return await self._run_test_generation(arguments)
-            elif tool_name == "performance_audit":
-                return await self._run_performance_audit(arguments)
-            elif tool_name == "release_prep":
-                return await self._run_release_prep(arguments)
-            elif tool_name == "auth_status":
-                return await self._get_auth_status()
-            elif tool_name == "auth_recommend":
-                return await self._get_auth_recommend(arguments)
-            elif tool_name == "telemetry_stats":
-                return await self._get_telemetry_stats(arguments)
-            elif tool_name == "dashboard_status":
-                return await self._get_dashboard_status()
-            elif tool_name == "memory_store":
-                return await self._handle_memory_store(arguments)
-            elif tool_name == "memory_retrieve":
-                return await self._handle_memory_retrieve(arguments)
-            elif tool_name == "memory_search":
-                return await self._handle_memory_search(arguments)
-            elif tool_name == "memory_forget":
-                return await self._handle_memory_forget(arguments)
-            elif tool_name == "empathy_get_level":
-                return await self._handle_empathy_get_level()
-            elif tool_name == "empathy_set_level":
-                return await self._handle_empathy_set_level(arguments)
-            elif tool_name == "context_get":
-                return await self._handle_context_get(arguments)
-            elif tool_name == "context_set":
-                return await self._handle_context_set(arguments)
-            else:
-                return {"success": False, "error": f"Unknown tool: {tool_name}"}
+            # Tool calls are interactive: admit their LLM calls ahead of batch work
+            with llm_priority(Priority.INTERACTIVE):
+                return await self._dispatch_tool(tool_name, arguments)
         except Exception as e:
             logger.exception(f"Tool execution failed: {tool_name}")
             return {"success": False, "error": str(e)}
 
+    async def _dispatch_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Route a tool call to its handler."""
+        if tool_name == "security_audit":
+            return await self._run_security_audit(arguments)
+        elif tool_name == "bug_predict":
+            return await self._run_bug_predict(arguments)
+        elif tool_name == "code_review":
+            return await self._run_code_review(arguments)
+        elif tool_name == "test_generation":
+            return await self._run_test_generation(arguments)
+        elif tool_name == "performance_audit":
+            return await self._run_performance_audit(arguments)
+        elif tool_name == "release_prep":
+            return await self._run_release_prep(arguments)
+        elif tool_name == "auth_status":
+            return await self._get_auth_status()
+        elif tool_name == "auth_recommend":
+            return await self._get_auth_recommend(arguments)
+        elif tool_name == "telemetry_stats":
+            return await self._get_telemetry_stats(arguments)
+        elif tool_name == "dashboard_status":
+            return await self._get_dashboard_status()
+        elif tool_name == "memory_store":
+            return await self._handle_memory_store(arguments)
+        elif tool_name == "memory_retrieve":
+            return await self._handle_memory_retrieve(arguments)
+        elif tool_name == "memory_search":
+            return await self._handle_memory_search(arguments)
+        elif tool_name == "memory_forget":
+            return await self._handle_memory_forget(arguments)
+        elif tool_name == "empathy_get_level":
+            return await self._handle_empathy_get_level()
+        elif tool_name == "empathy_set_level":
+            return await self._handle_empathy_set_level(arguments)
+        elif tool_name == "context_get":
+            return await self._handle_context_get(arguments)
+        elif tool_name == "context_set":
+            return await self._handle_context_set(arguments)
+        else:
+            return {"success": False, "error": f"Unknown tool: {tool_name}"}
+
     async def _run_security_audit(self, args: dict[str, Any]) -> dict[str, Any]:
         """Run security audit workflow."""
         from attune.workflows.security_audit import SecurityAuditWorkflow
@@ -733,25 +733,16 @@ class SecureMemDocsIntegration:
             List of pattern summaries
 
         """
-        all_pattern_ids = self.storage.list_patterns()
+        # Metadata comes from the storage index; pattern content is never loaded
         accessible_patterns = []
 
-        for pattern_id in all_pattern_ids:
+        for pattern_id, metadata in self.storage.list_metadata(
+            classification=classification.name if classification else None,
+            pattern_type=pattern_type,
+        ):
             try:
-                pattern_data = self.storage.retrieve(pattern_id)
-                if not pattern_data:
-                    continue
-
-                metadata = pattern_data["metadata"]
                 pat_classification = Classification[metadata["classification"]]
 
-                # Apply filters
-                if classification and pat_classification != classification:
-                    continue
-
-                if pattern_type and metadata.get("pattern_type") != pattern_type:
-                    continue
-
                 # Check access
                 if self._check_access(user_id, pat_classification, metadata):
                     accessible_patterns.append(
@@ -845,7 +836,7 @@ class SecureMemDocsIntegration:
             Dictionary with pattern statistics
 
         """
-        all_patterns = self.storage.list_patterns()
+        all_patterns = self.storage.list_metadata()
 
         stats: dict[str, Any] = {
             "total_patterns": len(all_patterns),
@@ -858,13 +849,8 @@ class SecureMemDocsIntegration:
             "with_pii_scrubbed": 0,
         }
 
-        for pattern_id in all_patterns:
+        for _pattern_id, metadata in all_patterns:
             try:
-                pattern_data = self.storage.retrieve(pattern_id)
-                if not pattern_data:
-                    continue
-
-                metadata = pattern_data["metadata"]
                 classification = metadata.get("classification", "INTERNAL")
 
                 stats["by_classification"][classification] += 1
@@ -14,6 +14,8 @@ from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from ..pattern_index import PatternIndex, score_pattern_text
+
 if TYPE_CHECKING:
     from ..long_term import Classification
 
@@ -172,26 +174,12 @@ class LongTermOperationsMixin:
         Returns:
             Relevance score (0.0 if no match)
         """
-        if not query_lower:
-            return 1.0  # No query - all patterns have equal score
-
-        content = str(pattern.get("content", "")).lower()
-        metadata_str = str(pattern.get("metadata", {})).lower()
-
-        score = 0.0
-
-        # Exact phrase match in content (highest score)
-        if query_lower in content:
-            score += 10.0
-
-        # Keyword matching (medium score)
-        for word in query_words:
-            if word in content:
-                score += 2.0
-            if word in metadata_str:
-                score += 1.0
-
-        return score
+        return score_pattern_text(
+            str(pattern.get("content", "")),
+            str(pattern.get("metadata", {})),
+            query_lower,
+            query_words,
+        )
 
     def _filter_and_score_patterns(
         self,
@@ -254,8 +242,10 @@ class LongTermOperationsMixin:
         3. Relevance scoring (exact matches rank higher)
         4. Results sorted by relevance
 
-        Memory-efficient: Uses generators and heapq.nlargest() to avoid
-        loading all patterns into memory. Only keeps top N results.
+        When the storage backend has a pattern index, filtering and
+        candidate selection are index queries and only the top N pattern
+        files are loaded. Otherwise patterns are streamed from disk and
+        heapq.nlargest() keeps only the top N results.
 
         Args:
             query: Text to search for in pattern content (case-insensitive)
@@ -278,6 +268,12 @@ class LongTermOperationsMixin:
             return []
 
         try:
+            index = self._get_pattern_index()
+            if index is not None:
+                return self._search_indexed_patterns(
+                    index, query, pattern_type, classification, limit
+                )
+
             # Use heapq.nlargest for memory-efficient top-N selection
             # This avoids loading all patterns into memory at once
             scored_patterns = heapq.nlargest(
@@ -293,10 +289,61 @@ class LongTermOperationsMixin:
             logger.error("pattern_search_failed", error=str(e))
             return []
 
+    def _search_indexed_patterns(
+        self,
+        index: PatternIndex,
+        query: str | None,
+        pattern_type: str | None,
+        classification: "Classification | str | None",
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Run search_patterns against the storage index.
+
+        Args:
+            index: Pattern index of the storage directory
+            query: Search query (case-insensitive)
+            pattern_type: Filter by pattern type
+            classification: Filter by classification level
+            limit: Maximum results to return
+
+        Returns:
+            Matching patterns, sorted by relevance
+        """
+        index.sync()
+        class_filter = getattr(classification, "value", classification) or None
+        results = []
+        for _, rel_path, _ in index.search(
+            query,
+            pattern_type=pattern_type or None,
+            classification=class_filter,
+            limit=limit,
+        ):
+            pattern_file = index.storage_dir / rel_path
+            try:
+                with pattern_file.open("r", encoding="utf-8") as f:
+                    results.append(json.load(f))
+            except (OSError, json.JSONDecodeError) as e:
+                logger.debug("pattern_load_failed", file=str(pattern_file), error=str(e))
+        return results
+
     # =========================================================================
     # PATTERN ITERATION (Internal Helpers)
     # =========================================================================
 
+    def _get_pattern_index(self) -> PatternIndex | None:
+        """Get the pattern index of the long-term storage backend, if any.
+
+        Returns:
+            PatternIndex when the backend is a MemDocsStorage with indexing
+            available, otherwise None.
+        """
+        from ..storage_backend import MemDocsStorage
+
+        storage = getattr(self._long_term, "storage", None)
+        if isinstance(storage, MemDocsStorage):
+            return storage.index
+        return None
+
     def _get_storage_dir(self) -> Path | None:
         """Get the storage directory from long-term memory backend.
 
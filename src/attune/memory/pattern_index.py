@@ -0,0 +1,472 @@
+"""Persistent metadata and full-text index for MemDocs pattern files.
+
+Listing, filtering and searching long-term patterns used to open and parse
+every ``*.json`` file in the storage directory. This module keeps an SQLite
+index next to the pattern files:
+
+- ``patterns``: one row per file with the filterable metadata
+  (classification, creator, pattern type) and the full metadata JSON
+- ``patterns_fts``: FTS5 table over content and metadata, using the
+  trigram tokenizer so matches are case-insensitive substrings, like the
+  keyword scoring in ``UnifiedMemory.search_patterns``
+
+``MemDocsStorage`` updates the index on ``store``/``delete``; ``sync()``
+reconciles files written or removed by other means using only ``stat``, so
+a file is parsed again only when its size or mtime changes.
+
+If SQLite lacks FTS5/trigram support (SQLite < 3.34) or the index cannot be
+opened, ``PatternIndex.open`` returns None and callers fall back to scanning
+the files.
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+INDEX_FILENAME = ".pattern_index.sqlite3"
+
+# Minimum term length the trigram tokenizer can match
+_MIN_FTS_TERM = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS patterns (
+    id INTEGER PRIMARY KEY,
+    rel_path TEXT NOT NULL UNIQUE,
+    pattern_id TEXT,
+    valid INTEGER NOT NULL,
+    top_level INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    classification TEXT,
+    created_by TEXT,
+    pattern_type TEXT,
+    metadata_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_patterns_classification ON patterns(classification);
+CREATE INDEX IF NOT EXISTS idx_patterns_created_by ON patterns(created_by);
+CREATE INDEX IF NOT EXISTS idx_patterns_pattern_type ON patterns(pattern_type);
+CREATE VIRTUAL TABLE IF NOT EXISTS patterns_fts USING fts5(
+    content, metadata, tokenize='trigram'
+);
+"""
+
+
+def _fts5_trigram_available() -> bool:
+    """Check whether this SQLite build supports FTS5 with the trigram tokenizer."""
+    try:
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.execute("CREATE VIRTUAL TABLE t USING fts5(x, tokenize='trigram')")
+        finally:
+            conn.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+FTS5_AVAILABLE = _fts5_trigram_available()
+
+
+def score_pattern_text(
+    content: str, metadata_text: str, query_lower: str, words: list[str]
+) -> float:
+    """Relevance score used by pattern search.
+
+    Args:
+        content: Pattern content
+        metadata_text: ``str()`` of the pattern metadata
+        query_lower: Lowercase query ("" matches everything with score 1.0)
+        words: Query words of at least 3 characters
+
+    Returns:
+        Relevance score (0.0 if no match)
+    """
+    if not query_lower:
+        return 1.0
+
+    content = content.lower()
+    metadata_text = metadata_text.lower()
+
+    score = 0.0
+    # Exact phrase match in content (highest score)
+    if query_lower in content:
+        score += 10.0
+    # Keyword matching (medium score)
+    for word in words:
+        if word in content:
+            score += 2.0
+        if word in metadata_text:
+            score += 1.0
+    return score
+
+
+def query_words(query_lower: str) -> list[str]:
+    """Split a lowercase query into scoring keywords (3+ characters)."""
+    return [w for w in query_lower.split() if len(w) >= _MIN_FTS_TERM]
+
+
+@dataclass
+class IndexedPattern:
+    """Index row for one pattern file."""
+
+    rel_path: str
+    pattern_id: str | None
+    classification: str | None
+    created_by: str | None
+    pattern_type: str | None
+    metadata: dict[str, Any]
+
+
+class PatternIndex:
+    """SQLite metadata and FTS5 index over a pattern storage directory.
+
+    Example:
+        >>> index = PatternIndex.open(Path("./memdocs_storage"))
+        >>> if index:
+        ...     index.sync()
+        ...     ids = index.list_ids(classification="PUBLIC")
+    """
+
+    def __init__(self, storage_dir: Path, index_path: Path | None = None):
+        """Open (or create) the index.
+
+        Args:
+            storage_dir: Directory containing pattern ``*.json`` files
+            index_path: SQLite file (defaults to ``storage_dir/.pattern_index.sqlite3``)
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened or created
+        """
+        self.storage_dir = Path(storage_dir)
+        self.index_path = index_path or self.storage_dir / INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    @classmethod
+    def open(cls, storage_dir: Path) -> PatternIndex | None:
+        """Open the index, or return None if indexing is unavailable.
+
+        Args:
+            storage_dir: Pattern storage directory
+
+        Returns:
+            PatternIndex, or None when FTS5/trigram is missing or SQLite fails
+        """
+        if not FTS5_AVAILABLE:
+            logger.debug("pattern_index_unavailable", reason="sqlite fts5 trigram not supported")
+            return None
+        try:
+            return cls(storage_dir)
+        except sqlite3.Error as e:
+            logger.warning("pattern_index_open_failed", storage_dir=str(storage_dir), error=str(e))
+            return None
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    # =========================================================================
+    # Updates
+    # =========================================================================
+
+    def _rel_path(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.storage_dir).as_posix()
+        except ValueError:
+            return path.resolve().relative_to(self.storage_dir.resolve()).as_posix()
+
+    def _upsert_locked(
+        self, rel_path: str, data: dict[str, Any] | None, stat: os.stat_result
+    ) -> None:
+        valid = isinstance(data, dict)
+        record: dict[str, Any] = data if valid else {}  # type: ignore[assignment]
+        metadata = record.get("metadata", {})
+        if not isinstance(metadata, dict):
+            metadata = {}
+
+        def field(name: str) -> str | None:
+            value = metadata.get(name, record.get(name))
+            return None if value is None else str(value)
+
+        row = (
+            record.get("pattern_id"),
+            int(valid),
+            int("/" not in rel_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            field("classification"),
+            field("created_by"),
+            field("pattern_type"),
+            json.dumps(metadata, default=str),
+        )
+        existing = self._conn.execute(
+            "SELECT id FROM patterns WHERE rel_path = ?", (rel_path,)
+        ).fetchone()
+        if existing:
+            row_id = existing[0]
+            self._conn.execute(
+                "UPDATE patterns SET pattern_id=?, valid=?, top_level=?, mtime_ns=?, size=?, "
+                "classification=?, created_by=?, pattern_type=?, metadata_json=? WHERE id=?",
+                (*row, row_id),
+            )
+            self._conn.execute("DELETE FROM patterns_fts WHERE rowid = ?", (row_id,))
+        else:
+            row_id = self._conn.execute(
+                "INSERT INTO patterns (pattern_id, valid, top_level, mtime_ns, size, "
+                "classification, created_by, pattern_type, metadata_json, rel_path) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (*row, rel_path),
+            ).lastrowid
+
+        if valid:
+            # Ciphertext is not searchable; index metadata only for encrypted patterns
+            content = "" if metadata.get("encrypted") else str(record.get("content", ""))
+            self._conn.execute(
+                "INSERT INTO patterns_fts (rowid, content, metadata) VALUES (?, ?, ?)",
+                (row_id, content, str(metadata)),
+            )
+
+    def _remove_locked(self, rel_path: str) -> bool:
+        existing = self._conn.execute(
+            "SELECT id FROM patterns WHERE rel_path = ?", (rel_path,)
+        ).fetchone()
+        if not existing:
+            return False
+        self._conn.execute("DELETE FROM patterns_fts WHERE rowid = ?", (existing[0],))
+        self._conn.execute("DELETE FROM patterns WHERE id = ?", (existing[0],))
+        return True
+
+    def upsert(self, path: Path, data: dict[str, Any]) -> None:
+        """Index a pattern file that was just written.
+
+        Args:
+            path: Pattern file path (inside ``storage_dir``)
+            data: The JSON document written to ``path``
+        """
+        try:
+            stat = path.stat()
+            with self._lock:
+                self._upsert_locked(self._rel_path(path), data, stat)
+                self._conn.commit()
+        except (OSError, ValueError, sqlite3.Error) as e:
+            # The next sync() reconciles the file from disk
+            logger.warning("pattern_index_update_failed", file=str(path), error=str(e))
+
+    def remove(self, path: Path) -> bool:
+        """Drop a pattern file from the index.
+
+        Returns:
+            True if the file was indexed
+        """
+        try:
+            with self._lock:
+                removed = self._remove_locked(self._rel_path(path))
+                self._conn.commit()
+        except (ValueError, sqlite3.Error) as e:
+            logger.warning("pattern_index_update_failed", file=str(path), error=str(e))
+            return False
+        return removed
+
+    def sync(self) -> int:
+        """Reconcile the index with the files on disk.
+
+        Only files whose size or mtime changed are parsed; vanished files
+        are removed.
+
+        Returns:
+            Number of rows added, updated or removed
+        """
+        on_disk: dict[str, tuple[Path, os.stat_result]] = {}
+        if self.storage_dir.exists():
+            for root, _dirs, files in os.walk(self.storage_dir):
+                for name in files:
+                    if not name.endswith(".json"):
+                        continue
+                    path = Path(root) / name
+                    try:
+                        on_disk[self._rel_path(path)] = (path, path.stat())
+                    except OSError:
+                        continue
+
+        changes = 0
+        with self._lock:
+            indexed = {
+                rel: (mtime_ns, size)
+                for rel, mtime_ns, size in self._conn.execute(
+                    "SELECT rel_path, mtime_ns, size FROM patterns"
+                )
+            }
+            for rel in indexed.keys() - on_disk.keys():
+                self._remove_locked(rel)
+                changes += 1
+            for rel, (path, stat) in on_disk.items():
+                if indexed.get(rel) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                try:
+                    with path.open(encoding="utf-8") as f:
+                        data = json.load(f)
+                except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+                    logger.debug("pattern_index_parse_failed", file=str(path), error=str(e))
+                    data = None
+                self._upsert_locked(rel, data, stat)
+                changes += 1
+            if changes:
+                self._conn.commit()
+        if changes:
+            logger.debug("pattern_index_synced", changes=changes)
+        return changes
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    @staticmethod
+    def _filters(
+        classification: str | None,
+        created_by: str | None,
+        pattern_type: str | None,
+        top_level_only: bool,
+    ) -> tuple[str, list[Any]]:
+        clauses = ["p.valid = 1"]
+        params: list[Any] = []
+        if top_level_only:
+            clauses.append("p.top_level = 1")
+        for column, value in (
+            ("classification", classification),
+            ("created_by", created_by),
+            ("pattern_type", pattern_type),
+        ):
+            if value is not None:
+                clauses.append(f"p.{column} = ?")
+                params.append(value)
+        return " AND ".join(clauses), params
+
+    def list_ids(
+        self,
+        classification: str | None = None,
+        created_by: str | None = None,
+    ) -> list[str | None]:
+        """Pattern IDs of top-level files matching the filters.
+
+        Args:
+            classification: Filter by classification
+            created_by: Filter by creator
+
+        Returns:
+            Pattern IDs ordered by file path
+        """
+        where, params = self._filters(classification, created_by, None, top_level_only=True)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT p.pattern_id FROM patterns p WHERE {where} ORDER BY p.rel_path",  # nosec B608
+                params,
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def list_records(
+        self,
+        classification: str | None = None,
+        created_by: str | None = None,
+        pattern_type: str | None = None,
+    ) -> list[IndexedPattern]:
+        """Index records of top-level files matching the filters.
+
+        Returns:
+            Records ordered by file path, including full metadata
+        """
+        where, params = self._filters(classification, created_by, pattern_type, top_level_only=True)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT p.rel_path, p.pattern_id, p.classification, p.created_by, "
+                f"p.pattern_type, p.metadata_json FROM patterns p WHERE {where} "  # nosec B608
+                "ORDER BY p.rel_path",
+                params,
+            ).fetchall()
+        return [
+            IndexedPattern(
+                rel_path=rel,
+                pattern_id=pattern_id,
+                classification=cls_,
+                created_by=creator,
+                pattern_type=ptype,
+                metadata=json.loads(metadata_json),
+            )
+            for rel, pattern_id, cls_, creator, ptype, metadata_json in rows
+        ]
+
+    def search(
+        self,
+        query: str | None = None,
+        pattern_type: str | None = None,
+        classification: str | None = None,
+        limit: int = 10,
+        top_level_only: bool = False,
+    ) -> list[tuple[float, str, str | None]]:
+        """Rank pattern files by keyword relevance.
+
+        FTS5 narrows the candidates to files containing the phrase or one of
+        the keywords; the candidates are then scored with
+        :func:`score_pattern_text`.
+
+        Args:
+            query: Text to search for (None/"" matches every file)
+            pattern_type: Filter by pattern type
+            classification: Filter by classification
+            limit: Maximum results
+            top_level_only: Ignore files in subdirectories
+
+        Returns:
+            List of (score, rel_path, pattern_id), best first
+        """
+        if limit <= 0:
+            return []
+        where, params = self._filters(classification, None, pattern_type, top_level_only)
+        query_lower = query.lower() if query else ""
+        words = query_words(query_lower)
+
+        sql = (
+            "SELECT p.rel_path, p.pattern_id, f.content, f.metadata FROM patterns p "
+            "JOIN patterns_fts f ON f.rowid = p.id"
+        )
+        if query_lower:
+            terms = [t for t in {query_lower, *words} if len(t) >= _MIN_FTS_TERM]
+            if terms:
+                sql += " WHERE patterns_fts MATCH ? AND "
+                params.insert(0, " OR ".join('"' + t.replace('"', '""') + '"' for t in terms))
+            else:
+                # Too short for trigrams: only an exact phrase match can score
+                sql += " WHERE f.content LIKE ? ESCAPE '\\' AND "
+                escaped = query_lower.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                params.insert(0, f"%{escaped}%")
+        else:
+            sql += " WHERE "
+        sql += f"{where} ORDER BY p.rel_path"
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        scored = (
+            (score_pattern_text(content, metadata_text, query_lower, words), rel, pattern_id)
+            for rel, pattern_id, content, metadata_text in rows
+        )
+        matches = [item for item in scored if item[0] > 0]
+        return heapq.nlargest(limit, matches, key=lambda item: item[0])
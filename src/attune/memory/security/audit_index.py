@@ -0,0 +1,320 @@
+"""Segment indexes and compliance rollups for audit logs.
+
+Each audit log segment (the active ``audit.jsonl`` and every rotated
+``audit.jsonl.<timestamp>``) gets a ``SegmentIndex``:
+
+- Postings of line offsets by ``event_type``, ``user_id`` and ``status``,
+  so filtered queries seek straight to candidate lines
+- The segment's time range, so date-filtered queries skip whole segments
+- A rollup of the counters used by ``get_compliance_report`` and
+  ``get_violation_summary``, so reports merge per-segment totals instead
+  of re-reading events
+
+Rotated segments are immutable, so their indexes are persisted as sidecar
+JSON files and reused until the segment size changes. The active segment's
+index is extended incrementally from the last indexed byte offset.
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under the Apache License, Version 2.0
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Event fields with offset postings
+INDEXED_FIELDS = ("event_type", "user_id", "status")
+
+
+def parse_event_time(timestamp: Any) -> datetime | None:
+    """Parse an audit event timestamp (ISO-8601, optional trailing Z)."""
+    try:
+        return datetime.fromisoformat(str(timestamp).rstrip("Z"))
+    except ValueError:
+        return None
+
+
+def _sortable_time(event_time: datetime) -> str:
+    """Fixed-width naive UTC ISO string, so string order equals time order."""
+    if event_time.tzinfo is not None:
+        event_time = event_time.astimezone(timezone.utc).replace(tzinfo=None)
+    return event_time.isoformat(timespec="microseconds")
+
+
+def new_rollup() -> dict[str, Any]:
+    """Create empty compliance/violation counters."""
+    return {
+        "llm_requests": {
+            "total": 0,
+            "with_pii_detected": 0,
+            "with_secrets_detected": 0,
+            "sanitization_applied": 0,
+        },
+        "pattern_storage": {
+            "total": 0,
+            "by_classification": {},
+            "with_pii_scrubbed": 0,
+            "encrypted": 0,
+        },
+        "pattern_retrieval": {"total": 0, "by_classification": {}, "access_denied": 0},
+        "security_violations": {"total": 0, "by_severity": {}, "by_type": {}},
+        "violations_by_user": {},
+        "compliance": {"checks": 0, "gdpr": 0, "hipaa": 0, "soc2": 0},
+    }
+
+
+def _bump(counts: dict[str, int], key: str) -> None:
+    counts[key] = counts.get(key, 0) + 1
+
+
+def add_to_rollup(rollup: dict[str, Any], event: dict[str, Any]) -> None:
+    """Count one event into a rollup."""
+    event_type = event.get("event_type")
+
+    if event_type == "llm_request":
+        llm = rollup["llm_requests"]
+        llm["total"] += 1
+        security = event.get("security", {})
+        if security.get("pii_detected", 0) > 0:
+            llm["with_pii_detected"] += 1
+        if security.get("secrets_detected", 0) > 0:
+            llm["with_secrets_detected"] += 1
+        if security.get("sanitization_applied"):
+            llm["sanitization_applied"] += 1
+
+    elif event_type == "store_pattern":
+        storage = rollup["pattern_storage"]
+        storage["total"] += 1
+        pattern = event.get("pattern", {})
+        _bump(storage["by_classification"], pattern.get("classification", "INTERNAL"))
+        if event.get("security", {}).get("pii_scrubbed", 0) > 0:
+            storage["with_pii_scrubbed"] += 1
+        if pattern.get("encrypted"):
+            storage["encrypted"] += 1
+
+    elif event_type == "retrieve_pattern":
+        retrieval = rollup["pattern_retrieval"]
+        retrieval["total"] += 1
+        _bump(
+            retrieval["by_classification"],
+            event.get("pattern", {}).get("classification", "INTERNAL"),
+        )
+        if not event.get("access", {}).get("granted", True):
+            retrieval["access_denied"] += 1
+
+    elif event_type == "security_violation":
+        violation = event.get("violation", {})
+        vtype = str(violation.get("type", "unknown"))
+        severity = str(violation.get("severity", "unknown"))
+        violations = rollup["security_violations"]
+        violations["total"] += 1
+        _bump(violations["by_type"], vtype)
+        _bump(violations["by_severity"], severity)
+
+        user = rollup["violations_by_user"].setdefault(
+            str(event.get("user_id", "unknown")),
+            {"total": 0, "by_type": {}, "by_severity": {}},
+        )
+        user["total"] += 1
+        _bump(user["by_type"], vtype)
+        _bump(user["by_severity"], severity)
+
+    compliance = event.get("compliance", {})
+    if compliance:
+        counts = rollup["compliance"]
+        counts["checks"] += 1
+        if compliance.get("gdpr_compliant"):
+            counts["gdpr"] += 1
+        if compliance.get("hipaa_compliant"):
+            counts["hipaa"] += 1
+        if compliance.get("soc2_compliant"):
+            counts["soc2"] += 1
+
+
+def merge_rollup(target: dict[str, Any], source: dict[str, Any]) -> dict[str, Any]:
+    """Add the counters of ``source`` into ``target`` (in place).
+
+    Returns:
+        ``target``
+    """
+    for key, value in source.items():
+        if isinstance(value, dict):
+            merge_rollup(target.setdefault(key, {}), value)
+        else:
+            target[key] = target.get(key, 0) + value
+    return target
+
+
+@dataclass
+class SegmentIndex:
+    """Offset postings, time range and rollup for one log segment."""
+
+    segment: str
+    size: int = 0
+    inode: int = 0
+    count: int = 0
+    min_ts: str | None = None
+    max_ts: str | None = None
+    postings: dict[str, dict[str, list[int]]] = field(
+        default_factory=lambda: {name: {} for name in INDEXED_FIELDS}
+    )
+    rollup: dict[str, Any] = field(default_factory=new_rollup)
+
+    def add(self, offset: int, event: dict[str, Any]) -> None:
+        """Index one event starting at byte ``offset``."""
+        self.count += 1
+        for name in INDEXED_FIELDS:
+            self.postings[name].setdefault(str(event.get(name, "")), []).append(offset)
+
+        event_time = parse_event_time(event.get("timestamp", ""))
+        if event_time is not None:
+            ts = _sortable_time(event_time)
+            if self.min_ts is None or ts < self.min_ts:
+                self.min_ts = ts
+            if self.max_ts is None or ts > self.max_ts:
+                self.max_ts = ts
+
+        add_to_rollup(self.rollup, event)
+
+    def extend(self, path: Path) -> int:
+        """Index complete lines appended to ``path`` since the last call.
+
+        Args:
+            path: Segment file
+
+        Returns:
+            Number of events indexed
+        """
+        added = 0
+        with open(path, "rb") as f:
+            f.seek(self.size)
+            offset = self.size
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Partially written line; picked up next time
+                line_offset = offset
+                offset += len(raw)
+                try:
+                    event = json.loads(raw)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    logger.warning("Skipping malformed audit log line")
+                    continue
+                if isinstance(event, dict):
+                    self.add(line_offset, event)
+                    added += 1
+            self.size = offset
+        return added
+
+    def may_match(
+        self,
+        event_type: str | None = None,
+        user_id: str | None = None,
+        status: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> bool:
+        """Whether any event in the segment can match the filters."""
+        for name, value in zip(INDEXED_FIELDS, (event_type, user_id, status), strict=True):
+            if value and value not in self.postings[name]:
+                return False
+        if start_date or end_date:
+            if self.min_ts is None or self.max_ts is None:
+                return False
+            if start_date and datetime.fromisoformat(self.max_ts) < start_date:
+                return False
+            if end_date and datetime.fromisoformat(self.min_ts) > end_date:
+                return False
+        return True
+
+    def within(self, start_date: datetime | None, end_date: datetime | None) -> bool:
+        """Whether every event in the segment lies inside the date range."""
+        if start_date is None and end_date is None:
+            return True
+        if self.min_ts is None or self.max_ts is None:
+            return self.count == 0
+        if start_date and datetime.fromisoformat(self.min_ts) < start_date:
+            return False
+        if end_date and datetime.fromisoformat(self.max_ts) > end_date:
+            return False
+        return True
+
+    def candidate_offsets(
+        self,
+        event_type: str | None = None,
+        user_id: str | None = None,
+        status: str | None = None,
+    ) -> list[int] | None:
+        """Sorted offsets of lines matching all indexed filters.
+
+        Returns:
+            Offsets, or None when no indexed filter is given (scan everything)
+        """
+        selected = [
+            self.postings[name].get(value, [])
+            for name, value in zip(INDEXED_FIELDS, (event_type, user_id, status), strict=True)
+            if value
+        ]
+        if not selected:
+            return None
+        selected.sort(key=len)
+        candidates = set(selected[0])
+        for offsets in selected[1:]:
+            candidates.intersection_update(offsets)
+        return sorted(candidates)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the sidecar file."""
+        return {
+            "version": INDEX_VERSION,
+            "segment": self.segment,
+            "size": self.size,
+            "count": self.count,
+            "min_ts": self.min_ts,
+            "max_ts": self.max_ts,
+            "postings": self.postings,
+            "rollup": self.rollup,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SegmentIndex":
+        """Deserialize a sidecar file.
+
+        Raises:
+            ValueError: If the sidecar was written by another index version
+        """
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported audit index version: {data.get('version')}")
+        return cls(
+            segment=data["segment"],
+            size=data["size"],
+            count=data["count"],
+            min_ts=data["min_ts"],
+            max_ts=data["max_ts"],
+            postings=data["postings"],
+            rollup=data["rollup"],
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the sidecar atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "SegmentIndex | None":
+        """Read a sidecar, returning None if it is missing or unreadable."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
@@ -8,8 +8,9 @@ Key Features:
 - ISO-8601 timestamps (UTC)
 - Unique event IDs (UUID)
 - Tamper-evident (append-only)
-- Query/search capability
+- Query/search capability across rotated segments (indexed)
 - Log rotation support
+- Group-commit writes (concurrent events share one write and flush/fsync)
 
 Reference:
 - SECURE_MEMORY_ARCHITECTURE.md: Audit Trail Implementation
@@ -24,14 +25,25 @@ Licensed under the Apache License, Version 2.0
 import json
 import logging
 import os
+import re
+import threading
+import time
 import uuid
+from collections.abc import Iterator
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+from .audit_index import SegmentIndex, add_to_rollup, merge_rollup, new_rollup, parse_event_time
 
 logger = logging.getLogger(__name__)
 
+# Rotated segment suffix: timestamp plus optional collision counter
+_SEGMENT_SUFFIX = re.compile(r"^(\d{8}_\d{6})(?:_(\d+))?$")
+
+DURABILITY_MODES = ("flush", "fsync")
+
 
 @dataclass
 class AuditEvent:
@@ -91,6 +103,14 @@ class AuditLogger:
     - Query and search capabilities
     - Log rotation support
 
+    Writes use group commit: events logged concurrently are appended with a
+    single write and flush (or fsync with ``durability="fsync"``). Every
+    ``log_*`` call returns only after its event has been committed.
+
+    Queries and reports cover the active log and all retained rotated
+    segments, using per-segment indexes (see ``audit_index``) to skip
+    segments and lines that cannot match.
+
     Example:
         >>> logger = AuditLogger()  # Uses platform-appropriate default
         >>> logger.log_llm_request(
@@ -122,6 +142,8 @@ class AuditLogger:
         retention_days: int = 365,
         enable_rotation: bool = True,
         enable_console_logging: bool = False,
+        durability: str = "flush",
+        commit_delay_ms: float = 0.0,
     ):
         """Initialize the audit logger.
 
@@ -132,8 +154,18 @@ class AuditLogger:
             retention_days: Number of days to retain audit logs
             enable_rotation: Whether to enable automatic log rotation
             enable_console_logging: Whether to also log to console (for development)
+            durability: "flush" (hand each commit to the OS) or "fsync"
+                (also fsync each commit to disk)
+            commit_delay_ms: How long a commit waits to gather concurrent
+                events into the same write (0 = no extra latency)
+
+        Raises:
+            ValueError: If durability is not a supported mode
 
         """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {DURABILITY_MODES}, got {durability!r}")
+
         # Use platform-appropriate default if log_dir not specified
         if log_dir is None:
             from attune.platform_utils import get_default_log_dir
@@ -147,10 +179,25 @@ class AuditLogger:
         self.retention_days = retention_days
         self.enable_rotation = enable_rotation
         self.enable_console_logging = enable_console_logging
+        self.durability = durability
+        self.commit_delay_ms = commit_delay_ms
 
         # Track security violations for alerting
         self._violation_counts: dict[str, int] = {}
 
+        # Group commit state: pending lines and commit sequence numbers
+        self._commit_cond = threading.Condition()
+        self._pending: list[str] = []
+        self._enqueued_seq = 0
+        self._committed_seq = 0
+        self._committing = False
+        self._file: IO[str] | None = None
+
+        # Segment indexes: rotated segments (by file name) and the active log
+        self._index_lock = threading.RLock()
+        self._segment_indexes: dict[str, SegmentIndex] = {}
+        self._active_index: SegmentIndex | None = None
+
         # Initialize log directory
         self._initialize_log_directory()
 
@@ -169,43 +216,123 @@ class AuditLogger:
             self.log_path = self.log_dir / self.log_filename
             logger.warning(f"Using fallback log directory: {self.log_dir}")
 
+    @property
+    def index_dir(self) -> Path:
+        """Directory holding sidecar indexes for rotated segments."""
+        return self.log_dir / f".{self.log_filename}.idx"
+
     def _write_event(self, event: AuditEvent):
         """Write an audit event to the log file.
 
-        Uses append-only mode for tamper-evidence.
+        Uses append-only mode for tamper-evidence. The event joins the
+        current commit group; whichever caller leads the group writes all
+        pending events at once. Returns after the event is committed.
         """
+        try:
+            line = json.dumps(event.to_dict(), ensure_ascii=False) + "\n"
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to write audit event: {e}")
+            return
+
+        with self._commit_cond:
+            self._pending.append(line)
+            self._enqueued_seq += 1
+            my_seq = batch_seq = self._enqueued_seq
+            while self._committing and self._committed_seq < my_seq:
+                self._commit_cond.wait()
+            # Committed by another caller's group, or this caller leads the next one
+            leader = self._committed_seq < my_seq
+            if leader:
+                self._committing = True
+
+        if leader:
+            try:
+                if self.commit_delay_ms > 0:
+                    time.sleep(self.commit_delay_ms / 1000)
+                with self._commit_cond:
+                    batch, self._pending = self._pending, []
+                    batch_seq = self._enqueued_seq
+                self._commit_batch(batch)
+            finally:
+                with self._commit_cond:
+                    self._committed_seq = max(self._committed_seq, batch_seq)
+                    self._committing = False
+                    self._commit_cond.notify_all()
+
+        # Optional console logging for development
+        if self.enable_console_logging:
+            logger.debug(f"Audit event: {event.event_type} - {event.status}")
+
+    def _commit_batch(self, lines: list[str]):
+        """Append a group of event lines with one write and flush."""
         try:
             # Check if rotation is needed
             if self.enable_rotation and self.log_path.exists():
                 if self.log_path.stat().st_size > self.max_file_size_bytes:
                     self._rotate_log()
 
-            # Write event as single line JSON
-            with open(self.log_path, "a", encoding="utf-8") as f:
-                json.dump(event.to_dict(), f, ensure_ascii=False)
-                f.write("\n")
-
-            # Optional console logging for development
-            if self.enable_console_logging:
-                logger.debug(f"Audit event: {event.event_type} - {event.status}")
+            f = self._open_log()
+            f.write("".join(lines))
+            f.flush()
+            if self.durability == "fsync":
+                os.fsync(f.fileno())
 
         except Exception as e:
             logger.error(f"Failed to write audit event: {e}")
+            self._close_log()
             # Critical: audit logging failure should be visible
             if self.enable_console_logging:
                 print(f"AUDIT LOG FAILURE: {e}", flush=True)
 
+    def _open_log(self) -> IO[str]:
+        """Return the append handle, reopening it if the file was moved or removed."""
+        if self._file is not None:
+            try:
+                if os.stat(self.log_path).st_ino == os.fstat(self._file.fileno()).st_ino:
+                    return self._file
+            except OSError:
+                pass
+            self._close_log()
+        self._file = open(self.log_path, "a", encoding="utf-8")
+        return self._file
+
+    def _close_log(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+    def close(self):
+        """Close the log file handle (reopened automatically on the next write)."""
+        with self._commit_cond:
+            self._close_log()
+
     def _rotate_log(self):
         """Rotate the audit log file.
 
-        Renames current log with timestamp and creates new file.
+        Renames current log with timestamp and creates new file. The
+        rotated segment's index is saved as a sidecar for later queries.
         """
         try:
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
             rotated_name = f"{self.log_filename}.{timestamp}"
             rotated_path = self.log_dir / rotated_name
-
-            self.log_path.rename(rotated_path)
+            collision = 1
+            while rotated_path.exists():
+                rotated_name = f"{self.log_filename}.{timestamp}_{collision}"
+                rotated_path = self.log_dir / rotated_name
+                collision += 1
+
+            with self._index_lock:
+                index = self._refresh_active_index()
+                self._close_log()
+                self.log_path.rename(rotated_path)
+                self._active_index = None
+                if index is not None:
+                    index.segment = rotated_name
+                    self._store_segment_index(index)
             logger.info(f"Audit log rotated: {rotated_path}")
 
             # Clean up old logs beyond retention period
@@ -215,7 +342,7 @@ class AuditLogger:
             logger.error(f"Failed to rotate audit log: {e}")
 
     def _cleanup_old_logs(self):
-        """Remove audit logs older than retention period"""
+        """Remove audit logs (and their indexes) older than retention period"""
         try:
             cutoff_date = datetime.utcnow() - timedelta(days=self.retention_days)
 
@@ -223,10 +350,11 @@ class AuditLogger:
                 # Extract timestamp from filename
                 try:
                     timestamp_str = log_file.suffix[1:]  # Remove leading dot
-                    file_date = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
+                    file_date = datetime.strptime(timestamp_str[:15], "%Y%m%d_%H%M%S")
 
                     if file_date < cutoff_date:
                         log_file.unlink()
+                        self._drop_segment_index(log_file.name)
                         logger.info(f"Removed old audit log: {log_file}")
                 except (ValueError, IndexError):
                     # Skip files that don't match expected format
@@ -235,6 +363,104 @@ class AuditLogger:
         except Exception as e:
             logger.error(f"Failed to cleanup old audit logs: {e}")
 
+    # =========================================================================
+    # Segment indexes
+    # =========================================================================
+
+    def _sidecar_path(self, segment: str) -> Path:
+        return self.index_dir / f"{segment}.json"
+
+    def _store_segment_index(self, index: SegmentIndex):
+        self._segment_indexes[index.segment] = index
+        try:
+            index.save(self._sidecar_path(index.segment))
+        except OSError as e:
+            logger.warning(f"Failed to save audit segment index: {e}")
+
+    def _drop_segment_index(self, segment: str):
+        with self._index_lock:
+            self._segment_indexes.pop(segment, None)
+            self._sidecar_path(segment).unlink(missing_ok=True)
+
+    def _rotated_segments(self) -> list[Path]:
+        """Rotated segment files, oldest first."""
+        segments = []
+        for path in self.log_dir.glob(f"{self.log_filename}.*"):
+            match = _SEGMENT_SUFFIX.match(path.name[len(self.log_filename) + 1 :])
+            if match and path.is_file():
+                segments.append((match.group(1), int(match.group(2) or 0), path))
+        return [path for _, _, path in sorted(segments)]
+
+    def _segment_index(self, path: Path) -> SegmentIndex:
+        """Index of a rotated segment: cached, from its sidecar, or rebuilt."""
+        size = path.stat().st_size
+        index = self._segment_indexes.get(path.name)
+        if index is None or index.size != size:
+            index = SegmentIndex.load(self._sidecar_path(path.name))
+            if index is None or index.segment != path.name or index.size != size:
+                index = SegmentIndex(segment=path.name)
+                index.extend(path)
+                self._store_segment_index(index)
+            else:
+                self._segment_indexes[path.name] = index
+        return index
+
+    def _refresh_active_index(self) -> SegmentIndex | None:
+        """Bring the active log's index up to date with the file."""
+        try:
+            stat = os.stat(self.log_path)
+        except FileNotFoundError:
+            self._active_index = None
+            return None
+
+        index = self._active_index
+        if index is None or index.inode != stat.st_ino or index.size > stat.st_size:
+            # New, rotated or truncated file: index from the start
+            index = SegmentIndex(segment=self.log_filename, inode=stat.st_ino)
+            self._active_index = index
+        if index.size < stat.st_size:
+            index.extend(self.log_path)
+        return index
+
+    def _segments(self) -> list[tuple[Path, SegmentIndex]]:
+        """All retained segments with up-to-date indexes, oldest first."""
+        with self._index_lock:
+            segments = []
+            for path in self._rotated_segments():
+                try:
+                    segments.append((path, self._segment_index(path)))
+                except OSError as e:
+                    logger.warning(f"Skipping unreadable audit segment {path}: {e}")
+            active = self._refresh_active_index()
+            if active is not None:
+                segments.append((self.log_path, active))
+            return segments
+
+    @staticmethod
+    def _read_segment(path: Path, index: SegmentIndex, offsets: list[int] | None) -> Iterator[dict]:
+        """Yield events from a segment, either all lines or only ``offsets``."""
+        with open(path, "rb") as f:
+            if offsets is None:
+                lines: Iterator[bytes] = iter(f.readline, b"")
+            else:
+
+                def seek_lines() -> Iterator[bytes]:
+                    for offset in offsets:
+                        f.seek(offset)
+                        yield f.readline()
+
+                lines = seek_lines()
+            for raw in lines:
+                if not raw.strip():
+                    continue
+                try:
+                    event = json.loads(raw)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    logger.warning("Skipping malformed audit log line")
+                    continue
+                if isinstance(event, dict):
+                    yield event
+
     def log_llm_request(
         self,
         user_id: str,
@@ -671,50 +897,55 @@ class AuditLogger:
         results: list[dict[str, object]] = []
 
         try:
-            if not self.log_path.exists():
-                return results
+            for path, index in self._segments():
+                if len(results) >= limit:
+                    break
+                if not index.may_match(event_type, user_id, status, start_date, end_date):
+                    continue
 
-            with open(self.log_path, encoding="utf-8") as f:
-                for line in f:
+                offsets = index.candidate_offsets(event_type, user_id, status)
+                for event in self._read_segment(path, index, offsets):
                     if len(results) >= limit:
                         break
-
-                    try:
-                        event = json.loads(line.strip())
-
-                        # Apply filters
-                        if event_type and event.get("event_type") != event_type:
-                            continue
-                        if user_id and event.get("user_id") != user_id:
-                            continue
-                        if status and event.get("status") != status:
-                            continue
-
-                        # Date range filtering
-                        if start_date or end_date:
-                            event_time = datetime.fromisoformat(
-                                event.get("timestamp", "").rstrip("Z"),
-                            )
-                            if start_date and event_time < start_date:
-                                continue
-                            if end_date and event_time > end_date:
-                                continue
-
+                    if self._matches(event, event_type, user_id, status, start_date, end_date):
                         # Custom filters (supports nested keys with __)
                         if filters and not self._apply_custom_filters(event, filters):
                             continue
-
                         results.append(event)
 
-                    except json.JSONDecodeError:
-                        logger.warning("Skipping malformed audit log line")
-                        continue
-
         except Exception as e:
             logger.error(f"Failed to query audit logs: {e}")
 
         return results
 
+    @staticmethod
+    def _matches(
+        event: dict,
+        event_type: str | None,
+        user_id: str | None,
+        status: str | None,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> bool:
+        """Apply the standard query filters to one event."""
+        if event_type and event.get("event_type") != event_type:
+            return False
+        if user_id and event.get("user_id") != user_id:
+            return False
+        if status and event.get("status") != status:
+            return False
+
+        # Date range filtering
+        if start_date or end_date:
+            event_time = parse_event_time(event.get("timestamp", ""))
+            if event_time is None:
+                return False
+            if start_date and event_time < start_date:
+                return False
+            if end_date and event_time > end_date:
+                return False
+        return True
+
     def _apply_custom_filters(self, event: dict, filters: dict) -> bool:
         """Apply custom filters to an event.
 
@@ -773,26 +1004,25 @@ class AuditLogger:
             >>> print(f"Total violations: {summary['total_violations']}")
 
         """
-        violations = self.query(event_type="security_violation", user_id=user_id)
+        rollup = new_rollup()
+        for _, index in self._segments():
+            merge_rollup(rollup, index.rollup)
+
+        by_user = rollup["violations_by_user"]
+        if user_id:
+            by_user = {user_id: by_user[user_id]} if user_id in by_user else {}
 
         by_type: dict[str, int] = {}
         by_severity: dict[str, int] = {}
-        by_user: dict[str, int] = {}
-
-        for violation in violations:
-            vtype = str(violation.get("violation", {}).get("type", "unknown"))
-            severity = str(violation.get("violation", {}).get("severity", "unknown"))
-            vid = str(violation.get("user_id", "unknown"))
-
-            by_type[vtype] = by_type.get(vtype, 0) + 1
-            by_severity[severity] = by_severity.get(severity, 0) + 1
-            by_user[vid] = by_user.get(vid, 0) + 1
+        for counts in by_user.values():
+            merge_rollup(by_type, counts["by_type"])
+            merge_rollup(by_severity, counts["by_severity"])
 
         summary: dict[str, int | dict[str, int]] = {
-            "total_violations": len(violations),
+            "total_violations": sum(counts["total"] for counts in by_user.values()),
             "by_type": by_type,
             "by_severity": by_severity,
-            "by_user": by_user,
+            "by_user": {vid: counts["total"] for vid, counts in by_user.items()},
         }
 
         return summary
@@ -821,8 +1051,16 @@ class AuditLogger:
             >>> print(f"Total LLM requests: {report['llm_requests']['total']}")
 
         """
-        # Query all events in period
-        all_events = self.query(start_date=start_date, end_date=end_date, limit=100000)
+        # Merge per-segment rollups; only segments straddling the period
+        # boundaries are re-read event by event
+        totals = new_rollup()
+        for path, index in self._segments():
+            if index.within(start_date, end_date):
+                merge_rollup(totals, index.rollup)
+            elif index.may_match(start_date=start_date, end_date=end_date):
+                for event in self._read_segment(path, index, None):
+                    if self._matches(event, None, None, None, start_date, end_date):
+                        add_to_rollup(totals, event)
 
         report: dict[str, Any] = {
             "period": {
@@ -854,68 +1092,19 @@ class AuditLogger:
             },
         }
 
-        total_compliance_checks = 0
-        gdpr_compliant = 0
-        hipaa_compliant = 0
-        soc2_compliant = 0
-
-        for event in all_events:
-            event_type = event.get("event_type")
-
-            if event_type == "llm_request":
-                report["llm_requests"]["total"] += 1
-                security = event.get("security", {})
-                if security.get("pii_detected", 0) > 0:
-                    report["llm_requests"]["with_pii_detected"] += 1
-                if security.get("secrets_detected", 0) > 0:
-                    report["llm_requests"]["with_secrets_detected"] += 1
-                if security.get("sanitization_applied"):
-                    report["llm_requests"]["sanitization_applied"] += 1
-
-            elif event_type == "store_pattern":
-                report["pattern_storage"]["total"] += 1
-                pattern = event.get("pattern", {})
-                classification = pattern.get("classification", "INTERNAL")
-                report["pattern_storage"]["by_classification"][classification] = (
-                    report["pattern_storage"]["by_classification"].get(classification, 0) + 1
-                )
-                if event.get("security", {}).get("pii_scrubbed", 0) > 0:
-                    report["pattern_storage"]["with_pii_scrubbed"] += 1
-                if pattern.get("encrypted"):
-                    report["pattern_storage"]["encrypted"] += 1
-
-            elif event_type == "retrieve_pattern":
-                report["pattern_retrieval"]["total"] += 1
-                pattern = event.get("pattern", {})
-                classification = pattern.get("classification", "INTERNAL")
-                report["pattern_retrieval"]["by_classification"][classification] = (
-                    report["pattern_retrieval"]["by_classification"].get(classification, 0) + 1
-                )
-                if not event.get("access", {}).get("granted", True):
-                    report["pattern_retrieval"]["access_denied"] += 1
-
-            elif event_type == "security_violation":
-                report["security_violations"]["total"] += 1
-                violation = event.get("violation", {})
-                vtype = violation.get("type", "unknown")
-                severity = violation.get("severity", "unknown")
-                report["security_violations"]["by_type"][vtype] = (
-                    report["security_violations"]["by_type"].get(vtype, 0) + 1
-                )
-                report["security_violations"]["by_severity"][severity] = (
-                    report["security_violations"]["by_severity"].get(severity, 0) + 1
-                )
-
-            # Track compliance rates
-            compliance = event.get("compliance", {})
-            if compliance:
-                total_compliance_checks += 1
-                if compliance.get("gdpr_compliant"):
-                    gdpr_compliant += 1
-                if compliance.get("hipaa_compliant"):
-                    hipaa_compliant += 1
-                if compliance.get("soc2_compliant"):
-                    soc2_compliant += 1
+        for section in (
+            "llm_requests",
+            "pattern_storage",
+            "pattern_retrieval",
+            "security_violations",
+        ):
+            merge_rollup(report[section], totals[section])
+
+        compliance = totals["compliance"]
+        total_compliance_checks = compliance["checks"]
+        gdpr_compliant = compliance["gdpr"]
+        hipaa_compliant = compliance["hipaa"]
+        soc2_compliant = compliance["soc2"]
 
         # Calculate compliance rates
         if total_compliance_checks > 0:
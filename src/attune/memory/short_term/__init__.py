@@ -14,6 +14,7 @@ Submodules:
     sessions: Collaboration session management
     batch: Batch operations for efficiency
     pagination: SCAN-based key pagination
+    embedded_store: Embedded store backing mock mode
     pubsub: Pub/Sub messaging
     streams: Redis Streams operations
     timelines: Time-window queries (sorted sets)
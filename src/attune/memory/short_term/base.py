@@ -37,11 +37,11 @@ from __future__ import annotations
 import os
 import time
 from collections.abc import Callable
-from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from attune.memory.short_term.embedded_store import EmbeddedStore
 from attune.memory.types import RedisConfig, RedisMetrics
 
 if TYPE_CHECKING:
@@ -89,7 +89,7 @@ class BaseOperations:
         _config: Redis configuration
         _metrics: Operation metrics tracker
         _client: Redis client instance (None if mock)
-        _mock_storage: In-memory storage for mock mode
+        _mock_storage: Embedded store used in mock mode
     """
 
     # Key prefixes for namespacing (shared across all operations)
@@ -166,11 +166,10 @@ class BaseOperations:
         # Initialize metrics
         self._metrics = RedisMetrics()
 
-        # Mock storage for testing
-        self._mock_storage: dict[str, tuple[Any, float | None]] = {}
-        self._mock_lists: dict[str, list[str]] = {}
-        self._mock_sorted_sets: dict[str, list[tuple[float, str]]] = {}
-        self._mock_streams: dict[str, list[tuple[str, dict]]] = {}
+        # Embedded store for mock mode (also backs lists, sorted sets, streams)
+        self._mock_storage = EmbeddedStore(
+            snapshot_path=self._config.mock_snapshot_path if self.use_mock else None
+        )
 
         # Create client
         if self.use_mock:
@@ -311,12 +310,8 @@ class BaseOperations:
         """
         # Mock mode path
         if self.use_mock:
-            if key in self._mock_storage:
-                value, expires = self._mock_storage[key]
-                if expires is None or datetime.now().timestamp() < expires:
-                    return str(value) if value is not None else None
-                del self._mock_storage[key]
-            return None
+            value = self._mock_storage.get_value(key)
+            return str(value) if value is not None else None
 
         # Real Redis path
         if self._client is None:
@@ -345,8 +340,7 @@ class BaseOperations:
 
         # Mock mode path
         if self.use_mock:
-            expires = datetime.now().timestamp() + effective_ttl
-            self._mock_storage[key] = (value, expires)
+            self._mock_storage.set_value(key, value, ttl=effective_ttl)
             return True
 
         # Real Redis path
@@ -368,10 +362,7 @@ class BaseOperations:
         """
         # Mock mode path
         if self.use_mock:
-            if key in self._mock_storage:
-                del self._mock_storage[key]
-                return True
-            return False
+            return self._mock_storage.delete(key)
 
         # Real Redis path
         if self._client is None:
@@ -389,10 +380,7 @@ class BaseOperations:
             List of matching keys
         """
         if self.use_mock:
-            import fnmatch
-
-            # Use list comp for small result sets (typical <1000 keys)
-            return [k for k in self._mock_storage.keys() if fnmatch.fnmatch(k, pattern)]
+            return self._mock_storage.keys_matching(pattern)
 
         if self._client is None:
             return []
@@ -425,19 +413,13 @@ class BaseOperations:
             Dict with memory stats including mode, key counts by prefix
         """
         if self.use_mock:
-            # Use generator expressions for memory-efficient counting
+            # Prefix counts come straight from the sorted key index
             return {
                 "mode": "mock",
                 "total_keys": len(self._mock_storage),
-                "working_keys": sum(
-                    1 for k in self._mock_storage if k.startswith(self.PREFIX_WORKING)
-                ),
-                "staged_keys": sum(
-                    1 for k in self._mock_storage if k.startswith(self.PREFIX_STAGED)
-                ),
-                "conflict_keys": sum(
-                    1 for k in self._mock_storage if k.startswith(self.PREFIX_CONFLICT)
-                ),
+                "working_keys": self._mock_storage.count_prefix(self.PREFIX_WORKING),
+                "staged_keys": self._mock_storage.count_prefix(self.PREFIX_STAGED),
+                "conflict_keys": self._mock_storage.count_prefix(self.PREFIX_CONFLICT),
             }
 
         if self._client is None:
@@ -467,7 +449,16 @@ class BaseOperations:
         self._metrics = RedisMetrics()
 
     def close(self) -> None:
-        """Close Redis connection and cleanup resources."""
+        """Close Redis connection and cleanup resources.
+
+        In mock mode with ``mock_snapshot_path`` configured, the embedded
+        store is snapshotted to disk.
+        """
+        if self.use_mock and self._mock_storage.snapshot_path is not None:
+            try:
+                self._mock_storage.save_snapshot()
+            except (OSError, ValueError) as e:
+                logger.warning("embedded_store_snapshot_failed", error=str(e))
         if self._client:
             self._client.close()
             self._client = None
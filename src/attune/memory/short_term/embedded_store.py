@@ -0,0 +1,676 @@
+"""Embedded in-process store used when Redis is unavailable.
+
+Stand-in for Redis in mock mode (local runs, CI, single-node deployments):
+- String keyspace with ``(value, expires)`` entries, exposed as a mapping so
+  existing mock-mode code paths keep working unchanged
+- Sorted key index for prefix and glob scans (SCAN-style cursors)
+- Expiry heap with active reaping of expired keys
+- List, sorted set and stream types for the queue, timeline and stream managers
+- Optional JSON snapshot persistence
+
+Classes:
+    EmbeddedStore: Thread-safe embedded key/value store
+
+Example:
+    >>> from attune.memory.short_term.embedded_store import EmbeddedStore
+    >>> store = EmbeddedStore()
+    >>> store.set_value("empathy:working:a", "1", ttl=60)
+    >>> store.scan(match="empathy:working:*")
+    ('0', ['empathy:working:a'])
+
+Copyright 2025 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import functools
+import heapq
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, MutableMapping
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_GLOB_SPECIAL = re.compile(r"[*?\[\\]")
+
+SNAPSHOT_VERSION = 1
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a Redis-style (case-sensitive) glob pattern."""
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the literal prefix of a glob pattern (up to the first wildcard)."""
+    match = _GLOB_SPECIAL.search(pattern)
+    return pattern if match is None else pattern[: match.start()]
+
+
+def _parse_stream_id(entry_id: str) -> tuple[int, int]:
+    """Parse a ``<ms>-<seq>`` stream ID (a bare ``<ms>`` means sequence 0)."""
+    ms, _, seq = entry_id.partition("-")
+    try:
+        return int(ms), int(seq or 0)
+    except ValueError:
+        return 0, 0
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode a stored value for the JSON snapshot."""
+    if isinstance(value, set):
+        return {"__set__": sorted(_encode_value(v) for v in value)}
+    if isinstance(value, dict):
+        return {str(k): _encode_value(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_encode_value(v) for v in value]
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    """Decode a value written by :func:`_encode_value`."""
+    if isinstance(value, dict):
+        if set(value) == {"__set__"}:
+            return {_decode_value(v) for v in value["__set__"]}
+        return {k: _decode_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode_value(v) for v in value]
+    return value
+
+
+class _SortedSet:
+    """Member -> score mapping kept ordered by (score, member)."""
+
+    __slots__ = ("scores", "entries")
+
+    def __init__(self) -> None:
+        self.scores: dict[str, float] = {}
+        self.entries: list[tuple[float, str]] = []
+
+    def add(self, member: str, score: float) -> bool:
+        old = self.scores.get(member)
+        if old is not None:
+            if old == score:
+                return False
+            del self.entries[bisect.bisect_left(self.entries, (old, member))]
+        self.scores[member] = score
+        bisect.insort(self.entries, (score, member))
+        return old is None
+
+    def remove(self, member: str) -> bool:
+        score = self.scores.pop(member, None)
+        if score is None:
+            return False
+        del self.entries[bisect.bisect_left(self.entries, (score, member))]
+        return True
+
+    def span(self, min_score: float, max_score: float) -> tuple[int, int]:
+        lo = bisect.bisect_left(self.entries, min_score, key=lambda e: e[0])
+        hi = bisect.bisect_right(self.entries, max_score, key=lambda e: e[0])
+        return lo, max(lo, hi)
+
+
+class _Stream:
+    """Append-only entry log with monotonic IDs and cheap head trimming."""
+
+    __slots__ = ("entries", "head", "last_id")
+
+    def __init__(self) -> None:
+        self.entries: list[tuple[tuple[int, int], dict]] = []
+        self.head = 0
+        self.last_id = (0, 0)
+
+    def __len__(self) -> int:
+        return len(self.entries) - self.head
+
+    def next_id(self, now_ms: int) -> tuple[int, int]:
+        ms, seq = self.last_id
+        return (now_ms, 0) if now_ms > ms else (ms, seq + 1)
+
+    def append(self, entry_id: tuple[int, int], fields: dict) -> None:
+        self.entries.append((entry_id, fields))
+        self.last_id = entry_id
+
+    def trim(self, max_len: int) -> None:
+        self.head = max(self.head, len(self.entries) - max_len)
+        # Compact once the dead head dominates the backing list
+        if self.head > 1024 and self.head * 2 > len(self.entries):
+            del self.entries[: self.head]
+            self.head = 0
+
+    def after(self, entry_id: tuple[int, int], count: int) -> list[tuple[tuple[int, int], dict]]:
+        start = bisect.bisect_right(self.entries, entry_id, lo=self.head, key=lambda e: e[0])
+        return self.entries[start : start + count]
+
+
+class EmbeddedStore(MutableMapping[str, tuple[Any, float | None]]):
+    """Thread-safe embedded store for short-term memory mock mode.
+
+    The string keyspace behaves like the ``dict[str, (value, expires)]`` it
+    replaces; raw mapping access does not apply expiry, so callers that
+    manage ``expires`` themselves are unaffected. The ``get_value`` /
+    ``set_value`` / ``scan`` helpers honour TTLs like Redis and drive active
+    reaping: every ``REAP_INTERVAL`` seconds up to ``REAP_BATCH`` expired
+    keys are popped from the expiry heap.
+
+    Lists, sorted sets and streams live in their own namespaces and do not
+    expire (the managers using them never set TTLs).
+
+    Attributes:
+        snapshot_path: Optional JSON snapshot file for persistence
+    """
+
+    REAP_INTERVAL = 0.1  # seconds between active reaping passes
+    REAP_BATCH = 256  # max keys reclaimed per pass
+
+    def __init__(
+        self,
+        snapshot_path: str | Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the store, loading a snapshot if one exists.
+
+        Args:
+            snapshot_path: JSON snapshot file (None disables persistence)
+            clock: Time source returning epoch seconds (injectable for tests)
+        """
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._data: dict[str, tuple[Any, float | None]] = {}
+        self._sorted_keys: list[str] = []
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._last_reap = 0.0
+        self._lists: dict[str, deque[str]] = {}
+        self._zsets: dict[str, _SortedSet] = {}
+        self._streams: dict[str, _Stream] = {}
+
+        if self.snapshot_path is not None and self.snapshot_path.exists():
+            self.load_snapshot()
+
+    # =========================================================================
+    # Mapping protocol (raw access, no expiry checks)
+    # =========================================================================
+
+    def __getitem__(self, key: str) -> tuple[Any, float | None]:
+        with self._lock:
+            return self._data[key]
+
+    def __setitem__(self, key: str, entry: tuple[Any, float | None]) -> None:
+        with self._lock:
+            if key not in self._data:
+                bisect.insort(self._sorted_keys, key)
+            self._data[key] = entry
+            expires = entry[1]
+            if expires is not None:
+                heapq.heappush(self._expiry_heap, (expires, key))
+                self._compact_heap()
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self._data[key]
+            index = bisect.bisect_left(self._sorted_keys, key)
+            del self._sorted_keys[index]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._sorted_keys))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        """Remove every key, list, sorted set and stream."""
+        with self._lock:
+            self._data.clear()
+            self._sorted_keys.clear()
+            self._expiry_heap.clear()
+            self._lists.clear()
+            self._zsets.clear()
+            self._streams.clear()
+
+    # =========================================================================
+    # String keyspace with TTL semantics
+    # =========================================================================
+
+    def _is_live(self, entry: tuple[Any, float | None], now: float) -> bool:
+        expires = entry[1]
+        return expires is None or now < expires
+
+    def get_value(self, key: str) -> Any | None:
+        """Get a value, treating expired keys as missing.
+
+        Args:
+            key: Key to read
+
+        Returns:
+            Stored value, or None if missing or expired
+        """
+        now = self._clock()
+        with self._lock:
+            self._maybe_reap(now)
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if not self._is_live(entry, now):
+                del self[key]
+                return None
+            return entry[0]
+
+    def set_value(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Set a value with an optional TTL.
+
+        Args:
+            key: Key to write
+            value: Value to store
+            ttl: Time-to-live in seconds (None = no expiry)
+        """
+        now = self._clock()
+        with self._lock:
+            self[key] = (value, now + ttl if ttl is not None else None)
+            self._maybe_reap(now)
+
+    def delete(self, key: str) -> bool:
+        """Delete a key if present.
+
+        Returns:
+            True if the key existed
+        """
+        with self._lock:
+            if key not in self._data:
+                return False
+            del self[key]
+            return True
+
+    def expire(self, key: str, ttl: float) -> bool:
+        """Set a new TTL on an existing key.
+
+        Returns:
+            True if the key exists
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False
+            self[key] = (entry[0], self._clock() + ttl)
+            return True
+
+    def ttl(self, key: str) -> float | None:
+        """Remaining time-to-live in seconds (None if missing or persistent)."""
+        entry = self._data.get(key)
+        if entry is None or entry[1] is None:
+            return None
+        return max(0.0, entry[1] - self._clock())
+
+    def _key_range(self, prefix: str) -> tuple[int, int]:
+        """Index range of ``_sorted_keys`` starting with ``prefix``."""
+        lo = bisect.bisect_left(self._sorted_keys, prefix)
+        if not prefix:
+            return lo, len(self._sorted_keys)
+        hi = bisect.bisect_left(self._sorted_keys, prefix[:-1] + chr(ord(prefix[-1]) + 1))
+        return lo, hi
+
+    def _iter_matching(self, pattern: str, after: str | None = None) -> Iterator[str]:
+        """Yield live keys matching ``pattern`` in sorted order (lock held)."""
+        prefix = _literal_prefix(pattern)
+        now = self._clock()
+        if prefix == pattern:
+            entry = self._data.get(pattern)
+            if (
+                entry is not None
+                and self._is_live(entry, now)
+                and (after is None or pattern > after)
+            ):
+                yield pattern
+            return
+
+        lo, hi = self._key_range(prefix)
+        if after is not None:
+            lo = max(lo, bisect.bisect_right(self._sorted_keys, after))
+        regex = _compile_glob(pattern)
+        for i in range(lo, hi):
+            key = self._sorted_keys[i]
+            if regex.match(key) and self._is_live(self._data[key], now):
+                yield key
+
+    def keys_matching(self, pattern: str = "*") -> list[str]:
+        """List live keys matching a glob pattern.
+
+        Only the sorted-index range sharing the pattern's literal prefix is
+        visited, so namespaced lookups don't touch unrelated keys.
+
+        Args:
+            pattern: Redis-style glob pattern
+
+        Returns:
+            Matching keys in sorted order
+        """
+        with self._lock:
+            self._maybe_reap(self._clock())
+            return list(self._iter_matching(pattern))
+
+    def count_prefix(self, prefix: str) -> int:
+        """Count keys (live or not yet reaped) starting with ``prefix``."""
+        with self._lock:
+            lo, hi = self._key_range(prefix)
+            return hi - lo
+
+    def scan(self, cursor: str = "0", match: str = "*", count: int = 100) -> tuple[str, list[str]]:
+        """Cursor-based iteration over live keys matching a pattern.
+
+        The cursor is the last key returned, so keys that exist for the
+        whole iteration are returned exactly once even if other keys are
+        added or removed between calls.
+
+        Args:
+            cursor: "0" to start, or the cursor returned by the previous call
+            match: Redis-style glob pattern
+            count: Maximum keys to return
+
+        Returns:
+            Tuple of (next cursor, keys); the cursor is "0" when finished
+        """
+        with self._lock:
+            self._maybe_reap(self._clock())
+            after = None if cursor == "0" else cursor
+            keys: list[str] = []
+            matches = self._iter_matching(match, after=after)
+            for key in matches:
+                if len(keys) == count:
+                    return keys[-1], keys
+                keys.append(key)
+            return "0", keys
+
+    # =========================================================================
+    # Expiry
+    # =========================================================================
+
+    def _compact_heap(self) -> None:
+        """Drop superseded heap entries once they dominate the heap."""
+        if len(self._expiry_heap) > 2 * len(self._data) + 64:
+            self._expiry_heap = [
+                (entry[1], key) for key, entry in self._data.items() if entry[1] is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _maybe_reap(self, now: float) -> None:
+        if now - self._last_reap >= self.REAP_INTERVAL:
+            self._last_reap = now
+            self.reap_expired(limit=self.REAP_BATCH, now=now)
+
+    def reap_expired(self, limit: int | None = None, now: float | None = None) -> int:
+        """Delete expired keys, oldest deadline first.
+
+        Args:
+            limit: Maximum keys to delete (None = all expired keys)
+            now: Reference time (defaults to the store clock)
+
+        Returns:
+            Number of keys deleted
+        """
+        now = self._clock() if now is None else now
+        reaped = 0
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now and (limit is None or reaped < limit):
+                expires, key = heapq.heappop(heap)
+                entry = self._data.get(key)
+                # Skip entries superseded by a later set/expire
+                if entry is None or entry[1] != expires:
+                    continue
+                del self[key]
+                reaped += 1
+        if reaped:
+            logger.debug("embedded_store_reaped", keys=reaped)
+        return reaped
+
+    # =========================================================================
+    # Lists
+    # =========================================================================
+
+    def lpush(self, key: str, value: str) -> int:
+        """Push to the head of a list; returns the new length."""
+        with self._lock:
+            items = self._lists.setdefault(key, deque())
+            items.appendleft(value)
+            return len(items)
+
+    def rpush(self, key: str, value: str) -> int:
+        """Push to the tail of a list; returns the new length."""
+        with self._lock:
+            items = self._lists.setdefault(key, deque())
+            items.append(value)
+            return len(items)
+
+    def lpop(self, key: str) -> str | None:
+        """Pop from the head of a list (None if empty)."""
+        with self._lock:
+            items = self._lists.get(key)
+            if not items:
+                return None
+            value = items.popleft()
+            if not items:
+                del self._lists[key]
+            return value
+
+    def llen(self, key: str) -> int:
+        """Length of a list (0 if missing)."""
+        return len(self._lists.get(key, ()))
+
+    def lrange(self, key: str, start: int, stop: int) -> list[str]:
+        """Items ``start..stop`` (inclusive) from the head of a list."""
+        with self._lock:
+            items = self._lists.get(key)
+            if not items:
+                return []
+            if stop < 0:
+                stop += len(items)
+            return [items[i] for i in range(max(start, 0), min(stop + 1, len(items)))]
+
+    # =========================================================================
+    # Sorted sets
+    # =========================================================================
+
+    def zadd(self, key: str, member: str, score: float) -> bool:
+        """Add or re-score a member; returns True if it was new."""
+        with self._lock:
+            return self._zsets.setdefault(key, _SortedSet()).add(member, score)
+
+    def zrem(self, key: str, member: str) -> bool:
+        """Remove a member; returns True if it existed."""
+        with self._lock:
+            zset = self._zsets.get(key)
+            return zset.remove(member) if zset is not None else False
+
+    def zcard(self, key: str) -> int:
+        """Number of members in a sorted set."""
+        zset = self._zsets.get(key)
+        return len(zset.scores) if zset is not None else 0
+
+    def zrangebyscore(
+        self,
+        key: str,
+        min_score: float,
+        max_score: float,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[str]:
+        """Members with ``min_score <= score <= max_score`` in ascending order."""
+        with self._lock:
+            zset = self._zsets.get(key)
+            if zset is None:
+                return []
+            lo, hi = zset.span(min_score, max_score)
+            lo += offset
+            if limit is not None:
+                hi = min(hi, lo + limit)
+            return [member for _, member in zset.entries[lo:hi]]
+
+    def zcount(self, key: str, min_score: float, max_score: float) -> int:
+        """Number of members with ``min_score <= score <= max_score``."""
+        with self._lock:
+            zset = self._zsets.get(key)
+            if zset is None:
+                return 0
+            lo, hi = zset.span(min_score, max_score)
+            return hi - lo
+
+    # =========================================================================
+    # Streams
+    # =========================================================================
+
+    def xadd(self, key: str, fields: dict, max_len: int | None = None) -> str:
+        """Append an entry with an auto-generated ``<ms>-<seq>`` ID.
+
+        Args:
+            key: Stream key
+            fields: Entry fields
+            max_len: Trim the stream to this many entries (None = unbounded)
+
+        Returns:
+            The new entry ID
+        """
+        with self._lock:
+            stream = self._streams.setdefault(key, _Stream())
+            entry_id = stream.next_id(int(self._clock() * 1000))
+            stream.append(entry_id, fields)
+            if max_len is not None:
+                stream.trim(max_len)
+            return f"{entry_id[0]}-{entry_id[1]}"
+
+    def xlen(self, key: str) -> int:
+        """Number of entries in a stream."""
+        stream = self._streams.get(key)
+        return len(stream) if stream is not None else 0
+
+    def xread_after(
+        self, key: str, after_id: str = "0", count: int = 100
+    ) -> list[tuple[str, dict]]:
+        """Entries with IDs strictly greater than ``after_id``.
+
+        Args:
+            key: Stream key
+            after_id: Exclusive lower bound ("0" = from the beginning)
+            count: Maximum entries to return
+
+        Returns:
+            List of (entry_id, fields) tuples
+        """
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is None:
+                return []
+            return [
+                (f"{ms}-{seq}", fields)
+                for (ms, seq), fields in stream.after(_parse_stream_id(after_id), count)
+            ]
+
+    # =========================================================================
+    # Snapshot persistence
+    # =========================================================================
+
+    def save_snapshot(self, path: str | Path | None = None) -> int:
+        """Write all live data to a JSON snapshot (atomically).
+
+        Sets are tagged so they round-trip; tuples come back as lists and
+        other non-JSON values are stored as strings.
+
+        Args:
+            path: Snapshot file (defaults to ``snapshot_path``)
+
+        Returns:
+            Number of string keys written
+
+        Raises:
+            ValueError: If no path is configured or the path is unsafe
+        """
+        from attune.config import _validate_file_path
+
+        target = Path(path) if path else self.snapshot_path
+        if target is None:
+            raise ValueError("No snapshot path configured")
+        validated = _validate_file_path(str(target))
+
+        now = self._clock()
+        with self._lock:
+            strings = []
+            for key in self._sorted_keys:
+                value, expires = self._data[key]
+                if expires is not None and expires <= now:
+                    continue
+                strings.append([key, _encode_value(value), expires])
+            snapshot = {
+                "version": SNAPSHOT_VERSION,
+                "saved_at": now,
+                "strings": strings,
+                "lists": {k: list(v) for k, v in self._lists.items()},
+                "zsets": {k: z.entries for k, z in self._zsets.items()},
+                "streams": {
+                    k: {
+                        "last_id": list(s.last_id),
+                        "entries": [[list(eid), f] for eid, f in s.entries[s.head :]],
+                    }
+                    for k, s in self._streams.items()
+                },
+            }
+
+        validated.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = validated.with_suffix(validated.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(snapshot, default=str), encoding="utf-8")
+        os.replace(tmp_path, validated)
+        logger.debug("embedded_store_snapshot_saved", path=str(validated), keys=len(strings))
+        return len(strings)
+
+    def load_snapshot(self, path: str | Path | None = None) -> int:
+        """Replace the store contents with a JSON snapshot.
+
+        Expired keys are dropped; a corrupt snapshot leaves the store empty.
+
+        Args:
+            path: Snapshot file (defaults to ``snapshot_path``)
+
+        Returns:
+            Number of string keys loaded
+        """
+        source = Path(path) if path else self.snapshot_path
+        if source is None or not source.exists():
+            return 0
+        try:
+            snapshot = json.loads(source.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("embedded_store_snapshot_load_failed", path=str(source), error=str(e))
+            return 0
+
+        now = self._clock()
+        with self._lock:
+            self.clear()
+            for key, value, expires in snapshot.get("strings", []):
+                if expires is None or expires > now:
+                    self[key] = (_decode_value(value), expires)
+            for key, items in snapshot.get("lists", {}).items():
+                self._lists[key] = deque(items)
+            for key, entries in snapshot.get("zsets", {}).items():
+                zset = self._zsets[key] = _SortedSet()
+                for score, member in entries:
+                    zset.add(member, score)
+            for key, data in snapshot.get("streams", {}).items():
+                stream = self._streams[key] = _Stream()
+                for entry_id, fields in data.get("entries", []):
+                    stream.append(tuple(entry_id), fields)
+                stream.last_id = tuple(data.get("last_id", stream.last_id))
+            return len(self._data)
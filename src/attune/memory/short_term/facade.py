@@ -70,6 +70,7 @@ from attune.memory.short_term.working import WorkingMemory
 logger = structlog.get_logger(__name__)
 
 if TYPE_CHECKING:
+    from attune.memory.short_term.embedded_store import EmbeddedStore
     from attune.memory.types import (
         AgentCredentials,
         CollaborationSession,
@@ -654,7 +655,7 @@ class RedisShortTermMemory:
     # =========================================================================
 
     @property
-    def _mock_storage(self) -> dict:
+    def _mock_storage(self) -> EmbeddedStore:
         """Access mock storage for testing."""
         return self._base._mock_storage
 
@@ -29,7 +29,6 @@ from __future__ import annotations
 
 import json
 import time
-from datetime import datetime
 from typing import TYPE_CHECKING
 
 import structlog
@@ -109,21 +108,17 @@ class Pagination:
 
         # Handle mock storage mode
         if self._base.use_mock:
-            import fnmatch
-
-            all_keys = [k for k in self._base._mock_storage.keys() if fnmatch.fnmatch(k, pattern)]
-            start_idx = int(cursor)
-            end_idx = start_idx + count
-            page_keys = all_keys[start_idx:end_idx]
+            # Key-ordered scan over the embedded store's sorted index
+            store = self._base._mock_storage
+            new_cursor, page_keys = store.scan(cursor=cursor, match=pattern, count=count)
 
             patterns = []
             for key in page_keys:
-                raw_value, expires = self._base._mock_storage[key]
-                if expires is None or datetime.now().timestamp() < expires:
+                raw_value = store.get_value(key)
+                if raw_value is not None:
                     patterns.append(StagedPattern.from_dict(json.loads(str(raw_value))))
 
-            new_cursor = str(end_idx) if end_idx < len(all_keys) else "0"
-            has_more = end_idx < len(all_keys)
+            has_more = new_cursor != "0"
 
             latency_ms = (time.perf_counter() - start_time) * 1000
             self._base._metrics.record_operation("list_paginated", latency_ms)
@@ -185,15 +180,10 @@ class Pagination:
         """
         # Handle mock storage mode
         if self._base.use_mock:
-            import fnmatch
-
-            all_keys = [k for k in self._base._mock_storage.keys() if fnmatch.fnmatch(k, pattern)]
-            start_idx = int(cursor)
-            end_idx = start_idx + count
-            page_keys = all_keys[start_idx:end_idx]
-            new_cursor = str(end_idx) if end_idx < len(all_keys) else "0"
-            has_more = end_idx < len(all_keys)
-            return PaginatedResult(items=page_keys, cursor=new_cursor, has_more=has_more)
+            new_cursor, page_keys = self._base._mock_storage.scan(
+                cursor=cursor, match=pattern, count=count
+            )
+            return PaginatedResult(items=page_keys, cursor=new_cursor, has_more=new_cursor != "0")
 
         # Handle real Redis client
         if self._base._client is None:
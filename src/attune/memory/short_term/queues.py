@@ -52,8 +52,8 @@ class QueueManager:
     Provides FIFO queue operations using Redis lists for task
     distribution and background job processing.
 
-    The class manages its own mock list storage for testing,
-    composed with BaseOperations for Redis client access.
+    In mock mode, lists live in the embedded store of the composed
+    BaseOperations instance.
 
     Attributes:
         PREFIX_QUEUE: Key prefix for queue names
@@ -74,7 +74,6 @@ class QueueManager:
             base: BaseOperations instance for Redis client access
         """
         self._base = base
-        self._mock_lists: dict[str, list[str]] = {}
 
     def push(
         self,
@@ -119,13 +118,9 @@ class QueueManager:
 
         # Handle mock mode
         if self._base.use_mock:
-            if full_queue not in self._mock_lists:
-                self._mock_lists[full_queue] = []
             if priority:
-                self._mock_lists[full_queue].insert(0, payload)
-            else:
-                self._mock_lists[full_queue].append(payload)
-            return len(self._mock_lists[full_queue])
+                return self._base._mock_storage.lpush(full_queue, payload)
+            return self._base._mock_storage.rpush(full_queue, payload)
 
         # Handle real Redis client
         if self._base._client is None:
@@ -160,9 +155,9 @@ class QueueManager:
 
         # Handle mock mode
         if self._base.use_mock:
-            if full_queue not in self._mock_lists or not self._mock_lists[full_queue]:
+            payload = self._base._mock_storage.lpop(full_queue)
+            if payload is None:
                 return None
-            payload = self._mock_lists[full_queue].pop(0)
             data: dict = json.loads(payload)
             return data
 
@@ -200,7 +195,7 @@ class QueueManager:
 
         # Handle mock mode
         if self._base.use_mock:
-            return len(self._mock_lists.get(full_queue, []))
+            return self._base._mock_storage.llen(full_queue)
 
         # Handle real Redis client
         if self._base._client is None:
@@ -233,7 +228,7 @@ class QueueManager:
 
         # Handle mock mode
         if self._base.use_mock:
-            items = self._mock_lists.get(full_queue, [])[:count]
+            items = self._base._mock_storage.lrange(full_queue, 0, count - 1)
             return [json.loads(item) for item in items]
 
         # Handle real Redis client
@@ -53,8 +53,8 @@ class StreamManager:
     Features include automatic ID generation, max length trimming,
     and blocking reads for real-time event processing.
 
-    The class manages its own mock stream storage for testing,
-    composed with BaseOperations for Redis client access.
+    In mock mode, streams live in the embedded store of the composed
+    BaseOperations instance.
 
     Attributes:
         PREFIX_STREAM: Key prefix for stream names
@@ -77,7 +77,6 @@ class StreamManager:
             base: BaseOperations instance for Redis client access
         """
         self._base = base
-        self._mock_streams: dict[str, list[tuple[str, dict]]] = {}
 
     def append(
         self,
@@ -133,13 +132,7 @@ class StreamManager:
 
         # Handle mock mode
         if self._base.use_mock:
-            if full_stream not in self._mock_streams:
-                self._mock_streams[full_stream] = []
-            entry_id = f"{int(datetime.now().timestamp() * 1000)}-0"
-            self._mock_streams[full_stream].append((entry_id, entry))
-            # Trim to max_len
-            if len(self._mock_streams[full_stream]) > max_len:
-                self._mock_streams[full_stream] = self._mock_streams[full_stream][-max_len:]
+            entry_id = self._base._mock_storage.xadd(full_stream, entry, max_len=max_len)
             latency_ms = (time.perf_counter() - start_time) * 1000
             self._base._metrics.record_operation("stream_append", latency_ms)
             return entry_id
@@ -181,12 +174,7 @@ class StreamManager:
 
         # Handle mock mode
         if self._base.use_mock:
-            if full_stream not in self._mock_streams:
-                return []
-            entries = self._mock_streams[full_stream]
-            # Filter by start_id (simple comparison)
-            filtered = [(eid, data) for eid, data in entries if eid > start_id]
-            return filtered[:count]
+            return self._base._mock_storage.xread_after(full_stream, start_id, count)
 
         # Handle real Redis client
         if self._base._client is None:
@@ -52,8 +52,8 @@ class TimelineManager:
     Provides time-series event storage using Redis sorted sets,
     where events are scored by timestamp for efficient time-window queries.
 
-    The class manages its own mock sorted set storage for testing,
-    composed with BaseOperations for Redis client access.
+    In mock mode, sorted sets live in the embedded store of the composed
+    BaseOperations instance.
 
     Attributes:
         PREFIX_TIMELINE: Key prefix for timeline names
@@ -75,7 +75,6 @@ class TimelineManager:
             base: BaseOperations instance for Redis client access
         """
         self._base = base
-        self._mock_sorted_sets: dict[str, list[tuple[float, str]]] = {}
 
     def add(
         self,
@@ -130,10 +129,7 @@ class TimelineManager:
 
         # Handle mock mode
         if self._base.use_mock:
-            if full_timeline not in self._mock_sorted_sets:
-                self._mock_sorted_sets[full_timeline] = []
-            self._mock_sorted_sets[full_timeline].append((score, payload))
-            self._mock_sorted_sets[full_timeline].sort(key=lambda x: x[0])
+            self._base._mock_storage.zadd(full_timeline, payload, score)
             return True
 
         # Handle real Redis client
@@ -173,15 +169,10 @@ class TimelineManager:
 
         # Handle mock mode
         if self._base.use_mock:
-            if full_timeline not in self._mock_sorted_sets:
-                return []
-            entries = self._mock_sorted_sets[full_timeline]
-            filtered = [
-                json.loads(payload)
-                for score, payload in entries
-                if q.start_score <= score <= q.end_score
-            ]
-            return filtered[q.offset : q.offset + q.limit]
+            payloads = self._base._mock_storage.zrangebyscore(
+                full_timeline, q.start_score, q.end_score, offset=q.offset, limit=q.limit
+            )
+            return [json.loads(payload) for payload in payloads]
 
         # Handle real Redis client
         if self._base._client is None:
@@ -222,10 +213,7 @@ class TimelineManager:
 
         # Handle mock mode
         if self._base.use_mock:
-            if full_timeline not in self._mock_sorted_sets:
-                return 0
-            entries = self._mock_sorted_sets[full_timeline]
-            return len([1 for score, _ in entries if q.start_score <= score <= q.end_score])
+            return self._base._mock_storage.zcount(full_timeline, q.start_score, q.end_score)
 
         # Handle real Redis client
         if self._base._client is None:
@@ -10,6 +10,7 @@ Key Features:
 - JSON-based file storage
 - Pattern storage with metadata
 - Query support (by classification, creator)
+- SQLite metadata/full-text index so list and search don't parse every file
 - Path validation for security
 
 Copyright 2025 Smart AI Memory, LLC
@@ -24,6 +25,8 @@ import structlog
 
 from attune.config import _validate_file_path
 
+from .pattern_index import PatternIndex, query_words, score_pattern_text
+
 logger = structlog.get_logger(__name__)
 
 
@@ -43,6 +46,8 @@ class MemDocsStorage:
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        # None when SQLite FTS5 is unavailable; queries then scan the files
+        self.index = PatternIndex.open(self.storage_dir)
         logger.info("memdocs_storage_initialized", storage_dir=str(self.storage_dir))
 
     def store(self, pattern_id: str, content: str, metadata: dict[str, Any]) -> bool:
@@ -72,6 +77,9 @@ class MemDocsStorage:
             with open(validated_pattern_file, "w", encoding="utf-8") as f:
                 json.dump(pattern_data, f, indent=2)
 
+            if self.index is not None:
+                self.index.upsert(pattern_file, pattern_data)
+
             logger.debug("pattern_stored", pattern_id=pattern_id)
             return True
 
@@ -123,6 +131,8 @@ class MemDocsStorage:
                 return False
 
             pattern_file.unlink()
+            if self.index is not None:
+                self.index.remove(pattern_file)
             logger.info("pattern_deleted", pattern_id=pattern_id)
             return True
 
@@ -145,6 +155,13 @@ class MemDocsStorage:
             List of pattern IDs
 
         """
+        if self.index is not None:
+            self.index.sync()
+            return self.index.list_ids(  # type: ignore[return-value]
+                classification=classification or None,
+                created_by=created_by or None,
+            )
+
         pattern_ids = []
 
         for pattern_file in self.storage_dir.glob("*.json"):
@@ -165,3 +182,90 @@ class MemDocsStorage:
                 continue
 
         return pattern_ids
+
+    def list_metadata(
+        self,
+        classification: str | None = None,
+        created_by: str | None = None,
+        pattern_type: str | None = None,
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """List pattern IDs with their metadata, without loading content.
+
+        Args:
+            classification: Filter by classification
+            created_by: Filter by creator
+            pattern_type: Filter by pattern type
+
+        Returns:
+            List of (pattern_id, metadata) tuples
+
+        """
+        if self.index is not None:
+            self.index.sync()
+            return [
+                (record.pattern_id, record.metadata)
+                for record in self.index.list_records(
+                    classification=classification or None,
+                    created_by=created_by or None,
+                    pattern_type=pattern_type or None,
+                )
+                if record.pattern_id is not None
+            ]
+
+        results = []
+        for pattern_id in self.list_patterns(classification=classification, created_by=created_by):
+            data = self.retrieve(pattern_id) if pattern_id else None
+            if data is None:
+                continue
+            metadata = data.get("metadata", {})
+            if pattern_type and metadata.get("pattern_type") != pattern_type:
+                continue
+            results.append((pattern_id, metadata))
+        return results
+
+    def search_patterns(
+        self,
+        query: str | None = None,
+        pattern_type: str | None = None,
+        classification: str | None = None,
+        limit: int = 10,
+    ) -> list[str]:
+        """Search patterns by keyword relevance.
+
+        Args:
+            query: Text to search for (None returns any matching pattern)
+            pattern_type: Filter by pattern type
+            classification: Filter by classification
+            limit: Maximum results
+
+        Returns:
+            Pattern IDs, most relevant first
+
+        """
+        if self.index is not None:
+            self.index.sync()
+            return [
+                pattern_id
+                for _, _, pattern_id in self.index.search(
+                    query,
+                    pattern_type=pattern_type,
+                    classification=classification,
+                    limit=limit,
+                    top_level_only=True,
+                )
+                if pattern_id is not None
+            ]
+
+        query_lower = query.lower() if query else ""
+        words = query_words(query_lower)
+        scored = []
+        for pattern_id, metadata in self.list_metadata(
+            classification=classification, pattern_type=pattern_type
+        ):
+            data = self.retrieve(pattern_id) or {}
+            content = "" if metadata.get("encrypted") else str(data.get("content", ""))
+            score = score_pattern_text(content, str(metadata), query_lower, words)
+            if score > 0:
+                scored.append((score, pattern_id))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [pattern_id for _, pattern_id in scored[:limit]]
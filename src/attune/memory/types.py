@@ -105,6 +105,9 @@ class RedisConfig:
     sentinel_hosts: list[tuple[str, int]] | None = None
     sentinel_master_name: str | None = None
 
+    # Embedded store settings (mock mode)
+    mock_snapshot_path: str | None = None  # Persist mock-mode data to this JSON file
+
     def to_redis_kwargs(self) -> dict:
         """Convert to redis.Redis constructor kwargs."""
         kwargs: dict[str, Any] = {
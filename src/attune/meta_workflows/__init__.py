@@ -11,6 +11,7 @@ Version: 1.0.0 (experimental)
 """
 
 from attune.meta_workflows.agent_creator import DynamicAgentCreator
+from attune.meta_workflows.analytics_index import ExecutionIndex, ExecutionSummary
 from attune.meta_workflows.form_engine import SocraticFormEngine
 from attune.meta_workflows.intent_detector import (
     IntentDetector,
@@ -64,6 +65,8 @@ __all__ = [
     "list_execution_results",
     "load_execution_result",
     # Analytics
+    "ExecutionIndex",
+    "ExecutionSummary",
     "PatternInsight",
     "PatternLearner",
     # Intent detection
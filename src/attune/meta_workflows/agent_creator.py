@@ -20,6 +20,12 @@ from attune.meta_workflows.models import (
 
 logger = logging.getLogger(__name__)
 
+# Roles that must run after other roles when both are part of a team
+AGENT_ROLE_DEPENDENCIES: dict[str, list[str]] = {
+    "publisher": ["package_builder"],
+    "changelog_updater": ["version_manager"],
+}
+
 
 class DynamicAgentCreator:
     """Creates agent teams dynamically from templates and form responses.
@@ -230,15 +236,9 @@ def validate_agent_dependencies(agents: list[AgentSpec]) -> list[str]:
     warnings = []
     agent_roles = {agent.role for agent in agents}
 
-    # Common dependencies
-    dependencies = {
-        "publisher": ["package_builder"],
-        "changelog_updater": ["version_manager"],
-    }
-
     for agent in agents:
-        if agent.role in dependencies:
-            for required_role in dependencies[agent.role]:
+        if agent.role in AGENT_ROLE_DEPENDENCIES:
+            for required_role in AGENT_ROLE_DEPENDENCIES[agent.role]:
                 if required_role not in agent_roles:
                     warnings.append(
                         f"Agent '{agent.role}' typically requires '{required_role}' "
@@ -246,3 +246,64 @@ def validate_agent_dependencies(agents: list[AgentSpec]) -> list[str]:
                     )
 
     return warnings
+
+
+def resolve_agent_dependencies(agents: list[AgentSpec]) -> dict[str, list[str]]:
+    """Resolve which agents each agent has to wait for.
+
+    Dependencies come from AGENT_ROLE_DEPENDENCIES plus any roles listed in
+    an agent's ``config["depends_on"]``. Required roles that are not part of
+    the team are ignored (validate_agent_dependencies() reports those).
+
+    Args:
+        agents: List of agent specs
+
+    Returns:
+        Mapping of agent_id to the agent_ids that must finish first
+
+    Raises:
+        ValueError: If the dependencies form a cycle
+
+    Example:
+        >>> builder = AgentSpec(role="package_builder", base_template="generic", tier_strategy=TierStrategy.CHEAP_ONLY, agent_id="b")
+        >>> publisher = AgentSpec(role="publisher", base_template="generic", tier_strategy=TierStrategy.CHEAP_ONLY, agent_id="p")
+        >>> resolve_agent_dependencies([publisher, builder])
+        {'p': ['b'], 'b': []}
+    """
+    ids_by_role: dict[str, list[str]] = {}
+    for agent in agents:
+        ids_by_role.setdefault(agent.role, []).append(agent.agent_id)
+
+    dependencies: dict[str, list[str]] = {}
+    for agent in agents:
+        required_roles = list(AGENT_ROLE_DEPENDENCIES.get(agent.role, []))
+        required_roles.extend(agent.config.get("depends_on", []))
+        dependencies[agent.agent_id] = [
+            agent_id
+            for role in required_roles
+            for agent_id in ids_by_role.get(role, [])
+            if agent_id != agent.agent_id
+        ]
+
+    # Kahn's algorithm - anything left unvisited is part of a cycle
+    remaining = {agent_id: len(deps) for agent_id, deps in dependencies.items()}
+    dependents: dict[str, list[str]] = {agent_id: [] for agent_id in dependencies}
+    for agent_id, deps in dependencies.items():
+        for dep in deps:
+            dependents[dep].append(agent_id)
+
+    ready = [agent_id for agent_id, count in remaining.items() if count == 0]
+    visited = 0
+    while ready:
+        agent_id = ready.pop()
+        visited += 1
+        for dependent in dependents[agent_id]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+
+    if visited != len(dependencies):
+        cyclic = sorted(agent_id for agent_id, count in remaining.items() if count > 0)
+        raise ValueError(f"Circular agent dependencies: {', '.join(cyclic)}")
+
+    return dependencies
@@ -0,0 +1,420 @@
+"""Incremental analytics index for meta-workflow executions.
+
+Keeps a compact, append-only table of execution summaries next to the
+saved run directories, plus per-template rollups built from it. Pattern
+analysis reads the index instead of loading every ``result.json``.
+
+Index file (``execution_index.jsonl`` in the executions directory):
+- One JSON object per line, appended when a run is saved
+- A later line for the same run_id replaces the earlier one
+- ``{"run_id": ..., "deleted": true}`` tombstones drop a run
+- Rewritten (compacted) once superseded lines outnumber live ones
+
+Created: 2026-10-18
+Purpose: Fast pattern analytics over thousands of meta-workflow runs
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from attune.config import _validate_file_path
+
+if TYPE_CHECKING:
+    from attune.meta_workflows.models import MetaWorkflowResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExecutionSummary:
+    """Compact row describing one saved execution.
+
+    Attributes:
+        run_id: Execution run ID
+        template_id: Template that was executed
+        timestamp: When the execution finished
+        success: Whether the whole workflow succeeded
+        total_cost: Total cost of the run
+        total_duration: Total duration in seconds
+        agent_count: Number of agents created
+        agents: Per-agent (role, tier_used, success, cost) rows
+        result_mtime_ns: mtime of result.json when indexed (None if unknown)
+    """
+
+    run_id: str
+    template_id: str
+    timestamp: str
+    success: bool
+    total_cost: float
+    total_duration: float
+    agent_count: int
+    agents: list[tuple[str, str, bool, float]] = field(default_factory=list)
+    result_mtime_ns: int | None = None
+
+    @property
+    def tier_counts(self) -> dict[str, int]:
+        """Number of agents that finished at each tier."""
+        counts: dict[str, int] = {}
+        for _role, tier, _success, _cost in self.agents:
+            counts[tier] = counts.get(tier, 0) + 1
+        return counts
+
+    @classmethod
+    def from_result(
+        cls, result: "MetaWorkflowResult", result_mtime_ns: int | None = None
+    ) -> "ExecutionSummary":
+        """Build a summary from a full execution result.
+
+        Args:
+            result: Execution result to summarize
+            result_mtime_ns: mtime of the result file the summary reflects
+
+        Returns:
+            ExecutionSummary for the result
+        """
+        return cls(
+            run_id=result.run_id,
+            template_id=result.template_id,
+            timestamp=result.timestamp,
+            success=bool(result.success),
+            total_cost=float(result.total_cost),
+            total_duration=float(result.total_duration),
+            agent_count=len(result.agents_created),
+            agents=[
+                (a.role, a.tier_used, bool(a.success), float(a.cost)) for a in result.agent_results
+            ],
+            result_mtime_ns=result_mtime_ns,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "run_id": self.run_id,
+            "template_id": self.template_id,
+            "timestamp": self.timestamp,
+            "success": self.success,
+            "total_cost": self.total_cost,
+            "total_duration": self.total_duration,
+            "agent_count": self.agent_count,
+            "agents": [list(a) for a in self.agents],
+            "result_mtime_ns": self.result_mtime_ns,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ExecutionSummary":
+        """Create from dictionary."""
+        return cls(
+            run_id=data["run_id"],
+            template_id=data["template_id"],
+            timestamp=data.get("timestamp", ""),
+            success=data.get("success", False),
+            total_cost=data.get("total_cost", 0.0),
+            total_duration=data.get("total_duration", 0.0),
+            agent_count=data.get("agent_count", 0),
+            agents=[tuple(a) for a in data.get("agents", [])],
+            result_mtime_ns=data.get("result_mtime_ns"),
+        )
+
+
+@dataclass
+class TemplateRollup:
+    """Pre-aggregated statistics over a set of executions.
+
+    Attributes:
+        template_id: Template the rollup covers (None for all templates)
+        runs: Number of executions
+        successful_runs: Number of successful executions
+        total_cost: Sum of execution costs
+        min_cost: Cheapest execution
+        max_cost: Most expensive execution
+        total_agents: Sum of agents created
+        agent_counts: Agents created per execution
+        tier_stats: "role:tier" -> {"success", "total", "cost"}
+        tier_costs: tier -> {"total", "count"}
+        role_stats: role -> {"total", "failures"}
+    """
+
+    template_id: str | None = None
+    runs: int = 0
+    successful_runs: int = 0
+    total_cost: float = 0.0
+    min_cost: float = 0.0
+    max_cost: float = 0.0
+    total_agents: int = 0
+    agent_counts: list[int] = field(default_factory=list)
+    tier_stats: dict[str, dict[str, float]] = field(default_factory=dict)
+    tier_costs: dict[str, dict[str, float]] = field(default_factory=dict)
+    role_stats: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def add(self, summary: ExecutionSummary) -> None:
+        """Fold one execution into the rollup.
+
+        Args:
+            summary: Execution summary to add
+        """
+        if self.runs == 0:
+            self.min_cost = self.max_cost = summary.total_cost
+        else:
+            self.min_cost = min(self.min_cost, summary.total_cost)
+            self.max_cost = max(self.max_cost, summary.total_cost)
+
+        self.runs += 1
+        if summary.success:
+            self.successful_runs += 1
+        self.total_cost += summary.total_cost
+        self.total_agents += summary.agent_count
+        self.agent_counts.append(summary.agent_count)
+
+        for role, tier, success, cost in summary.agents:
+            stats = self.tier_stats.setdefault(
+                f"{role}:{tier}", {"success": 0, "total": 0, "cost": 0.0}
+            )
+            stats["total"] += 1
+            stats["success"] += 1 if success else 0
+            stats["cost"] += cost
+
+            costs = self.tier_costs.setdefault(tier, {"total": 0.0, "count": 0})
+            costs["total"] += cost
+            costs["count"] += 1
+
+            role_stats = self.role_stats.setdefault(role, {"total": 0, "failures": 0})
+            role_stats["total"] += 1
+            role_stats["failures"] += 0 if success else 1
+
+    def merge(self, other: "TemplateRollup") -> None:
+        """Fold another rollup into this one.
+
+        Args:
+            other: Rollup to merge
+        """
+        if other.runs == 0:
+            return
+        if self.runs == 0:
+            self.min_cost, self.max_cost = other.min_cost, other.max_cost
+        else:
+            self.min_cost = min(self.min_cost, other.min_cost)
+            self.max_cost = max(self.max_cost, other.max_cost)
+
+        self.runs += other.runs
+        self.successful_runs += other.successful_runs
+        self.total_cost += other.total_cost
+        self.total_agents += other.total_agents
+        self.agent_counts.extend(other.agent_counts)
+
+        for target, source in (
+            (self.tier_stats, other.tier_stats),
+            (self.tier_costs, other.tier_costs),
+            (self.role_stats, other.role_stats),
+        ):
+            for key, values in source.items():
+                bucket = target.setdefault(key, dict.fromkeys(values, 0))
+                for name, value in values.items():
+                    bucket[name] += value
+
+
+class ExecutionIndex:
+    """Append-only execution summary table with per-template rollups.
+
+    Writes are O(1) appends; reads replay only the bytes appended since the
+    last refresh, so a long-lived index stays current cheaply.
+
+    Attributes:
+        executions_dir: Directory holding run directories and the index
+        index_path: Path of the index file
+    """
+
+    INDEX_FILE = "execution_index.jsonl"
+
+    def __init__(self, executions_dir: str | Path):
+        """Initialize index (nothing is read until refresh()).
+
+        Args:
+            executions_dir: Directory where execution results are stored
+        """
+        self.executions_dir = Path(executions_dir)
+        self.index_path = self.executions_dir / self.INDEX_FILE
+        self._summaries: dict[str, ExecutionSummary] = {}
+        self._rollups: dict[str, TemplateRollup] = {}
+        self._stale_templates: set[str] = set()
+        self._offset = 0
+        self._line_count = 0
+
+    def refresh(self) -> None:
+        """Apply index lines appended since the last refresh."""
+        try:
+            size = self.index_path.stat().st_size
+        except OSError:
+            return
+
+        if size < self._offset:
+            # Compacted by another writer - start over
+            self._summaries.clear()
+            self._rollups.clear()
+            self._stale_templates.clear()
+            self._offset = 0
+            self._line_count = 0
+
+        if size == self._offset:
+            return
+
+        try:
+            with self.index_path.open("rb") as f:
+                f.seek(self._offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # Partially written line - pick it up next time
+                    self._offset += len(raw)
+                    self._line_count += 1
+                    try:
+                        entry = json.loads(raw)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping malformed line in {self.index_path}")
+                        continue
+                    if entry.get("deleted"):
+                        self._drop(entry["run_id"])
+                    else:
+                        self._apply(ExecutionSummary.from_dict(entry))
+        except OSError as e:
+            logger.warning(f"Failed to read execution index: {e}")
+            return
+
+        self._maybe_compact()
+
+    def record(self, summary: ExecutionSummary, persist: bool = True) -> None:
+        """Add or replace an execution summary.
+
+        Args:
+            summary: Summary to store
+            persist: Append to the index file (False keeps it in memory only)
+        """
+        self._apply(summary)
+        if persist:
+            self._append(summary.to_dict())
+
+    def remove(self, run_id: str, persist: bool = True) -> None:
+        """Drop an execution from the index.
+
+        Args:
+            run_id: Run to drop
+            persist: Append a tombstone to the index file
+        """
+        if run_id not in self._summaries:
+            return
+        self._drop(run_id)
+        if persist:
+            self._append({"run_id": run_id, "deleted": True})
+
+    def get(self, run_id: str) -> ExecutionSummary | None:
+        """Get the summary for a run, if indexed."""
+        return self._summaries.get(run_id)
+
+    def run_ids(self) -> set[str]:
+        """All indexed run IDs."""
+        return set(self._summaries)
+
+    def summaries(self, template_id: str | None = None) -> list[ExecutionSummary]:
+        """Indexed summaries, newest run first.
+
+        Args:
+            template_id: Optional template ID to filter by
+
+        Returns:
+            Matching summaries sorted like list_execution_results()
+        """
+        matches = [
+            s
+            for s in self._summaries.values()
+            if template_id is None or s.template_id == template_id
+        ]
+        matches.sort(key=lambda s: s.run_id, reverse=True)
+        return matches
+
+    def rollup(self, template_id: str | None = None) -> TemplateRollup:
+        """Pre-aggregated statistics for one template or all of them.
+
+        Args:
+            template_id: Template to report on (None for all templates)
+
+        Returns:
+            TemplateRollup (empty if nothing matches)
+        """
+        for stale in self._stale_templates:
+            rebuilt = TemplateRollup(template_id=stale)
+            for summary in self._summaries.values():
+                if summary.template_id == stale:
+                    rebuilt.add(summary)
+            self._rollups[stale] = rebuilt
+        self._stale_templates.clear()
+
+        if template_id is not None:
+            return self._rollups.get(template_id, TemplateRollup(template_id=template_id))
+
+        combined = TemplateRollup()
+        for rollup in self._rollups.values():
+            combined.merge(rollup)
+        return combined
+
+    def compact(self) -> None:
+        """Rewrite the index file with only live summaries."""
+        lines = "".join(
+            json.dumps(s.to_dict(), separators=(",", ":")) + "\n" for s in self._summaries.values()
+        )
+        try:
+            validated_path = _validate_file_path(str(self.index_path))
+            tmp_path = validated_path.with_name(validated_path.name + ".tmp")
+            tmp_path.write_text(lines, encoding="utf-8")
+            os.replace(tmp_path, validated_path)
+            self._offset = len(lines.encode("utf-8"))
+            self._line_count = len(self._summaries)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to compact execution index: {e}")
+
+    def _apply(self, summary: ExecutionSummary) -> None:
+        """Apply a summary to the in-memory table and rollups."""
+        previous = self._summaries.get(summary.run_id)
+        self._summaries[summary.run_id] = summary
+        if previous is not None:
+            self._stale_templates.add(previous.template_id)
+            self._stale_templates.add(summary.template_id)
+        elif summary.template_id not in self._stale_templates:
+            self._rollups.setdefault(
+                summary.template_id, TemplateRollup(template_id=summary.template_id)
+            ).add(summary)
+
+    def _drop(self, run_id: str) -> None:
+        """Remove a run from the in-memory table and mark its rollup stale."""
+        previous = self._summaries.pop(run_id, None)
+        if previous is not None:
+            self._stale_templates.add(previous.template_id)
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        """Append one entry to the index file."""
+        if not self.executions_dir.exists():
+            return
+        line = (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+        try:
+            validated_path = _validate_file_path(str(self.index_path))
+            in_sync = (validated_path.stat().st_size if validated_path.exists() else 0) == (
+                self._offset
+            )
+            with validated_path.open("ab") as f:
+                f.write(line)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to update execution index: {e}")
+            return
+
+        # Our own line is already applied. If the file had other unread
+        # lines, leave the offset alone so refresh() still picks them up.
+        if in_sync:
+            self._offset += len(line)
+            self._line_count += 1
+            self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Compact once superseded lines clearly outnumber live summaries."""
+        if self._line_count > 2 * max(len(self._summaries), 50):
+            self.compact()
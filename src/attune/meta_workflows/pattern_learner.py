@@ -5,6 +5,7 @@ for optimizing future workflows.
 
 Hybrid Storage:
 - File-based storage: Persistent, human-readable execution results
+- Analytics index: Compact execution summaries with per-template rollups
 - Memory-based storage: Rich semantic queries, relationship modeling
 
 Created: 2026-01-17
@@ -16,6 +17,7 @@ from collections import defaultdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from attune.meta_workflows.analytics_index import ExecutionIndex, ExecutionSummary, TemplateRollup
 from attune.meta_workflows.models import PatternInsight
 from attune.meta_workflows.workflow import list_execution_results, load_execution_result
 
@@ -35,11 +37,13 @@ class PatternLearner:
 
     Hybrid Architecture:
     - Files: Persistent storage of execution results
+    - Index: Execution summaries and rollups used for all analytics
     - Memory: Rich semantic queries and relationship modeling
 
     Attributes:
         executions_dir: Directory where execution results are stored
         memory: Optional UnifiedMemory instance for enhanced querying
+        index: Analytics index over the executions directory
     """
 
     def __init__(
@@ -59,6 +63,8 @@ class PatternLearner:
             executions_dir = str(Path.home() / ".empathy" / "meta_workflows" / "executions")
         self.executions_dir = Path(executions_dir)
         self.memory = memory
+        self.index = ExecutionIndex(self.executions_dir)
+        self._reconciled_mtime_ns: int | None = None
 
         logger.info(
             f"Pattern learner initialized: {self.executions_dir}",
@@ -77,43 +83,34 @@ class PatternLearner:
         Returns:
             List of pattern insights
         """
-        # Load all execution results
-        run_ids = list_execution_results(storage_dir=str(self.executions_dir))
+        index = self._refresh_index()
 
-        if not run_ids:
+        if not index.run_ids():
             logger.warning("No execution results found")
             return []
 
-        # Filter by template if specified
-        results = []
-        for run_id in run_ids:
-            try:
-                result = load_execution_result(run_id, storage_dir=str(self.executions_dir))
-                if template_id is None or result.template_id == template_id:
-                    results.append(result)
-            except Exception as e:
-                logger.warning(f"Failed to load result {run_id}: {e}")
+        rollup = index.rollup(template_id)
 
-        if not results:
+        if rollup.runs == 0:
             logger.warning(f"No results found for template: {template_id}")
             return []
 
-        logger.info(f"Analyzing {len(results)} execution(s)")
+        logger.info(f"Analyzing {rollup.runs} execution(s)")
 
         # Generate insights
         insights = []
 
         # 1. Agent count patterns
-        insights.extend(self._analyze_agent_counts(results))
+        insights.extend(self._analyze_agent_counts(rollup))
 
         # 2. Tier performance patterns
-        insights.extend(self._analyze_tier_performance(results))
+        insights.extend(self._analyze_tier_performance(rollup))
 
         # 3. Cost patterns
-        insights.extend(self._analyze_costs(results))
+        insights.extend(self._analyze_costs(rollup))
 
         # 4. Common failures
-        insights.extend(self._analyze_failures(results))
+        insights.extend(self._analyze_failures(rollup))
 
         # Filter by confidence
         insights = [i for i in insights if i.confidence >= min_confidence]
@@ -122,28 +119,85 @@ class PatternLearner:
 
         return insights
 
-    def _analyze_agent_counts(self, results: list) -> list[PatternInsight]:
+    def _refresh_index(self) -> ExecutionIndex:
+        """Bring the analytics index in line with the executions directory.
+
+        New index lines are always applied. The directory itself is only
+        re-listed when its mtime changed (a run directory was added or
+        removed) or cannot be read; runs that are missing from the index,
+        or whose result.json changed since indexing, are loaded once and
+        added. Runs whose directory disappeared are dropped.
+
+        Returns:
+            The refreshed index
+        """
+        self.index.refresh()
+
+        try:
+            dir_mtime_ns: int | None = self.executions_dir.stat().st_mtime_ns
+        except OSError:
+            dir_mtime_ns = None
+
+        if dir_mtime_ns is not None and dir_mtime_ns == self._reconciled_mtime_ns:
+            return self.index
+
+        run_ids = list_execution_results(storage_dir=str(self.executions_dir))
+        for run_id in run_ids:
+            try:
+                result_mtime_ns: int | None = (
+                    (self.executions_dir / run_id / "result.json").stat().st_mtime_ns
+                )
+            except OSError:
+                result_mtime_ns = None
+
+            summary = self.index.get(run_id)
+            if (
+                summary is not None
+                and result_mtime_ns is not None
+                and summary.result_mtime_ns == result_mtime_ns
+            ):
+                continue
+
+            try:
+                result = load_execution_result(run_id, storage_dir=str(self.executions_dir))
+            except Exception as e:
+                logger.warning(f"Failed to load result {run_id}: {e}")
+                continue
+
+            # Only persist summaries that reflect a real file on disk
+            self.index.record(
+                ExecutionSummary.from_result(result, result_mtime_ns),
+                persist=result_mtime_ns is not None,
+            )
+
+        for run_id in self.index.run_ids() - set(run_ids):
+            self.index.remove(run_id, persist=dir_mtime_ns is not None)
+
+        self._reconciled_mtime_ns = dir_mtime_ns
+        return self.index
+
+    def _analyze_agent_counts(self, rollup: TemplateRollup) -> list[PatternInsight]:
         """Analyze patterns in agent counts.
 
         Args:
-            results: List of workflow results
+            rollup: Aggregated execution statistics
 
         Returns:
             List of insights about agent counts
         """
         insights = []
 
-        agent_counts = [len(r.agents_created) for r in results]
+        agent_counts = rollup.agent_counts
 
         if not agent_counts:
             return insights
 
-        avg_count = sum(agent_counts) / len(agent_counts)
+        avg_count = rollup.total_agents / len(agent_counts)
         min_count = min(agent_counts)
         max_count = max(agent_counts)
 
         # Calculate confidence based on sample size
-        confidence = min(len(results) / 10.0, 1.0)
+        confidence = min(rollup.runs / 10.0, 1.0)
 
         insights.append(
             PatternInsight(
@@ -154,42 +208,31 @@ class PatternLearner:
                     "average": avg_count,
                     "min": min_count,
                     "max": max_count,
-                    "counts": agent_counts,
+                    "counts": list(agent_counts),
                 },
-                sample_size=len(results),
+                sample_size=rollup.runs,
             )
         )
 
         return insights
 
-    def _analyze_tier_performance(self, results: list) -> list[PatternInsight]:
+    def _analyze_tier_performance(self, rollup: TemplateRollup) -> list[PatternInsight]:
         """Analyze tier performance patterns.
 
         Args:
-            results: List of workflow results
+            rollup: Aggregated execution statistics
 
         Returns:
             List of insights about tier performance
         """
         insights = []
 
-        # Track success rate by agent role and tier
-        tier_stats = defaultdict(lambda: {"success": 0, "total": 0, "costs": []})
-
-        for result in results:
-            for agent_result in result.agent_results:
-                key = f"{agent_result.role}:{agent_result.tier_used}"
-                tier_stats[key]["total"] += 1
-                if agent_result.success:
-                    tier_stats[key]["success"] += 1
-                tier_stats[key]["costs"].append(agent_result.cost)
-
         # Generate insights for agents with enough data
-        for key, stats in tier_stats.items():
+        for key, stats in rollup.tier_stats.items():
             if stats["total"] >= 3:  # Minimum 3 samples
                 role, tier = key.split(":")
                 success_rate = stats["success"] / stats["total"]
-                avg_cost = sum(stats["costs"]) / len(stats["costs"])
+                avg_cost = stats["cost"] / stats["total"]
 
                 confidence = min(stats["total"] / 10.0, 1.0)
 
@@ -211,82 +254,66 @@ class PatternLearner:
 
         return insights
 
-    def _analyze_costs(self, results: list) -> list[PatternInsight]:
+    def _analyze_costs(self, rollup: TemplateRollup) -> list[PatternInsight]:
         """Analyze cost patterns.
 
         Args:
-            results: List of workflow results
+            rollup: Aggregated execution statistics
 
         Returns:
             List of insights about costs
         """
         insights = []
 
-        if not results:
+        if rollup.runs == 0:
             return insights
 
-        total_costs = [r.total_cost for r in results]
-        avg_cost = sum(total_costs) / len(total_costs)
-        min_cost = min(total_costs)
-        max_cost = max(total_costs)
-
-        # Calculate cost by tier
-        tier_costs = defaultdict(list)
-        for result in results:
-            for agent_result in result.agent_results:
-                tier_costs[agent_result.tier_used].append(agent_result.cost)
+        avg_cost = rollup.total_cost / rollup.runs
 
+        # Cost by tier
         tier_breakdown = {}
-        for tier, costs in tier_costs.items():
+        for tier, costs in rollup.tier_costs.items():
             tier_breakdown[tier] = {
-                "avg": sum(costs) / len(costs),
-                "total": sum(costs),
-                "count": len(costs),
+                "avg": costs["total"] / costs["count"],
+                "total": costs["total"],
+                "count": costs["count"],
             }
 
-        confidence = min(len(results) / 10.0, 1.0)
+        confidence = min(rollup.runs / 10.0, 1.0)
 
         insights.append(
             PatternInsight(
                 insight_type="cost_analysis",
-                description=f"Average workflow cost ${avg_cost:.2f} (range: ${min_cost:.2f}-${max_cost:.2f})",
+                description=f"Average workflow cost ${avg_cost:.2f} (range: ${rollup.min_cost:.2f}-${rollup.max_cost:.2f})",
                 confidence=confidence,
                 data={
                     "average": avg_cost,
-                    "min": min_cost,
-                    "max": max_cost,
+                    "min": rollup.min_cost,
+                    "max": rollup.max_cost,
                     "tier_breakdown": tier_breakdown,
                 },
-                sample_size=len(results),
+                sample_size=rollup.runs,
             )
         )
 
         return insights
 
-    def _analyze_failures(self, results: list) -> list[PatternInsight]:
+    def _analyze_failures(self, rollup: TemplateRollup) -> list[PatternInsight]:
         """Analyze failure patterns.
 
         Args:
-            results: List of workflow results
+            rollup: Aggregated execution statistics
 
         Returns:
             List of insights about failures
         """
         insights = []
 
-        failed_agents = defaultdict(int)
-        total_agents = defaultdict(int)
-
-        for result in results:
-            for agent_result in result.agent_results:
-                total_agents[agent_result.role] += 1
-                if not agent_result.success:
-                    failed_agents[agent_result.role] += 1
-
         # Find agents with failures
-        for role, failure_count in failed_agents.items():
+        for role, stats in rollup.role_stats.items():
+            failure_count = stats["failures"]
             if failure_count > 0:
-                total = total_agents[role]
+                total = stats["total"]
                 failure_rate = failure_count / total
 
                 confidence = min(total / 10.0, 1.0)
@@ -367,22 +394,12 @@ class PatternLearner:
         for insight in insights:
             insights_by_type[insight.insight_type].append(insight)
 
-        # Load all results for summary stats
-        run_ids = list_execution_results(storage_dir=str(self.executions_dir))
-        results = []
-        for run_id in run_ids:
-            try:
-                result = load_execution_result(run_id, storage_dir=str(self.executions_dir))
-                if template_id is None or result.template_id == template_id:
-                    results.append(result)
-            except Exception:
-                continue
-
-        # Calculate summary statistics
-        total_runs = len(results)
-        successful_runs = sum(1 for r in results if r.success)
-        total_cost = sum(r.total_cost for r in results)
-        total_agents = sum(len(r.agents_created) for r in results)
+        # Summary statistics come straight from the pre-aggregated rollup
+        rollup = self.index.rollup(template_id)
+        total_runs = rollup.runs
+        successful_runs = rollup.successful_runs
+        total_cost = rollup.total_cost
+        total_agents = rollup.total_agents
 
         report = {
             "summary": {
@@ -576,29 +593,78 @@ Form Responses:
         template_id: str | None,
         limit: int,
     ) -> list["MetaWorkflowResult"]:
-        """Fallback file-based search when memory is unavailable."""
+        """Fallback file-based search when memory is unavailable.
+
+        Candidates are narrowed by template through the analytics index, so
+        only result files that can match are loaded for keyword matching.
+        """
         # Simple keyword search in file-based storage
         results = []
-        run_ids = list_execution_results(storage_dir=str(self.executions_dir))
+        query_lower = query.lower()
 
-        for run_id in run_ids[:limit]:
+        for summary in self._refresh_index().summaries(template_id):
+            if len(results) >= limit:
+                break
             try:
-                result = load_execution_result(run_id, storage_dir=str(self.executions_dir))
-
-                # Filter by template
-                if template_id and result.template_id != template_id:
-                    continue
+                result = load_execution_result(summary.run_id, storage_dir=str(self.executions_dir))
 
                 # Simple keyword matching
                 result_json = result.to_json().lower()
-                if query.lower() in result_json:
+                if query_lower in result_json:
                     results.append(result)
 
             except Exception as e:
-                logger.warning(f"Failed to load result {run_id}: {e}")
+                logger.warning(f"Failed to load result {summary.run_id}: {e}")
+                continue
+
+        return results
+
+    def _search_execution_summaries(
+        self,
+        query: str,
+        template_id: str | None,
+        limit: int,
+    ) -> list[ExecutionSummary]:
+        """Semantic search that resolves matches to index summaries.
+
+        Like search_executions_by_context(), but returns the compact
+        summaries from the analytics index instead of loading result files.
+        """
+        if not self.memory:
+            return [
+                ExecutionSummary.from_result(r)
+                for r in self._search_executions_files(query, template_id, limit)
+            ]
+
+        try:
+            patterns = self.memory.search_patterns(
+                query=query,
+                pattern_type="meta_workflow_execution",
+                limit=limit,
+            )
+        except Exception as e:
+            logger.error(f"Memory search failed: {e}")
+            return [
+                ExecutionSummary.from_result(r)
+                for r in self._search_executions_files(query, template_id, limit)
+            ]
+
+        index = self._refresh_index()
+        summaries = []
+        for pattern in patterns:
+            metadata = pattern.get("metadata", {})
+            run_id = metadata.get("run_id")
+            if not run_id:
+                continue
+            if template_id and metadata.get("template_id") != template_id:
+                continue
+            summary = index.get(run_id)
+            if summary is None:
+                logger.warning(f"Result file not found for run_id: {run_id}")
                 continue
+            summaries.append(summary)
 
-        return results[:limit]
+        return summaries
 
     def get_smart_recommendations(
         self,
@@ -644,7 +710,7 @@ Form Responses:
                     key_responses.append(f"{key}={value}")
                 query += f" with {', '.join(key_responses[:3])}"
 
-            similar_executions = self.search_executions_by_context(
+            similar_executions = self._search_execution_summaries(
                 query=query,
                 template_id=template_id,
                 limit=5,
@@ -666,8 +732,8 @@ Form Responses:
                 # Add tier recommendations from similar executions
                 tier_usage = defaultdict(int)
                 for execution in similar_executions:
-                    for agent_result in execution.agent_results:
-                        tier_usage[agent_result.tier_used] += 1
+                    for tier, count in execution.tier_counts.items():
+                        tier_usage[tier] += count
 
                 if tier_usage:
                     most_common_tier = max(tier_usage.items(), key=lambda x: x[1])[0]
@@ -34,6 +34,8 @@ try:
 except ImportError:
     pass  # dotenv not installed, use environment variables directly
 
+import asyncio
+import concurrent.futures
 import json
 import logging
 import time
@@ -42,7 +44,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from attune.config import _validate_file_path
-from attune.meta_workflows.agent_creator import DynamicAgentCreator
+from attune.meta_workflows.agent_creator import DynamicAgentCreator, resolve_agent_dependencies
+from attune.meta_workflows.analytics_index import ExecutionIndex, ExecutionSummary
 from attune.meta_workflows.form_engine import SocraticFormEngine
 from attune.meta_workflows.models import (
     AgentExecutionResult,
@@ -63,6 +66,27 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class _DeferredUsageTracker:
+    """Collects one agent's telemetry so it can be replayed in agent order.
+
+    Agents run concurrently, so writing straight to the shared UsageTracker
+    would interleave their calls by completion time. Each agent records into
+    its own buffer and the buffers are replayed once every agent finished.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    def track_llm_call(self, **kwargs: Any) -> None:
+        """Record a track_llm_call() invocation."""
+        self.calls.append(kwargs)
+
+    def replay(self, tracker: UsageTracker) -> None:
+        """Forward recorded calls to the real tracker."""
+        for kwargs in self.calls:
+            tracker.track_llm_call(**kwargs)
+
+
 class MetaWorkflow:
     """Orchestrates complete meta-workflow execution.
 
@@ -79,14 +103,18 @@ class MetaWorkflow:
         form_engine: Engine for collecting form responses
         agent_creator: Creator for generating agent teams
         pattern_learner: Optional pattern learner for memory integration
+        max_concurrent_agents: Upper bound on agents running at the same time
     """
 
+    DEFAULT_MAX_CONCURRENT_AGENTS = 4
+
     def __init__(
         self,
         template: MetaWorkflowTemplate | None = None,
         template_id: str | None = None,
         storage_dir: str | None = None,
         pattern_learner: "PatternLearner | None" = None,
+        max_concurrent_agents: int = DEFAULT_MAX_CONCURRENT_AGENTS,
     ):
         """Initialize meta-workflow with optional memory integration.
 
@@ -98,6 +126,8 @@ class MetaWorkflow:
             pattern_learner: Optional pattern learner with memory integration
                             If provided, execution results will be stored in
                             both files and memory for rich semantic querying
+            max_concurrent_agents: Maximum number of agents executed at once
+                            during real execution (1 = sequential)
 
         Raises:
             ValueError: If neither template nor template_id provided
@@ -116,6 +146,7 @@ class MetaWorkflow:
         self.form_engine = SocraticFormEngine()
         self.agent_creator = DynamicAgentCreator()
         self.pattern_learner = pattern_learner
+        self.max_concurrent_agents = max(1, max_concurrent_agents)
 
         # Set up storage
         if storage_dir is None:
@@ -306,6 +337,11 @@ class MetaWorkflow:
         - PROGRESSIVE: cheap → capable → premium (escalates on failure)
         - CAPABLE_FIRST: capable → premium (skips cheap tier)
 
+        Independent agents run concurrently (up to max_concurrent_agents);
+        an agent only starts once the agents it depends on have finished
+        (see resolve_agent_dependencies). Results are returned in the order
+        of ``agents`` regardless of completion order.
+
         Each LLM call is tracked via UsageTracker for cost analysis.
 
         Args:
@@ -315,48 +351,111 @@ class MetaWorkflow:
             List of agent execution results with actual LLM costs
 
         Raises:
-            RuntimeError: If agent execution encounters fatal error
+            ValueError: If agent dependencies are circular
         """
-        results = []
         router = ModelRouter()
         tracker = UsageTracker.get_instance()
+        coroutine = self._execute_agents_concurrently(agents, router, tracker)
 
-        for agent in agents:
-            logger.info(f"Executing agent: {agent.role} ({agent.tier_strategy.value})")
+        # asyncio.run() fails inside a running loop (e.g. MCP server), so
+        # offload to a thread in that case
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
 
-            try:
-                result = self._execute_single_agent_with_escalation(agent, router, tracker)
-                results.append(result)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, coroutine).result()
 
-                logger.info(
-                    f"Agent {agent.role} completed: "
-                    f"tier={result.tier_used}, cost=${result.cost:.4f}, "
-                    f"success={result.success}"
-                )
+    async def _execute_agents_concurrently(
+        self,
+        agents: list[AgentSpec],
+        router: ModelRouter,
+        tracker: UsageTracker,
+    ) -> list[AgentExecutionResult]:
+        """Run agents as asyncio tasks bounded by a semaphore.
+
+        Args:
+            agents: List of agent specs to execute
+            router: Model router for tier selection
+            tracker: Usage tracker for telemetry
 
-            except Exception as e:
-                logger.error(f"Agent {agent.role} failed with error: {e}")
-
-                # Create error result
-                error_result = AgentExecutionResult(
-                    agent_id=agent.agent_id,
-                    role=agent.role,
-                    success=False,
-                    cost=0.0,
-                    duration=0.0,
-                    tier_used="error",
-                    output={"error": str(e)},
-                    error=str(e),
+        Returns:
+            List of agent execution results, in the order of ``agents``
+        """
+        dependencies = resolve_agent_dependencies(agents)
+        semaphore = asyncio.Semaphore(self.max_concurrent_agents)
+        deferred = {agent.agent_id: _DeferredUsageTracker() for agent in agents}
+        tasks: dict[str, asyncio.Task[AgentExecutionResult]] = {}
+
+        async def run_agent(agent: AgentSpec) -> AgentExecutionResult:
+            prerequisites = [tasks[agent_id] for agent_id in dependencies[agent.agent_id]]
+            if prerequisites:
+                await asyncio.wait(prerequisites)
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._execute_agent_safely, agent, router, deferred[agent.agent_id]
                 )
-                results.append(error_result)
+
+        # No await between task creation, so every task exists before any runs
+        for agent in agents:
+            tasks[agent.agent_id] = asyncio.create_task(run_agent(agent))
+
+        results = [await tasks[agent.agent_id] for agent in agents]
+
+        for agent in agents:
+            deferred[agent.agent_id].replay(tracker)
 
         return results
 
+    def _execute_agent_safely(
+        self,
+        agent: AgentSpec,
+        router: ModelRouter,
+        tracker: "UsageTracker | _DeferredUsageTracker",
+    ) -> AgentExecutionResult:
+        """Execute one agent, converting unexpected errors into a failed result.
+
+        Args:
+            agent: Agent specification
+            router: Model router for tier selection
+            tracker: Usage tracker for telemetry
+
+        Returns:
+            AgentExecutionResult (tier_used="error" if execution raised)
+        """
+        logger.info(f"Executing agent: {agent.role} ({agent.tier_strategy.value})")
+
+        try:
+            result = self._execute_single_agent_with_escalation(agent, router, tracker)
+
+            logger.info(
+                f"Agent {agent.role} completed: "
+                f"tier={result.tier_used}, cost=${result.cost:.4f}, "
+                f"success={result.success}"
+            )
+            return result
+
+        except Exception as e:
+            logger.error(f"Agent {agent.role} failed with error: {e}")
+
+            # Create error result
+            return AgentExecutionResult(
+                agent_id=agent.agent_id,
+                role=agent.role,
+                success=False,
+                cost=0.0,
+                duration=0.0,
+                tier_used="error",
+                output={"error": str(e)},
+                error=str(e),
+            )
+
     def _execute_single_agent_with_escalation(
         self,
         agent: AgentSpec,
         router: ModelRouter,
-        tracker: UsageTracker,
+        tracker: "UsageTracker | _DeferredUsageTracker",
     ) -> AgentExecutionResult:
         """Execute single agent with progressive tier escalation.
 
@@ -419,7 +518,7 @@ class MetaWorkflow:
         agent: AgentSpec,
         tier: ModelTier,
         router: ModelRouter,
-        tracker: UsageTracker,
+        tracker: "UsageTracker | _DeferredUsageTracker",
     ) -> AgentExecutionResult:
         """Execute agent at specific tier.
 
@@ -829,6 +928,12 @@ class MetaWorkflow:
         validated_report = _validate_file_path(str(report_file))
         validated_report.write_text(report, encoding="utf-8")
 
+        # Keep the analytics index current so PatternLearner never has to
+        # reload this result file
+        ExecutionIndex(self.storage_dir).record(
+            ExecutionSummary.from_result(result, validated_result.stat().st_mtime_ns)
+        )
+
         logger.info(f"Saved execution results to: {run_dir}")
         return run_dir
 
@@ -34,6 +34,7 @@ from .fallback import (
     RetryPolicy,
     TierFallbackHelper,
 )
+from .prompt_layout import PromptLayout, PromptSegment, Stability
 from .provider_config import (
     ProviderConfig,
     ProviderMode,
@@ -53,6 +54,7 @@ from .registry import (
     get_model,
     get_pricing_for_model,
 )
+from .scheduler import LLMScheduler, ModelLimits, Priority, get_llm_scheduler, llm_priority
 from .tasks import (
     CAPABLE_TASKS,
     CHEAP_TASKS,
@@ -120,18 +122,26 @@ __all__ = [
     # Executor exports
     "LLMExecutor",
     "LLMResponse",
+    # Scheduler exports
+    "LLMScheduler",
     "MockLLMExecutor",
+    "ModelLimits",
     "ModelInfo",
     "ModelPerformance",
     "ModelProvider",
     # Registry exports
     "ModelRegistry",
     "ModelTier",
+    "Priority",
+    # Prompt layout exports
+    "PromptLayout",
+    "PromptSegment",
     "ProviderConfig",
     # Provider config exports
     "ProviderMode",
     "ResilientExecutor",
     "RetryPolicy",
+    "Stability",
     "SubscriptionTier",
     "TaskInfo",
     "TierFallbackHelper",
@@ -154,6 +164,7 @@ __all__ = [
     "get_all_models",
     "get_all_tasks",
     "get_auth_strategy",
+    "get_llm_scheduler",
     "get_model",
     "get_module_size_category",
     "get_pricing_for_model",
@@ -162,6 +173,7 @@ __all__ = [
     "get_telemetry_store",
     "get_tier_for_task",
     "is_known_task",
+    "llm_priority",
     "log_llm_call",
     "log_workflow_run",
     "normalize_task_type",
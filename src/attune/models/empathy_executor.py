@@ -14,9 +14,12 @@ from datetime import datetime
 from typing import Any
 
 from .executor import ExecutionContext, LLMResponse
+from .prompt_layout import PromptLayout
 from .registry import get_model
+from .scheduler import current_priority, get_llm_scheduler
 from .tasks import get_tier_for_task
 from .telemetry import LLMCallRecord, TelemetryBackend, TelemetryStore
+from .token_estimator import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -178,7 +181,7 @@ class EmpathyLLMExecutor:
         self,
         task_type: str,
         prompt: str,
-        system: str | None = None,
+        system: str | PromptLayout | None = None,
         context: ExecutionContext | None = None,
         **kwargs: Any,
     ) -> LLMResponse:
@@ -187,7 +190,7 @@ class EmpathyLLMExecutor:
         Args:
             task_type: Type of task for routing (e.g., "summarize", "fix_bug").
             prompt: The user prompt to send.
-            system: Optional system prompt (passed as context).
+            system: Optional system prompt or PromptLayout (passed as context).
             context: Optional execution context for tracking.
             **kwargs: Additional arguments for EmpathyLLM.interact().
 
@@ -232,27 +235,41 @@ class EmpathyLLMExecutor:
         # Use actual provider (resolved for hybrid mode)
         provider = actual_provider
 
-        # Call EmpathyLLM with task_type routing
-        result = await llm.interact(
-            user_id=user_id,
-            user_input=prompt,
-            context=full_context if full_context else None,
-            task_type=effective_task_type,
-            **kwargs,
+        # Admission through the shared scheduler (rate limits, concurrency, priority)
+        model_info = get_model(provider, tier_str)
+        scheduler_model = hybrid_model_id or (
+            model_info.id if model_info else f"{provider}:{tier_str}"
         )
+        estimated_tokens = estimate_tokens(str(system or "") + prompt, scheduler_model)
+        priority = current_priority()
+        if context and context.priority is not None:
+            priority = context.priority
+
+        async with get_llm_scheduler().slot(
+            scheduler_model, estimated_tokens, priority, provider=provider
+        ) as slot:
+            # Call EmpathyLLM with task_type routing
+            result = await llm.interact(
+                user_id=user_id,
+                user_input=prompt,
+                context=full_context if full_context else None,
+                task_type=effective_task_type,
+                **kwargs,
+            )
+
+            # Extract routing metadata
+            metadata = result.get("metadata", {})
+
+            # Get token counts
+            tokens_input = metadata.get("tokens_used", 0)
+            tokens_output = metadata.get("output_tokens", 0)
+            if tokens_input:
+                slot.actual_tokens = tokens_input
 
         # Calculate latency
         latency_ms = int((time.time() - start_time) * 1000)
 
-        # Extract routing metadata
-        metadata = result.get("metadata", {})
-
-        # Get token counts
-        tokens_input = metadata.get("tokens_used", 0)
-        tokens_output = metadata.get("output_tokens", 0)
-
-        # Get model info - use hybrid_model_id if set, otherwise look up
-        model_info = get_model(provider, tier_str)
+        # Get model ID - use hybrid_model_id if set, otherwise look up
         model_id = hybrid_model_id or metadata.get("routed_model", metadata.get("model", ""))
         if not model_id and model_info:
             model_id = model_info.id
@@ -302,6 +319,8 @@ class EmpathyLLMExecutor:
                     model_id=model_id,
                     input_tokens=tokens_input,
                     output_tokens=tokens_output,
+                    cache_creation_input_tokens=metadata.get("cache_creation_tokens", 0),
+                    cache_read_input_tokens=metadata.get("cache_read_tokens", 0),
                     estimated_cost=cost_estimate,
                     latency_ms=latency_ms,
                     success=True,
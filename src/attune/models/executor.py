@@ -97,6 +97,7 @@ class ExecutionContext:
         timeout_seconds: Timeout for this execution
         session_id: Session identifier
         metadata: Additional context (can include retry_policy, fallback_policy)
+        priority: LLM scheduler priority (defaults to the ``llm_priority`` scope)
 
     """
 
@@ -109,6 +110,7 @@ class ExecutionContext:
     timeout_seconds: int | None = None
     session_id: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    priority: int | None = None
 
 
 @runtime_checkable
@@ -0,0 +1,171 @@
+"""Cache-aware system prompt assembly.
+
+Anthropic caches a prompt *prefix*: a request reuses the cache only up to the
+first byte that differs from an earlier request. A timestamp or run id early
+in a system prompt therefore invalidates everything after it, including the
+static guidelines that make up most of the prompt.
+
+``PromptLayout`` collects prompt segments tagged with how often they change,
+renders them from most to least stable, and places ``cache_control``
+breakpoints at the end of each stable group that is long enough to cache.
+
+Example:
+    >>> layout = PromptLayout(model="claude-sonnet-4-5")
+    >>> layout.add(guidelines, Stability.STATIC, "guidelines")
+    >>> layout.add(f"Run started {now}", Stability.VOLATILE, "run")
+    >>> layout.add(stage_rules, Stability.STAGE, "stage")
+    >>> layout.render()  # guidelines, stage rules, then the run line
+    >>> layout.system_blocks()  # Anthropic system blocks with breakpoints
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any
+
+from attune.utils.tokens import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# Anthropic allows at most four cache breakpoints per request
+MAX_CACHE_BREAKPOINTS = 4
+
+# Fragments that change on every run; segments containing them cannot be cached
+_VOLATILE_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}"  # ISO timestamp
+    r"|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",  # UUID
+    re.IGNORECASE,
+)
+
+
+class Stability(IntEnum):
+    """How often a prompt segment changes, from most to least stable."""
+
+    STATIC = 0  # Same for every run and stage (role, guidelines, docs)
+    SESSION = 1  # Same for every stage of one run (project context)
+    STAGE = 2  # Same for every call of one stage (stage instructions)
+    VOLATILE = 3  # Different on every call (timestamps, ids, per-file data)
+
+
+@dataclass(frozen=True)
+class PromptSegment:
+    """One piece of a system prompt."""
+
+    text: str
+    stability: Stability = Stability.STATIC
+    label: str = ""
+
+
+def min_cacheable_tokens(model: str) -> int:
+    """Return the shortest prefix Anthropic will cache for ``model``."""
+    return 2048 if "haiku" in model.lower() else 1024
+
+
+class PromptLayout:
+    """Ordered, cache-aware collection of system prompt segments.
+
+    Segments are rendered grouped by stability, most stable first; within a
+    group they keep the order they were added in.
+
+    Args:
+        model: Model ID, used for token counting and the cacheable minimum
+        min_tokens: Override for the shortest prefix worth a breakpoint
+    """
+
+    def __init__(self, model: str = "", min_tokens: int | None = None) -> None:
+        self.model = model
+        self.min_tokens = min_tokens if min_tokens is not None else min_cacheable_tokens(model)
+        self._segments: list[PromptSegment] = []
+
+    def add(
+        self, text: str | None, stability: Stability = Stability.STATIC, label: str = ""
+    ) -> PromptLayout:
+        """Add a segment; empty text is ignored.
+
+        Segments containing a timestamp or UUID are demoted to VOLATILE so
+        they cannot break the cached prefix.
+
+        Returns:
+            This layout, for chaining
+        """
+        if not text:
+            return self
+        if stability < Stability.VOLATILE and _VOLATILE_PATTERN.search(text):
+            logger.debug(f"Prompt segment '{label}' contains run-specific data; moved last")
+            stability = Stability.VOLATILE
+        self._segments.append(PromptSegment(text, stability, label))
+        return self
+
+    def extend(self, other: PromptLayout) -> PromptLayout:
+        """Add every segment of ``other``, keeping its stability tags."""
+        self._segments.extend(other._segments)
+        return self
+
+    @property
+    def segments(self) -> list[PromptSegment]:
+        """Segments in render order."""
+        return sorted(self._segments, key=lambda s: s.stability)
+
+    def _groups(self) -> list[tuple[Stability, str]]:
+        groups: list[tuple[Stability, list[str]]] = []
+        for segment in self.segments:
+            if groups and groups[-1][0] == segment.stability:
+                groups[-1][1].append(segment.text)
+            else:
+                groups.append((segment.stability, [segment.text]))
+        return [(stability, "\n".join(texts)) for stability, texts in groups]
+
+    def render(self) -> str:
+        """Render the prompt as one string."""
+        return "\n".join(segment.text for segment in self.segments)
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __bool__(self) -> bool:
+        return bool(self._segments)
+
+    def cacheable_prefix(self) -> str:
+        """Return the rendered non-volatile part of the prompt."""
+        return "\n".join(
+            segment.text for segment in self.segments if segment.stability < Stability.VOLATILE
+        )
+
+    def system_blocks(self, cache: bool = True) -> list[dict[str, Any]]:
+        """Render Anthropic system blocks, one per stability group.
+
+        A group's block gets a ``cache_control`` breakpoint when the prefix
+        up to and including it reaches the model's cacheable minimum.
+        Volatile content never gets one. Each block after the first starts
+        with the newline separating it from the previous group, so a block's
+        text does not depend on what follows it.
+
+        Args:
+            cache: Whether to place breakpoints at all
+
+        Returns:
+            List of ``{"type": "text", "text": ...}`` blocks
+        """
+        blocks: list[dict[str, Any]] = []
+        prefix_tokens = 0
+        breakpoints = 0
+        model = self.model or "claude-sonnet-4-5-20250929"
+        for i, (stability, text) in enumerate(self._groups()):
+            block: dict[str, Any] = {"type": "text", "text": text if i == 0 else "\n" + text}
+            prefix_tokens += count_tokens(block["text"], model)
+            if (
+                cache
+                and stability < Stability.VOLATILE
+                and prefix_tokens >= self.min_tokens
+                and breakpoints < MAX_CACHE_BREAKPOINTS
+            ):
+                block["cache_control"] = {"type": "ephemeral"}
+                breakpoints += 1
+            blocks.append(block)
+        return blocks
@@ -0,0 +1,582 @@
+"""LLM Call Scheduler
+
+Central admission control for LLM calls, so parallel workflows and agent
+teams do not burst past provider rate limits:
+
+- Per-model token buckets for requests/minute and tokens/minute, charged
+  with the token estimator before a call and corrected with actual usage
+- An AIMD concurrency window per model: additive increase on fast successful
+  calls, multiplicative decrease on 429s and latency spikes
+- Priority queues, so interactive calls (e.g. MCP tools) are admitted ahead
+  of queued batch work. Callers set the priority for everything they run with
+  ``llm_priority(...)``; executors read it with ``current_priority()``
+
+Buckets, windows and 429 pauses are shared by every event loop in the
+process; each loop queues and wakes only its own waiters, so the scheduler
+can be used from several threads or successive ``asyncio.run`` calls.
+
+Limits come from ``$ATTUNE_LLM_LIMITS`` (default ``~/.empathy/llm_limits.json``),
+keyed by model ID, provider or ``"default"``::
+
+    {"default": {"requests_per_minute": 50, "tokens_per_minute": 40000},
+     "anthropic": {"requests_per_minute": 1000, "tokens_per_minute": 400000}}
+
+``$ATTUNE_LLM_REQUESTS_PER_MINUTE`` and ``$ATTUNE_LLM_TOKENS_PER_MINUTE``
+override the default. Local providers (ollama) are not rate limited unless
+configured.
+
+Example:
+    >>> scheduler = get_llm_scheduler()
+    >>> async with scheduler.slot("claude-sonnet-4-5", estimated_tokens=1200) as slot:
+    ...     response = await provider.generate(messages)
+    ...     slot.actual_tokens = response.tokens_used
+
+Copyright 2025 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Default per-model limits (Anthropic tier 1-2 order of magnitude)
+DEFAULT_REQUESTS_PER_MINUTE = 50
+DEFAULT_TOKENS_PER_MINUTE = 40_000
+
+LIMITS_ENV_VAR = "ATTUNE_LLM_LIMITS"
+DEFAULT_LIMITS_PATH = Path.home() / ".empathy" / "llm_limits.json"
+
+# Providers running on local hardware have no rate limits to respect
+LOCAL_PROVIDERS = frozenset({"ollama", "local"})
+
+# AIMD concurrency window
+DEFAULT_INITIAL_WINDOW = 4.0
+DEFAULT_MIN_WINDOW = 1.0
+DEFAULT_MAX_WINDOW = 32.0
+RATE_LIMIT_DECREASE = 0.5  # Window multiplier on 429
+LATENCY_DECREASE = 0.9  # Window multiplier on a latency spike
+LATENCY_SPIKE_RATIO = 2.0  # Latency above this multiple of the average is a spike
+LATENCY_EWMA_ALPHA = 0.2
+LATENCY_MIN_SAMPLES = 5
+
+
+class Priority(IntEnum):
+    """Admission priority (lower runs first)."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BATCH = 2
+
+
+_current_priority: ContextVar[Priority] = ContextVar("llm_priority", default=Priority.NORMAL)
+
+
+@contextmanager
+def llm_priority(priority: Priority | int) -> Iterator[None]:
+    """Run LLM calls made in this context (and tasks it creates) at ``priority``.
+
+    Example:
+        >>> with llm_priority(Priority.BATCH):
+        ...     await workflow.execute(...)
+    """
+    token = _current_priority.set(Priority(priority))
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> Priority:
+    """Priority set by the innermost ``llm_priority`` block (NORMAL by default)."""
+    return _current_priority.get()
+
+
+@dataclass
+class ModelLimits:
+    """Rate limits for one model (None disables that bucket)."""
+
+    requests_per_minute: int | None = DEFAULT_REQUESTS_PER_MINUTE
+    tokens_per_minute: int | None = DEFAULT_TOKENS_PER_MINUTE
+
+    @classmethod
+    def unlimited(cls) -> ModelLimits:
+        """Limits with no buckets, for local providers."""
+        return cls(requests_per_minute=None, tokens_per_minute=None)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously up to its capacity."""
+
+    def __init__(self, capacity: float, per_minute: float, clock: Callable[[], float]):
+        self.capacity = capacity
+        self.rate = per_minute / 60.0
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """Currently available tokens (may be negative after corrections)."""
+        self._refill()
+        return self._tokens
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if available now)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self._tokens >= amount:
+            return 0.0
+        return (amount - self._tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        """Take tokens (negative amounts return tokens)."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens - amount)
+
+    def drain(self) -> None:
+        """Empty the bucket (e.g. after a 429)."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    tokens: int = field(compare=False)
+    future: asyncio.Future[None] = field(compare=False)
+
+
+class _ModelState:
+    """Buckets, window and latency signal for one model, shared by all loops."""
+
+    def __init__(self, limits: ModelLimits, window: float, clock: Callable[[], float]):
+        self.window = window
+        self.paused_until = 0.0
+        self.latency_ewma: float | None = None
+        self.samples = 0
+        self.rate_limited = 0
+        self.set_limits(limits, clock)
+
+    def set_limits(self, limits: ModelLimits, clock: Callable[[], float]) -> None:
+        self.limits = limits
+        rpm, tpm = limits.requests_per_minute, limits.tokens_per_minute
+        self.requests = TokenBucket(rpm, rpm, clock) if rpm else None
+        self.tokens = TokenBucket(tpm, tpm, clock) if tpm else None
+
+    def wait_time(self, tokens: int, now: float) -> float:
+        """Seconds until a call of ``tokens`` may start."""
+        return max(
+            self.paused_until - now,
+            self.requests.wait_time(1) if self.requests else 0.0,
+            self.tokens.wait_time(tokens) if self.tokens else 0.0,
+        )
+
+    def charge(self, tokens: int) -> None:
+        if self.requests:
+            self.requests.consume(1)
+        if self.tokens:
+            self.tokens.consume(min(tokens, self.tokens.capacity))
+
+    def correct(self, estimated: int, actual: int) -> None:
+        if self.tokens:
+            self.tokens.consume(actual - min(estimated, self.tokens.capacity))
+
+
+class _LoopQueue:
+    """Waiters and in-flight calls of one model on one event loop."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.waiters: list[_Waiter] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+
+@dataclass
+class SchedulerSlot:
+    """An admitted call. Set ``actual_tokens`` to correct the estimate."""
+
+    model: str
+    estimated_tokens: int
+    priority: Priority
+    queued_seconds: float
+    actual_tokens: int | None = None
+
+
+class LLMScheduler:
+    """Rate-limit aware admission control shared by all LLM executors."""
+
+    def __init__(
+        self,
+        limits: dict[str, ModelLimits] | None = None,
+        default_limits: ModelLimits | None = None,
+        initial_window: float = DEFAULT_INITIAL_WINDOW,
+        min_window: float = DEFAULT_MIN_WINDOW,
+        max_window: float = DEFAULT_MAX_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            limits: Rate limits by model ID or provider name
+            default_limits: Limits for models not in ``limits``
+            initial_window: Starting concurrency window per model
+            min_window: Smallest concurrency window
+            max_window: Largest concurrency window
+            clock: Monotonic clock (injectable for tests)
+        """
+        self._limits = dict(limits or {})
+        self.default_limits = default_limits or ModelLimits()
+        self.initial_window = initial_window
+        self.min_window = min_window
+        self.max_window = max_window
+        self._clock = clock
+        self._models: dict[str, _ModelState] = {}
+        self._queues: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, _LoopQueue]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.RLock()
+        self._seq = itertools.count()
+
+    def set_limits(self, model: str, limits: ModelLimits) -> None:
+        """Set rate limits for a model or provider (resets its buckets)."""
+        with self._lock:
+            self._limits[model] = limits
+            state = self._models.get(model)
+            if state is not None:
+                state.set_limits(limits, self._clock)
+
+    def limits_for(self, model: str, provider: str | None = None) -> ModelLimits:
+        """Resolve limits: model, then provider, then local/default."""
+        if model in self._limits:
+            return self._limits[model]
+        if provider is not None and provider in self._limits:
+            return self._limits[provider]
+        if provider in LOCAL_PROVIDERS:
+            return ModelLimits.unlimited()
+        return self.default_limits
+
+    def _state(self, model: str, provider: str | None = None) -> _ModelState:
+        state = self._models.get(model)
+        if state is None:
+            limits = self.limits_for(model, provider)
+            state = _ModelState(limits, self.initial_window, self._clock)
+            self._models[model] = state
+        return state
+
+    def _queue(self, loop: asyncio.AbstractEventLoop, model: str) -> _LoopQueue:
+        queues = self._queues.setdefault(loop, {})
+        queue = queues.get(model)
+        if queue is None:
+            queue = queues[model] = _LoopQueue()
+        return queue
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        model: str,
+        estimated_tokens: int = 0,
+        priority: Priority | int = Priority.NORMAL,
+        provider: str | None = None,
+    ) -> AsyncIterator[SchedulerSlot]:
+        """Wait for admission, then hold a concurrency slot for one call.
+
+        Rate limit errors raised inside the block shrink the window and pause
+        the model; other outcomes feed the latency signal.
+
+        Args:
+            model: Model identifier (limits are tracked per model)
+            estimated_tokens: Estimated tokens charged to the tokens/minute bucket
+            priority: Admission priority
+            provider: Provider name, used for provider-wide and local limits
+
+        Yields:
+            SchedulerSlot for the admitted call
+        """
+        priority = Priority(priority)
+        loop = asyncio.get_running_loop()
+        queued_at = self._clock()
+        await self._acquire(loop, model, provider, estimated_tokens, priority)
+        slot = SchedulerSlot(
+            model=model,
+            estimated_tokens=estimated_tokens,
+            priority=priority,
+            queued_seconds=self._clock() - queued_at,
+        )
+        started = self._clock()
+        rate_limited = False
+        try:
+            yield slot
+        except BaseException as e:
+            rate_limited = is_rate_limit_error(e)
+            if rate_limited:
+                self._on_rate_limited(model, retry_after(e))
+            raise
+        finally:
+            self._release(loop, model, slot, self._clock() - started, rate_limited)
+
+    async def _acquire(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        model: str,
+        provider: str | None,
+        tokens: int,
+        priority: Priority,
+    ) -> None:
+        future: asyncio.Future[None] = loop.create_future()
+        with self._lock:
+            self._state(model, provider)
+            queue = self._queue(loop, model)
+            heapq.heappush(queue.waiters, _Waiter(int(priority), next(self._seq), tokens, future))
+        self._dispatch(loop, model)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                admitted = future.done() and not future.cancelled()
+                if admitted:
+                    # Admitted just before cancellation: give the slot back
+                    queue.in_flight -= 1
+                else:
+                    queue.waiters = [w for w in queue.waiters if w.future is not future]
+                    heapq.heapify(queue.waiters)
+            if admitted:
+                self._dispatch(loop, model)
+            raise
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop, model: str) -> None:
+        """Admit this loop's queued calls, highest priority first, while limits allow."""
+        with self._lock:
+            state = self._models[model]
+            queue = self._queue(loop, model)
+            if queue.timer is not None:
+                queue.timer.cancel()
+                queue.timer = None
+
+            while queue.waiters:
+                head = queue.waiters[0]
+                if head.future.done():  # Cancelled while queued
+                    heapq.heappop(queue.waiters)
+                    continue
+                if queue.in_flight >= max(int(state.window), 1):
+                    return  # A release will dispatch again
+
+                wait = state.wait_time(head.tokens, self._clock())
+                if wait > 0:
+                    queue.timer = loop.call_later(wait, self._dispatch, loop, model)
+                    return
+
+                heapq.heappop(queue.waiters)
+                state.charge(head.tokens)
+                queue.in_flight += 1
+                head.future.set_result(None)
+
+    def _release(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        model: str,
+        slot: SchedulerSlot,
+        latency: float,
+        rate_limited: bool,
+    ) -> None:
+        with self._lock:
+            state = self._models[model]
+            self._queue(loop, model).in_flight -= 1
+
+            if slot.actual_tokens is not None:
+                state.correct(slot.estimated_tokens, slot.actual_tokens)
+
+            if not rate_limited:
+                self._on_latency(state, latency)
+        self._dispatch(loop, model)
+
+    def _on_latency(self, state: _ModelState, latency: float) -> None:
+        """Additive increase, or a mild decrease on latency spikes."""
+        spike = (
+            state.latency_ewma is not None
+            and state.samples >= LATENCY_MIN_SAMPLES
+            and latency > state.latency_ewma * LATENCY_SPIKE_RATIO
+        )
+        if spike:
+            state.window = max(self.min_window, state.window * LATENCY_DECREASE)
+        else:
+            state.window = min(self.max_window, state.window + 1.0 / state.window)
+
+        if state.latency_ewma is None:
+            state.latency_ewma = latency
+        else:
+            state.latency_ewma += LATENCY_EWMA_ALPHA * (latency - state.latency_ewma)
+        state.samples += 1
+
+    def _on_rate_limited(self, model: str, retry_after_seconds: float | None) -> None:
+        """Multiplicative decrease and a pause until the limit resets."""
+        with self._lock:
+            state = self._state(model)
+            state.rate_limited += 1
+            state.window = max(self.min_window, state.window * RATE_LIMIT_DECREASE)
+            if state.requests:
+                state.requests.drain()
+            if retry_after_seconds:
+                state.paused_until = max(state.paused_until, self._clock() + retry_after_seconds)
+        logger.warning(
+            f"Rate limited on {model}: window reduced to {state.window:.1f}"
+            + (f", pausing {retry_after_seconds:.1f}s" if retry_after_seconds else "")
+        )
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-model window, queue and bucket state (queues summed over loops)."""
+        with self._lock:
+            queues = [q for per_loop in list(self._queues.values()) for q in per_loop.items()]
+            return {
+                model: {
+                    "window": round(state.window, 2),
+                    "in_flight": sum(q.in_flight for m, q in queues if m == model),
+                    "queued": sum(
+                        1 for m, q in queues if m == model for w in q.waiters if not w.future.done()
+                    ),
+                    "requests_available": (
+                        round(state.requests.tokens, 1) if state.requests else None
+                    ),
+                    "tokens_available": round(state.tokens.tokens, 1) if state.tokens else None,
+                    "rate_limited": state.rate_limited,
+                    "latency_ewma": state.latency_ewma,
+                }
+                for model, state in self._models.items()
+            }
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether an exception is a provider rate limit (HTTP 429).
+
+    Matches the exception type, an HTTP status of 429 on the error or its
+    response, or "rate limit" in the message. A bare "429" in a message is
+    not enough: it also appears in ids, sizes and line numbers.
+    """
+    if type(error).__name__ == "RateLimitError":
+        return True
+    response = getattr(error, "response", None)
+    for status in (
+        getattr(error, "status_code", None),
+        getattr(error, "status", None),
+        getattr(response, "status_code", None),
+    ):
+        if status == 429:
+            return True
+    message = str(error).lower()
+    return "rate limit" in message or "rate_limit" in message
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Seconds from a ``retry-after`` response header, if present."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def _parse_limits(value: Any) -> ModelLimits:
+    if not isinstance(value, dict):
+        raise ValueError(f"expected an object, got {value!r}")
+    limits = ModelLimits()
+    for name in ("requests_per_minute", "tokens_per_minute"):
+        limit = value.get(name, getattr(limits, name))
+        if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int)):
+            raise ValueError(f"{name} must be an integer or null, got {limit!r}")
+        setattr(limits, name, limit or None)
+    return limits
+
+
+def load_limits(path: str | Path | None = None) -> tuple[dict[str, ModelLimits], ModelLimits]:
+    """Load rate limits from the limits file and environment.
+
+    Args:
+        path: JSON limits file (default: ``$ATTUNE_LLM_LIMITS`` or
+            ``~/.empathy/llm_limits.json``)
+
+    Returns:
+        Tuple of (limits by model or provider, default limits). Invalid
+        entries are logged and skipped.
+    """
+    limits: dict[str, ModelLimits] = {}
+    default = ModelLimits()
+
+    path = Path(path or os.getenv(LIMITS_ENV_VAR) or DEFAULT_LIMITS_PATH)
+    if path.exists():
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring LLM limits file {path}: {e}")
+            data = {}
+        for key, value in (data if isinstance(data, dict) else {}).items():
+            try:
+                parsed = _parse_limits(value)
+            except ValueError as e:
+                logger.warning(f"Ignoring LLM limits for {key}: {e}")
+                continue
+            if key == "default":
+                default = parsed
+            else:
+                limits[key] = parsed
+
+    for attr, env_var in (
+        ("requests_per_minute", "ATTUNE_LLM_REQUESTS_PER_MINUTE"),
+        ("tokens_per_minute", "ATTUNE_LLM_TOKENS_PER_MINUTE"),
+    ):
+        value = os.getenv(env_var)
+        if value:
+            try:
+                setattr(default, attr, int(value))
+            except ValueError:
+                logger.warning(f"Ignoring {env_var}={value!r}: not an integer")
+
+    return limits, default
+
+
+# Global scheduler instance
+_scheduler: LLMScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Get the process-wide LLM scheduler, configured by ``load_limits()``."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                limits, default = load_limits()
+                _scheduler = LLMScheduler(limits=limits, default_limits=default)
+    return _scheduler
+
+
+def reset_llm_scheduler() -> None:
+    """Reset the process-wide scheduler (mainly for tests)."""
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = None
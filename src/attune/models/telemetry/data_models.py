@@ -38,6 +38,10 @@ class LLMCallRecord:
     input_tokens: int = 0
     output_tokens: int = 0
 
+    # Anthropic prompt cache usage, reported separately from input_tokens
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+
     # Cost (in USD)
     estimated_cost: float = 0.0
     actual_cost: float | None = None
@@ -26,6 +26,9 @@ except ImportError:
 # Heuristic fallback: ~4 tokens per word, ~0.25 tokens per character
 TOKENS_PER_CHAR_HEURISTIC = 0.25
 
+# Upper bound on files counted when estimating a target directory
+MAX_DIRECTORY_FILES = 500
+
 
 @functools.lru_cache(maxsize=4)
 def _get_encoding(model_id: str) -> Any:
@@ -210,21 +213,12 @@ def estimate_workflow_cost(
                     file_content = f.read()
                 input_tokens += estimate_tokens(file_content)
             elif os.path.isdir(validated_target):
-                # Estimate based on directory size (rough heuristic)
-                total_chars = 0
-                for root, _, files in os.walk(validated_target):
-                    for file in files[:50]:  # Limit to first 50 files
-                        if file.endswith((".py", ".js", ".ts", ".tsx", ".jsx")):
-                            try:
-                                filepath = os.path.join(root, file)
-                                validated_filepath = _validate_file_path(filepath)
-                                with open(
-                                    validated_filepath, encoding="utf-8", errors="ignore"
-                                ) as f:
-                                    total_chars += len(f.read())
-                            except (ValueError, OSError):
-                                pass
-                input_tokens += int(total_chars * TOKENS_PER_CHAR_HEURISTIC)
+                # Stream source files through the shared batch token counter
+                from attune.utils.token_counter import get_token_counter
+
+                input_tokens += get_token_counter().estimate_directory(
+                    validated_target, max_files=MAX_DIRECTORY_FILES
+                )
         except (ValueError, OSError):
             pass  # Keep original estimate
 
@@ -14,6 +14,8 @@ Provides threshold-based alerting for LLM usage metrics.
 - error_rate: Percentage of failed LLM calls
 - avg_latency: Average response time in milliseconds
 - token_usage: Total tokens used in the last 24 hours
+- p50_latency / p95_latency / p99_latency: Latency percentiles (last 24 hours)
+- hourly_cost / hourly_error_rate: Cost and error rate in the last hour
 
 Copyright 2025-2026 Smart-AI-Memory
 Licensed under the Apache License, Version 2.0
@@ -31,13 +33,15 @@ import urllib.error
 import urllib.parse
 import urllib.request
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from .telemetry_window import TelemetryTailer
+
 logger = logging.getLogger(__name__)
 
 
@@ -152,6 +156,11 @@ class AlertMetric(Enum):
     ERROR_RATE = "error_rate"
     AVG_LATENCY = "avg_latency"
     TOKEN_USAGE = "token_usage"
+    P50_LATENCY = "p50_latency"
+    P95_LATENCY = "p95_latency"
+    P99_LATENCY = "p99_latency"
+    HOURLY_COST = "hourly_cost"
+    HOURLY_ERROR_RATE = "hourly_error_rate"
 
 
 class AlertSeverity(Enum):
@@ -280,6 +289,8 @@ class AlertEngine:
         )
 
         self._cooldown_cache: dict[str, float] = {}  # alert_id -> last_triggered_time
+        # Incremental 24h/1h metrics over usage.jsonl (no rescans per check)
+        self._tailer = TelemetryTailer(self.telemetry_dir / "usage.jsonl")
         self._init_db()
 
     def _init_db(self) -> None:
@@ -538,69 +549,26 @@ class AlertEngine:
     def get_metrics(self) -> dict[str, float]:
         """Get current telemetry metrics.
 
-        Reads from telemetry files and calculates:
+        Reads entries appended to the telemetry file since the last call
+        (following rotations) into per-minute sliding windows and calculates:
         - daily_cost: Total cost in last 24 hours
         - error_rate: Percentage of errors
         - avg_latency: Average latency in ms
         - token_usage: Total tokens in last 24 hours
+        - p50_latency / p95_latency / p99_latency: Latency percentiles in ms
+        - hourly_cost: Total cost in the last hour
+        - hourly_error_rate: Percentage of errors in the last hour
 
         Returns:
             Dictionary of metric name to current value
         """
-        usage_file = self.telemetry_dir / "usage.jsonl"
-
-        if not usage_file.exists():
-            logger.debug("telemetry_file_not_found", path=str(usage_file))
-            return {
-                "daily_cost": 0.0,
-                "error_rate": 0.0,
-                "avg_latency": 0.0,
-                "token_usage": 0,
-            }
-
-        # Read last 24 hours of data
-        cutoff = datetime.now() - timedelta(hours=24)
-        total_cost = 0.0
-        total_tokens = 0
-        total_latency = 0.0
-        total_calls = 0
-        error_calls = 0
-
         try:
-            with open(usage_file) as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    try:
-                        entry = json.loads(line)
-                        timestamp = datetime.fromisoformat(entry.get("timestamp", "2000-01-01"))
-                        if timestamp < cutoff:
-                            continue
-
-                        total_calls += 1
-                        total_cost += entry.get("cost", 0.0)
-                        total_tokens += entry.get("tokens", {}).get("total", 0)
-                        total_latency += entry.get("duration_ms", 0)
-
-                        if entry.get("error"):
-                            error_calls += 1
-                    except (json.JSONDecodeError, KeyError):
-                        continue
+            self._tailer.poll()
         except (OSError, PermissionError) as e:
-            logger.warning("telemetry_read_error", error=str(e))
-            return {
-                "daily_cost": 0.0,
-                "error_rate": 0.0,
-                "avg_latency": 0.0,
-                "token_usage": 0,
-            }
+            logger.warning(f"Failed to read telemetry file {self._tailer.path}: {e}")
+            return {metric.value: 0.0 for metric in AlertMetric}
 
-        return {
-            "daily_cost": total_cost,
-            "error_rate": (error_calls / total_calls * 100) if total_calls > 0 else 0.0,
-            "avg_latency": (total_latency / total_calls) if total_calls > 0 else 0.0,
-            "token_usage": total_tokens,
-        }
+        return self._tailer.window.metrics()
 
     def check_and_trigger(self) -> list[AlertEvent]:
         """Check all alerts and trigger notifications if thresholds exceeded.
@@ -671,6 +639,11 @@ class AlertEngine:
             AlertMetric.ERROR_RATE: "%",
             AlertMetric.AVG_LATENCY: "ms",
             AlertMetric.TOKEN_USAGE: "tokens",
+            AlertMetric.P50_LATENCY: "ms",
+            AlertMetric.P95_LATENCY: "ms",
+            AlertMetric.P99_LATENCY: "ms",
+            AlertMetric.HOURLY_COST: "USD",
+            AlertMetric.HOURLY_ERROR_RATE: "%",
         }
         unit = metric_units.get(alert.metric, "")
 
@@ -23,6 +23,7 @@ import time
 import click
 
 from .alerts import (
+    AlertMetric,
     get_alert_engine,
 )
 
@@ -36,7 +37,8 @@ def alerts():
 @alerts.command()
 @click.option("--non-interactive", is_flag=True, help="Skip interactive prompts")
 @click.option(
-    "--metric", type=click.Choice(["daily_cost", "error_rate", "avg_latency", "token_usage"])
+    "--metric",
+    type=click.Choice([m.value for m in AlertMetric]),
 )
 @click.option("--threshold", type=float)
 @click.option("--channel", type=click.Choice(["webhook", "email", "stdout"]))
@@ -143,6 +145,11 @@ def _create_alert(
         "error_rate": "Error Rate",
         "avg_latency": "Average Latency",
         "token_usage": "Token Usage",
+        "p50_latency": "P50 Latency",
+        "p95_latency": "P95 Latency",
+        "p99_latency": "P99 Latency",
+        "hourly_cost": "Hourly Cost",
+        "hourly_error_rate": "Hourly Error Rate",
     }
 
     try:
@@ -419,6 +426,11 @@ def metrics(as_json: bool):
         "error_rate": ("Error Rate", "%"),
         "avg_latency": ("Avg Latency", "ms"),
         "token_usage": ("Token Usage", "tokens"),
+        "p50_latency": ("P50 Latency", "ms"),
+        "p95_latency": ("P95 Latency", "ms"),
+        "p99_latency": ("P99 Latency", "ms"),
+        "hourly_cost": ("Hourly Cost (1h)", "USD"),
+        "hourly_error_rate": ("Hourly Error Rate (1h)", "%"),
     }
 
     for key, value in current_metrics.items():
@@ -0,0 +1,419 @@
+"""Incremental Sliding-Window Metrics for Telemetry Alerts
+
+Keeps 24-hour and 1-hour aggregates of ``usage.jsonl`` up to date without
+rescanning the file:
+
+- ``TelemetryTailer`` reads only the bytes appended since the last poll. It
+  remembers the file's inode and offset, and when the tracker rotates
+  ``usage.jsonl`` it finishes reading the rotated file before following the
+  new one.
+- ``SlidingWindowMetrics`` stores per-minute aggregates in a ring buffer and
+  keeps running totals per window, so reading window metrics costs the same
+  regardless of how much telemetry has been written.
+- ``LatencySketch`` is a mergeable, log-bucketed quantile sketch used for
+  p50/p95/p99 latency with bounded relative error.
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Window sizes in minutes
+HOUR_MINUTES = 60
+DAY_MINUTES = 24 * 60
+
+# Default relative accuracy of latency percentiles (1%)
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+
+class LatencySketch:
+    """Quantile sketch with logarithmic buckets (DDSketch-style).
+
+    Values are counted in buckets whose bounds grow geometrically, so any
+    quantile is estimated within ``relative_accuracy`` of a true value.
+    Sketches with the same accuracy can be merged and subtracted by adding
+    bucket counts, which lets sliding windows expire old minutes.
+
+    Example:
+        >>> sketch = LatencySketch()
+        >>> for ms in (100, 200, 300, 400, 5000):
+        ...     sketch.add(ms)
+        >>> abs(sketch.quantile(0.5) - 300) <= 300 * 0.01
+        True
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates
+        """
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value (values <= 0 are counted as zero)."""
+        if value <= 0:
+            self.zero_count += count
+        else:
+            key = self._key(value)
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.count += count
+
+    def merge(self, other: LatencySketch) -> None:
+        """Add all values of another sketch."""
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def subtract(self, other: LatencySketch) -> None:
+        """Remove all values of another sketch previously merged into this one."""
+        for key, count in other.bins.items():
+            remaining = self.bins.get(key, 0) - count
+            if remaining > 0:
+                self.bins[key] = remaining
+            else:
+                self.bins.pop(key, None)
+        self.zero_count = max(0, self.zero_count - other.zero_count)
+        self.count = max(0, self.count - other.count)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile (0 <= q <= 1), or 0.0 when empty."""
+        if self.count == 0:
+            return 0.0
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                # Midpoint of the bucket (gamma^(k-1), gamma^k]
+                return 2 * self.gamma**key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.bins) / (self.gamma + 1)
+
+
+@dataclass
+class MinuteAggregate:
+    """Aggregated telemetry for one minute (or a window of minutes)."""
+
+    minute: int = -1
+    calls: int = 0
+    errors: int = 0
+    cost: float = 0.0
+    tokens: int = 0
+    latency_ms: float = 0.0
+    latency: LatencySketch = field(default_factory=LatencySketch)
+
+    def add_call(self, cost: float, tokens: int, latency_ms: float, error: bool) -> None:
+        """Count one call."""
+        self.calls += 1
+        self.errors += int(error)
+        self.cost += cost
+        self.tokens += tokens
+        self.latency_ms += latency_ms
+        self.latency.add(latency_ms)
+
+    def subtract(self, other: MinuteAggregate) -> None:
+        """Remove an aggregate previously counted in this one."""
+        self.calls -= other.calls
+        self.errors -= other.errors
+        self.cost -= other.cost
+        self.tokens -= other.tokens
+        self.latency_ms -= other.latency_ms
+        self.latency.subtract(other.latency)
+        if self.calls <= 0:
+            # Avoid float drift once the window is empty
+            self.reset()
+
+    def reset(self, minute: int = -1) -> None:
+        """Clear all counts."""
+        self.minute = minute
+        self.calls = 0
+        self.errors = 0
+        self.cost = 0.0
+        self.tokens = 0
+        self.latency_ms = 0.0
+        self.latency = LatencySketch(self.latency.relative_accuracy)
+
+
+class SlidingWindowMetrics:
+    """Per-minute ring buffer with running totals for trailing windows.
+
+    ``add()`` and ``advance()`` update the running totals of every window
+    incrementally, so ``metrics()`` does not depend on the number of calls.
+
+    Example:
+        >>> window = SlidingWindowMetrics()
+        >>> _ = window.add(time.time(), cost=0.5, tokens=1200, latency_ms=800, error=False)
+        >>> window.metrics()["daily_cost"]
+        0.5
+    """
+
+    def __init__(
+        self,
+        windows: tuple[int, ...] = (HOUR_MINUTES, DAY_MINUTES),
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ):
+        """Initialize the buffer.
+
+        Args:
+            windows: Window sizes in minutes (the largest sets the ring size)
+            relative_accuracy: Relative accuracy of latency percentiles
+        """
+        self.windows = tuple(sorted(windows))
+        self.size = self.windows[-1]
+        self.relative_accuracy = relative_accuracy
+        self._slots = [self._new_aggregate() for _ in range(self.size)]
+        self._totals = {w: self._new_aggregate() for w in self.windows}
+        self._current: int | None = None
+
+    def _new_aggregate(self, minute: int = -1) -> MinuteAggregate:
+        return MinuteAggregate(minute=minute, latency=LatencySketch(self.relative_accuracy))
+
+    def clear(self) -> None:
+        """Drop all data."""
+        for slot in self._slots:
+            slot.reset()
+        for total in self._totals.values():
+            total.reset()
+        self._current = None
+
+    def advance(self, now: float) -> None:
+        """Move the windows forward to ``now`` (epoch seconds), expiring old minutes."""
+        minute = int(now // 60)
+        if self._current is None:
+            self._current = minute
+            return
+        if minute <= self._current:
+            return
+
+        if minute - self._current >= self.size:
+            self.clear()
+            self._current = minute
+            return
+
+        for m in range(self._current + 1, minute + 1):
+            for w, total in self._totals.items():
+                leaving = self._slots[(m - w) % self.size]
+                if leaving.minute == m - w and leaving.calls:
+                    total.subtract(leaving)
+            slot = self._slots[m % self.size]
+            if slot.minute != m:
+                slot.reset(m)
+        self._current = minute
+
+    def add(
+        self,
+        timestamp: float,
+        cost: float = 0.0,
+        tokens: int = 0,
+        latency_ms: float = 0.0,
+        error: bool = False,
+    ) -> bool:
+        """Count a call made at ``timestamp`` (epoch seconds).
+
+        Returns:
+            False if the call is older than the largest window and was dropped
+        """
+        self.advance(timestamp)
+        minute = int(timestamp // 60)
+        current = self._current if self._current is not None else minute
+        if minute <= current - self.size:
+            return False
+
+        slot = self._slots[minute % self.size]
+        if slot.minute != minute:
+            slot.reset(minute)
+        slot.add_call(cost, tokens, latency_ms, error)
+
+        for w, total in self._totals.items():
+            if minute > current - w:
+                total.add_call(cost, tokens, latency_ms, error)
+        return True
+
+    def window(self, minutes: int) -> MinuteAggregate:
+        """Running totals of a window (must be one of ``windows``)."""
+        return self._totals[minutes]
+
+    def metrics(self, now: float | None = None) -> dict[str, float]:
+        """Alert metrics for the trailing 24 hours and hour.
+
+        Args:
+            now: Current time in epoch seconds (default: time.time())
+
+        Returns:
+            Dictionary of metric name to current value
+        """
+        self.advance(time.time() if now is None else now)
+        day = self._totals[self.size]
+        hour = self._totals.get(HOUR_MINUTES, day)
+
+        return {
+            "daily_cost": day.cost,
+            "error_rate": (day.errors / day.calls * 100) if day.calls > 0 else 0.0,
+            "avg_latency": (day.latency_ms / day.calls) if day.calls > 0 else 0.0,
+            "token_usage": day.tokens,
+            "p50_latency": day.latency.quantile(0.50),
+            "p95_latency": day.latency.quantile(0.95),
+            "p99_latency": day.latency.quantile(0.99),
+            "hourly_cost": hour.cost,
+            "hourly_error_rate": (hour.errors / hour.calls * 100) if hour.calls > 0 else 0.0,
+        }
+
+
+def _entry_timestamp(entry: dict[str, Any]) -> float | None:
+    """Epoch seconds of a telemetry entry.
+
+    Accepts the ``timestamp`` field (local time) and the UsageTracker ``ts``
+    field (UTC with a ``Z`` suffix).
+    """
+    raw = entry.get("timestamp") or entry.get("ts")
+    if not raw:
+        return None
+    try:
+        return datetime.fromisoformat(raw.replace("Z", "+00:00")).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _entry_tokens(entry: dict[str, Any]) -> int:
+    tokens = entry.get("tokens") or {}
+    if not isinstance(tokens, dict):
+        return int(tokens or 0)
+    if "total" in tokens:
+        return tokens["total"]
+    return tokens.get("input", 0) + tokens.get("output", 0)
+
+
+class TelemetryTailer:
+    """Incrementally feeds a JSONL telemetry file into a ``SlidingWindowMetrics``.
+
+    Each ``poll()`` reads only complete lines appended since the previous
+    poll. Rotation (rename of the file, as done by ``UsageTracker``) is
+    detected by an inode change: the remainder of the rotated file is read
+    first, then the new file is followed from its start.
+    """
+
+    def __init__(self, path: str | Path, window: SlidingWindowMetrics | None = None):
+        """Initialize the tailer.
+
+        Args:
+            path: Telemetry file to follow (e.g. ``usage.jsonl``)
+            window: Metrics to update (default: a new 24h/1h window)
+        """
+        self.path = Path(path)
+        self.window = window or SlidingWindowMetrics()
+        self.offset = 0
+        self._file_id: tuple[int, int] | None = None  # (st_dev, st_ino)
+        self.lines_read = 0
+
+    def poll(self) -> int:
+        """Read newly appended entries.
+
+        Returns:
+            Number of entries added to the window
+
+        Raises:
+            OSError: If the telemetry file exists but cannot be read
+        """
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            stat = None
+
+        file_id = (stat.st_dev, stat.st_ino) if stat else None
+        added = 0
+
+        if self._file_id is not None and file_id != self._file_id:
+            # Rotated: finish the old file, wherever it was renamed to
+            rotated = self._find_rotated(self._file_id)
+            if rotated is not None:
+                added += self._read(rotated)
+            self._file_id = None
+            self.offset = 0
+
+        if stat is None:
+            return added
+
+        if self._file_id is None:
+            self._file_id = file_id
+            self.offset = 0
+        elif stat.st_size < self.offset:
+            # Truncated or replaced in place: follow it from the start
+            self.offset = 0
+
+        if stat.st_size > self.offset:
+            added += self._read(self.path)
+        return added
+
+    def _find_rotated(self, file_id: tuple[int, int]) -> Path | None:
+        """Find the rotated file that used to be ``self.path``."""
+        pattern = f"{self.path.stem}.*{self.path.suffix}"
+        for candidate in self.path.parent.glob(pattern):
+            try:
+                stat = candidate.stat()
+            except OSError:
+                continue
+            if (stat.st_dev, stat.st_ino) == file_id:
+                return candidate
+        return None
+
+    def _read(self, path: Path) -> int:
+        """Read complete lines from ``self.offset`` and advance it."""
+        with open(path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read()
+
+        end = data.rfind(b"\n")
+        if end < 0:
+            return 0  # Only a partial line so far
+        self.offset += end + 1
+
+        now = time.time()
+        added = 0
+        for line in data[: end + 1].splitlines():
+            if not line.strip():
+                continue
+            self.lines_read += 1
+            try:
+                entry = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if not isinstance(entry, dict):
+                continue
+            timestamp = _entry_timestamp(entry)
+            if timestamp is None:
+                continue
+            try:
+                added += self.window.add(
+                    min(timestamp, now),
+                    cost=float(entry.get("cost", 0.0) or 0.0),
+                    tokens=_entry_tokens(entry),
+                    latency_ms=float(entry.get("duration_ms", 0) or 0),
+                    error=bool(entry.get("error")),
+                )
+            except (TypeError, ValueError):
+                continue
+        return added
@@ -10,8 +10,10 @@ Copyright 2025 Smart AI Memory, LLC
 Licensed under the Apache License, Version 2.0
 """
 
+import bisect
 import json
 import logging
+import os
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -21,6 +23,10 @@ from attune.pattern_library import Pattern, PatternLibrary
 
 logger = logging.getLogger(__name__)
 
+# Manifest of saved configurations (not matched by the "*.json" config glob)
+MANIFEST_FILENAME = ".manifest"
+MANIFEST_VERSION = 1
+
 
 def _validate_file_path(path: str, allowed_dir: str | None = None) -> Path:
     """Validate file path to prevent path traversal and arbitrary writes.
@@ -201,6 +207,38 @@ class AgentConfiguration:
         return cls(**data)
 
 
+@dataclass
+class ConfigurationSummary:
+    """Manifest entry for a saved configuration.
+
+    Holds the fields needed to rank and filter configurations, so queries can
+    run without parsing configuration files. ``mtime_ns`` and ``size`` detect
+    files changed outside the store.
+    """
+
+    id: str
+    filename: str
+    task_pattern: str
+    success_rate: float
+    avg_quality_score: float
+    mtime_ns: int
+    size: int
+
+    @property
+    def rank_key(self) -> tuple[float, float]:
+        """Sort key: best success rate, then best quality score first."""
+        return (-self.success_rate, -self.avg_quality_score)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the manifest."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ConfigurationSummary":
+        """Deserialize a manifest entry."""
+        return cls(**data)
+
+
 class ConfigurationStore:
     """Persistent storage for successful agent team compositions.
 
@@ -212,10 +250,15 @@ class ConfigurationStore:
 
     File structure:
         .attune/orchestration/compositions/
+        ├── .manifest  (id, task_pattern, metrics and file stat per configuration)
         ├── release_prep_001.json
         ├── test_coverage_boost_001.json
         └── security_deep_dive_001.json
 
+    Queries run against the manifest, which keeps configurations ranked per
+    task pattern; configuration files are only parsed for returned results.
+    Metric changes are re-ranked when the configuration is saved.
+
     Example:
         >>> store = ConfigurationStore()
         >>>
@@ -261,35 +304,173 @@ class ConfigurationStore:
             logger.error(f"Failed to create storage directory {self.storage_dir}: {e}")
             raise ValueError(f"Cannot create storage directory: {e}") from e
 
-        # In-memory cache for fast lookups
+        # In-memory cache of hydrated configurations
         self._cache: dict[str, AgentConfiguration] = {}
         self._loaded = False
 
-    def _load_all_from_disk(self) -> None:
-        """Load all configurations from disk into cache.
+        # Manifest index: id -> summary, plus ranked (rank_key, seq, id) lists
+        self._manifest_path = self.storage_dir / MANIFEST_FILENAME
+        self._summaries: dict[str, ConfigurationSummary] = {}
+        self._ranked: list[tuple[tuple[float, float], int, str]] = []
+        self._ranked_by_task: dict[str, list[tuple[tuple[float, float], int, str]]] = {}
+        self._rank_entries: dict[str, tuple[tuple[float, float], int, str]] = {}
+        self._next_seq = 0
 
-        This is called lazily on first access to avoid startup overhead.
+    def _load_index(self) -> None:
+        """Load the manifest and reconcile it with the files on disk.
+
+        This is called lazily on first access to avoid startup overhead. Only
+        files that are new or changed since the manifest was written are parsed.
         """
         if self._loaded:
             return
 
+        manifest = self._read_manifest()
+        summaries: dict[str, ConfigurationSummary] = {}
+        known = {summary.filename: summary for summary in manifest.values()}
+        parsed = 0
+
         try:
-            for config_file in self.storage_dir.glob("*.json"):
-                try:
-                    with config_file.open("r") as f:
-                        data = json.load(f)
-                        config = AgentConfiguration.from_dict(data)
+            with os.scandir(self.storage_dir) as entries:
+                files = sorted(
+                    (
+                        entry
+                        for entry in entries
+                        if entry.name.endswith(".json") and entry.is_file()
+                    ),
+                    key=lambda entry: entry.name,
+                )
+                for entry in files:
+                    stat = entry.stat()
+                    summary = known.get(entry.name)
+                    if (
+                        summary is None
+                        or summary.mtime_ns != stat.st_mtime_ns
+                        or summary.size != stat.st_size
+                    ):
+                        config = self._read_config(Path(entry.path))
+                        if config is None:
+                            continue
+                        parsed += 1
                         self._cache[config.id] = config
-                except (json.JSONDecodeError, KeyError, TypeError) as e:
-                    logger.warning(f"Failed to load {config_file}: {e}")
-                    continue
-
-            logger.info(f"Loaded {len(self._cache)} configurations from disk")
-            self._loaded = True
-
+                        summary = self._summarize(config, entry.name, stat)
+                    summaries[summary.id] = summary
         except OSError as e:
             logger.error(f"Error reading from {self.storage_dir}: {e}")
-            # Don't raise - start with empty cache
+            # Don't raise - start with empty index
+
+        # Keep manifest order (save order) for tie-breaking, new files last
+        ordered = [summaries.pop(cid) for cid in manifest if cid in summaries]
+        ordered.extend(summaries.values())
+        for summary in ordered:
+            self._index_summary(summary)
+
+        if parsed or len(ordered) != len(manifest):
+            self._write_manifest()
+
+        logger.info(f"Indexed {len(self._summaries)} configurations ({parsed} parsed)")
+        self._loaded = True
+
+    def _load_all_from_disk(self) -> None:
+        """Hydrate every indexed configuration into the cache."""
+        self._load_index()
+        for config_id in list(self._summaries):
+            self._hydrate(config_id)
+
+    def _hydrate(self, config_id: str) -> AgentConfiguration | None:
+        """Return a configuration, parsing its file on first access."""
+        config = self._cache.get(config_id)
+        if config is not None:
+            return config
+
+        summary = self._summaries.get(config_id)
+        if summary is None:
+            return None
+        config = self._read_config(self.storage_dir / summary.filename)
+        if config is None:
+            self._unindex_summary(config_id)
+            return None
+        self._cache[config_id] = config
+        return config
+
+    def _read_config(self, config_file: Path) -> AgentConfiguration | None:
+        """Parse a configuration file, returning None if it is unreadable."""
+        try:
+            with config_file.open("r") as f:
+                return AgentConfiguration.from_dict(json.load(f))
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to load {config_file}: {e}")
+            return None
+
+    def _summarize(
+        self, config: AgentConfiguration, filename: str, stat: os.stat_result
+    ) -> ConfigurationSummary:
+        """Build a manifest entry from a configuration and its file stat."""
+        return ConfigurationSummary(
+            id=config.id,
+            filename=filename,
+            task_pattern=config.task_pattern,
+            success_rate=config.success_rate,
+            avg_quality_score=config.avg_quality_score,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+        )
+
+    def _index_summary(self, summary: ConfigurationSummary) -> None:
+        """Add or re-rank a configuration in the manifest index."""
+        previous = self._rank_entries.get(summary.id)
+        if previous is not None:
+            seq = previous[1]  # Keep original position among equal ranks
+            self._unindex_summary(summary.id)
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+
+        entry = (summary.rank_key, seq, summary.id)
+        self._summaries[summary.id] = summary
+        self._rank_entries[summary.id] = entry
+        bisect.insort(self._ranked, entry)
+        bisect.insort(self._ranked_by_task.setdefault(summary.task_pattern, []), entry)
+
+    def _unindex_summary(self, config_id: str) -> None:
+        """Remove a configuration from the manifest index."""
+        summary = self._summaries.pop(config_id, None)
+        entry = self._rank_entries.pop(config_id, None)
+        if summary is None or entry is None:
+            return
+        for ranked in (self._ranked, self._ranked_by_task.get(summary.task_pattern, [])):
+            position = bisect.bisect_left(ranked, entry)
+            if position < len(ranked) and ranked[position] == entry:
+                del ranked[position]
+        if not self._ranked_by_task.get(summary.task_pattern):
+            self._ranked_by_task.pop(summary.task_pattern, None)
+
+    def _read_manifest(self) -> dict[str, ConfigurationSummary]:
+        """Read the manifest, returning an empty one if missing or invalid."""
+        try:
+            with self._manifest_path.open("r") as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                return {}
+            return {entry["id"]: ConfigurationSummary.from_dict(entry) for entry in data["configs"]}
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, AttributeError):
+            return {}
+
+    def _write_manifest(self) -> None:
+        """Write the manifest atomically, in save order."""
+        summaries = sorted(self._summaries.values(), key=lambda s: self._rank_entries[s.id][1])
+        data = {"version": MANIFEST_VERSION, "configs": [s.to_dict() for s in summaries]}
+        try:
+            validated_path = _validate_file_path(
+                str(self._manifest_path), allowed_dir=str(self.storage_dir)
+            )
+            tmp_path = validated_path.with_name(validated_path.name + ".tmp")
+            with tmp_path.open("w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, validated_path)
+        except (OSError, ValueError) as e:
+            # The manifest is rebuilt from the configuration files if missing
+            logger.warning(f"Failed to write configuration manifest: {e}")
 
     def save(self, config: AgentConfiguration) -> Path:
         """Save agent configuration to disk and update pattern library.
@@ -307,6 +488,8 @@ class ConfigurationStore:
         if not config.id or not isinstance(config.id, str):
             raise ValueError("config.id must be a non-empty string")
 
+        self._load_index()
+
         # Validate filename (prevent path traversal)
         filename = f"{config.id}.json"
         file_path = self.storage_dir / filename
@@ -325,8 +508,15 @@ class ConfigurationStore:
             logger.error(f"Failed to save configuration {config.id}: {e}")
             raise
 
-        # Update in-memory cache
+        # Update in-memory cache and manifest
         self._cache[config.id] = config
+        try:
+            stat = validated_path.stat()
+        except OSError as e:
+            logger.warning(f"Failed to stat {validated_path}: {e}")
+        else:
+            self._index_summary(self._summarize(config, validated_path.name, stat))
+            self._write_manifest()
 
         # Integrate with pattern library
         if self.pattern_library:
@@ -349,11 +539,10 @@ class ConfigurationStore:
         if not config_id or not isinstance(config_id, str):
             raise ValueError("config_id must be a non-empty string")
 
-        # Load all configs if not already loaded
-        self._load_all_from_disk()
+        # Load the index if not already loaded
+        self._load_index()
 
-        # Return from cache
-        return self._cache.get(config_id)
+        return self._hydrate(config_id)
 
     def search(
         self,
@@ -385,32 +574,29 @@ class ConfigurationStore:
         if limit < 1:
             raise ValueError(f"limit must be positive, got {limit}")
 
-        # Load all configs if not already loaded
-        self._load_all_from_disk()
-
-        # Filter by criteria
-        matches: list[AgentConfiguration] = []
+        # Load the index if not already loaded
+        self._load_index()
 
-        for config in self._cache.values():
-            # Filter by task pattern
-            if task_pattern and config.task_pattern != task_pattern:
-                continue
+        # Ranked by success rate (descending), then quality score (descending)
+        ranked = self._ranked_by_task.get(task_pattern, []) if task_pattern else self._ranked
 
-            # Filter by success rate
-            if config.success_rate < min_success_rate:
-                continue
+        matches: list[AgentConfiguration] = []
+        for (neg_success_rate, neg_quality_score), _, config_id in ranked:
+            # Every remaining entry has a lower success rate
+            if -neg_success_rate < min_success_rate:
+                break
 
             # Filter by quality score
-            if config.avg_quality_score < min_quality_score:
+            if -neg_quality_score < min_quality_score:
                 continue
 
-            matches.append(config)
-
-        # Sort by success rate (descending), then quality score (descending)
-        matches.sort(key=lambda c: (c.success_rate, c.avg_quality_score), reverse=True)
+            config = self._hydrate(config_id)
+            if config is not None:
+                matches.append(config)
+                if len(matches) >= limit:
+                    break
 
-        # Apply limit
-        return matches[:limit]
+        return matches
 
     def get_best_for_task(self, task_pattern: str) -> AgentConfiguration | None:
         """Get the best-performing configuration for a specific task pattern.
@@ -421,8 +607,13 @@ class ConfigurationStore:
         Returns:
             Best configuration if found, None otherwise
         """
-        results = self.search(task_pattern=task_pattern, limit=1)
-        return results[0] if results else None
+        self._load_index()
+
+        for _, _, config_id in self._ranked_by_task.get(task_pattern, []):
+            config = self._hydrate(config_id)
+            if config is not None:
+                return config
+        return None
 
     def delete(self, config_id: str) -> bool:
         """Delete a configuration.
@@ -440,15 +631,16 @@ class ConfigurationStore:
         if not config_id or not isinstance(config_id, str):
             raise ValueError("config_id must be a non-empty string")
 
-        # Load all configs if not already loaded
-        self._load_all_from_disk()
+        # Load the index if not already loaded
+        self._load_index()
 
-        # Check if exists in cache
-        if config_id not in self._cache:
+        # Check if exists in index
+        summary = self._summaries.get(config_id)
+        if summary is None:
             return False
 
         # Delete from disk
-        file_path = self.storage_dir / f"{config_id}.json"
+        file_path = self.storage_dir / summary.filename
         if file_path.exists():
             try:
                 file_path.unlink()
@@ -457,8 +649,10 @@ class ConfigurationStore:
                 logger.error(f"Failed to delete {file_path}: {e}")
                 raise
 
-        # Delete from cache
-        del self._cache[config_id]
+        # Delete from cache and manifest
+        self._cache.pop(config_id, None)
+        self._unindex_summary(config_id)
+        self._write_manifest()
 
         return True
 
@@ -470,7 +664,7 @@ class ConfigurationStore:
         """
         self._load_all_from_disk()
 
-        configs = list(self._cache.values())
+        configs = [self._cache[cid] for cid in self._summaries if cid in self._cache]
 
         # Sort by last_used (most recent first), with never-used at end
         configs.sort(
@@ -39,6 +39,9 @@ import asyncio
 import logging
 from typing import Any
 
+from attune.models.executor import ExecutionContext, LLMExecutor
+from attune.models.prompt_layout import PromptLayout, Stability
+
 from ._strategies.base import ExecutionStrategy
 from ._strategies.conditional_strategies import (
     ConditionalStrategy,
@@ -77,6 +80,13 @@ from .agent_templates import AgentTemplate
 
 logger = logging.getLogger(__name__)
 
+# Representative task type per agent tier, used to route executor calls
+_TIER_TASK_TYPES = {
+    "CHEAP": "summarize",
+    "CAPABLE": "generate_code",
+    "PREMIUM": "coordinate",
+}
+
 
 # =============================================================================
 # Advanced Patterns (Patterns 11-13)
@@ -212,16 +222,46 @@ class PromptCachedSequentialStrategy(ExecutionStrategy):
         - Cache size limits enforced
     """
 
-    def __init__(self, cached_context: str | None = None, cache_ttl: int = 3600):
+    def __init__(
+        self,
+        cached_context: str | None = None,
+        cache_ttl: int = 3600,
+        executor: LLMExecutor | None = None,
+    ):
         """Initialize with optional cached context.
 
         Args:
             cached_context: Large unchanging context to cache
                 (e.g., documentation, code files, guidelines)
             cache_ttl: Cache time-to-live in seconds (default: 1 hour)
+            executor: LLM executor (default: Anthropic EmpathyLLMExecutor
+                recording to the telemetry store)
         """
         self.cached_context = cached_context
         self.cache_ttl = cache_ttl
+        self.executor = executor
+
+    def _get_executor(self) -> LLMExecutor:
+        if self.executor is None:
+            from attune.models import EmpathyLLMExecutor, get_telemetry_store
+
+            self.executor = EmpathyLLMExecutor(
+                provider="anthropic", telemetry_store=get_telemetry_store()
+            )
+        return self.executor
+
+    def _build_layout(self, agent: AgentTemplate) -> PromptLayout:
+        """Build an agent's system prompt: shared context first, then its role.
+
+        The shared context is the cached prefix reused by every agent; the
+        task and previous output go in the user message.
+        """
+        layout = PromptLayout()
+        layout.add(self.cached_context, Stability.STATIC, "cached_context")
+        layout.add(
+            f"Your role: {agent.role}\n{agent.default_instructions}", Stability.STAGE, agent.id
+        )
+        return layout
 
     async def execute(self, agents: list[AgentTemplate], context: dict[str, Any]) -> StrategyResult:
         """Execute agents sequentially with shared cache.
@@ -233,51 +273,45 @@ class PromptCachedSequentialStrategy(ExecutionStrategy):
         Returns:
             Result with cumulative outputs
         """
-        from attune.models import LLMClient
-
-        client = LLMClient()
+        executor = self._get_executor()
         outputs = []
         current_output = context.get("input", {})
         start_time = asyncio.get_event_loop().time()
 
         for agent in agents:
+            agent_start = asyncio.get_event_loop().time()
             try:
-                # Build prompt with cached context
-                if self.cached_context:
-                    full_prompt = f"""{self.cached_context}
-
----
-
-Current task: {context.get('task', '')}
-Previous output: {current_output}
-Your role: {agent.role}"""
-                else:
-                    full_prompt = f"{context.get('task', '')}\n\nPrevious: {current_output}"
-
-                # Execute with caching enabled
-                response = await client.call(
-                    prompt=full_prompt,
-                    system_prompt=agent.system_prompt,
-                    tier=agent.tier,
-                    workflow_id=f"cached-seq:{agent.agent_id}",
-                    enable_caching=True,  # Anthropic prompt caching
+                response = await executor.run(
+                    task_type=_TIER_TASK_TYPES.get(agent.tier_preference.upper(), "generate_code"),
+                    prompt=f"Current task: {context.get('task', '')}\n"
+                    f"Previous output: {current_output}",
+                    system=self._build_layout(agent),
+                    context=ExecutionContext(
+                        workflow_name="prompt-cached-sequential",
+                        step_name=agent.id,
+                        tier_hint=agent.tier_preference.lower(),
+                    ),
                 )
 
                 result = AgentResult(
-                    agent_id=agent.agent_id,
+                    agent_id=agent.id,
                     success=True,
-                    output=response,
+                    output={
+                        "content": response.content,
+                        "cache_creation_tokens": response.metadata.get("cache_creation_tokens", 0),
+                        "cache_read_tokens": response.metadata.get("cache_read_tokens", 0),
+                    },
                     confidence=1.0,
-                    duration_seconds=response.get("duration", 0.0),
+                    duration_seconds=asyncio.get_event_loop().time() - agent_start,
                 )
 
                 outputs.append(result)
-                current_output = response.get("content", "")
+                current_output = response.content
 
             except Exception as e:
-                logger.exception(f"Agent {agent.agent_id} failed: {e}")
+                logger.exception(f"Agent {agent.id} failed: {e}")
                 result = AgentResult(
-                    agent_id=agent.agent_id,
+                    agent_id=agent.id,
                     success=False,
                     output={},
                     confidence=0.0,
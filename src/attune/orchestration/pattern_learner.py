@@ -6,6 +6,8 @@ and recommends optimal compositions based on historical data.
 Features:
     - Track success metrics for each pattern execution
     - Memory + file storage for fast access and persistence
+    - Append-only record log with periodic compaction into a snapshot
+    - Signature buckets so similarity search only scores matching candidates
     - Hybrid recommendation: similarity matching → statistical fallback
 
 Security:
@@ -14,8 +16,10 @@ Security:
     - JSON serialization only (no pickle)
 """
 
+import heapq
 import json
 import logging
+import os
 from collections import defaultdict
 from collections.abc import Iterator
 from dataclasses import asdict, dataclass, field
@@ -27,6 +31,9 @@ from attune.config import _validate_file_path
 
 logger = logging.getLogger(__name__)
 
+# Sum of all feature weights in ContextSignature.similarity()
+_SIGNATURE_MAX_SCORE = 7.0
+
 
 # =============================================================================
 # Data Models
@@ -190,6 +197,62 @@ class ContextSignature:
             priority=context.get("priority", "normal"),
         )
 
+    @classmethod
+    def from_features(cls, features: dict[str, Any]) -> "ContextSignature":
+        """Extract signature from stored record context features.
+
+        Args:
+            features: ExecutionRecord.context_features dictionary
+
+        Returns:
+            ContextSignature with extracted features
+        """
+        return cls(
+            task_type=features.get("task_type", ""),
+            agent_count=features.get("agent_count", 0),
+            has_conditions=features.get("has_conditions", False),
+            has_nesting=features.get("has_nesting", False),
+            priority=features.get("priority", "normal"),
+        )
+
+    @property
+    def task_prefix(self) -> str:
+        """Task type prefix used for partial task matching."""
+        return self.task_type.split("_")[0]
+
+    def bucket_key(self) -> tuple[str, str, bool, bool]:
+        """Bucket key grouping signatures that share discrete features.
+
+        Everything that similarity() compares exactly (task prefix, priority,
+        boolean flags) goes into the key; agent_count and the full task type
+        are scored inside the bucket.
+
+        Returns:
+            (task_prefix, priority, has_conditions, has_nesting)
+        """
+        return (self.task_prefix, self.priority, self.has_conditions, self.has_nesting)
+
+    def max_similarity(self, bucket: tuple[str, str, bool, bool]) -> float:
+        """Upper bound of similarity() against any signature in a bucket.
+
+        Args:
+            bucket: Bucket key as returned by bucket_key()
+
+        Returns:
+            Highest similarity score any member of the bucket can reach
+        """
+        task_prefix, priority, has_conditions, has_nesting = bucket
+        score = 1.0  # Agent count ratio can reach 1.0 in any bucket
+        if self.task_type and task_prefix == self.task_prefix:
+            score += 3.0
+        if has_conditions == self.has_conditions:
+            score += 1.0
+        if has_nesting == self.has_nesting:
+            score += 1.0
+        if priority == self.priority:
+            score += 1.0
+        return score / _SIGNATURE_MAX_SCORE
+
     def similarity(self, other: "ContextSignature") -> float:
         """Calculate similarity score with another signature.
 
@@ -250,68 +313,155 @@ class ContextSignature:
 class LearningStore:
     """Memory + file storage for learning data.
 
-    Maintains an in-memory cache for fast access with
-    periodic persistence to a JSON file.
+    Maintains an in-memory cache for fast access. New records are appended
+    to a JSONL log on save(); the log is periodically compacted into the
+    JSON snapshot so that saves stay proportional to the number of new
+    records rather than the whole history.
 
     Attributes:
-        file_path: Path to persistence file
+        file_path: Path to snapshot file
+        log_path: Path to append-only record log
+        compact_threshold: Logged records that trigger compaction
         _records: In-memory execution records
-        _stats: In-memory pattern statistics
+        _signatures: Precomputed context signature per record
+        _buckets: Record indices grouped by ContextSignature.bucket_key()
+        _stats: In-memory pattern statistics (updated incrementally)
+        _pending: Records not yet appended to the log
         _dirty: Whether in-memory data needs saving
     """
 
     DEFAULT_FILE = "patterns/learning_memory.json"
+    DEFAULT_COMPACT_THRESHOLD = 500
+    MIN_SIMILARITY = 0.3
 
-    def __init__(self, file_path: str | None = None):
+    def __init__(self, file_path: str | None = None, compact_threshold: int | None = None):
         """Initialize learning store.
 
         Args:
-            file_path: Path to persistence file (default: patterns/learning_memory.json)
+            file_path: Path to snapshot file (default: patterns/learning_memory.json)
+            compact_threshold: Number of logged records that triggers a rewrite
+                of the snapshot (default: 500)
         """
         self.file_path = Path(file_path or self.DEFAULT_FILE)
+        self.log_path = self.file_path.with_suffix(".log.jsonl")
+        self.compact_threshold = compact_threshold or self.DEFAULT_COMPACT_THRESHOLD
         self._records: list[ExecutionRecord] = []
+        self._signatures: list[ContextSignature] = []
+        self._buckets: dict[tuple[str, str, bool, bool], list[int]] = defaultdict(list)
         self._stats: dict[str, PatternStats] = {}
-        self._context_index: dict[str, list[int]] = defaultdict(list)
+        self._pending: list[ExecutionRecord] = []
+        self._logged_count = 0
         self._dirty = False
 
         # Load existing data if available
         self._load()
 
     def _load(self) -> None:
-        """Load data from file if it exists."""
-        if not self.file_path.exists():
+        """Load the snapshot and replay the record log if they exist."""
+        if self.file_path.exists():
+            try:
+                with self.file_path.open("r") as f:
+                    data = json.load(f)
+
+                for r in data.get("records", []):
+                    self._index_record(ExecutionRecord.from_dict(r))
+
+                self._stats = {
+                    s["pattern"]: PatternStats.from_dict(s) for s in data.get("stats", [])
+                }
+                if not self._stats and self._records:
+                    # Older snapshots may lack rollups - rebuild them once
+                    for record in self._records:
+                        self._update_stats(record)
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse learning data: {e}")
+            except Exception as e:
+                logger.exception(f"Failed to load learning data: {e}")
+        else:
             logger.info(f"No existing learning data at {self.file_path}")
-            return
-
-        try:
-            with self.file_path.open("r") as f:
-                data = json.load(f)
-
-            # Load records
-            self._records = [ExecutionRecord.from_dict(r) for r in data.get("records", [])]
 
-            # Load stats
-            self._stats = {s["pattern"]: PatternStats.from_dict(s) for s in data.get("stats", [])}
-
-            # Rebuild context index
-            for i, record in enumerate(self._records):
-                sig = ContextSignature(task_type=record.context_features.get("task_type", ""))
-                self._context_index[sig.task_type].append(i)
+        self._replay_log()
 
+        if self._records:
             logger.info(
                 f"Loaded {len(self._records)} records, "
                 f"{len(self._stats)} pattern stats from {self.file_path}"
             )
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse learning data: {e}")
-        except Exception as e:
-            logger.exception(f"Failed to load learning data: {e}")
+
+    def _replay_log(self) -> None:
+        """Apply logged records that are newer than the snapshot.
+
+        Each log line carries the record's sequence number, so entries
+        already folded into the snapshot (e.g. after an interrupted
+        compaction) are skipped. A torn trailing line is ignored.
+        """
+        if not self.log_path.exists():
+            return
+
+        try:
+            with self.log_path.open("r") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping malformed line in {self.log_path}")
+                        continue
+                    self._logged_count += 1
+                    if entry.get("seq", 0) < len(self._records):
+                        continue
+                    record = ExecutionRecord.from_dict(entry["record"])
+                    self._index_record(record)
+                    self._update_stats(record)
+        except OSError as e:
+            logger.exception(f"Failed to replay learning log: {e}")
+
+    def _index_record(self, record: ExecutionRecord) -> None:
+        """Append a record to memory and its signature bucket."""
+        signature = ContextSignature.from_features(record.context_features)
+        self._buckets[signature.bucket_key()].append(len(self._records))
+        self._records.append(record)
+        self._signatures.append(signature)
+
+    def _update_stats(self, record: ExecutionRecord) -> None:
+        """Fold a record into its pattern's rollup."""
+        if record.pattern not in self._stats:
+            self._stats[record.pattern] = PatternStats(pattern=record.pattern)
+        self._stats[record.pattern].update(record)
 
     def save(self) -> None:
-        """Save data to file."""
+        """Append pending records to the log, compacting when it grows large."""
         if not self._dirty:
             return
 
+        if self._logged_count + len(self._pending) >= self.compact_threshold:
+            self.compact()
+            return
+
+        # Ensure directory exists
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            validated_path = _validate_file_path(str(self.log_path))
+            first_seq = len(self._records) - len(self._pending)
+            with validated_path.open("a") as f:
+                for offset, record in enumerate(self._pending):
+                    entry = {"seq": first_seq + offset, "record": record.to_dict()}
+                    f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self._logged_count += len(self._pending)
+            self._pending.clear()
+            self._dirty = False
+            logger.debug(f"Appended learning records to {validated_path}")
+        except (OSError, ValueError) as e:
+            logger.exception(f"Failed to save learning data: {e}")
+
+    def compact(self) -> None:
+        """Rewrite the snapshot with all records and truncate the log.
+
+        The snapshot is written to a temporary file and swapped in with
+        os.replace(), so a crash never leaves a half-written snapshot.
+        """
         # Ensure directory exists
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -327,10 +477,19 @@ class LearningStore:
 
         try:
             validated_path = _validate_file_path(str(self.file_path))
-            with validated_path.open("w") as f:
-                json.dump(data, f, indent=2)
+            tmp_path = validated_path.with_name(validated_path.name + ".tmp")
+            with tmp_path.open("w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, validated_path)
+
+            validated_log = _validate_file_path(str(self.log_path))
+            if validated_log.exists():
+                validated_log.unlink()
+
+            self._logged_count = 0
+            self._pending.clear()
             self._dirty = False
-            logger.info(f"Saved learning data to {validated_path}")
+            logger.info(f"Compacted learning data into {validated_path}")
         except (OSError, ValueError) as e:
             logger.exception(f"Failed to save learning data: {e}")
 
@@ -340,21 +499,13 @@ class LearningStore:
         Args:
             record: Record to add
         """
-        self._records.append(record)
-
-        # Update stats
-        if record.pattern not in self._stats:
-            self._stats[record.pattern] = PatternStats(pattern=record.pattern)
-        self._stats[record.pattern].update(record)
-
-        # Update context index
-        task_type = record.context_features.get("task_type", "")
-        self._context_index[task_type].append(len(self._records) - 1)
-
+        self._index_record(record)
+        self._update_stats(record)
+        self._pending.append(record)
         self._dirty = True
 
         # Auto-save periodically
-        if len(self._records) % 10 == 0:
+        if len(self._pending) >= 10:
             self.save()
 
     def get_stats(self, pattern: str) -> PatternStats | None:
@@ -393,6 +544,10 @@ class LearningStore:
     ) -> list[tuple[ExecutionRecord, float]]:
         """Find records with similar context.
 
+        Buckets are visited in order of their best achievable similarity.
+        Buckets that cannot beat the minimum threshold, or the current
+        k-th best score once ``limit`` matches are held, are never scored.
+
         Args:
             signature: Context signature to match
             limit: Maximum records to return
@@ -400,23 +555,35 @@ class LearningStore:
         Returns:
             List of (record, similarity_score) tuples
         """
-        scored: list[tuple[ExecutionRecord, float]] = []
-
-        for record in self._records:
-            record_sig = ContextSignature(
-                task_type=record.context_features.get("task_type", ""),
-                agent_count=record.context_features.get("agent_count", 0),
-                has_conditions=record.context_features.get("has_conditions", False),
-                has_nesting=record.context_features.get("has_nesting", False),
-                priority=record.context_features.get("priority", "normal"),
-            )
-            score = signature.similarity(record_sig)
-            if score > 0.3:  # Minimum threshold
-                scored.append((record, score))
+        if limit <= 0:
+            return []
+
+        ranked_buckets = sorted(
+            ((signature.max_similarity(key), key) for key in self._buckets),
+            key=lambda item: item[0],
+            reverse=True,
+        )
 
-        # Sort by similarity and return top results
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored[:limit]
+        # Min-heap of (score, -index) keeps the best `limit` matches, preferring
+        # earlier records on ties like a stable sort over the full history would
+        top: list[tuple[float, int]] = []
+        for bound, key in ranked_buckets:
+            if bound <= self.MIN_SIMILARITY:
+                break
+            if len(top) >= limit and bound < top[0][0]:
+                break
+            for index in self._buckets[key]:
+                score = signature.similarity(self._signatures[index])
+                if score <= self.MIN_SIMILARITY:
+                    continue
+                item = (score, -index)
+                if len(top) < limit:
+                    heapq.heappush(top, item)
+                elif item > top[0]:
+                    heapq.heapreplace(top, item)
+
+        top.sort(reverse=True)
+        return [(self._records[-neg_index], score) for score, neg_index in top]
 
 
 # =============================================================================
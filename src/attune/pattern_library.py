@@ -9,10 +9,15 @@ Copyright 2025 Smart AI Memory, LLC
 Licensed under the Apache License, Version 2.0
 """
 
+import heapq
+from collections.abc import Hashable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+# Minimum relevance for a pattern to be returned by query_patterns
+MIN_RELEVANCE = 0.3
+
 
 @dataclass
 class Pattern:
@@ -119,7 +124,9 @@ class PatternLibrary:
         Performance optimizations:
         - patterns_by_type: O(1) lookup by pattern type
         - patterns_by_tag: O(1) lookup by tag
-        - Reduces query_patterns from O(n) to O(k) where k = matching patterns
+        - patterns_by_context: O(1) lookup by (context key, value) pair
+        - Reduces query_patterns from O(n) to O(k) where k = patterns sharing
+          a context pair or tag with the query
         """
         self.patterns: dict[str, Pattern] = {}  # pattern_id -> Pattern
         self.agent_contributions: dict[str, list[str]] = {}  # agent_id -> pattern_ids
@@ -128,6 +135,18 @@ class PatternLibrary:
         # Performance optimization: Index structures for fast lookups
         self._patterns_by_type: dict[str, list[str]] = {}  # pattern_type -> pattern_ids
         self._patterns_by_tag: dict[str, list[str]] = {}  # tag -> pattern_ids
+        self._init_context_index()
+
+    def _init_context_index(self) -> None:
+        """Create the inverted index over pattern context (see query_patterns)."""
+        # (context key, value) -> pattern_ids, for hashable values
+        self._patterns_by_context: dict[tuple[Any, Any], list[str]] = {}
+        # context key -> pattern_ids, for every pattern with that key
+        self._patterns_by_context_key: dict[Any, list[str]] = {}
+        # context key -> pattern_ids whose value for the key is unhashable
+        self._unhashable_context: dict[Any, list[str]] = {}
+        # pattern_id -> contribution order, for stable ranking of equal scores
+        self._pattern_order: dict[str, int] = {}
 
     def contribute_pattern(self, agent_id: str, pattern: Pattern) -> None:
         """Agent contributes a discovered pattern to the library
@@ -178,11 +197,50 @@ class PatternLibrary:
             self._patterns_by_type[pattern.pattern_type] = []
         self._patterns_by_type[pattern.pattern_type].append(pattern.id)
 
-        for tag in pattern.tags:
+        for tag in dict.fromkeys(pattern.tags):
             if tag not in self._patterns_by_tag:
                 self._patterns_by_tag[tag] = []
             self._patterns_by_tag[tag].append(pattern.id)
 
+        self._index_context(pattern)
+
+    def _index_context(self, pattern: Pattern) -> None:
+        """Add a pattern's context pairs to the inverted index."""
+        self._pattern_order[pattern.id] = len(self._pattern_order)
+        for key, value in pattern.context.items():
+            self._patterns_by_context_key.setdefault(key, []).append(pattern.id)
+            if isinstance(value, Hashable):
+                try:
+                    self._patterns_by_context.setdefault((key, value), []).append(pattern.id)
+                    continue
+                except TypeError:
+                    pass  # e.g. a tuple containing a list
+            self._unhashable_context.setdefault(key, []).append(pattern.id)
+
+    def _candidate_ids(self, context: dict[str, Any]) -> set[str]:
+        """Patterns sharing at least one context pair or tag with the query.
+
+        Only these can reach MIN_RELEVANCE: without a matching context value
+        or tag, the success-rate boost alone is at most 0.2.
+        """
+        candidates: set[str] = set()
+        for key, value in context.items():
+            if key not in self._patterns_by_context_key:
+                continue
+            try:
+                candidates.update(self._patterns_by_context.get((key, value), ()))
+            except TypeError:
+                # Unhashable query value: compare against every pattern with the key
+                candidates.update(self._patterns_by_context_key[key])
+                continue
+            candidates.update(self._unhashable_context.get(key, ()))
+
+        context_tags = context.get("tags", [])
+        if isinstance(context_tags, Iterable):
+            for tag in context_tags:
+                candidates.update(self._patterns_by_tag.get(tag, ()))
+        return candidates
+
     def query_patterns(
         self,
         agent_id: str,
@@ -190,18 +248,25 @@ class PatternLibrary:
         pattern_type: str | None = None,
         min_confidence: float = 0.5,
         limit: int = 10,
+        contributed_by: str | None = None,
     ) -> list[PatternMatch]:
         """Query relevant patterns for current context
 
+        Only patterns sharing a context key/value pair or a tag with the
+        query are scored (via the inverted index), and the best ``limit``
+        matches are kept in a bounded heap instead of sorting every match.
+
         Args:
             agent_id: ID of querying agent
             context: Current context dictionary
             pattern_type: Optional filter by pattern type
             min_confidence: Minimum confidence threshold (0-1)
             limit: Maximum patterns to return
+            contributed_by: Optional filter by contributing agent ID
 
         Returns:
-            List of PatternMatch objects, sorted by relevance
+            List of PatternMatch objects, sorted by relevance (ties in
+            contribution order)
 
         Raises:
             ValueError: If agent_id is empty, min_confidence out of range, or limit < 1
@@ -229,38 +294,42 @@ class PatternLibrary:
         if limit < 1:
             raise ValueError(f"limit must be positive, got {limit}")
 
-        matches: list[PatternMatch] = []
-
-        # Performance optimization: Use index for pattern_type filter (O(1) vs O(n))
+        # Performance optimization: Only score patterns sharing a feature with the query
+        candidate_ids = self._candidate_ids(context)
         if pattern_type:
-            # Only check patterns of the requested type
-            # Use generator to avoid creating intermediate list
-            pattern_ids = self._patterns_by_type.get(pattern_type, [])
-            patterns_to_check = (self.patterns[pid] for pid in pattern_ids)
-        else:
-            # Check all patterns - use generator to avoid materializing all patterns
-            patterns_to_check = (p for p in self.patterns.values())
+            candidate_ids.intersection_update(self._patterns_by_type.get(pattern_type, ()))
+        if contributed_by is not None:
+            candidate_ids.intersection_update(self.agent_contributions.get(contributed_by, ()))
+
+        # Min-heap of the best `limit` matches: (score, -order, pattern_id, factors)
+        top: list[tuple[float, int, str, list[str]]] = []
+        for pattern_id in candidate_ids:
+            pattern = self.patterns[pattern_id]
 
-        for pattern in patterns_to_check:
             # Apply confidence filter
             if pattern.confidence < min_confidence:
                 continue
 
             # Calculate relevance
             relevance_score, matching_factors = self._calculate_relevance(pattern, context)
+            if relevance_score <= MIN_RELEVANCE:
+                continue
 
-            if relevance_score > 0.3:  # Minimum relevance threshold
-                matches.append(
-                    PatternMatch(
-                        pattern=pattern,
-                        relevance_score=relevance_score,
-                        matching_factors=matching_factors,
-                    ),
-                )
+            item = (relevance_score, -self._pattern_order[pattern_id], pattern_id, matching_factors)
+            if len(top) < limit:
+                heapq.heappush(top, item)
+            elif item[:2] > top[0][:2]:
+                heapq.heapreplace(top, item)
 
-        # Sort by relevance and limit
-        matches.sort(key=lambda m: m.relevance_score, reverse=True)
-        return matches[:limit]
+        top.sort(key=lambda item: item[:2], reverse=True)
+        return [
+            PatternMatch(
+                pattern=self.patterns[pattern_id],
+                relevance_score=score,
+                matching_factors=factors,
+            )
+            for score, _, pattern_id, factors in top
+        ]
 
     def get_pattern(self, pattern_id: str) -> Pattern | None:
         """Get a specific pattern by ID
@@ -540,3 +609,4 @@ class PatternLibrary:
         self.pattern_graph = {}
         self._patterns_by_type = {}
         self._patterns_by_tag = {}
+        self._init_context_index()
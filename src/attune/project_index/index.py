@@ -21,6 +21,25 @@ from .scanner_parallel import ParallelProjectScanner
 
 logger = logging.getLogger(__name__)
 
+# Parsed index files keyed by path, validated by (mtime_ns, size). Lets
+# repeated loads in one process (or in processes forked from a warm CLI
+# daemon) skip re-reading and re-parsing an unchanged index.
+_INDEX_FILE_CACHE: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
+
+def _read_index_file(path: Path) -> dict[str, Any]:
+    """Read and parse an index file, reusing the parse if it is unchanged."""
+    key = path.resolve()
+    stat = key.stat()
+    cached = _INDEX_FILE_CACHE.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with open(key, encoding="utf-8") as f:
+        data = json.load(f)
+    _INDEX_FILE_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
 
 class ProjectIndex:
     """Central project index with file metadata.
@@ -84,8 +103,7 @@ class ProjectIndex:
             return False
 
         try:
-            with open(self._index_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_index_file(self._index_path)
 
             # Validate schema version
             if data.get("schema_version") != self.SCHEMA_VERSION:
@@ -480,6 +498,11 @@ class ProjectIndex:
         """Get record for a specific file."""
         return self._records.get(path)
 
+    @property
+    def generated_at(self) -> datetime | None:
+        """When the index was last generated or refreshed (None if never)."""
+        return self._generated_at
+
     def get_summary(self) -> ProjectSummary:
         """Get project summary."""
         return self._summary
@@ -9,6 +9,16 @@ Supports multiple embedding backends:
 3. Anthropic: Uses Claude for semantic analysis (via message API)
 4. Sentence Transformers: Local neural embeddings (requires torch)
 
+When NumPy is installed, stored embeddings are kept L2-normalized in a
+float32 matrix (``EmbeddingMatrix``) and searched with a single matrix
+multiply plus ``argpartition`` for top-k selection. Without NumPy the
+pure-Python cosine similarity path is used.
+
+A persisted store is a JSON file of goal metadata plus a ``.npy`` sidecar
+holding the matrix. The JSON is written last and names the sidecar it was
+written with; if that sidecar is missing or does not match, the stored goal
+texts are re-embedded instead of being dropped.
+
 Copyright 2026 Smart-AI-Memory
 Licensed under the Apache License, Version 2.0
 """
@@ -21,16 +31,31 @@ import logging
 import math
 import os
 import re
+import uuid
+import zlib
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from ..config import _validate_file_path
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Vector store file format (2 = embeddings in a sidecar .npy matrix)
+STORE_VERSION = 2
+
 
 # =============================================================================
 # DATA STRUCTURES
@@ -43,7 +68,7 @@ class EmbeddedGoal:
 
     goal_id: str
     goal_text: str
-    embedding: list[float]
+    embedding: Sequence[float]
     metadata: dict[str, Any] = field(default_factory=dict)
     domains: list[str] = field(default_factory=list)
     workflow_id: str | None = None
@@ -54,7 +79,7 @@ class EmbeddedGoal:
         return {
             "goal_id": self.goal_id,
             "goal_text": self.goal_text,
-            "embedding": self.embedding,
+            "embedding": list(self.embedding),
             "metadata": self.metadata,
             "domains": self.domains,
             "workflow_id": self.workflow_id,
@@ -123,6 +148,17 @@ class EmbeddingProvider(ABC):
         pass
 
 
+@lru_cache(maxsize=65536)
+def _feature_hash(term: str, dimension: int) -> tuple[int, int]:
+    """Map a term to a (bucket, sign) pair for feature hashing.
+
+    CRC32 is stable across processes (unlike ``hash()``) and far cheaper
+    than a cryptographic digest; the top bit picks the sign.
+    """
+    h = zlib.crc32(term.encode("utf-8"))
+    return h % dimension, -1 if h & 0x80000000 else 1
+
+
 class TFIDFEmbeddingProvider(EmbeddingProvider):
     """Simple TF-IDF based embeddings (no external dependencies).
 
@@ -166,8 +202,15 @@ class TFIDFEmbeddingProvider(EmbeddingProvider):
 
     def _hash_to_bucket(self, term: str) -> int:
         """Hash term to fixed bucket for dimensionality reduction."""
-        h = int(hashlib.md5(term.encode(), usedforsecurity=False).hexdigest(), 16)
-        return h % self._dimension
+        return _feature_hash(term, self._dimension)[0]
+
+    def _term_weights(self, text: str) -> dict[int, float]:
+        """Signed TF-IDF weight per hash bucket for one text."""
+        weights: dict[int, float] = {}
+        for term, freq in self._compute_tf(self._tokenize(text)).items():
+            bucket, sign = _feature_hash(term, self._dimension)
+            weights[bucket] = weights.get(bucket, 0.0) + sign * freq * self._idf.get(term, 1.0)
+        return weights
 
     def embed(self, text: str) -> list[float]:
         """Generate TF-IDF based embedding.
@@ -175,19 +218,9 @@ class TFIDFEmbeddingProvider(EmbeddingProvider):
         Uses feature hashing to project sparse TF-IDF vector
         to fixed dimension.
         """
-        tokens = self._tokenize(text)
-        tf = self._compute_tf(tokens)
-
-        # Initialize vector
         vector = [0.0] * self._dimension
-
-        # Project TF-IDF scores to fixed dimension using feature hashing
-        for term, freq in tf.items():
-            bucket = self._hash_to_bucket(term)
-            # Use sign trick for better distribution
-            sign = 1 if int(hashlib.sha256(term.encode()).hexdigest(), 16) % 2 == 0 else -1
-            idf = self._idf.get(term, 1.0)
-            vector[bucket] += sign * freq * idf
+        for bucket, weight in self._term_weights(text).items():
+            vector[bucket] = weight
 
         # L2 normalize
         norm = math.sqrt(sum(x * x for x in vector)) or 1.0
@@ -195,7 +228,44 @@ class TFIDFEmbeddingProvider(EmbeddingProvider):
 
     def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """Embed multiple texts."""
-        return [self.embed(text) for text in texts]
+        if not NUMPY_AVAILABLE:
+            return [self.embed(text) for text in texts]
+        return self.embed_matrix(texts).tolist()
+
+    def embed_matrix(self, texts: list[str]) -> Any:
+        """Embed multiple texts into a normalized float32 matrix.
+
+        Term weights for all texts are scattered into the matrix with one
+        ``np.add.at`` call and normalized row-wise.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            ``np.ndarray`` of shape ``(len(texts), dimension)``
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("embed_matrix requires numpy")
+
+        rows: list[int] = []
+        cols: list[int] = []
+        values: list[float] = []
+        for row, text in enumerate(texts):
+            weights = self._term_weights(text)
+            rows.extend([row] * len(weights))
+            cols.extend(weights.keys())
+            values.extend(weights.values())
+
+        matrix = np.zeros((len(texts), self._dimension), dtype=np.float64)
+        np.add.at(
+            matrix, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), values
+        )
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (matrix / norms).astype(np.float32)
 
     def fit(self, documents: list[str]):
         """Fit IDF weights on document corpus.
@@ -360,7 +430,7 @@ class SentenceTransformerProvider(EmbeddingProvider):
             return [fallback.embed(t) for t in texts]
 
         embeddings = self._model.encode(texts, convert_to_numpy=True)
-        return [e.tolist() for e in embeddings]
+        return embeddings.tolist()
 
 
 # =============================================================================
@@ -368,10 +438,277 @@ class SentenceTransformerProvider(EmbeddingProvider):
 # =============================================================================
 
 
+class EmbeddingMatrix:
+    """Growable float32 matrix of L2-normalized embeddings keyed by ID.
+
+    Rows are stored normalized, so cosine similarity against a normalized
+    query is a single matrix-vector product. Capacity doubles on growth and
+    removal swaps the last row into the freed slot, keeping rows contiguous.
+
+    Requires NumPy.
+
+    Example:
+        >>> matrix = EmbeddingMatrix(dimension=3)
+        >>> matrix.add("a", [1.0, 0.0, 0.0])
+        >>> matrix.search([1.0, 0.1, 0.0], top_k=1)[0][0]
+        'a'
+    """
+
+    def __init__(self, dimension: int, capacity: int = 1024):
+        """Initialize an empty matrix.
+
+        Args:
+            dimension: Embedding dimension
+            capacity: Initial row capacity
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("EmbeddingMatrix requires numpy")
+        self.dimension = dimension
+        self._data = np.zeros((max(capacity, 1), dimension), dtype=np.float32)
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._rows
+
+    @property
+    def ids(self) -> list[str]:
+        """IDs in row order."""
+        return list(self._ids)
+
+    @property
+    def vectors(self) -> Any:
+        """Stored (normalized) rows as an ``np.ndarray`` view."""
+        return self._data[: len(self._ids)]
+
+    def _normalize(self, vectors: Any) -> Any:
+        try:
+            array = np.asarray(vectors, dtype=np.float32)
+        except ValueError:
+            # Ragged input: rows of the wrong dimension stay zero
+            array = np.zeros((len(vectors), self.dimension), dtype=np.float32)
+            for row, vector in enumerate(vectors):
+                if len(vector) == self.dimension:
+                    array[row] = vector
+        if array.ndim == 1:
+            array = array.reshape(1, -1)
+        if array.shape[1] != self.dimension:
+            # Mismatched dimensions never match (cosine similarity 0.0)
+            return np.zeros((array.shape[0], self.dimension), dtype=np.float32)
+        norms = np.linalg.norm(array, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return array / norms
+
+    def _reserve(self, rows: int) -> None:
+        needed = len(self._ids) + rows
+        if needed <= self._data.shape[0] and self._data.flags.writeable:
+            return
+        capacity = max(needed, self._data.shape[0] * 2)
+        grown = np.zeros((capacity, self.dimension), dtype=np.float32)
+        grown[: len(self._ids)] = self._data[: len(self._ids)]
+        self._data = grown
+
+    def row(self, item_id: str) -> Any:
+        """Stored (normalized) row for an ID as an ``np.ndarray`` view.
+
+        Raises:
+            KeyError: If the ID is not stored
+        """
+        return self._data[self._rows[item_id]]
+
+    def add(self, item_id: str, vector: Any) -> None:
+        """Add or replace a vector."""
+        self.add_batch([item_id], [vector])
+
+    def add_batch(self, item_ids: list[str], vectors: Any) -> None:
+        """Add or replace many vectors at once.
+
+        Args:
+            item_ids: IDs, one per vector
+            vectors: Sequence of vectors or an ``(n, dimension)`` array
+        """
+        if not item_ids:
+            return
+        normalized = self._normalize(vectors)
+        self._reserve(len(item_ids))
+        for item_id, row_vector in zip(item_ids, normalized, strict=True):
+            row = self._rows.get(item_id)
+            if row is None:
+                row = len(self._ids)
+                self._ids.append(item_id)
+                self._rows[item_id] = row
+            self._data[row] = row_vector
+
+    def remove(self, item_id: str) -> bool:
+        """Remove a vector.
+
+        Returns:
+            True if the ID was present
+        """
+        row = self._rows.pop(item_id, None)
+        if row is None:
+            return False
+        self._reserve(0)
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._data[row] = self._data[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+        self._ids.pop()
+        return True
+
+    def search(
+        self,
+        query: Any,
+        top_k: int = 5,
+        min_similarity: float = -1.0,
+        mask: Any | None = None,
+    ) -> list[tuple[str, float]]:
+        """Find the most similar stored vectors.
+
+        Args:
+            query: Query vector
+            top_k: Number of results
+            min_similarity: Minimum cosine similarity
+            mask: Optional boolean array selecting eligible rows
+
+        Returns:
+            List of (id, similarity), most similar first
+        """
+        return self.search_batch([query], top_k, min_similarity, mask)[0]
+
+    def search_batch(
+        self,
+        queries: Any,
+        top_k: int = 5,
+        min_similarity: float = -1.0,
+        mask: Any | None = None,
+    ) -> list[list[tuple[str, float]]]:
+        """Top-k search for many queries with one matrix multiply.
+
+        Args:
+            queries: Sequence of query vectors or ``(q, dimension)`` array
+            top_k: Number of results per query
+            min_similarity: Minimum cosine similarity
+            mask: Optional boolean array selecting eligible rows
+
+        Returns:
+            One result list per query, most similar first
+        """
+        queries = self._normalize(queries)
+        size = len(self._ids)
+        if size == 0 or top_k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        scores = queries @ self.vectors.T
+        if mask is not None:
+            scores[:, ~np.asarray(mask, dtype=bool)[:size]] = -np.inf
+
+        k = min(top_k, size)
+        results = []
+        for row_scores in scores:
+            if k < size:
+                # argpartition finds the k-th best score; ties at that score
+                # are taken in row order so results are deterministic
+                kth = row_scores[np.argpartition(row_scores, -k)[-k]]
+                above = np.flatnonzero(row_scores > kth)
+                ties = np.flatnonzero(row_scores == kth)[: k - len(above)]
+                candidates = np.sort(np.concatenate([above, ties]))
+            else:
+                candidates = np.arange(size)
+            # Stable sort keeps row order for equal scores
+            ordered = candidates[np.argsort(-row_scores[candidates], kind="stable")]
+            results.append(
+                [
+                    (self._ids[i], float(row_scores[i]))
+                    for i in ordered
+                    if row_scores[i] >= min_similarity
+                ]
+            )
+        return results
+
+    def save(self, path: Path | str) -> None:
+        """Save rows to a ``.npy`` file (IDs are persisted by the caller).
+
+        Args:
+            path: Destination path
+        """
+        validated_path = _validate_file_path(str(path))
+        tmp_path = validated_path.with_name(validated_path.name + ".tmp")
+        with tmp_path.open("wb") as f:
+            np.save(f, self.vectors)
+        os.replace(tmp_path, validated_path)
+
+    @classmethod
+    def load(cls, path: Path | str, ids: list[str], mmap: bool = True) -> EmbeddingMatrix:
+        """Load rows saved by :meth:`save`.
+
+        With ``mmap=True`` the file is memory-mapped read-only and only
+        copied into memory on the first write.
+
+        Args:
+            path: ``.npy`` file
+            ids: Row IDs, in row order
+            mmap: Memory-map instead of reading the file
+
+        Returns:
+            Loaded matrix
+
+        Raises:
+            ValueError: If the row count does not match ``ids``
+        """
+        data = np.load(str(path), mmap_mode="r" if mmap else None)
+        if data.ndim != 2 or data.shape[0] != len(ids):
+            raise ValueError(f"Embedding matrix has {data.shape[0]} rows, expected {len(ids)}")
+        matrix = cls(dimension=data.shape[1], capacity=1)
+        matrix._data = data if mmap else np.asarray(data, dtype=np.float32)
+        matrix._ids = list(ids)
+        matrix._rows = {item_id: row for row, item_id in enumerate(ids)}
+        return matrix
+
+
+class _MatrixRow(Sequence[float]):
+    """Embedding of a loaded goal, read from the store's matrix on access.
+
+    Loaded stores keep embeddings only in the (memory-mapped) matrix
+    instead of copying every row into a Python list.
+    """
+
+    __slots__ = ("_matrix", "_goal_id")
+
+    def __init__(self, matrix: EmbeddingMatrix, goal_id: str):
+        self._matrix = matrix
+        self._goal_id = goal_id
+
+    def __len__(self) -> int:
+        return self._matrix.dimension
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._matrix.row(self._goal_id).tolist()[index]
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._matrix.row(self._goal_id).tolist())
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class VectorStore:
     """In-memory vector store with similarity search.
 
-    Supports persistence to JSON files.
+    Supports persistence to JSON files. With NumPy installed, embeddings are
+    also kept in an ``EmbeddingMatrix`` for vectorized search and persisted
+    to a sidecar ``.npy`` file next to the JSON metadata.
+
+    Every change is saved immediately; use :meth:`batch` to save once for a
+    group of changes.
     """
 
     def __init__(
@@ -388,11 +725,47 @@ class VectorStore:
         self.provider = provider or TFIDFEmbeddingProvider()
         self.storage_path = Path(storage_path) if storage_path else None
         self._goals: dict[str, EmbeddedGoal] = {}
+        self._matrix: EmbeddingMatrix | None = (
+            EmbeddingMatrix(self.provider.dimension) if NUMPY_AVAILABLE else None
+        )
+        # Sidecar file name the saved JSON refers to, and whether the matrix
+        # changed since it was written
+        self._sidecar: str | None = None
+        self._matrix_dirty = True
+        self._batch_depth = 0
+        self._save_pending = False
+        # Set when the stored file could not be read; it is kept as a backup
+        # instead of being overwritten
+        self._unreadable = False
 
         # Load from storage if exists
         if self.storage_path and self.storage_path.exists():
             self._load()
 
+    @property
+    def matrix_path(self) -> Path | None:
+        """Sidecar path of the last saved or loaded embedding matrix."""
+        if not self.storage_path or not self._sidecar:
+            return None
+        return self.storage_path.with_name(self._sidecar)
+
+    @contextmanager
+    def batch(self) -> Iterator[VectorStore]:
+        """Defer saving until the block exits.
+
+        Example:
+            >>> with store.batch():
+            ...     for text in goals:
+            ...         store.add(text)  # Saved once, on exit
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._save_pending:
+                self._save()
+
     def add(
         self,
         goal_text: str,
@@ -431,6 +804,9 @@ class VectorStore:
         )
 
         self._goals[goal_id] = goal
+        if self._matrix is not None:
+            self._matrix.add(goal_id, embedding)
+            self._matrix_dirty = True
 
         # Auto-save if storage configured
         if self.storage_path:
@@ -438,6 +814,40 @@ class VectorStore:
 
         return goal
 
+    def add_batch(self, goals: list[dict[str, Any]]) -> list[EmbeddedGoal]:
+        """Add many goals, embedding them in one batch and saving once.
+
+        Args:
+            goals: Keyword arguments for :meth:`add`, one dict per goal
+
+        Returns:
+            The embedded goals
+        """
+        texts = [g["goal_text"] for g in goals]
+        embeddings = self.provider.embed_batch(texts)
+
+        added = []
+        for spec, embedding in zip(goals, embeddings, strict=True):
+            goal_text = spec["goal_text"]
+            goal = EmbeddedGoal(
+                goal_id=spec.get("goal_id") or hashlib.sha256(goal_text.encode()).hexdigest()[:12],
+                goal_text=goal_text,
+                embedding=embedding,
+                metadata=spec.get("metadata") or {},
+                domains=spec.get("domains") or [],
+                workflow_id=spec.get("workflow_id"),
+                success_score=spec.get("success_score", 0.0),
+            )
+            self._goals[goal.goal_id] = goal
+            added.append(goal)
+
+        if self._matrix is not None and added:
+            self._matrix.add_batch([g.goal_id for g in added], [g.embedding for g in added])
+            self._matrix_dirty = True
+        if self.storage_path and added:
+            self._save()
+        return added
+
     def search(
         self,
         query: str,
@@ -461,6 +871,16 @@ class VectorStore:
 
         query_embedding = self.provider.embed(query)
 
+        if self._matrix is not None:
+            mask = None
+            if domain_filter:
+                mask = np.fromiter(
+                    (domain_filter in self._goals[goal_id].domains for goal_id in self._matrix.ids),
+                    dtype=bool,
+                    count=len(self._matrix),
+                )
+            return self._matrix_results(query_embedding, top_k, min_similarity, mask)
+
         results: list[tuple[float, EmbeddedGoal]] = []
 
         for goal in self._goals.values():
@@ -496,6 +916,9 @@ class VectorStore:
         Returns:
             List of similarity results
         """
+        if self._matrix is not None:
+            return self._matrix_results(embedding, top_k, min_similarity)
+
         results: list[tuple[float, EmbeddedGoal]] = []
 
         for goal in self._goals.values():
@@ -510,6 +933,24 @@ class VectorStore:
             for i, (sim, goal) in enumerate(results[:top_k])
         ]
 
+    def _matrix_results(
+        self,
+        embedding: list[float],
+        top_k: int,
+        min_similarity: float,
+        mask: Any | None = None,
+    ) -> list[SimilarityResult]:
+        """Run a top-k search against the embedding matrix."""
+        assert self._matrix is not None
+        if len(embedding) != self._matrix.dimension:
+            # Same as _cosine_similarity for mismatched vectors
+            embedding = [0.0] * self._matrix.dimension
+        matches = self._matrix.search(embedding, top_k, min_similarity, mask)
+        return [
+            SimilarityResult(goal=self._goals[goal_id], similarity=sim, rank=i + 1)
+            for i, (goal_id, sim) in enumerate(matches)
+        ]
+
     def get(self, goal_id: str) -> EmbeddedGoal | None:
         """Get a goal by ID."""
         return self._goals.get(goal_id)
@@ -517,7 +958,13 @@ class VectorStore:
     def remove(self, goal_id: str) -> bool:
         """Remove a goal by ID."""
         if goal_id in self._goals:
-            del self._goals[goal_id]
+            goal = self._goals.pop(goal_id)
+            if isinstance(goal.embedding, _MatrixRow):
+                # Detach from the matrix row about to be reused
+                goal.embedding = list(goal.embedding)
+            if self._matrix is not None:
+                self._matrix.remove(goal_id)
+                self._matrix_dirty = True
             if self.storage_path:
                 self._save()
             return True
@@ -551,23 +998,99 @@ class VectorStore:
         return dot / (norm_a * norm_b)
 
     def _save(self):
-        """Save to storage."""
+        """Save to storage.
+
+        The sidecar matrix is written under a fresh name only when it changed,
+        then the JSON is replaced atomically, so a crash between the two
+        writes leaves the previous JSON and sidecar intact.
+        """
         if not self.storage_path:
             return
+        if self._batch_depth:
+            self._save_pending = True
+            return
+        self._save_pending = False
 
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        validated_path = _validate_file_path(str(self.storage_path))
 
-        data = {
-            "version": 1,
-            "goals": [g.to_dict() for g in self._goals.values()],
-        }
+        if self._unreadable and validated_path.exists():
+            backup_path = validated_path.with_name(validated_path.name + ".bak")
+            os.replace(validated_path, backup_path)
+            logger.warning(f"Kept unreadable vector store as {backup_path}")
+        self._unreadable = False
+
+        stale_sidecar = None
+        if self._matrix is not None:
+            if self._matrix_dirty or not self._sidecar:
+                stale_sidecar = self._sidecar
+                self._sidecar = f"{validated_path.stem}.{uuid.uuid4().hex[:8]}.npy"
+                self._matrix.save(validated_path.with_name(self._sidecar))
+                self._matrix_dirty = False
+            # Goals are written in matrix row order; embeddings go to the .npy
+            goals = []
+            for goal_id in self._matrix.ids:
+                goal_data = self._goals[goal_id].to_dict()
+                if len(goal_data["embedding"]) == self._matrix.dimension:
+                    del goal_data["embedding"]
+                goals.append(goal_data)
+            data: dict[str, Any] = {
+                "version": STORE_VERSION,
+                "matrix": {
+                    "file": self._sidecar,
+                    "rows": len(self._matrix),
+                    "dimension": self._matrix.dimension,
+                },
+                "goals": goals,
+            }
+        else:
+            data = {
+                "version": 1,
+                "goals": [g.to_dict() for g in self._goals.values()],
+            }
 
-        validated_path = _validate_file_path(str(self.storage_path))
-        with validated_path.open("w") as f:
+        tmp_path = validated_path.with_name(validated_path.name + ".tmp")
+        with tmp_path.open("w") as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp_path, validated_path)
+
+        if stale_sidecar and stale_sidecar != self._sidecar:
+            try:
+                validated_path.with_name(stale_sidecar).unlink(missing_ok=True)
+            except OSError as e:
+                # INTENTIONAL: a leftover sidecar is harmless (e.g. still mapped on Windows)
+                logger.debug(f"Could not remove old embedding matrix {stale_sidecar}: {e}")
+
+    def _load_matrix(self, data: dict[str, Any], ids: list[str]) -> EmbeddingMatrix | None:
+        """Load the sidecar matrix referenced by a version 2 store.
+
+        Args:
+            data: Parsed JSON store
+            ids: Goal IDs, in row order
+
+        Returns:
+            The memory-mapped matrix, or None if NumPy is unavailable or the
+            sidecar is missing or does not match the JSON
+        """
+        if not NUMPY_AVAILABLE or not self.storage_path:
+            return None
+        # Stores written before the sidecar was referenced used a fixed name
+        sidecar = data.get("matrix", {}).get("file") or self.storage_path.with_suffix(".npy").name
+        try:
+            matrix = EmbeddingMatrix.load(self.storage_path.with_name(sidecar), ids)
+        except (OSError, ValueError, EOFError) as e:
+            logger.warning(f"Embedding matrix {sidecar} unusable, re-embedding stored goals: {e}")
+            return None
+        self._sidecar = sidecar
+        return matrix
 
     def _load(self):
-        """Load from storage."""
+        """Load from storage.
+
+        Goals whose embeddings are missing (lost sidecar, no NumPy) or have
+        a different dimension than the provider are re-embedded from their
+        text.
+        """
         if not self.storage_path or not self.storage_path.exists():
             return
 
@@ -575,12 +1098,54 @@ class VectorStore:
             with self.storage_path.open("r") as f:
                 data = json.load(f)
 
-            for goal_data in data.get("goals", []):
+            goal_data_list = data.get("goals", [])
+            version = data.get("version", 1)
+            dimension = self.provider.dimension
+
+            if version >= 2:
+                matrix = self._load_matrix(data, [g["goal_id"] for g in goal_data_list])
+                if matrix is not None and matrix.dimension == dimension:
+                    # Rows stay in the memory-mapped matrix until written
+                    self._matrix = matrix
+                    self._matrix_dirty = False
+                    for goal_data in goal_data_list:
+                        goal_data.setdefault("embedding", _MatrixRow(matrix, goal_data["goal_id"]))
+            elif isinstance(self.provider, TFIDFEmbeddingProvider):
+                # Version 1 TF-IDF embeddings used a different feature hash
+                for goal_data in goal_data_list:
+                    goal_data.pop("embedding", None)
+
+            stale = [g for g in goal_data_list if len(g.get("embedding") or ()) != dimension]
+            if stale:
+                logger.info(f"Re-embedding {len(stale)} stored goals")
+                rows = self.provider.embed_batch([g["goal_text"] for g in stale])
+                for goal_data, row in zip(stale, rows, strict=True):
+                    goal_data["embedding"] = row
+
+            for goal_data in goal_data_list:
                 goal = EmbeddedGoal.from_dict(goal_data)
                 self._goals[goal.goal_id] = goal
 
+            if self._matrix is not None:
+                stale_ids = {g["goal_id"] for g in stale}
+                missing = [
+                    goal
+                    for goal in self._goals.values()
+                    if goal.goal_id in stale_ids or goal.goal_id not in self._matrix
+                ]
+                if missing:
+                    self._matrix.add_batch(
+                        [g.goal_id for g in missing], [g.embedding for g in missing]
+                    )
+                    self._matrix_dirty = True
+
         except Exception as e:
+            # INTENTIONAL: start empty, but keep the unreadable file on the next save
             logger.warning(f"Failed to load vector store: {e}")
+            self._goals.clear()
+            self._matrix = EmbeddingMatrix(self.provider.dimension) if NUMPY_AVAILABLE else None
+            self._matrix_dirty = True
+            self._unreadable = True
 
 
 # =============================================================================
@@ -672,32 +1237,32 @@ class SemanticGoalMatcher:
         Returns:
             List of similar goals with their workflows
         """
-        results = self.store.search(
-            query=goal_text,
-            top_k=top_k * 2,  # Get more to filter
-            min_similarity=min_similarity,
-        )
-
-        # Filter by success score and format results
-        formatted = []
-        for result in results:
-            if result.goal.success_score >= min_success_score:
-                formatted.append(
-                    {
-                        "goal_id": result.goal.goal_id,
-                        "goal_text": result.goal.goal_text,
-                        "similarity": round(result.similarity, 3),
-                        "workflow_id": result.goal.workflow_id,
-                        "domains": result.goal.domains,
-                        "success_score": result.goal.success_score,
-                        "metadata": result.goal.metadata,
-                    }
-                )
-
-            if len(formatted) >= top_k:
+        # Over-fetch to allow for the success filter, widening only if the
+        # filter leaves too few results and more goals remain
+        fetch = top_k * 2
+        while True:
+            results = self.store.search(
+                query=goal_text,
+                top_k=fetch,
+                min_similarity=min_similarity,
+            )
+            eligible = [r for r in results if r.goal.success_score >= min_success_score]
+            if len(eligible) >= top_k or len(results) < fetch:
                 break
+            fetch *= 4
 
-        return formatted
+        return [
+            {
+                "goal_id": result.goal.goal_id,
+                "goal_text": result.goal.goal_text,
+                "similarity": round(result.similarity, 3),
+                "workflow_id": result.goal.workflow_id,
+                "domains": result.goal.domains,
+                "success_score": result.goal.success_score,
+                "metadata": result.goal.metadata,
+            }
+            for result in eligible[:top_k]
+        ]
 
     def suggest_workflow(
         self,
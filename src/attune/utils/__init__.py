@@ -1,5 +1,5 @@
 """Utility modules for Attune AI."""
 
-from .tokens import count_message_tokens, count_tokens, estimate_cost
+from .tokens import count_message_tokens, count_tokens, count_tokens_batch, estimate_cost
 
-__all__ = ["count_tokens", "count_message_tokens", "estimate_cost"]
+__all__ = ["count_tokens", "count_tokens_batch", "count_message_tokens", "estimate_cost"]
@@ -0,0 +1,323 @@
+"""Shared token counting service.
+
+Process-wide token counter with a content-hash keyed LRU cache, batch
+encoding through tiktoken's threaded ``encode_batch`` and a streaming
+estimator for whole directories.
+
+The same file contents and system prompts are counted repeatedly across
+workflow stages; memoizing by content hash turns those repeats into a
+dictionary lookup. Hit rate is reported through ``CacheMonitor`` under the
+``token_count`` cache name.
+
+Copyright 2025 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from attune.cache_monitor import CacheMonitor
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAME = "token_count"
+
+DEFAULT_EXTENSIONS = (".py", ".js", ".ts", ".tsx", ".jsx")
+SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__", "venv", ".venv"})
+
+
+def _content_text(content: Any) -> str:
+    """Text of message content, which may be a list of content blocks.
+
+    Anthropic messages carry either a string or a list of blocks; only the
+    text blocks are counted. Anything else is counted by its ``str()``.
+    """
+    if content is None or isinstance(content, str):
+        return content or ""
+    if isinstance(content, list):
+        parts = []
+        for block in content:
+            if isinstance(block, str):
+                parts.append(block)
+            elif isinstance(block, dict):
+                parts.append(str(block.get("text", "")))
+            else:
+                parts.append(str(getattr(block, "text", "")))
+        return "\n".join(part for part in parts if part)
+    return str(content)
+
+
+def _heuristic(text: str) -> int:
+    """Fallback heuristic token counting (~4 chars per token)."""
+    if not text:
+        return 0
+    return max(1, len(text) // 4)
+
+
+class TokenCounter:
+    """Memoizing token counter shared across the process.
+
+    Counts are cached by ``(encoding name, blake2b(text))`` so identical
+    content is only encoded once regardless of where it is counted from.
+    When no tiktoken encoding is available the ~4 chars/token heuristic is
+    used and nothing is cached (the heuristic is cheaper than hashing).
+
+    Example:
+        >>> counter = TokenCounter()
+        >>> counter.count_batch(["Hello, world!", "Hello, world!"])
+        [4, 4]
+
+    """
+
+    DEFAULT_MAX_SIZE = 4096
+    DEFAULT_BATCH_SIZE = 32
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        encoding: Any | None = None,
+        num_threads: int | None = None,
+    ):
+        """Initialize the counter.
+
+        Args:
+            max_size: Maximum number of cached counts
+            encoding: tiktoken-compatible encoding (loaded lazily if None)
+            num_threads: Thread pool size for ``encode_batch``
+
+        """
+        self.max_size = max_size
+        self.num_threads = num_threads or min(8, os.cpu_count() or 1)
+        self._encoding = encoding
+        self._encoding_loaded = encoding is not None
+        self._cache: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+        self._lock = threading.Lock()
+
+        monitor = CacheMonitor.get_instance()
+        try:
+            monitor.register_cache(CACHE_NAME, max_size=max_size)
+        except ValueError:
+            # Already registered by another instance (e.g., in tests)
+            pass
+
+    @property
+    def encoding(self) -> Any | None:
+        """The tiktoken encoding, or None when only the heuristic is available."""
+        if not self._encoding_loaded:
+            from attune.utils.tokens import _get_tiktoken_encoding
+
+            self._encoding = _get_tiktoken_encoding("cl100k_base")
+            self._encoding_loaded = True
+        return self._encoding
+
+    def _key(self, text: str) -> tuple[str, bytes]:
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16)
+        return (getattr(self._encoding, "name", "default"), digest.digest())
+
+    def _lookup(self, key: tuple[str, bytes]) -> int | None:
+        with self._lock:
+            tokens = self._cache.get(key)
+            if tokens is not None:
+                self._cache.move_to_end(key)
+        monitor = CacheMonitor.get_instance()
+        if tokens is not None:
+            monitor.record_hit(CACHE_NAME)
+        else:
+            monitor.record_miss(CACHE_NAME)
+        return tokens
+
+    def _store(self, key: tuple[str, bytes], tokens: int) -> None:
+        evicted = 0
+        with self._lock:
+            self._cache[key] = tokens
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                evicted += 1
+            size = len(self._cache)
+        monitor = CacheMonitor.get_instance()
+        for _ in range(evicted):
+            monitor.record_eviction(CACHE_NAME)
+        monitor.update_size(CACHE_NAME, size)
+
+    def count(self, text: str | list[Any]) -> int:
+        """Count tokens in a single text.
+
+        Args:
+            text: Text to tokenize, or a list of message content blocks
+
+        Returns:
+            Token count (0 for empty text)
+
+        """
+        text = _content_text(text)
+        if not text:
+            return 0
+        encoding = self.encoding
+        if encoding is None:
+            return _heuristic(text)
+
+        key = self._key(text)
+        tokens = self._lookup(key)
+        if tokens is not None:
+            return tokens
+
+        try:
+            tokens = len(encoding.encode(text, disallowed_special=()))
+        except Exception as e:
+            logger.warning(f"tiktoken encoding failed: {e}")
+            return _heuristic(text)
+        self._store(key, tokens)
+        return tokens
+
+    def count_batch(self, texts: list[str | list[Any]]) -> list[int]:
+        """Count tokens for many texts at once.
+
+        Cache misses are deduplicated and encoded together with
+        ``encode_batch``, which releases the GIL and fans out over a thread
+        pool.
+
+        Args:
+            texts: Texts to tokenize; lists of message content blocks are
+                counted by their text
+
+        Returns:
+            Token counts in the same order as ``texts``
+
+        """
+        texts = [_content_text(text) for text in texts]
+        encoding = self.encoding
+        if encoding is None:
+            return [_heuristic(text) for text in texts]
+
+        results: list[int] = [0] * len(texts)
+        pending: dict[tuple[str, bytes], list[int]] = {}
+        pending_texts: list[str] = []
+
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            key = self._key(text)
+            if key in pending:
+                # Duplicate within this batch: counts as a hit once encoded
+                pending[key].append(i)
+                CacheMonitor.get_instance().record_hit(CACHE_NAME)
+                continue
+            tokens = self._lookup(key)
+            if tokens is not None:
+                results[i] = tokens
+            else:
+                pending[key] = [i]
+                pending_texts.append(text)
+
+        if not pending_texts:
+            return results
+
+        try:
+            encoded = encoding.encode_batch(
+                pending_texts, num_threads=self.num_threads, disallowed_special=()
+            )
+            counts = [len(tokens) for tokens in encoded]
+        except Exception as e:
+            logger.warning(f"tiktoken batch encoding failed: {e}")
+            # Heuristic values are not cached
+            for indices, text in zip(pending.values(), pending_texts, strict=True):
+                for i in indices:
+                    results[i] = _heuristic(text)
+            return results
+
+        for (key, indices), tokens in zip(pending.items(), counts, strict=True):
+            self._store(key, tokens)
+            for i in indices:
+                results[i] = tokens
+        return results
+
+    def estimate_directory(
+        self,
+        path: str | Path,
+        extensions: Iterable[str] = DEFAULT_EXTENSIONS,
+        max_files: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """Estimate tokens for all matching source files under a directory.
+
+        Files are read and counted in batches, so memory stays bounded by
+        ``batch_size`` file contents regardless of tree size.
+
+        Args:
+            path: Directory to scan
+            extensions: File suffixes to include
+            max_files: Stop after this many files (None for no limit)
+            batch_size: Number of files encoded per ``encode_batch`` call
+
+        Returns:
+            Total token count
+
+        """
+        from attune.config import _validate_file_path
+
+        total = 0
+        batch: list[str] = []
+        for file_path in self._iter_files(Path(path), tuple(extensions), max_files):
+            try:
+                validated = _validate_file_path(str(file_path))
+                batch.append(validated.read_text(encoding="utf-8", errors="ignore"))
+            except (ValueError, OSError):
+                continue
+            if len(batch) >= batch_size:
+                total += sum(self.count_batch(batch))
+                batch = []
+        if batch:
+            total += sum(self.count_batch(batch))
+        return total
+
+    @staticmethod
+    def _iter_files(
+        root: Path, extensions: tuple[str, ...], max_files: int | None
+    ) -> Iterator[Path]:
+        seen = 0
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            for filename in sorted(filenames):
+                if not filename.endswith(extensions):
+                    continue
+                if max_files is not None and seen >= max_files:
+                    return
+                seen += 1
+                yield Path(dirpath) / filename
+
+    def clear(self) -> None:
+        """Clear all cached counts."""
+        with self._lock:
+            self._cache.clear()
+        CacheMonitor.get_instance().update_size(CACHE_NAME, 0)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_counter: TokenCounter | None = None
+_counter_lock = threading.Lock()
+
+
+def get_token_counter() -> TokenCounter:
+    """Get the process-wide token counter.
+
+    Returns:
+        Shared TokenCounter instance
+
+    """
+    global _counter
+    if _counter is None:
+        with _counter_lock:
+            if _counter is None:
+                _counter = TokenCounter()
+    return _counter
@@ -13,6 +13,8 @@ import os
 from dataclasses import dataclass
 from typing import Any
 
+from attune.utils.token_counter import _content_text, get_token_counter
+
 logger = logging.getLogger(__name__)
 
 # Lazy import to avoid requiring dependencies if not used
@@ -71,29 +73,6 @@ def _get_tiktoken_encoding(model: str) -> Any:
         return None
 
 
-def _count_tokens_tiktoken(text: str, model: str) -> int:
-    """Count tokens using tiktoken (fast local estimation)."""
-    if not text:
-        return 0
-
-    encoding = _get_tiktoken_encoding(model)
-    if not encoding:
-        return 0
-
-    try:
-        return len(encoding.encode(text))
-    except Exception as e:
-        logger.warning(f"tiktoken encoding failed: {e}")
-        return 0
-
-
-def _count_tokens_heuristic(text: str) -> int:
-    """Fallback heuristic token counting (~4 chars per token)."""
-    if not text:
-        return 0
-    return max(1, len(text) // 4)
-
-
 def count_tokens(
     text: str, model: str = "claude-sonnet-4-5-20250929", use_api: bool = False
 ) -> int:
@@ -138,18 +117,32 @@ def count_tokens(
             logger.warning(f"API token counting failed, using fallback: {e}")
             # Continue to fallback methods
 
-    # Try tiktoken first (fast and accurate)
-    if TIKTOKEN_AVAILABLE:
-        tokens = _count_tokens_tiktoken(text, model)
-        if tokens > 0:
-            return tokens
+    # Shared memoizing counter (tiktoken when available, heuristic otherwise)
+    return get_token_counter().count(text)
+
+
+def count_tokens_batch(texts: list[str]) -> list[int]:
+    """Count tokens for many texts in one call.
+
+    Uncached texts are encoded together with tiktoken's threaded
+    ``encode_batch``; repeated content is served from the shared cache.
+
+    Args:
+        texts: Texts to tokenize
+
+    Returns:
+        Token counts in the same order as ``texts``
 
-    # Fallback to heuristic
-    return _count_tokens_heuristic(text)
+    Example:
+        >>> count_tokens_batch(["Hello, world!", ""])
+        [4, 0]
+
+    """
+    return get_token_counter().count_batch(texts)
 
 
 def count_message_tokens(
-    messages: list[dict[str, str]],
+    messages: list[dict[str, Any]],
     system_prompt: str | None = None,
     model: str = "claude-sonnet-4-5-20250929",
     use_api: bool = False,
@@ -221,11 +214,10 @@ def count_message_tokens(
         counts["system"] = 0
 
     # Count messages with overhead
-    message_tokens = 0
-    for message in messages:
-        content = message.get("content", "")
-        message_tokens += count_tokens(content, model, use_api=False)
-        message_tokens += 4  # Overhead for role markers
+    # Content may be a list of content blocks; count their text
+    contents = [_content_text(message.get("content")) for message in messages]
+    message_tokens = sum(count_tokens_batch(contents))
+    message_tokens += 4 * len(messages)  # Overhead for role markers
 
     counts["messages"] = message_tokens
     counts["total"] = counts["system"] + message_tokens
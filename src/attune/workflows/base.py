@@ -40,9 +40,12 @@ from attune.cost_tracker import CostTracker
 # Import unified types from attune.models
 from attune.models import (
     LLMExecutor,
+    PromptLayout,
     TelemetryBackend,
 )
 
+from .batch_mode import BatchModeMixin
+
 # Re-export CachedResponse for backward compatibility (moved to caching.py in Phase 1)
 # Import mixins (extracted for maintainability)
 from .caching import (
@@ -111,6 +114,7 @@ class BaseWorkflow(
     LLMMixin,
     CoordinationMixin,
     StatePersistenceMixin,
+    BatchModeMixin,
     MultiAgentStageMixin,
     PromptMixin,
     ExecutorMixin,
@@ -147,6 +151,7 @@ class BaseWorkflow(
     description: str = "Base workflow template"
     stages: list[str] = []
     tier_map: dict[str, ModelTier] = {}
+    batchable_stages: list[str] = []
 
     def __init__(
         self,
@@ -169,6 +174,8 @@ class BaseWorkflow(
         state_store: AgentStateStore | None = None,
         multi_agent_configs: dict[str, dict[str, Any]] | None = None,
         ctx: WorkflowContext | None = None,
+        enable_batch_mode: bool = False,
+        batch_endpoint: Any | None = None,
     ):
         """Initialize workflow with optional cost tracker, provider, and config.
 
@@ -228,6 +235,14 @@ class BaseWorkflow(
                      When provided, proxy methods delegate to ctx services instead
                      of mixin implementations. When None (default), all behavior
                      comes from mixins as before. See ``workflows/context.py``.
+            enable_batch_mode: Whether to offload LLM calls of stages listed in
+                     ``batchable_stages`` to the Message Batches API (default False).
+                     Requests issued concurrently within such a stage are submitted
+                     as one batch at 50% cost and polled with adaptive backoff.
+                     With a state_store, submitted batches are checkpointed and a
+                     re-run with the same agent_id resumes them. See ``batch_mode.py``.
+            batch_endpoint: Optional batch endpoint (create_batch / get_batch_status /
+                     get_batch_results). Defaults to AnthropicBatchProvider.
 
         """
         from .config import WorkflowConfig
@@ -283,6 +298,17 @@ class BaseWorkflow(
         self._state_stage_costs: dict[str, float] = {}
         self._state_last_output: Any = None
 
+        # Batch mode (Message Batches offload for batchable stages)
+        self._enable_batch_mode = enable_batch_mode
+        self._batch_endpoint = batch_endpoint
+        self._batch_collector = None
+        self._batch_current_stage: str | None = None
+        self._state_batch_jobs: dict[str, dict[str, Any]] = {}
+
+        # Packed code context (see PromptMixin._pack_context)
+        self._context_packer = None
+        self._context_packing: dict[str, dict[str, int]] = {}
+
         # Multi-agent stage configs (Phase 4 - DynamicTeam integration)
         self._multi_agent_configs = multi_agent_configs
 
@@ -400,6 +426,31 @@ class BaseWorkflow(
             return self._ctx.cache.store(stage, system, user_message, model, response)
         return super()._store_in_cache(stage, system, user_message, model, response)
 
+    async def _await_cache_fill(
+        self,
+        stage: str,
+        system: str,
+        user_message: str,
+        model: str,
+    ) -> tuple[CachedResponse | None, bool]:
+        """Wait for a shared cache fill -- delegates to CacheService when ctx is provided."""
+        if self._ctx and self._ctx.cache:
+            return await self._ctx.cache.wait_for_fill(stage, system, user_message, model)
+        return await super()._await_cache_fill(stage, system, user_message, model)
+
+    def _release_cache_lease(
+        self,
+        stage: str,
+        system: str,
+        user_message: str,
+        model: str,
+    ) -> None:
+        """Release a cache lease -- delegates to CacheService when ctx is provided."""
+        if self._ctx and self._ctx.cache:
+            self._ctx.cache.release(stage, system, user_message, model)
+            return
+        super()._release_cache_lease(stage, system, user_message, model)
+
     def _get_cache_type(self) -> str:
         """Get cache type -- delegates to CacheService when ctx is provided."""
         if self._ctx and self._ctx.cache:
@@ -470,6 +521,8 @@ class BaseWorkflow(
         success: bool = True,
         error_message: str | None = None,
         fallback_used: bool = False,
+        cache_creation_input_tokens: int = 0,
+        cache_read_input_tokens: int = 0,
     ) -> None:
         """Emit call record -- delegates to TelemetryService when ctx is provided."""
         if self._ctx and self._ctx.telemetry:
@@ -479,12 +532,14 @@ class BaseWorkflow(
                 output_tokens=output_tokens, cost=cost, latency_ms=latency_ms,
                 success=success, error_message=error_message,
                 fallback_used=fallback_used,
+                cache_creation_input_tokens=cache_creation_input_tokens,
+                cache_read_input_tokens=cache_read_input_tokens,
             )
             return
         super()._emit_call_telemetry(
             step_name, task_type, tier, model_id, input_tokens,
             output_tokens, cost, latency_ms, success, error_message,
-            fallback_used,
+            fallback_used, cache_creation_input_tokens, cache_read_input_tokens,
         )
 
     def _emit_workflow_telemetry(self, result: Any) -> None:
@@ -521,14 +576,34 @@ class BaseWorkflow(
         guidelines: list[str] | None = None,
         documentation: str | None = None,
         examples: list[dict[str, str]] | None = None,
+        project_context: str | None = None,
+        context: str | None = None,
     ) -> str:
         """Build cached system prompt -- delegates to PromptService when ctx is provided."""
         if self._ctx and self._ctx.prompt:
             return self._ctx.prompt.build_cached_system_prompt(
-                role, guidelines, documentation, examples,
+                role, guidelines, documentation, examples, project_context, context,
             )
         return super()._build_cached_system_prompt(
-            role, guidelines, documentation, examples,
+            role, guidelines, documentation, examples, project_context, context,
+        )
+
+    def _build_prompt_layout(
+        self,
+        role: str,
+        guidelines: list[str] | None = None,
+        documentation: str | None = None,
+        examples: list[dict[str, str]] | None = None,
+        project_context: str | None = None,
+        context: str | None = None,
+    ) -> PromptLayout:
+        """Build prompt layout -- delegates to PromptService when ctx is provided."""
+        if self._ctx and self._ctx.prompt:
+            return self._ctx.prompt.build_prompt_layout(
+                role, guidelines, documentation, examples, project_context, context,
+            )
+        return super()._build_prompt_layout(
+            role, guidelines, documentation, examples, project_context, context,
         )
 
     def _render_xml_prompt(
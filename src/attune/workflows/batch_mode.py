@@ -0,0 +1,540 @@
+"""Batch Execution Mode for BaseWorkflow.
+
+Offloads the LLM calls of latency-tolerant workflow stages to the
+Anthropic Message Batches API (50% cost reduction).  Stages opt in by
+listing themselves in ``batchable_stages``; batch mode is enabled per
+workflow instance with ``enable_batch_mode=True``.
+
+While a batchable stage runs, ``_call_llm`` enqueues each request with a
+``BatchCollector`` instead of calling the model.  Requests issued together
+(e.g. via ``asyncio.gather`` over 200 modules) are accumulated until the
+stage stops issuing new ones, submitted as a single batch, and polled with
+adaptive backoff.  Submitted batch IDs are saved in the
+``StatePersistenceMixin`` checkpoint, so re-running an interrupted workflow
+with the same ``agent_id`` and ``state_store`` resumes polling the existing
+batch instead of paying for the requests again.
+
+Expected attributes on the host class:
+    name (str): Workflow name
+    batchable_stages (list[str]): Stages whose LLM calls may be batched
+    _provider_str (str): Provider string identifier
+    _enable_batch_mode (bool): Batch mode flag
+    _batch_endpoint: Optional batch endpoint (defaults to AnthropicBatchProvider)
+    _calculate_cost(tier, in_tokens, out_tokens): Cost calc (from CostTrackingMixin)
+    _state_get_recovery_checkpoint(): From StatePersistenceMixin
+    _state_record_batch_submitted(...): From StatePersistenceMixin
+
+Copyright 2026 Smart-AI-Memory
+Licensed under Apache 2.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol
+
+from attune.models.prompt_layout import PromptLayout
+
+if TYPE_CHECKING:
+    from .compat import ModelTier
+
+logger = logging.getLogger(__name__)
+
+# Message Batches are billed at half the standard price
+BATCH_DISCOUNT = 0.5
+
+# Collection and polling defaults
+DEFAULT_FLUSH_DELAY = 0.5  # seconds without new requests before submitting
+DEFAULT_MAX_BATCH_SIZE = 10_000
+DEFAULT_POLL_INITIAL = 5.0  # seconds
+DEFAULT_POLL_MAX = 300.0  # seconds
+DEFAULT_POLL_FACTOR = 1.5
+DEFAULT_BATCH_TIMEOUT = 86400.0  # Batches expire after 24 hours
+
+
+class BatchEndpoint(Protocol):
+    """Synchronous Message Batches endpoint (see ``AnthropicBatchProvider``)."""
+
+    def create_batch(self, requests: list[dict[str, Any]]) -> str: ...
+
+    def get_batch_status(self, batch_id: str) -> Any: ...
+
+    def get_batch_results(self, batch_id: str) -> list[Any]: ...
+
+
+class AdaptiveBackoff:
+    """Polling interval that grows while a batch is idle and shrinks on progress.
+
+    Example:
+        >>> backoff = AdaptiveBackoff(initial=5, maximum=300)
+        >>> backoff.next_delay(progressed=False)
+        5.0
+        >>> backoff.next_delay(progressed=False)
+        7.5
+    """
+
+    def __init__(
+        self,
+        initial: float = DEFAULT_POLL_INITIAL,
+        maximum: float = DEFAULT_POLL_MAX,
+        factor: float = DEFAULT_POLL_FACTOR,
+    ):
+        """Initialize the backoff.
+
+        Args:
+            initial: First (and minimum) delay in seconds
+            maximum: Maximum delay in seconds
+            factor: Growth factor while no progress is observed
+        """
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self._delay: float | None = None
+
+    def next_delay(self, progressed: bool) -> float:
+        """Get the delay before the next poll.
+
+        Args:
+            progressed: Whether requests completed since the previous poll
+
+        Returns:
+            Delay in seconds
+        """
+        if self._delay is None:
+            self._delay = self.initial
+        elif progressed:
+            self._delay = max(self.initial, self._delay / self.factor)
+        else:
+            self._delay = min(self.maximum, self._delay * self.factor)
+        return self._delay
+
+
+def batch_custom_id(params: dict[str, Any]) -> str:
+    """Deterministic ``custom_id`` for a request, stable across runs.
+
+    Args:
+        params: Message creation parameters
+
+    Returns:
+        ID matching the API's ``^[a-zA-Z0-9_-]{1,64}$`` constraint
+    """
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return "req_" + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:40]
+
+
+def _as_dict(obj: Any) -> dict[str, Any]:
+    """Convert an SDK model or dict to a plain dict."""
+    if isinstance(obj, dict):
+        return obj
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return dict(obj)
+
+
+def _completed_count(counts: Any) -> int:
+    """Number of requests in a batch that are no longer processing."""
+    if isinstance(counts, dict):
+        return sum(counts.get(k, 0) for k in ("succeeded", "errored", "canceled", "expired"))
+    return sum(getattr(counts, k, 0) for k in ("succeeded", "errored", "canceled", "expired"))
+
+
+def _parse_result(raw: dict[str, Any]) -> tuple[str, int, int]:
+    """Extract (content, input_tokens, output_tokens) from a batch result.
+
+    Raises:
+        RuntimeError: If the request errored, expired, or was canceled
+    """
+    result = raw.get("result") or {}
+    result_type = result.get("type", "unknown")
+
+    if result_type == "succeeded":
+        message = result.get("message") or {}
+        content = "".join(
+            block.get("text", "")
+            for block in message.get("content", [])
+            if isinstance(block, dict) and block.get("type") == "text"
+        )
+        usage = message.get("usage") or {}
+        return content, usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+
+    if result_type == "errored":
+        error = result.get("error") or {}
+        # Errored results wrap the error in an ErrorResponse envelope
+        error = error.get("error", error)
+        raise RuntimeError(
+            f"Batch request errored: {error.get('type', 'unknown_error')}: "
+            f"{error.get('message', 'Unknown error')}"
+        )
+    raise RuntimeError(f"Batch request {result_type}")
+
+
+@dataclass
+class _PendingRequest:
+    """Request waiting to be submitted."""
+
+    custom_id: str
+    params: dict[str, Any]
+    future: asyncio.Future[tuple[str, int, int]]
+
+
+@dataclass
+class BatchStats:
+    """Counters for a collector."""
+
+    requests: int = 0
+    deduplicated: int = 0
+    batches_submitted: int = 0
+    batches_resumed: int = 0
+    polls: int = 0
+    poll_delays: list[float] = field(default_factory=list)
+
+
+class BatchCollector:
+    """Accumulates LLM requests and runs them as Message Batches.
+
+    ``submit()`` returns once the request's batch has ended.  Pending
+    requests are flushed as one batch when no new request arrives for
+    ``flush_delay`` seconds or ``max_batch_size`` requests are pending.
+    Identical concurrent requests share one batch entry.
+
+    Example:
+        >>> collector = BatchCollector(AnthropicBatchProvider(api_key="sk-ant-..."))
+        >>> results = await asyncio.gather(
+        ...     *(collector.submit({"model": m, "max_tokens": 1024, "messages": msgs})
+        ...       for msgs in all_messages)
+        ... )
+    """
+
+    def __init__(
+        self,
+        endpoint: BatchEndpoint,
+        flush_delay: float = DEFAULT_FLUSH_DELAY,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        poll_initial: float = DEFAULT_POLL_INITIAL,
+        poll_max: float = DEFAULT_POLL_MAX,
+        timeout: float = DEFAULT_BATCH_TIMEOUT,
+        resume: dict[str, str] | None = None,
+        on_submit: Callable[[str, list[str]], None] | None = None,
+    ):
+        """Initialize the collector.
+
+        Args:
+            endpoint: Batch endpoint used to create and poll batches
+            flush_delay: Idle seconds before pending requests are submitted
+            max_batch_size: Submit as soon as this many requests are pending
+            poll_initial: First polling delay in seconds
+            poll_max: Maximum polling delay in seconds
+            timeout: Seconds to wait for a batch before failing its requests
+            resume: Mapping of custom_id to an already submitted batch ID.
+                Matching requests are answered from that batch.
+            on_submit: Called with (batch_id, custom_ids) after each submission
+        """
+        self.endpoint = endpoint
+        self.flush_delay = flush_delay
+        self.max_batch_size = max_batch_size
+        self.poll_initial = poll_initial
+        self.poll_max = poll_max
+        self.timeout = timeout
+        self.stats = BatchStats()
+
+        self._resume = dict(resume or {})
+        self._on_submit = on_submit
+        self._pending: dict[str, _PendingRequest] = {}
+        self._inflight: dict[str, asyncio.Future[tuple[str, int, int]]] = {}
+        self._results: dict[str, asyncio.Task[dict[str, dict[str, Any]]]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    async def submit(self, params: dict[str, Any]) -> tuple[str, int, int]:
+        """Queue a request and wait for its batch result.
+
+        Args:
+            params: Message creation parameters (model, max_tokens, messages, ...)
+
+        Returns:
+            Tuple of (content, input_tokens, output_tokens)
+
+        Raises:
+            RuntimeError: If the request or its batch failed
+            TimeoutError: If the batch did not end within the timeout
+        """
+        custom_id = batch_custom_id(params)
+        self.stats.requests += 1
+
+        future = self._inflight.get(custom_id)
+        if future is not None:
+            self.stats.deduplicated += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[custom_id] = future
+        future.add_done_callback(lambda _: self._inflight.pop(custom_id, None))
+        self._pending[custom_id] = _PendingRequest(custom_id, params, future)
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        if len(self._pending) >= self.max_batch_size:
+            self._flush_handle = None
+            self.flush()
+        else:
+            self._flush_handle = loop.call_later(self.flush_delay, self.flush)
+
+        return await asyncio.shield(future)
+
+    def flush(self) -> None:
+        """Dispatch all pending requests now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        pending, self._pending = list(self._pending.values()), {}
+
+        # Requests recovered from a checkpoint are answered by their old batch
+        groups: dict[str | None, list[_PendingRequest]] = {}
+        for request in pending:
+            groups.setdefault(self._resume.get(request.custom_id), []).append(request)
+
+        for batch_id, requests in groups.items():
+            task = asyncio.ensure_future(self._dispatch(batch_id, requests))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch_id: str | None, requests: list[_PendingRequest]) -> None:
+        """Submit (or resume) a batch and resolve its requests' futures."""
+        try:
+            if batch_id is None:
+                batch_id = await self._create_batch(requests)
+            else:
+                self.stats.batches_resumed += 1
+                logger.info(f"Resuming batch {batch_id} for {len(requests)} requests")
+
+            results = await self._get_results(batch_id)
+        except Exception as e:  # noqa: BLE001
+            # INTENTIONAL: Propagate any failure to every waiting caller
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        for request in requests:
+            if request.future.done():
+                continue
+            raw = results.get(request.custom_id)
+            if raw is None:
+                request.future.set_exception(
+                    RuntimeError(f"Batch {batch_id} returned no result for {request.custom_id}")
+                )
+                continue
+            try:
+                request.future.set_result(_parse_result(raw))
+            except RuntimeError as e:
+                request.future.set_exception(e)
+
+    async def _create_batch(self, requests: list[_PendingRequest]) -> str:
+        """Submit requests as a new batch."""
+        api_requests = [{"custom_id": r.custom_id, "params": r.params} for r in requests]
+        batch_id = await asyncio.to_thread(self.endpoint.create_batch, api_requests)
+        self.stats.batches_submitted += 1
+        logger.info(f"Submitted batch {batch_id} with {len(requests)} requests")
+
+        custom_ids = [r.custom_id for r in requests]
+        for custom_id in custom_ids:
+            self._resume[custom_id] = batch_id
+        if self._on_submit is not None:
+            self._on_submit(batch_id, custom_ids)
+        return batch_id
+
+    def _get_results(self, batch_id: str) -> asyncio.Task[dict[str, dict[str, Any]]]:
+        """Get the (shared) task waiting for a batch's results."""
+        task = self._results.get(batch_id)
+        if task is None:
+            task = asyncio.ensure_future(self._wait_for_batch(batch_id))
+            self._results[batch_id] = task
+        return task
+
+    async def _wait_for_batch(self, batch_id: str) -> dict[str, dict[str, Any]]:
+        """Poll a batch with adaptive backoff until it ends.
+
+        Returns:
+            Results keyed by custom_id
+
+        Raises:
+            TimeoutError: If the batch did not end within the timeout
+        """
+        backoff = AdaptiveBackoff(initial=self.poll_initial, maximum=self.poll_max)
+        deadline = time.monotonic() + self.timeout
+        completed = 0
+
+        while True:
+            status = await asyncio.to_thread(self.endpoint.get_batch_status, batch_id)
+            self.stats.polls += 1
+            if status.processing_status == "ended":
+                break
+
+            now_completed = _completed_count(status.request_counts)
+            delay = backoff.next_delay(progressed=now_completed > completed)
+            completed = now_completed
+
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"Batch {batch_id} did not complete within {self.timeout}s")
+
+            logger.debug(
+                f"Batch {batch_id} {status.processing_status}: "
+                f"{completed} completed, next poll in {delay:.1f}s"
+            )
+            self.stats.poll_delays.append(delay)
+            await asyncio.sleep(delay)
+
+        raw_results = await asyncio.to_thread(self.endpoint.get_batch_results, batch_id)
+        results = {}
+        for raw in raw_results:
+            raw = _as_dict(raw)
+            results[raw.get("custom_id", "")] = raw
+        return results
+
+
+class BatchModeMixin:
+    """Mixin routing LLM calls of batchable stages through Message Batches.
+
+    Does nothing unless the workflow is created with ``enable_batch_mode=True``
+    and the running stage is listed in ``batchable_stages``.  Subclasses can
+    tune collection and polling through the ``batch_*`` class attributes.
+    """
+
+    batch_flush_delay: float = DEFAULT_FLUSH_DELAY
+    batch_poll_initial: float = DEFAULT_POLL_INITIAL
+    batch_poll_max: float = DEFAULT_POLL_MAX
+    batch_timeout: float = DEFAULT_BATCH_TIMEOUT
+
+    # Expected attributes (set by BaseWorkflow.__init__)
+    name: str
+    batchable_stages: list[str]
+    _provider_str: str
+    _enable_batch_mode: bool
+    _batch_endpoint: Any  # BatchEndpoint | None
+    _batch_collector: BatchCollector | None
+    _batch_current_stage: str | None
+
+    @contextmanager
+    def _batch_stage(self, stage_name: str) -> Iterator[None]:
+        """Mark ``stage_name`` as the running stage for batch routing.
+
+        Pending requests are flushed when the stage finishes so none are
+        left waiting on the idle timer.
+        """
+        self._batch_current_stage = stage_name
+        try:
+            yield
+        finally:
+            self._batch_current_stage = None
+            if self._batch_collector is not None:
+                self._batch_collector.flush()
+
+    def _batch_stage_active(self) -> bool:
+        """Whether LLM calls of the running stage should be batched."""
+        if not self._enable_batch_mode:
+            return False
+        stage = self._batch_current_stage
+        if stage is None or stage not in self.batchable_stages:
+            return False
+        return self._get_batch_collector() is not None
+
+    def _batch_prepare_run(self) -> None:
+        """Start a run, resuming batches recorded in the last checkpoint."""
+        self._batch_collector = None
+        self._batch_current_stage = None
+        if not self._enable_batch_mode:
+            return
+
+        checkpoint = self._state_get_recovery_checkpoint()
+        if not checkpoint or checkpoint.get("workflow_name") != self.name:
+            return
+
+        jobs = checkpoint.get("batch_jobs") or {}
+        if jobs:
+            self._state_batch_jobs = {batch_id: dict(job) for batch_id, job in jobs.items()}
+            logger.info(f"Recovered {len(jobs)} pending batch(es) from checkpoint")
+
+    def _get_batch_collector(self) -> BatchCollector | None:
+        """Get the collector for this run, creating the endpoint if needed."""
+        if self._batch_collector is not None:
+            return self._batch_collector
+
+        endpoint = self._batch_endpoint
+        if endpoint is None:
+            if self._provider_str != "anthropic":
+                logger.debug(f"Batch mode unavailable for provider {self._provider_str}")
+                return None
+            try:
+                from attune_llm.providers import AnthropicBatchProvider
+
+                endpoint = AnthropicBatchProvider(api_key=os.getenv("ANTHROPIC_API_KEY"))
+            except (ImportError, ValueError) as e:
+                logger.warning(f"Batch mode unavailable: {e}")
+                return None
+            self._batch_endpoint = endpoint
+
+        resume = {
+            custom_id: batch_id
+            for batch_id, job in getattr(self, "_state_batch_jobs", {}).items()
+            for custom_id in job.get("custom_ids", [])
+        }
+        self._batch_collector = BatchCollector(
+            endpoint,
+            flush_delay=self.batch_flush_delay,
+            poll_initial=self.batch_poll_initial,
+            poll_max=self.batch_poll_max,
+            timeout=self.batch_timeout,
+            resume=resume,
+            on_submit=self._on_batch_submitted,
+        )
+        return self._batch_collector
+
+    def _on_batch_submitted(self, batch_id: str, custom_ids: list[str]) -> None:
+        """Checkpoint a submitted batch so an interrupted run can resume it."""
+        stage = self._batch_current_stage or "unknown"
+        self._state_record_batch_submitted(stage, batch_id, custom_ids)
+
+    async def _run_batched_call(
+        self,
+        tier: ModelTier,
+        model: str,
+        system: str | PromptLayout,
+        user_message: str,
+        max_tokens: int,
+    ) -> tuple[str, int, int, float]:
+        """Run one LLM call through the batch collector.
+
+        A PromptLayout system prompt is sent as blocks with cache breakpoints.
+
+        Returns:
+            Tuple of (content, input_tokens, output_tokens, cost)
+        """
+        collector = self._get_batch_collector()
+        if collector is None:
+            raise RuntimeError("Batch mode is not available")
+
+        params: dict[str, Any] = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": user_message}],
+        }
+        if isinstance(system, PromptLayout) and system:
+            params["system"] = PromptLayout(model=model).extend(system).system_blocks()
+        elif system:
+            params["system"] = system
+
+        content, in_tokens, out_tokens = await collector.submit(params)
+        cost = self._calculate_cost(tier, in_tokens, out_tokens) * BATCH_DISCOUNT
+        return content, in_tokens, out_tokens, cost
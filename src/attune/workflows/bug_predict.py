@@ -72,6 +72,8 @@ class BugPredictionWorkflow(BaseWorkflow):
         "predict": ModelTier.CAPABLE,
         "recommend": ModelTier.PREMIUM,
     }
+    # Token budget for the flagged code placed in the recommend prompt
+    context_budgets = {"recommend": 2000}
 
     def __init__(
         self,
@@ -474,12 +476,23 @@ class BugPredictionWorkflow(BaseWorkflow):
                     f"- {file_path}: {p.get('pattern')} (severity: {p.get('severity')})",
                 )
 
+        # Code of the riskiest files, ranked around the flagged patterns
+        risky_files = list(dict.fromkeys(pred["file"] for pred in top_risks if pred.get("file")))
+        code_context = ""
+        if risky_files:
+            code_context = self._pack_context(
+                "recommend", paths=risky_files, task=" ".join(issues_summary)
+            )
+
         # Build input payload
         input_payload = f"""Target: {target or "codebase"}
 
 Issues Found:
 {chr(10).join(issues_summary) if issues_summary else "No specific issues identified"}
 
+Relevant Code:
+{code_context or "Not available"}
+
 Historical Bug Patterns:
 {json.dumps(self._bug_patterns[:5], indent=2) if self._bug_patterns else "None"}
 
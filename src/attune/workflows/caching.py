@@ -178,6 +178,62 @@ class CachingMixin:
 
         return None
 
+    async def _await_cache_fill(
+        self,
+        stage: str,
+        system: str,
+        user_message: str,
+        model: str,
+    ) -> tuple[CachedResponse | None, bool]:
+        """Coordinate with other callers computing the same response.
+
+        Called after a cache miss. With a shared cache tier, only one caller
+        (across tasks and processes) computes a given response; the others
+        wait for it here.
+
+        Args:
+            stage: Stage name for cache key
+            system: System prompt
+            user_message: User message
+            model: Model ID
+
+        Returns:
+            Tuple of (response stored by another caller or None, whether this
+            caller holds the lease and should release it if it fails)
+        """
+        if not self._enable_cache or not hasattr(self._cache, "acquire_or_wait"):
+            return None, False
+
+        try:
+            full_prompt = self._make_cache_key(system, user_message)
+            cached_data, owns_lease = await self._cache.acquire_or_wait(  # type: ignore[union-attr]
+                self.name, stage, full_prompt, model
+            )
+            if cached_data is not None:
+                logger.debug(f"Shared cache fill for {self.name}:{stage}")
+                return CachedResponse.from_dict(cached_data), False
+            return None, owns_lease
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Cache fill wait failed (malformed data): {e}, continuing with LLM call")
+        except (OSError, ConnectionError) as e:
+            logger.debug(
+                f"Cache fill wait failed (connection error): {e}, continuing with LLM call"
+            )
+
+        return None, False
+
+    def _release_cache_lease(
+        self,
+        stage: str,
+        system: str,
+        user_message: str,
+        model: str,
+    ) -> None:
+        """Release a lease taken by _await_cache_fill without storing a response."""
+        if self._cache is None or not hasattr(self._cache, "release"):
+            return
+        self._cache.release(self.name, stage, self._make_cache_key(system, user_message), model)
+
     def _store_in_cache(
         self,
         stage: str,
@@ -51,6 +51,13 @@ class CodeReviewWorkflow(BaseWorkflow):
         "scan": ModelTier.CAPABLE,
         "architect_review": ModelTier.PREMIUM,
     }
+    # Token budgets for the code placed in each stage's prompt
+    context_budgets = {
+        "project_context": 3000,
+        "classify": 1000,
+        "scan": 1500,
+        "architect_review": 1000,
+    }
 
     def __init__(
         self,
@@ -138,7 +145,8 @@ class CodeReviewWorkflow(BaseWorkflow):
     def _gather_project_context(self) -> str:
         """Gather project context for project-level reviews.
 
-        Reads project metadata and key files to provide context to the LLM.
+        Reads project metadata and the highest-impact modules from the project
+        index, packed into the ``project_context`` token budget.
         Returns formatted project context string, or empty string if no context found.
         """
         import os
@@ -153,44 +161,43 @@ class CodeReviewWorkflow(BaseWorkflow):
         context_parts.append(f"# Path: {cwd}")
         context_parts.append("")
 
-        # Check for pyproject.toml
-        pyproject = cwd / "pyproject.toml"
-        if pyproject.exists():
+        # Metadata files and the highest-impact modules share the stage budget;
+        # each file is cut to its token share instead of a character prefix
+        budget = self.context_budgets.get("project_context", self.default_context_budget)
+        metadata = [("pyproject.toml", "toml"), ("package.json", "json")]
+        for readme_name in ["README.md", "README.rst", "README.txt", "README"]:
+            if (cwd / readme_name).exists():
+                metadata.append((readme_name, ""))
+                break
+        for file_name, fence in metadata:
+            path = cwd / file_name
+            if not path.exists():
+                continue
             try:
-                content = pyproject.read_text()[:2000]
-                context_parts.append("## pyproject.toml")
-                context_parts.append("```toml")
-                context_parts.append(content)
-                context_parts.append("```")
-                context_parts.append("")
+                content = path.read_text()
             except OSError:
-                pass
-
-        # Check for package.json
-        package_json = cwd / "package.json"
-        if package_json.exists():
-            try:
-                content = package_json.read_text()[:2000]
-                context_parts.append("## package.json")
-                context_parts.append("```json")
+                continue
+            content = self._pack_context("project_context", source=content, budget=budget // 6)
+            context_parts.append(f"## {file_name}")
+            if fence:
+                context_parts.extend([f"```{fence}", content, "```"])
+            else:
                 context_parts.append(content)
-                context_parts.append("```")
-                context_parts.append("")
-            except OSError:
-                pass
-
-        # Check for README
-        for readme_name in ["README.md", "README.rst", "README.txt", "README"]:
-            readme = cwd / readme_name
-            if readme.exists():
-                try:
-                    content = readme.read_text()[:3000]
-                    context_parts.append(f"## {readme_name}")
-                    context_parts.append(content)
-                    context_parts.append("")
-                    break
-                except OSError:
-                    pass
+            context_parts.append("")
+
+        # Signatures and docstrings of the modules with the most dependents
+        key_modules = self._get_context_packer().project_files()
+        if key_modules:
+            context_parts.append("## Key Modules")
+            context_parts.append(
+                self._pack_context(
+                    "project_context",
+                    paths=key_modules,
+                    task="project purpose, architecture and public API",
+                    budget=budget // 2,
+                )
+            )
+            context_parts.append("")
 
         # Get directory structure (top 2 levels)
         context_parts.append("## Project Structure")
@@ -359,12 +366,13 @@ class CodeReviewWorkflow(BaseWorkflow):
 
 Respond with a brief classification summary."""
 
+        code = self._pack_context("classify", source=code_to_review, task=" ".join(files_changed))
         user_message = f"""Classify this code change:
 
 Files: {", ".join(files_changed) if files_changed else "Not specified"}
 
 Code:
-{code_to_review[:4000]}"""
+{code}"""
 
         response, input_tokens, output_tokens = await self._call_llm(
             tier,
@@ -582,12 +590,15 @@ Findings ({len(external_findings)} total):
 
 Verify these findings and identify additional issues."""
 
+        code = self._pack_context(
+            "scan", source=code_to_review, task=f"{classification} {external_context}"
+        )
         user_message = f"""Review this code for security and quality issues:
 
 Previous classification: {classification}
 {external_context}
 Code to review:
-{code_to_review[:6000]}"""
+{code}"""
 
         response, input_tokens, output_tokens = await self._call_llm(
             tier,
@@ -757,13 +768,14 @@ Code to review:
         classification = input_data.get("classification", "")
 
         # Build input payload
+        code = self._pack_context("architect_review", source=code_to_review, task=classification)
         input_payload = f"""Classification: {classification}
 
 Security Scan Results:
 {scan_results[:2000]}
 
 Code:
-{code_to_review[:4000]}"""
+{code}"""
 
         # Check if XML prompts are enabled
         if self._is_xml_enabled():
@@ -0,0 +1,595 @@
+"""Token-budgeted code context packing for workflow prompts.
+
+Code workflows used to paste raw file prefixes (``read_text()[:2000]``) into
+their prompts, so the budget went to whatever happened to come first in a
+file. ``ContextPacker`` ranks every symbol by impact (from the ProjectIndex)
+and relevance to the task, then renders each at the richest level the token
+budget allows:
+
+1. signature only
+2. signature plus docstring summary
+3. full source
+
+Imports shared by several files are listed once. Content that already fits
+the budget is passed through unchanged; otherwise the packed text fills the
+budget as closely as possible without exceeding it.
+
+Example:
+    >>> packer = ContextPacker(".")
+    >>> packed = packer.pack_files(["src/app/config.py"], budget=1500, task="load config")
+    >>> packed.tokens <= 1500
+    True
+    >>> packed.tokens_saved
+    3120
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from attune.utils.tokens import count_tokens, count_tokens_batch
+
+from .test_gen.ast_analyzer import ASTFunctionAnalyzer
+from .test_gen.data_models import FunctionSignature
+
+logger = logging.getLogger(__name__)
+
+# Render levels, cheapest first
+SIGNATURE = 1
+DOCSTRING = 2
+FULL = 3
+
+# Lines kept when a non-Python document is summarized
+_DOCUMENT_SUMMARY_LINES = 12
+
+# Partial-fill attempts once every symbol is at its best affordable level
+_MAX_PARTIAL_FILLS = 8
+
+_WORD_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+_STOP_WORDS = frozenset(
+    {
+        "the",
+        "and",
+        "for",
+        "with",
+        "this",
+        "that",
+        "from",
+        "self",
+        "none",
+        "true",
+        "false",
+        "return",
+        "def",
+        "class",
+        "import",
+        "code",
+        "review",
+    }
+)
+
+
+@dataclass
+class PackedContext:
+    """Packed prompt context and how much it saved.
+
+    Attributes:
+        text: Context to place in the prompt
+        tokens: Tokens in ``text``
+        raw_tokens: Tokens the unpacked content would have used
+        budget: Token budget the text was packed into
+        symbols_total: Symbols considered
+        symbols_full: Symbols included with their full source
+        symbols_summarized: Symbols included as signature or docstring only
+    """
+
+    text: str
+    tokens: int
+    raw_tokens: int
+    budget: int
+    symbols_total: int = 0
+    symbols_full: int = 0
+    symbols_summarized: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        """Tokens saved compared to sending the content unpacked."""
+        return max(0, self.raw_tokens - self.tokens)
+
+    @property
+    def symbols_omitted(self) -> int:
+        """Symbols left out entirely."""
+        return self.symbols_total - self.symbols_full - self.symbols_summarized
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for stage output and result metadata."""
+        return {
+            "tokens": self.tokens,
+            "raw_tokens": self.raw_tokens,
+            "tokens_saved": self.tokens_saved,
+            "budget": self.budget,
+            "symbols_total": self.symbols_total,
+            "symbols_full": self.symbols_full,
+            "symbols_summarized": self.symbols_summarized,
+            "symbols_omitted": self.symbols_omitted,
+        }
+
+
+@dataclass(eq=False)
+class _Symbol:
+    """One packable unit and its renderings per level."""
+
+    order: tuple[int, int]  # (file index, line) for output ordering
+    renderings: dict[int, str]
+    parent: _Symbol | None = None
+    score: float = 0.0
+    ranked: bool = True  # False for headers pulled in by their children
+    level: int = 0
+    text: str = ""
+    costs: dict[int, int] = field(default_factory=dict)
+
+    def set_level(self, level: int, text: str | None = None) -> None:
+        self.level = level
+        self.text = self.renderings[level] if text is None else text
+
+
+def _terms(text: str) -> set[str]:
+    """Split identifiers and words into lowercase search terms."""
+    terms: set[str] = set()
+    for word in _WORD_RE.findall(text):
+        for part in word.split("_"):
+            terms.update(p.lower() for p in _CAMEL_RE.findall(part))
+    return {t for t in terms if len(t) >= 3 and t not in _STOP_WORDS}
+
+
+def _summary(docstring: str | None) -> str:
+    """First paragraph of a docstring."""
+    if not docstring:
+        return ""
+    return docstring.strip().split("\n\n", 1)[0].strip()
+
+
+def _lines(source_lines: list[str], node: ast.stmt) -> str:
+    """Source of ``node`` including its decorators."""
+    start = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+    return "\n".join(source_lines[start - 1 : node.end_lineno])
+
+
+def _with_docstring(header: str, indent: str, summary: str, ellipsis: bool = True) -> str:
+    """Header followed by an indented docstring (and ``...`` for a body)."""
+    body_indent = indent + "    "
+    doc = summary.replace("\n", f"\n{body_indent}")
+    text = f'{header}\n{body_indent}"""{doc}"""'
+    return f"{text}\n{body_indent}..." if ellipsis else text
+
+
+class ContextPacker:
+    """Packs source files into a token budget for a prompt.
+
+    Args:
+        project_root: Root the ProjectIndex and relative paths resolve from
+        index: Loaded ProjectIndex to rank files by impact (loaded from
+            ``project_root`` on first use when omitted)
+    """
+
+    def __init__(self, project_root: str | Path = ".", index: Any | None = None) -> None:
+        self.project_root = Path(project_root)
+        self._index = index
+        self._index_loaded = index is not None
+
+    @property
+    def index(self) -> Any | None:
+        """ProjectIndex for the project, or None if no index has been built."""
+        if not self._index_loaded:
+            self._index_loaded = True
+            try:
+                from attune.project_index import ProjectIndex
+
+                index = ProjectIndex(str(self.project_root))
+                self._index = index if index.load() else None
+            except Exception as e:  # noqa: BLE001
+                # INTENTIONAL: Ranking falls back to relevance alone without an index
+                logger.debug(f"Project index unavailable for context packing: {e}")
+                self._index = None
+        return self._index
+
+    def project_files(self, limit: int = 20) -> list[str]:
+        """Highest-impact Python source files from the project index.
+
+        Args:
+            limit: Maximum number of files
+
+        Returns:
+            Paths relative to ``project_root``; empty without an index
+        """
+        if self.index is None:
+            return []
+        records = [
+            r
+            for r in self.index.get_all_files()
+            if r.language == "python" and r.category.value == "source"
+        ]
+        records.sort(key=lambda r: (-r.impact_score, -r.imported_by_count, r.path))
+        return [r.path for r in records[:limit]]
+
+    def pack_source(
+        self, source: str, budget: int, task: str = "", name: str | None = None
+    ) -> PackedContext:
+        """Pack one piece of source code or text.
+
+        Args:
+            source: Python source, a diff or any other text
+            budget: Maximum tokens of the packed text
+            task: Description of the task, used to rank symbols by relevance
+            name: Optional label rendered as a header
+
+        Returns:
+            PackedContext within ``budget``
+        """
+        return self._pack([(name, source)], budget, task)
+
+    def pack_files(self, paths: list[str | Path], budget: int, task: str = "") -> PackedContext:
+        """Pack several files, each under a ``# <path>`` header.
+
+        Args:
+            paths: Files to pack; relative paths resolve from ``project_root``
+            budget: Maximum tokens of the packed text
+            task: Description of the task, used to rank symbols by relevance
+
+        Returns:
+            PackedContext within ``budget``
+        """
+        files: list[tuple[str | None, str]] = []
+        for path in paths:
+            full_path = Path(path) if Path(path).is_absolute() else self.project_root / path
+            try:
+                files.append((str(path), full_path.read_text(errors="ignore")))
+            except OSError as e:
+                logger.debug(f"Skipping {path} in context packing: {e}")
+        return self._pack(files, budget, task)
+
+    # ------------------------------------------------------------------
+    # Packing
+    # ------------------------------------------------------------------
+
+    def _pack(self, files: list[tuple[str | None, str]], budget: int, task: str) -> PackedContext:
+        raw_text = "\n\n".join(
+            f"# {name}\n{content}" if name else content for name, content in files
+        )
+        raw_tokens = count_tokens(raw_text)
+        budget = max(0, budget)
+        if raw_tokens <= budget:
+            return PackedContext(raw_text, raw_tokens, raw_tokens, budget)
+
+        task_terms = _terms(task)
+        symbols, import_symbols = self._collect(files, task_terms)
+        self._price(symbols)
+
+        ranked = sorted((s for s in symbols if s.ranked), key=lambda s: (-s.score, s.order))
+        remaining = budget
+        # Signatures of everything first, then imports, then richer renderings
+        remaining = self._upgrade(ranked, SIGNATURE, remaining)
+        remaining = self._upgrade(import_symbols, SIGNATURE, remaining)
+        remaining = self._upgrade(ranked, DOCSTRING, remaining)
+        remaining = self._upgrade(ranked, FULL, remaining)
+        self._partial_fill(ranked, remaining)
+
+        text = self._assemble(symbols)
+        tokens = count_tokens(text)
+        if tokens > budget:
+            text = _truncate_lines(text, budget)
+            tokens = count_tokens(text)
+
+        included = [s for s in ranked if s.level]
+        full = sum(1 for s in included if s.level == FULL)
+        return PackedContext(
+            text=text,
+            tokens=tokens,
+            raw_tokens=raw_tokens,
+            budget=budget,
+            symbols_total=len(ranked),
+            symbols_full=full,
+            symbols_summarized=len(included) - full,
+        )
+
+    def _impact(self, files: list[tuple[str | None, str]]) -> dict[str, float]:
+        """Impact of each file, normalized to 0..1 across the packed files."""
+        if self.index is None:
+            return {}
+        scores = {}
+        for name, _ in files:
+            record = self.index.get_file(name) if name else None
+            if record is not None:
+                scores[name] = record.impact_score + 0.1 * record.imported_by_count
+        top = max(scores.values(), default=0.0)
+        return {name: score / top for name, score in scores.items()} if top else {}
+
+    def _collect(
+        self, files: list[tuple[str | None, str]], task_terms: set[str]
+    ) -> tuple[list[_Symbol], list[_Symbol]]:
+        impact = self._impact(files)
+        parsed: list[tuple[int, str | None, str, ast.Module | None]] = []
+        import_counts: Counter[str] = Counter()
+        for file_idx, (name, content) in enumerate(files):
+            tree = None
+            if name is None or name.endswith((".py", ".pyi")):
+                try:
+                    tree = ast.parse(content)
+                except (SyntaxError, ValueError):
+                    tree = None
+            if tree is not None:
+                import_counts.update(set(self._imports(tree)))
+            parsed.append((file_idx, name, content, tree))
+
+        shared = sorted(i for i, n in import_counts.items() if n > 1)
+        symbols: list[_Symbol] = []
+        import_symbols: list[_Symbol] = []
+        if shared:
+            block = "# Shared imports\n" + "\n".join(shared)
+            shared_symbol = _Symbol((-1, 0), {SIGNATURE: block}, ranked=False)
+            symbols.append(shared_symbol)
+            import_symbols.append(shared_symbol)
+
+        for file_idx, name, content, tree in parsed:
+            header = _Symbol((file_idx, -2), {SIGNATURE: f"# {name}" if name else ""}, ranked=False)
+            symbols.append(header)
+            file_impact = impact.get(name or "", 0.0)
+            if tree is None:
+                symbols.append(self._document(file_idx, header, content, task_terms, file_impact))
+                continue
+            own_imports = [i for i in dict.fromkeys(self._imports(tree)) if i not in shared]
+            if own_imports:
+                imports = _Symbol(
+                    (file_idx, 0), {SIGNATURE: "\n".join(own_imports)}, header, ranked=False
+                )
+                symbols.append(imports)
+                import_symbols.append(imports)
+            for symbol in self._python_symbols(file_idx, header, content, tree, task_terms):
+                symbol.score += file_impact
+                symbols.append(symbol)
+        return symbols, import_symbols
+
+    @staticmethod
+    def _imports(tree: ast.Module) -> list[str]:
+        return [
+            ast.unparse(node) for node in tree.body if isinstance(node, ast.Import | ast.ImportFrom)
+        ]
+
+    @staticmethod
+    def _document(
+        file_idx: int, header: _Symbol, content: str, task_terms: set[str], impact: float
+    ) -> _Symbol:
+        """A non-Python document: its opening lines, or all of it."""
+        lines = content.splitlines()
+        renderings = {FULL: content}
+        if len(lines) > _DOCUMENT_SUMMARY_LINES:
+            renderings[SIGNATURE] = "\n".join(lines[:_DOCUMENT_SUMMARY_LINES]) + "\n..."
+        # Documents (READMEs, manifests, diffs) outrank individual symbols
+        score = 2.0 + impact + len(task_terms & _terms(content)) * 0.5
+        return _Symbol((file_idx, 1), renderings, header, score)
+
+    def _python_symbols(
+        self,
+        file_idx: int,
+        header: _Symbol,
+        source: str,
+        tree: ast.Module,
+        task_terms: set[str],
+    ) -> list[_Symbol]:
+        analyzer = ASTFunctionAnalyzer()
+        analyzer.visit(tree)
+        functions = {f.name: f for f in analyzer.functions}
+        classes = {c.name: c for c in analyzer.classes}
+        source_lines = source.splitlines()
+        symbols: list[_Symbol] = []
+
+        docstring = ast.get_docstring(tree)
+        if docstring:
+            symbols.append(
+                _Symbol(
+                    (file_idx, -1),
+                    {DOCSTRING: f'"""{_summary(docstring)}"""'},
+                    header,
+                    1.0 + 0.5 * len(task_terms & _terms(docstring)),
+                )
+            )
+
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+                symbols.append(
+                    self._function(
+                        file_idx, header, node, functions.get(node.name), source_lines, task_terms
+                    )
+                )
+            elif isinstance(node, ast.ClassDef):
+                class_symbol = self._class(file_idx, header, node, source_lines, task_terms)
+                symbols.append(class_symbol)
+                signature = classes.get(node.name)
+                methods = {m.name: m for m in signature.methods} if signature else {}
+                for item in node.body:
+                    if isinstance(item, ast.FunctionDef | ast.AsyncFunctionDef):
+                        symbols.append(
+                            self._function(
+                                file_idx,
+                                class_symbol,
+                                item,
+                                methods.get(item.name),
+                                source_lines,
+                                task_terms,
+                            )
+                        )
+            elif isinstance(node, ast.Assign | ast.AnnAssign):
+                full = _lines(source_lines, node)
+                first, _, rest = full.partition("\n")
+                renderings = {FULL: full}
+                if rest:
+                    renderings[SIGNATURE] = f"{first} ..."
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                names = " ".join(ast.unparse(t) for t in targets)
+                symbols.append(
+                    _Symbol(
+                        (file_idx, node.lineno),
+                        renderings,
+                        header,
+                        0.3 + 2.0 * len(task_terms & _terms(names)),
+                    )
+                )
+        return symbols
+
+    @staticmethod
+    def _function(
+        file_idx: int,
+        parent: _Symbol,
+        node: ast.FunctionDef | ast.AsyncFunctionDef,
+        signature: FunctionSignature | None,
+        source_lines: list[str],
+        task_terms: set[str],
+    ) -> _Symbol:
+        indent = " " * node.col_offset
+        keyword = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+        decorators = "".join(f"{indent}@{ast.unparse(d)}\n" for d in node.decorator_list)
+        returns = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+        header = f"{decorators}{indent}{keyword} {node.name}({ast.unparse(node.args)}){returns}:"
+
+        summary = _summary(signature.docstring if signature else ast.get_docstring(node))
+        if signature and signature.raises:
+            summary = f"{summary}\nRaises: {', '.join(sorted(signature.raises))}".strip()
+        renderings = {SIGNATURE: f"{header} ..."}
+        if summary:
+            renderings[DOCSTRING] = _with_docstring(header, indent, summary)
+        renderings[FULL] = _lines(source_lines, node)
+
+        body = "\n".join(source_lines[node.lineno - 1 : node.end_lineno])
+        relevance = (
+            3.0 * len(task_terms & _terms(node.name))
+            + 1.0 * len(task_terms & _terms(summary))
+            + 0.5 * len(task_terms & _terms(body))
+        )
+        complexity = signature.complexity if signature else 1
+        score = relevance + 0.1 * min(complexity, 20) + (0.0 if node.name.startswith("_") else 0.5)
+        return _Symbol((file_idx, node.lineno), renderings, parent, score)
+
+    @staticmethod
+    def _class(
+        file_idx: int,
+        parent: _Symbol,
+        node: ast.ClassDef,
+        source_lines: list[str],
+        task_terms: set[str],
+    ) -> _Symbol:
+        bases = [ast.unparse(b) for b in node.bases] + [ast.unparse(k) for k in node.keywords]
+        decorators = "".join(f"@{ast.unparse(d)}\n" for d in node.decorator_list)
+        arguments = f"({', '.join(bases)})" if bases else ""
+        header = f"{decorators}class {node.name}{arguments}:"
+        summary = _summary(ast.get_docstring(node))
+        renderings = {SIGNATURE: header}
+        if summary:
+            renderings[DOCSTRING] = _with_docstring(header, "", summary, ellipsis=False)
+        # Full level: header, docstring and the non-method body (fields, constants)
+        fields = [
+            _lines(source_lines, item)
+            for item in node.body
+            if not isinstance(item, ast.FunctionDef | ast.AsyncFunctionDef)
+            and not (isinstance(item, ast.Expr) and isinstance(item.value, ast.Constant))
+        ]
+        if fields:
+            renderings[FULL] = "\n".join([renderings.get(DOCSTRING, header), *fields])
+
+        relevance = 3.0 * len(task_terms & _terms(node.name)) + len(task_terms & _terms(summary))
+        score = relevance + (0.0 if node.name.startswith("_") else 0.5)
+        return _Symbol((file_idx, node.lineno), renderings, parent, score)
+
+    @staticmethod
+    def _price(symbols: list[_Symbol]) -> None:
+        """Count the tokens of every rendering in one batch."""
+        texts = [text for s in symbols for text in s.renderings.values()]
+        counts = iter(count_tokens_batch(texts))
+        for symbol in symbols:
+            # One extra token for the newline joining it to the next part
+            symbol.costs = {level: next(counts) + 1 for level in symbol.renderings}
+
+    @staticmethod
+    def _ancestors_cost(symbol: _Symbol) -> tuple[int, list[_Symbol]]:
+        missing = []
+        parent = symbol.parent
+        while parent is not None and not parent.level:
+            missing.append(parent)
+            parent = parent.parent
+        return sum(p.costs[min(p.renderings)] for p in missing), missing
+
+    def _upgrade(self, symbols: list[_Symbol], level: int, remaining: int) -> int:
+        """Raise each symbol to ``level`` in rank order while the budget allows."""
+        for symbol in symbols:
+            if level not in symbol.renderings or symbol.level >= level:
+                continue
+            extra, missing = self._ancestors_cost(symbol)
+            delta = symbol.costs[level] - (symbol.costs[symbol.level] if symbol.level else 0)
+            if delta + extra > remaining:
+                continue
+            for parent in missing:
+                parent.set_level(min(parent.renderings))
+            symbol.set_level(level)
+            remaining -= delta + extra
+        return remaining
+
+    def _partial_fill(self, ranked: list[_Symbol], remaining: int) -> None:
+        """Spend the leftover budget on the start of the best unaffordable bodies."""
+        attempts = 0
+        for symbol in ranked:
+            if remaining <= 2 or attempts >= _MAX_PARTIAL_FILLS:
+                return
+            if FULL not in symbol.renderings or symbol.level == FULL:
+                continue
+            attempts += 1
+            extra, missing = self._ancestors_cost(symbol)
+            current = symbol.costs[symbol.level] if symbol.level else 0
+            allowance = remaining - extra + current
+            lines = symbol.renderings[FULL].splitlines()
+            body_line = lines[min(1, len(lines) - 1)] if lines else ""
+            indent = body_line[: len(body_line) - len(body_line.lstrip())]
+            shown = len(symbol.text.splitlines()) if symbol.level else 0
+
+            # Largest prefix of the body that fits the allowance
+            low, high, best = shown + 1, len(lines) - 1, None
+            while low <= high:
+                mid = (low + high) // 2
+                candidate = "\n".join(lines[:mid]) + f"\n{indent}..."
+                cost = count_tokens(candidate) + 1
+                if cost <= allowance:
+                    best, low = (candidate, cost), mid + 1
+                else:
+                    high = mid - 1
+            if best is None:
+                continue
+            for parent in missing:
+                parent.set_level(min(parent.renderings))
+            symbol.set_level(max(symbol.level, SIGNATURE), best[0])
+            remaining -= best[1] - current + extra
+
+    @staticmethod
+    def _assemble(symbols: list[_Symbol]) -> str:
+        parts = [s.text for s in sorted(symbols, key=lambda s: s.order) if s.level and s.text]
+        return "\n".join(parts)
+
+
+def _truncate_lines(text: str, budget: int) -> str:
+    """Longest prefix of whole lines of ``text`` within ``budget`` tokens."""
+    lines = text.splitlines()
+    low, high = 0, len(lines)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if count_tokens("\n".join(lines[:mid])) <= budget:
+            low = mid
+        else:
+            high = mid - 1
+    return "\n".join(lines[:low])
@@ -6,9 +6,16 @@ Extracted from workflow.py for maintainability.
 Contains:
 - ChunkedGenerationMixin: Chunked write/polish, export, and display methods
 
+Chunks are written either sequentially (each prompt sees the full outline and
+the end of the previous chunk) or, with ``parallel_chunks``, concurrently from
+a shared section contract and glossary, streamed to the draft export as they
+finish and followed by a cheap consistency pass.
+
 Expected attributes on the host class:
     max_write_tokens: int
     sections_per_chunk: int
+    parallel_chunks: bool
+    max_concurrent_chunks: int
     max_cost: float
     graceful_degradation: bool
     export_path: Path | None
@@ -23,18 +30,27 @@ Licensed under the Apache License, Version 2.0
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import re
+import time
 from datetime import datetime
 from pathlib import Path
 
 from attune.config import _validate_file_path
+from attune.utils.tokens import count_tokens_batch
 
 from ..base import ModelTier
 from .report_formatter import format_doc_gen_report
 
 logger = logging.getLogger(__name__)
 
+# Top-level outline entries, e.g. "1. Introduction" (not "1.1 Sub-section")
+_TOP_LEVEL_SECTION = re.compile(r"^(\d+)\.\s+([A-Za-z].*)")
+_DEFINITION = re.compile(r"^([ \t]*)(?:async[ \t]+)?(def|class)[ \t]+([A-Za-z_]\w*)", re.MULTILINE)
+_SUMMARY_CHARS = 120
+
 
 class ChunkedGenerationMixin:
     """Mixin providing chunked generation and display utilities for doc generation."""
@@ -42,6 +58,8 @@ class ChunkedGenerationMixin:
     # Class-level defaults for expected attributes
     max_write_tokens: int = 16000
     sections_per_chunk: int = 3
+    parallel_chunks: bool = False
+    max_concurrent_chunks: int = 4
     graceful_degradation: bool = True
     export_path: Path | None = None
     max_display_chars: int = 45000
@@ -49,48 +67,24 @@ class ChunkedGenerationMixin:
     _total_content_tokens: int = 0
     _partial_results: dict = {}  # noqa: RUF012
 
-    async def _write_chunked(
+    def _split_into_chunks(self, sections: list[str]) -> list[list[str]]:
+        """Group outline sections into chunks of ``sections_per_chunk``."""
+        return [
+            sections[i : i + self.sections_per_chunk]
+            for i in range(0, len(sections), self.sections_per_chunk)
+        ]
+
+    def _chunk_system_prompt(
         self,
-        sections: list[str],
-        outline: str,
-        doc_type: str,
+        chunk_idx: int,
+        chunk_count: int,
+        sections_list: str,
         audience: str,
-        content_to_document: str,
-        tier: ModelTier,
-    ) -> tuple[dict, int, int]:
-        """Generate documentation in chunks to avoid truncation.
-
-        Enterprise-safe: includes cost tracking and graceful degradation.
-        """
-        all_content: list[str] = []
-        total_input_tokens: int = 0
-        total_output_tokens: int = 0
-        stopped_early: bool = False
-        error_message: str | None = None
-
-        # Split sections into chunks
-        chunks = []
-        for i in range(0, len(sections), self.sections_per_chunk):
-            chunks.append(sections[i : i + self.sections_per_chunk])
-
-        logger.info(f"Generating documentation in {len(chunks)} chunks")
-
-        for chunk_idx, chunk_sections in enumerate(chunks):
-            sections_list = ", ".join(chunk_sections)
-
-            # Build context about what came before
-            previous_context = ""
-            if chunk_idx > 0 and all_content:
-                # Include last 500 chars of previous content for continuity
-                previous_context = f"""
-Previous sections already written (for context/continuity):
-...{all_content[-1][-500:]}
-
-Continue with the next sections, maintaining consistent style and terminology."""
-
-            system = f"""You are an expert technical writer creating comprehensive developer documentation.
+    ) -> str:
+        """Build the writer system prompt for one chunk of sections."""
+        return f"""You are an expert technical writer creating comprehensive developer documentation.
 
-Write ONLY these sections (part {chunk_idx + 1} of {len(chunks)}): {sections_list}
+Write ONLY these sections (part {chunk_idx + 1} of {chunk_count}): {sections_list}
 
 YOUR TASK FOR THESE SECTIONS (TWO PHASES):
 
@@ -136,7 +130,16 @@ def function_name(params) -> return_type
 Complete BOTH phases for these sections.
 ═══════════════════════════════════════════════════════════════"""
 
-            user_message = f"""Write comprehensive documentation for these sections in TWO PHASES:
+    def _chunk_user_message(
+        self,
+        sections_list: str,
+        doc_type: str,
+        audience: str,
+        content_to_document: str,
+        context: str,
+    ) -> str:
+        """Build the writer request for one chunk; ``context`` places it in the document."""
+        return f"""Write comprehensive documentation for these sections in TWO PHASES:
 
 Sections to write: {sections_list}
 
@@ -146,15 +149,55 @@ Target Audience: {audience}
 Source code (extract actual functions/classes from here):
 {content_to_document[:3000]}
 
-Full outline (for context):
-{outline}
-{previous_context}
+{context}
 
 PHASE 1: Write comprehensive content with real code examples
 PHASE 2: Add structured API reference sections with **Args:**, **Returns:**, **Raises:**
 
 Generate complete sections now, ensuring both phases are complete."""
 
+    async def _write_chunked(
+        self,
+        sections: list[str],
+        outline: str,
+        doc_type: str,
+        audience: str,
+        content_to_document: str,
+        tier: ModelTier,
+    ) -> tuple[dict, int, int]:
+        """Generate documentation in chunks to avoid truncation.
+
+        Enterprise-safe: includes cost tracking and graceful degradation.
+        """
+        all_content: list[str] = []
+        total_input_tokens: int = 0
+        total_output_tokens: int = 0
+        stopped_early: bool = False
+        error_message: str | None = None
+
+        chunks = self._split_into_chunks(sections)
+
+        logger.info(f"Generating documentation in {len(chunks)} chunks")
+
+        for chunk_idx, chunk_sections in enumerate(chunks):
+            sections_list = ", ".join(chunk_sections)
+
+            # Build context about what came before
+            previous_context = ""
+            if chunk_idx > 0 and all_content:
+                # Include last 500 chars of previous content for continuity
+                previous_context = _previous_context(all_content[-1])
+
+            system = self._chunk_system_prompt(chunk_idx, len(chunks), sections_list, audience)
+
+            user_message = self._chunk_user_message(
+                sections_list,
+                doc_type,
+                audience,
+                content_to_document,
+                f"Full outline (for context):\n{outline}\n{previous_context}",
+            )
+
             try:
                 response, input_tokens, output_tokens = await self._call_llm(
                     tier,
@@ -225,6 +268,302 @@ Generate complete sections now, ensuring both phases are complete."""
 
         return (result, total_input_tokens, total_output_tokens)
 
+    async def _write_chunked_parallel(
+        self,
+        sections: list[str],
+        outline: str,
+        doc_type: str,
+        audience: str,
+        content_to_document: str,
+        tier: ModelTier,
+        shared_context: str | None = None,
+    ) -> tuple[dict, int, int]:
+        """Generate documentation chunks concurrently against a shared contract.
+
+        Each chunk prompt carries the compact section contract and glossary
+        instead of the full outline and the previous chunk, so chunks are
+        independent and run under a ``max_concurrent_chunks`` limiter. Finished
+        chunks are streamed to a draft file in ``export_path`` in outline order,
+        then a cheap consistency pass aligns terminology across chunks.
+
+        Enterprise-safe: includes cost tracking and graceful degradation.
+        """
+        chunks = self._split_into_chunks(sections)
+        shared_context = shared_context or self._build_shared_context(
+            outline, sections, content_to_document
+        )
+        context = (
+            f"{shared_context}\n\n"
+            "The other parts are written in parallel by other writers. Write ONLY your "
+            "sections, do not repeat or introduce the others, and use the glossary names exactly."
+        )
+        prompts = [
+            (
+                self._chunk_system_prompt(idx, len(chunks), ", ".join(chunk), audience),
+                self._chunk_user_message(
+                    ", ".join(chunk), doc_type, audience, content_to_document, context
+                ),
+            )
+            for idx, chunk in enumerate(chunks)
+        ]
+        max_tokens = self.max_write_tokens // len(chunks) + 2000
+        limiter = asyncio.Semaphore(max(1, self.max_concurrent_chunks))
+        stop = asyncio.Event()
+
+        async def write(idx: int) -> tuple[int, str | None, int, int, float, Exception | None]:
+            async with limiter:
+                if stop.is_set():
+                    return idx, None, 0, 0, 0.0, None
+                started = time.perf_counter()
+                try:
+                    response, input_tokens, output_tokens = await self._call_llm(
+                        tier, *prompts[idx], max_tokens=max_tokens
+                    )
+                except Exception as e:  # noqa: BLE001
+                    # INTENTIONAL: reported per chunk below (graceful degradation)
+                    return idx, None, 0, 0, 0.0, e
+                # Track cost before releasing the slot so no chunk starts past the limit
+                _, should_stop = self._track_cost(tier, input_tokens, output_tokens)
+                if should_stop:
+                    stop.set()
+                elapsed = time.perf_counter() - started
+                return idx, response, input_tokens, output_tokens, elapsed, None
+
+        logger.info(
+            f"Generating documentation in {len(chunks)} parallel chunks "
+            f"(max {self.max_concurrent_chunks} concurrent)"
+        )
+
+        contents: dict[int, str] = {}
+        latencies: list[float] = []
+        total_input_tokens: int = 0
+        total_output_tokens: int = 0
+        stopped_early: bool = False
+        error_message: str | None = None
+
+        draft = _DraftStream(self._draft_path(doc_type))
+        start = time.perf_counter()
+        tasks = [asyncio.create_task(write(idx)) for idx in range(len(chunks))]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                idx, response, input_tokens, output_tokens, elapsed, error = await finished
+                if error is not None:
+                    error_message = f"Error generating chunk {idx + 1}: {error}"
+                    logger.error(error_message)
+                    if not self.graceful_degradation:
+                        raise error
+                    stopped_early = True
+                if response is None:
+                    draft.add(idx, None)
+                    continue
+
+                contents[idx] = response
+                latencies.append(elapsed)
+                total_input_tokens += input_tokens
+                total_output_tokens += output_tokens
+                draft.add(idx, response)
+
+                logger.info(
+                    f"Chunk {idx + 1}/{len(chunks)} complete ({len(contents)} done): "
+                    f"{len(response)} chars, {output_tokens} tokens, "
+                    f"cost so far: ${self._accumulated_cost:.2f}",
+                )
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            draft.close()
+
+        if stop.is_set():
+            stopped_early = True
+            remaining = len(chunks) - len(contents)
+            error_message = (
+                f"Cost limit reached (${self._accumulated_cost:.2f}). "
+                f"Stopped after {len(contents)}/{len(chunks)} chunks. "
+                f"{remaining} chunks not generated."
+            )
+            logger.warning(error_message)
+
+        ordered = [contents[idx] for idx in sorted(contents)]
+        combined_document = "\n\n".join(ordered)
+        replacements = 0
+        if not stop.is_set():
+            (
+                combined_document,
+                polish_input_tokens,
+                polish_output_tokens,
+                replacements,
+            ) = await self._consistency_pass(ordered, shared_context)
+            total_input_tokens += polish_input_tokens
+            total_output_tokens += polish_output_tokens
+        wall_clock = time.perf_counter() - start
+
+        # Compare with the prompts sequential mode would have sent for the same chunks
+        done = sorted(contents)
+        sequential_prompts = [
+            self._chunk_system_prompt(idx, len(chunks), ", ".join(chunks[idx]), audience)
+            + self._chunk_user_message(
+                ", ".join(chunks[idx]),
+                doc_type,
+                audience,
+                content_to_document,
+                f"Full outline (for context):\n{outline}\n"
+                + (_previous_context(contents[idx - 1]) if idx - 1 in contents else ""),
+            )
+            for idx in done
+        ]
+        token_counts = count_tokens_batch(
+            [prompts[idx][0] + prompts[idx][1] for idx in done] + sequential_prompts
+        )
+        prompt_tokens = sum(token_counts[: len(done)])
+        sequential_prompt_tokens = sum(token_counts[len(done) :])
+        sequential_seconds = sum(latencies)
+        parallel_stats = {
+            "max_concurrent_chunks": self.max_concurrent_chunks,
+            "wall_clock_seconds": round(wall_clock, 2),
+            "sequential_estimate_seconds": round(sequential_seconds, 2),
+            "wall_clock_saved_seconds": round(max(0.0, sequential_seconds - wall_clock), 2),
+            "prompt_tokens": prompt_tokens,
+            "sequential_prompt_tokens": sequential_prompt_tokens,
+            "prompt_tokens_saved": sequential_prompt_tokens - prompt_tokens,
+            "consistency_replacements": replacements,
+        }
+        logger.info(
+            f"Parallel chunk writing took {wall_clock:.1f}s "
+            f"(~{sequential_seconds:.1f}s sequential), "
+            f"{prompt_tokens} prompt tokens (~{sequential_prompt_tokens} sequential)"
+        )
+
+        self._total_content_tokens = total_output_tokens
+
+        # Store partial results for graceful degradation
+        self._partial_results = {
+            "draft_document": combined_document,
+            "sections_completed": len(contents),
+            "sections_total": len(chunks),
+        }
+
+        result = {
+            "draft_document": combined_document,
+            "doc_type": doc_type,
+            "audience": audience,
+            "outline": outline,
+            "chunked": True,
+            "parallel": True,
+            "chunk_count": len(chunks),
+            "chunks_completed": len(contents),
+            "stopped_early": stopped_early,
+            "accumulated_cost": self._accumulated_cost,
+            "parallel_stats": parallel_stats,
+            "source_code": content_to_document,  # Pass through for API reference generation
+        }
+        if draft.path is not None:
+            result["draft_path"] = str(draft.path)
+
+        if error_message:
+            result["warning"] = error_message
+
+        return (result, total_input_tokens, total_output_tokens)
+
+    def _build_shared_context(self, outline: str, sections: list[str], source: str) -> str:
+        """Condense the outline and source into a section contract and glossary.
+
+        Args:
+            outline: Outline produced by the outline stage
+            sections: Top-level section titles parsed from the outline
+            source: Source being documented
+
+        Returns:
+            Context shared by every parallel chunk prompt
+        """
+        descriptions = _outline_descriptions(outline)
+        lines = ["SECTION CONTRACT (each section is written by exactly one writer):"]
+        for part, chunk_sections in enumerate(self._split_into_chunks(sections), 1):
+            for title in chunk_sections:
+                summary = descriptions.get(title)
+                lines.append(f"- [part {part}] {title}" + (f": {summary}" if summary else ""))
+
+        glossary = _glossary_terms(source)
+        if glossary:
+            lines.append("")
+            lines.append("GLOSSARY (use these exact names; document each only in its own section):")
+            lines.extend(f"- `{name}` ({kind})" for name, kind in glossary)
+        return "\n".join(lines)
+
+    async def _consistency_pass(
+        self,
+        chunk_contents: list[str],
+        shared_context: str,
+    ) -> tuple[str, int, int, int]:
+        """Align terminology across independently written chunks.
+
+        Only each chunk's headings and code terms are sent (CHEAP tier); the
+        returned term replacements are applied locally.
+
+        Returns:
+            Tuple of (document, input_tokens, output_tokens, replacements_applied)
+        """
+        document = "\n\n".join(chunk_contents)
+        if len(chunk_contents) < 2:
+            return document, 0, 0, 0
+
+        digest: list[str] = []
+        for part, content in enumerate(chunk_contents, 1):
+            headings = [ln.strip() for ln in content.splitlines() if ln.lstrip().startswith("#")]
+            terms = sorted(set(re.findall(r"`([^`\n]{2,60})`", content)))
+            digest.append(f"Part {part} headings: {' | '.join(headings[:15])}")
+            digest.append(f"Part {part} terms: {', '.join(terms[:40])}")
+
+        digest_text = "\n".join(digest)
+        system = (
+            "You are a technical editor checking consistency between documentation parts "
+            "written by different writers. Respond with JSON only."
+        )
+        user_message = f"""{shared_context}
+
+{digest_text}
+
+Find names or terms that refer to the same thing but are written differently across parts, \
+or that differ from the glossary. Respond with a JSON object mapping each inconsistent form \
+to its canonical form, e.g. {{"getUser": "get_user"}}. Respond with {{}} if all parts agree."""
+
+        try:
+            response, input_tokens, output_tokens = await self._call_llm(
+                ModelTier.CHEAP,
+                system,
+                user_message,
+                max_tokens=500,
+            )
+        except Exception as e:  # noqa: BLE001
+            # INTENTIONAL: the pass is an optional refinement; keep the draft as written
+            logger.warning(f"Consistency pass failed: {e}")
+            return document, 0, 0, 0
+
+        self._track_cost(ModelTier.CHEAP, input_tokens, output_tokens)
+
+        applied = 0
+        for old, new in _parse_replacements(response).items():
+            document, count = re.subn(
+                rf"(?<!\w){re.escape(old)}(?!\w)", lambda _m, new=new: new, document
+            )
+            applied += count
+        return document, input_tokens, output_tokens, applied
+
+    def _draft_path(self, doc_type: str) -> Path | None:
+        """Path that parallel chunks are streamed to, or None if export is disabled."""
+        if not self.export_path:
+            return None
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_doc_type = doc_type.replace(" ", "_").replace("/", "-").lower()
+        try:
+            self.export_path.mkdir(parents=True, exist_ok=True)
+            return _validate_file_path(
+                str(self.export_path / f"{safe_doc_type}_{timestamp}_draft.md")
+            )
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to prepare draft export: {e}")
+            return None
+
     async def _polish_chunked(self, input_data: dict, tier: ModelTier) -> tuple[dict, int, int]:
         """Polish large documents in chunks to avoid truncation.
 
@@ -480,3 +819,108 @@ Make all code examples complete and executable."""
         chunks = [chunk.format(total=total) for chunk in chunks]
 
         return chunks
+
+
+def _previous_context(previous: str) -> str:
+    """Continuity note sequential mode adds from the previous chunk."""
+    return f"""
+Previous sections already written (for context/continuity):
+...{previous[-500:]}
+
+Continue with the next sections, maintaining consistent style and terminology."""
+
+
+def _outline_descriptions(outline: str) -> dict[str, str]:
+    """Map each top-level outline title to a one-line summary of its purpose."""
+    descriptions: dict[str, str] = {}
+    current: str | None = None
+    for line in outline.split("\n"):
+        stripped = line.strip()
+        match = _TOP_LEVEL_SECTION.match(stripped)
+        if match:
+            title, _, summary = match.group(2).strip().partition(" - ")
+            current = title.strip()
+            if summary.strip():
+                descriptions[current] = summary.strip()[:_SUMMARY_CHARS]
+            continue
+        if current and current not in descriptions and stripped:
+            descriptions[current] = stripped.lstrip("-*• ").strip()[:_SUMMARY_CHARS]
+    return descriptions
+
+
+def _glossary_terms(source: str, limit: int = 40) -> list[tuple[str, str]]:
+    """Public classes, functions and methods defined in ``source``."""
+    terms: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    for indent, keyword, name in _DEFINITION.findall(source):
+        if name.startswith("_") or name in seen:
+            continue
+        seen.add(name)
+        if keyword == "class":
+            terms.append((name, "class"))
+        else:
+            terms.append((f"{name}()", "method" if indent else "function"))
+        if len(terms) >= limit:
+            break
+    return terms
+
+
+def _parse_replacements(response: str) -> dict[str, str]:
+    """Extract a ``{"old": "new"}`` mapping from the consistency pass response."""
+    match = re.search(r"\{.*\}", response, re.DOTALL)
+    if not match:
+        return {}
+    try:
+        data = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        old: new
+        for old, new in data.items()
+        if isinstance(old, str) and isinstance(new, str) and len(old.strip()) > 1 and old != new
+    }
+
+
+class _DraftStream:
+    """Appends finished chunks to the draft file in outline order.
+
+    Chunks finish out of order; each is held until every earlier chunk has
+    been written or skipped, so the file is always a readable prefix.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self._pending: dict[int, str | None] = {}
+        self._next = 0
+        self._write("", mode="w")
+
+    def add(self, idx: int, content: str | None) -> None:
+        """Record chunk ``idx`` (None if it was skipped) and flush what is in order."""
+        self._pending[idx] = content
+        ready: list[str] = []
+        while self._next in self._pending:
+            chunk = self._pending.pop(self._next)
+            if chunk:
+                ready.append(chunk)
+            self._next += 1
+        if ready:
+            self._write("\n\n".join(ready) + "\n\n")
+
+    def close(self) -> None:
+        """Write chunks still waiting on an earlier chunk that never finished."""
+        remaining = [chunk for _, chunk in sorted(self._pending.items()) if chunk]
+        self._pending.clear()
+        if remaining:
+            self._write("\n\n".join(remaining) + "\n\n")
+
+    def _write(self, text: str, mode: str = "a") -> None:
+        if self.path is None:
+            return
+        try:
+            with self.path.open(mode, encoding="utf-8") as f:
+                f.write(text)
+        except OSError as e:
+            logger.error(f"Failed to stream draft to {self.path}: {e}")
+            self.path = None
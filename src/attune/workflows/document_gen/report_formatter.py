@@ -77,6 +77,14 @@ def format_doc_gen_report(result: dict, input_data: dict) -> str:
             )
         else:
             lines.append(f"Generation Mode: Chunked ({chunk_count} chunks)")
+    parallel_stats = input_data.get("parallel_stats")
+    if parallel_stats:
+        lines.append(
+            f"Parallel Writing: {parallel_stats['wall_clock_seconds']:.1f}s "
+            f"(~{parallel_stats['sequential_estimate_seconds']:.1f}s sequential), "
+            f"{parallel_stats['prompt_tokens']:,} prompt tokens "
+            f"(~{parallel_stats['sequential_prompt_tokens']:,} sequential)"
+        )
     if polish_chunked:
         polish_chunks = result.get("polish_chunks", 0)
         lines.append(f"Polish Mode: Chunked ({polish_chunks} sections)")
@@ -58,6 +58,8 @@ class DocumentGenerationWorkflow(
         section_focus: list[str] | None = None,
         chunked_generation: bool = True,
         sections_per_chunk: int = 3,
+        parallel_chunks: bool = False,
+        max_concurrent_chunks: int = 4,
         max_cost: float = 5.0,  # Cost guardrail in USD
         cost_warning_threshold: float = 0.8,  # Warn at 80% of max_cost
         graceful_degradation: bool = True,  # Return partial results on error
@@ -79,6 +81,10 @@ class DocumentGenerationWorkflow(
             chunked_generation: If True, generates large docs in chunks to avoid
                 truncation (default True).
             sections_per_chunk: Number of sections to generate per chunk (default 3).
+            parallel_chunks: If True, write chunks concurrently from a shared section
+                contract and glossary instead of sequentially (default False).
+            max_concurrent_chunks: Maximum chunks written at once in parallel mode
+                (default 4).
             max_cost: Maximum cost in USD before stopping (default $5).
                 Set to 0 to disable cost limits.
             cost_warning_threshold: Percentage of max_cost to trigger warning (default 0.8).
@@ -101,6 +107,8 @@ class DocumentGenerationWorkflow(
         self.section_focus = section_focus
         self.chunked_generation = chunked_generation
         self.sections_per_chunk = sections_per_chunk
+        self.parallel_chunks = parallel_chunks
+        self.max_concurrent_chunks = max_concurrent_chunks
         self.max_cost = max_cost
         self.cost_warning_threshold = cost_warning_threshold
         self.graceful_degradation = graceful_degradation
@@ -288,16 +296,21 @@ Generate an outline that covers all these aspects comprehensively."""
             max_tokens=1000,
         )
 
-        return (
-            {
-                "outline": response,
-                "doc_type": doc_type,
-                "audience": audience,
-                "content_to_document": content_to_document,
-            },
-            input_tokens,
-            output_tokens,
-        )
+        result = {
+            "outline": response,
+            "doc_type": doc_type,
+            "audience": audience,
+            "content_to_document": content_to_document,
+        }
+        if self.parallel_chunks:
+            # Compact context shared by all parallel writers (see _write_chunked_parallel)
+            result["shared_context"] = self._build_shared_context(
+                response,
+                self._parse_outline_sections(response),
+                content_to_document,
+            )
+
+        return (result, input_tokens, output_tokens)
 
     def _parse_outline_sections(self, outline: str) -> list[str]:
         """Parse top-level section titles from the outline.
@@ -345,6 +358,16 @@ Generate an outline that covers all these aspects comprehensively."""
             and not self.section_focus  # Don't chunk if already focused
         )
 
+        if use_chunking and self.parallel_chunks:
+            return await self._write_chunked_parallel(
+                sections,
+                outline,
+                doc_type,
+                audience,
+                content_to_document,
+                tier,
+                shared_context=input_data.get("shared_context"),
+            )
         if use_chunking:
             return await self._write_chunked(
                 sections,
@@ -31,6 +31,7 @@ Expected attributes on the host class:
     _enable_coordination (bool): Coordination flag
     _agent_id (str | None): Agent identifier
     _telemetry_backend: Telemetry backend
+    _context_packing (dict): Packed-context token stats per stage
 
     Inherited methods:
     _maybe_setup_cache(): From CachingMixin
@@ -46,6 +47,8 @@ Expected attributes on the host class:
     _generate_cost_report(): From CostTrackingMixin
     _get_tier_with_routing(stage, data, budget): From TierRoutingMixin
     _get_heartbeat_coordinator(): From CoordinationMixin
+    _batch_prepare_run(): From BatchModeMixin
+    _batch_stage(stage_name): From BatchModeMixin
 
 Copyright 2025 Smart-AI-Memory
 Licensed under the Apache License, Version 2.0
@@ -104,6 +107,9 @@ class ExecutionMixin:
         # Record workflow start in state store (Phase 4 - state persistence)
         self._state_record_workflow_start()
 
+        # Resume Message Batches recorded in the last checkpoint (batch mode)
+        self._batch_prepare_run()
+
         # Log task routing (Tier 1 automation monitoring)
         routing_id = f"routing-{self._run_id}"
         routing_record = TaskRoutingRecord(
@@ -171,6 +177,7 @@ class ExecutionMixin:
 
         started_at = datetime.now()
         self._stages_run = []
+        self._context_packing = {}
         current_data = kwargs
         error = None
 
@@ -338,11 +345,12 @@ class ExecutionMixin:
 
                 try:
                     # Run the stage at current tier
-                    output, input_tokens, output_tokens = await self.run_stage(
-                        stage_name,
-                        tier,
-                        current_data,
-                    )
+                    with self._batch_stage(stage_name):
+                        output, input_tokens, output_tokens = await self.run_stage(
+                            stage_name,
+                            tier,
+                            current_data,
+                        )
 
                     stage_end = datetime.now()
                     duration_ms = int((stage_end - stage_start).total_seconds() * 1000)
@@ -516,11 +524,12 @@ class ExecutionMixin:
             self._state_record_stage_start(stage_name)
 
             # Run the stage
-            output, input_tokens, output_tokens = await self.run_stage(
-                stage_name,
-                tier,
-                current_data,
-            )
+            with self._batch_stage(stage_name):
+                output, input_tokens, output_tokens = await self.run_stage(
+                    stage_name,
+                    tier,
+                    current_data,
+                )
 
             stage_end = datetime.now()
             duration_ms = int((stage_end - stage_start).total_seconds() * 1000)
@@ -648,6 +657,8 @@ class ExecutionMixin:
             error_type=error_type,
             transient=transient,
         )
+        if self._context_packing:
+            result.metadata["context_packing"] = self._context_packing
 
         # Report workflow completion to progress tracker
         if self._progress_tracker and error is None:
@@ -25,6 +25,7 @@ from typing import TYPE_CHECKING, Any
 from attune.models import (
     ExecutionContext,
     LLMExecutor,
+    PromptLayout,
 )
 
 if TYPE_CHECKING:
@@ -128,7 +129,7 @@ class ExecutorMixin:
         self,
         step: WorkflowStepConfig,
         prompt: str,
-        system: str | None = None,
+        system: str | PromptLayout | None = None,
         **kwargs: Any,
     ) -> tuple[str, int, int, float]:
         """Run a workflow step using the LLMExecutor.
@@ -140,7 +141,7 @@ class ExecutorMixin:
         Args:
             step: WorkflowStepConfig defining the step
             prompt: The prompt to send
-            system: Optional system prompt
+            system: Optional system prompt or cache-aware PromptLayout
             **kwargs: Additional arguments passed to executor
 
         Returns:
@@ -176,6 +177,8 @@ class ExecutorMixin:
             cost=response.cost_estimate,
             latency_ms=latency_ms,
             success=True,
+            cache_creation_input_tokens=response.metadata.get("cache_creation_tokens", 0),
+            cache_read_input_tokens=response.metadata.get("cache_read_tokens", 0),
         )
 
         return (
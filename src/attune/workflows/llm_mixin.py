@@ -17,6 +17,8 @@ Expected attributes on the host class:
     _get_cache_type(): Get cache type string (from CachingMixin)
     _calculate_cost(tier, in_tokens, out_tokens): Cost calc (from CostTrackingMixin)
     _track_telemetry(...): Telemetry tracking (from TelemetryMixin)
+    _batch_stage_active(): Whether to batch the call (from BatchModeMixin)
+    _run_batched_call(...): Batched LLM call (from BatchModeMixin)
 
 Copyright 2025 Smart-AI-Memory
 Licensed under the Apache License, Version 2.0
@@ -29,6 +31,8 @@ import time
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from attune.models.prompt_layout import PromptLayout
+
     from .compat import ModelTier
 
 logger = logging.getLogger(__name__)
@@ -54,7 +58,7 @@ class LLMMixin:
     async def _call_llm(
         self,
         tier: ModelTier,
-        system: str,
+        system: str | PromptLayout,
         user_message: str,
         max_tokens: int = 4096,
         stage_name: str | None = None,
@@ -69,7 +73,8 @@ class LLMMixin:
 
         Args:
             tier: Model tier to use (CHEAP, CAPABLE, PREMIUM)
-            system: System prompt
+            system: System prompt, or a PromptLayout to let Anthropic cache its
+                stable prefix (see ``_build_prompt_layout``)
             user_message: User message/prompt
             max_tokens: Maximum tokens in response
             stage_name: Optional stage name for cache key (defaults to tier)
@@ -88,9 +93,16 @@ class LLMMixin:
         stage = stage_name or f"llm_call_{tier.value}"
         model = self.get_model_for_tier(tier)
         cache_type = None
+        system_text = str(system)
 
         # Try cache lookup using CachingMixin
-        cached = self._try_cache_lookup(stage, system, user_message, model)
+        cached = self._try_cache_lookup(stage, system_text, user_message, model)
+        owns_lease = False
+        if cached is None:
+            # Single-flight: wait if another caller is computing this response
+            cached, owns_lease = await self._await_cache_fill(
+                stage, system_text, user_message, model
+            )
         if cached is not None:
             # Track telemetry for cache hit
             duration_ms = int((time.time() - start_time) * 1000)
@@ -120,11 +132,17 @@ class LLMMixin:
         )
 
         try:
-            content, in_tokens, out_tokens, cost = await self.run_step_with_executor(
-                step=step,
-                prompt=user_message,
-                system=system,
-            )
+            if self._batch_stage_active():
+                # Batchable stage in batch mode: offload to Message Batches
+                content, in_tokens, out_tokens, cost = await self._run_batched_call(
+                    tier, model, system, user_message, max_tokens
+                )
+            else:
+                content, in_tokens, out_tokens, cost = await self.run_step_with_executor(
+                    step=step,
+                    prompt=user_message,
+                    system=system,
+                )
 
             # Calculate duration
             duration_ms = int((time.time() - start_time) * 1000)
@@ -144,7 +162,7 @@ class LLMMixin:
             # Store in cache using CachingMixin
             self._store_in_cache(
                 stage,
-                system,
+                system_text,
                 user_message,
                 model,
                 CachedResponse(content=content, input_tokens=in_tokens, output_tokens=out_tokens),
@@ -167,6 +185,10 @@ class LLMMixin:
             # INTENTIONAL: Graceful degradation - return error message rather than crashing workflow
             logger.exception(f"Unexpected error calling LLM: {e}")
             return f"Error calling LLM: {type(e).__name__}", 0, 0
+        finally:
+            if owns_lease:
+                # No-op after a successful store; frees waiters if the call failed
+                self._release_cache_lease(stage, system_text, user_message, model)
 
     def should_skip_stage(self, stage_name: str, input_data: Any) -> tuple[bool, str | None]:
         """Determine if a stage should be skipped.
@@ -3,6 +3,26 @@
 Real-time progress streaming for workflow execution.
 Enables live UI updates in VS Code and other clients.
 
+Wire protocol (server -> client):
+    {"type": "connected", ...}
+        Sent once on connect.
+    {"type": "snapshot", "seq": N, "workflows": {workflow_id: state}}
+        Full state of every known workflow. Sent on (re)connect, when a
+        client asks for one, and when a client fell too far behind.
+    {"type": "progress_delta", "seq": N, "updates": [entry, ...]}
+        Coalesced frame. Each entry is ``{"workflow_id", "full": state}``
+        for a workflow the client has not seen yet, or
+        ``{"workflow_id", "changes": {...}, "stages": {index: {...}}}``
+        holding only the fields that changed since the last state
+        delivered to that client. ``apply_delta`` rebuilds the state.
+
+Clients may send ``{"type": "snapshot"}`` to resynchronize at any time.
+
+Every client has its own bounded queue drained by its own sender task, so
+a slow client only delays itself. Updates for the same workflow/stage
+that arrive before the next frame replace each other, and frames are
+sent at most ``frame_rate`` times per second.
+
 Copyright 2025 Smart AI Memory, LLC
 Licensed under the Apache License, Version 2.0
 """
@@ -13,6 +33,7 @@ import asyncio
 import json
 import logging
 import signal
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from typing import Any
@@ -38,8 +59,15 @@ try:
 except ImportError:
     pass
 
+# Exceptions that mean a client has gone away
+CONNECTION_CLOSED: tuple[type[BaseException], ...] = (ConnectionError,)
+if WEBSOCKETS_AVAILABLE:
+    CONNECTION_CLOSED = (websockets.exceptions.ConnectionClosed, ConnectionError)
+
 logger = logging.getLogger(__name__)
 
+ENTRY_CACHE_SIZE = 4096  # Encoded delta entries shared across clients
+
 
 @dataclass
 class ProgressServerConfig:
@@ -50,6 +78,292 @@ class ProgressServerConfig:
     ping_interval: float = 20.0
     ping_timeout: float = 20.0
     max_connections: int = 100
+    frame_rate: float = 10.0  # Max frames/sec per client (0 = send as fast as drained)
+    max_pending_updates: int = 256  # Distinct workflow/stage updates queued per client
+
+
+def diff_state(base: dict[str, Any] | None, state: dict[str, Any]) -> dict[str, Any]:
+    """Encode ``state`` as a delta entry against ``base``.
+
+    Args:
+        base: Last workflow state delivered to the client, or None
+        state: Current workflow state (``ProgressUpdate.to_dict()``)
+
+    Returns:
+        Delta entry understood by ``apply_delta``
+
+    """
+    workflow_id = state["workflow_id"]
+    if base is None or len(base.get("stages", [])) != len(state.get("stages", [])):
+        return {"workflow_id": workflow_id, "full": state}
+
+    changes = {
+        key: value for key, value in state.items() if key != "stages" and base.get(key) != value
+    }
+    stages = {}
+    for index, (old, new) in enumerate(zip(base["stages"], state["stages"], strict=True)):
+        if old != new:
+            stages[str(index)] = {key: value for key, value in new.items() if old.get(key) != value}
+
+    entry: dict[str, Any] = {"workflow_id": workflow_id, "changes": changes}
+    if stages:
+        entry["stages"] = stages
+    return entry
+
+
+def apply_delta(base: dict[str, Any] | None, entry: dict[str, Any]) -> dict[str, Any]:
+    """Rebuild a workflow state from a delta entry (client-side helper).
+
+    Args:
+        base: Previously reconstructed state for the workflow, or None
+        entry: Entry from a ``progress_delta`` frame
+
+    Returns:
+        The reconstructed workflow state
+
+    Raises:
+        ValueError: If the entry is a delta but no base state is known
+
+    """
+    if "full" in entry:
+        return entry["full"]
+    if base is None:
+        raise ValueError(f"No base state for workflow {entry['workflow_id']}")
+
+    state = {**base, **entry["changes"]}
+    stages = list(base.get("stages", []))
+    for index, changes in entry.get("stages", {}).items():
+        stages[int(index)] = {**stages[int(index)], **changes}
+    state["stages"] = stages
+    return state
+
+
+class ClientChannel:
+    """Per-client bounded queue with coalescing and a rate-limited sender.
+
+    Pending updates are keyed by (workflow_id, stage); a newer update for
+    the same key replaces the queued one. When the queue is full, the
+    oldest queued update of the same workflow is dropped (the newer state
+    supersedes it); if there is none, the queue is discarded and the
+    client gets a snapshot instead.
+
+    Args:
+        websocket: Connection with an async ``send(str)`` method
+        broadcaster: Owning broadcaster (source of snapshots)
+        frame_rate: Max frames per second (0 = no rate limit)
+        max_pending: Max distinct queued updates
+
+    """
+
+    def __init__(
+        self,
+        websocket: Any,
+        broadcaster: ProgressBroadcaster,
+        frame_rate: float,
+        max_pending: int,
+    ):
+        self.websocket = websocket
+        self.frame_interval = 1.0 / frame_rate if frame_rate > 0 else 0.0
+        self.max_pending = max_pending
+        self.frames_sent = 0
+        self.snapshots_sent = 0
+        self.updates_merged = 0
+        self.updates_dropped = 0
+        self._broadcaster = broadcaster
+        self._pending: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._pending_seq = 0
+        self._baselines: dict[str, dict[str, Any]] = {}
+        self._needs_snapshot = True  # Every (re)connect starts from a snapshot
+        self._ready = asyncio.Event()
+        self._ready.set()
+        self._sending = False
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of updates waiting for the next frame."""
+        return len(self._pending)
+
+    @property
+    def flushed(self) -> bool:
+        """Whether everything queued so far has been delivered."""
+        return not (self._pending or self._needs_snapshot or self._sending)
+
+    def start(self) -> None:
+        """Start the sender task on the running loop."""
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the sender task."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def offer(self, key: tuple[str, str], state: dict[str, Any], seq: int) -> None:
+        """Queue an update without blocking the publisher."""
+        self._pending_seq = seq
+        self._ready.set()
+        if self._needs_snapshot:
+            return  # The snapshot will carry the latest state
+
+        if key in self._pending:
+            self.updates_merged += 1
+            del self._pending[key]
+        elif len(self._pending) >= self.max_pending:
+            superseded = next((k for k in self._pending if k[0] == key[0]), None)
+            if superseded is None:
+                self.updates_dropped += len(self._pending)
+                self.request_snapshot()
+                return
+            del self._pending[superseded]
+            self.updates_dropped += 1
+        self._pending[key] = state
+
+    def request_snapshot(self) -> None:
+        """Replace queued updates with a full snapshot on the next frame."""
+        self._needs_snapshot = True
+        self._pending.clear()
+        self._ready.set()
+
+    def forget(self, workflow_id: str) -> None:
+        """Drop the delivered baseline for a removed workflow."""
+        self._baselines.pop(workflow_id, None)
+
+    def _build_frame(self) -> str | None:
+        if self._needs_snapshot:
+            self._needs_snapshot = False
+            self._pending.clear()
+            seq, workflows = self._broadcaster.snapshot()
+            self._baselines = dict(workflows)
+            self.snapshots_sent += 1
+            return json.dumps({"type": "snapshot", "seq": seq, "workflows": workflows})
+
+        if not self._pending:
+            return None
+
+        updates = []
+        for (workflow_id, _stage), state in self._pending.items():
+            updates.append(self._broadcaster.encode_entry(self._baselines.get(workflow_id), state))
+            self._baselines[workflow_id] = state
+        self._pending.clear()
+        return (
+            f'{{"type": "progress_delta", "seq": {self._pending_seq}, '
+            f'"updates": [{", ".join(updates)}]}}'
+        )
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            started = loop.time()
+
+            message = self._build_frame()
+            if message is not None:
+                self._sending = True
+                try:
+                    await self.websocket.send(message)
+                except CONNECTION_CLOSED:
+                    self._broadcaster.discard(self.websocket)
+                    return
+                finally:
+                    self._sending = False
+                self.frames_sent += 1
+
+            if self.frame_interval:
+                await asyncio.sleep(max(0.0, started + self.frame_interval - loop.time()))
+
+
+class ProgressBroadcaster:
+    """Fan-out of progress updates to many clients without back-pressure.
+
+    Holds the latest state of every workflow and one ``ClientChannel`` per
+    connection. ``publish`` only records state and marks channels dirty; it
+    never awaits a client.
+
+    Args:
+        frame_rate: Max frames per second per client
+        max_pending: Max distinct queued updates per client
+
+    """
+
+    def __init__(self, frame_rate: float = 10.0, max_pending: int = 256):
+        self.frame_rate = frame_rate
+        self.max_pending = max_pending
+        self.seq = 0
+        self._state: dict[str, dict[str, Any]] = {}
+        self._channels: dict[Any, ClientChannel] = {}
+        # (id(base), id(state)) -> (base, state, encoded entry); clients that
+        # were sent the same baseline share one diff and one encoding.
+        self._entry_cache: dict[tuple[int, int], tuple[Any, Any, str]] = {}
+
+    @property
+    def channels(self) -> list[ClientChannel]:
+        """Channels of the connected clients."""
+        return list(self._channels.values())
+
+    def add_client(self, websocket: Any) -> ClientChannel:
+        """Register a connection; its first frame is a snapshot."""
+        channel = ClientChannel(websocket, self, self.frame_rate, self.max_pending)
+        self._channels[websocket] = channel
+        channel.start()
+        return channel
+
+    def get_channel(self, websocket: Any) -> ClientChannel | None:
+        """Get the channel for a connection."""
+        return self._channels.get(websocket)
+
+    def discard(self, websocket: Any) -> ClientChannel | None:
+        """Unregister a connection without waiting for its sender."""
+        return self._channels.pop(websocket, None)
+
+    async def remove_client(self, websocket: Any) -> None:
+        """Unregister a connection and stop its sender."""
+        channel = self.discard(websocket)
+        if channel is not None:
+            await channel.close()
+
+    async def close(self) -> None:
+        """Stop all senders."""
+        channels = list(self._channels.values())
+        self._channels.clear()
+        await asyncio.gather(*[channel.close() for channel in channels], return_exceptions=True)
+
+    def publish(self, update: ProgressUpdate) -> None:
+        """Record an update and queue it for every client.
+
+        Must be called on the event loop thread.
+        """
+        state = update.to_dict()
+        self.seq += 1
+        self._state[update.workflow_id] = state
+        key = (update.workflow_id, update.current_stage)
+        for channel in self._channels.values():
+            channel.offer(key, state, self.seq)
+
+    def encode_entry(self, base: dict[str, Any] | None, state: dict[str, Any]) -> str:
+        """Encode the delta from ``base`` to ``state`` as JSON, once per pair."""
+        key = (id(base), id(state))
+        cached = self._entry_cache.get(key)
+        if cached is not None and cached[0] is base and cached[1] is state:
+            return cached[2]
+
+        encoded = json.dumps(diff_state(base, state))
+        if len(self._entry_cache) >= ENTRY_CACHE_SIZE:
+            self._entry_cache.clear()
+        self._entry_cache[key] = (base, state, encoded)
+        return encoded
+
+    def forget(self, workflow_id: str) -> None:
+        """Drop a finished workflow from the state and client baselines."""
+        self._state.pop(workflow_id, None)
+        for channel in self._channels.values():
+            channel.forget(workflow_id)
+
+    def snapshot(self) -> tuple[int, dict[str, dict[str, Any]]]:
+        """Get the current sequence number and state of every workflow."""
+        return self.seq, dict(self._state)
 
 
 class ProgressServer:
@@ -71,10 +385,16 @@ class ProgressServer:
         self._server: Any = None
         self._running = False
         self._trackers: dict[str, ProgressTracker] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._broadcaster = ProgressBroadcaster(
+            frame_rate=self.config.frame_rate,
+            max_pending=self.config.max_pending_updates,
+        )
 
     async def start(self) -> None:
         """Start the WebSocket server."""
         self._running = True
+        self._loop = asyncio.get_running_loop()
 
         self._server = await websockets.serve(
             self._handle_connection,
@@ -89,6 +409,7 @@ class ProgressServer:
     async def stop(self) -> None:
         """Stop the WebSocket server."""
         self._running = False
+        await self._broadcaster.close()
 
         # Close all client connections
         if self._clients:
@@ -127,6 +448,9 @@ class ProgressServer:
                 ),
             )
 
+            # First frame from the channel is a snapshot of all workflows
+            self._broadcaster.add_client(websocket)
+
             # Handle incoming messages (subscriptions, etc.)
             async for message in websocket:
                 await self._handle_message(websocket, message)
@@ -135,6 +459,7 @@ class ProgressServer:
             pass
         finally:
             self._clients.discard(websocket)
+            await self._broadcaster.remove_client(websocket)
             logger.debug(f"Client {client_id} disconnected. Total clients: {len(self._clients)}")
 
     async def _handle_message(self, websocket: WebSocketServerProtocol, message: str) -> None:
@@ -155,6 +480,12 @@ class ProgressServer:
                         json.dumps({"type": "subscribed", "workflow_id": workflow_id}),
                     )
 
+            elif msg_type == "snapshot":
+                # Client lost track of state and wants a full resync
+                channel = self._broadcaster.get_channel(websocket)
+                if channel:
+                    channel.request_snapshot()
+
             elif msg_type == "get_status":
                 # Client wants current status of all workflows
                 await websocket.send(
@@ -171,24 +502,12 @@ class ProgressServer:
             await websocket.send(json.dumps({"type": "error", "message": "Invalid JSON"}))
 
     async def broadcast(self, update: ProgressUpdate) -> None:
-        """Broadcast a progress update to all connected clients."""
-        if not self._clients:
-            return
-
-        message = json.dumps({"type": "progress", **update.to_dict()})
+        """Queue a progress update for all connected clients.
 
-        # Broadcast to all clients
-        await asyncio.gather(
-            *[self._send_safe(client, message) for client in self._clients],
-            return_exceptions=True,
-        )
-
-    async def _send_safe(self, client: WebSocketServerProtocol, message: str) -> None:
-        """Send message to client with error handling."""
-        try:
-            await client.send(message)
-        except websockets.exceptions.ConnectionClosed:
-            self._clients.discard(client)
+        Returns immediately; each client's sender coalesces queued updates
+        and delivers them as delta frames at the configured frame rate.
+        """
+        self._broadcaster.publish(update)
 
     def create_tracker(
         self,
@@ -227,6 +546,7 @@ class ProgressServer:
     def remove_tracker(self, workflow_id: str) -> None:
         """Remove a tracker when workflow completes."""
         self._trackers.pop(workflow_id, None)
+        self._broadcaster.forget(workflow_id)
 
     def get_callback(self) -> ProgressCallback:
         """Get a synchronous callback that queues broadcasts.
@@ -235,16 +555,16 @@ class ProgressServer:
         """
 
         def callback(update: ProgressUpdate) -> None:
-            # Schedule broadcast in event loop
             try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    asyncio.create_task(self.broadcast(update))
-                else:
-                    loop.run_until_complete(self.broadcast(update))
+                running = asyncio.get_running_loop()
             except RuntimeError:
-                # No event loop, skip
-                pass
+                running = None
+
+            if self._loop is None or running is self._loop:
+                self._broadcaster.publish(update)
+            elif not self._loop.is_closed():
+                # Called from another thread: hand off to the server loop
+                self._loop.call_soon_threadsafe(self._broadcaster.publish, update)
 
         return callback
 
@@ -8,6 +8,8 @@ Expected attributes on the host class:
     description (str): Workflow description
     stages (list[str]): Stage names
     _config (WorkflowConfig | None): Workflow configuration
+    _context_packer (ContextPacker | None): Lazily created context packer
+    _context_packing (dict): Packed-context token stats per stage
     get_tier_for_stage(stage_name): Returns tier for a stage
     get_model_for_tier(tier): Returns model for a tier
 
@@ -17,10 +19,16 @@ Licensed under the Apache License, Version 2.0
 
 from __future__ import annotations
 
+import logging
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from attune.models.prompt_layout import PromptLayout, Stability
+
 if TYPE_CHECKING:
-    pass
+    from .context_packer import ContextPacker
+
+logger = logging.getLogger(__name__)
 
 
 class PromptMixin:
@@ -31,6 +39,12 @@ class PromptMixin:
     description: str
     stages: list[str]
     _config: Any  # WorkflowConfig | None
+    _context_packer: ContextPacker | None
+    _context_packing: dict[str, dict[str, int]]
+
+    # Token budget for packed code context per stage (see _pack_context)
+    context_budgets: dict[str, int] = {}
+    default_context_budget: int = 2000
 
     def describe(self) -> str:
         """Get a human-readable description of the workflow."""
@@ -54,6 +68,8 @@ class PromptMixin:
         guidelines: list[str] | None = None,
         documentation: str | None = None,
         examples: list[dict[str, str]] | None = None,
+        project_context: str | None = None,
+        context: str | None = None,
     ) -> str:
         """Build system prompt optimized for Anthropic prompt caching.
 
@@ -63,13 +79,16 @@ class PromptMixin:
         - Large context (>1024 tokens)
 
         Structure: Static content goes first (cacheable), dynamic content
-        goes in user messages (not cached).
+        goes in user messages (not cached). See ``_build_prompt_layout`` for
+        the segment order.
 
         Args:
             role: The role for the AI (e.g., "expert code reviewer")
             guidelines: List of static guidelines/rules
             documentation: Static documentation or reference material
             examples: Static examples for few-shot learning
+            project_context: Context shared by every stage of this run
+            context: Per-call data (timestamps, run ids, file details)
 
         Returns:
             System prompt with static content first for optimal caching
@@ -86,41 +105,138 @@ class PromptMixin:
             >>> # This prompt will be cached by Anthropic for 5 minutes
             >>> # Subsequent calls with same prompt read from cache (90% cost reduction)
         """
-        parts = []
+        return self._build_prompt_layout(
+            role, guidelines, documentation, examples, project_context, context
+        ).render()
+
+    def _build_prompt_layout(
+        self,
+        role: str,
+        guidelines: list[str] | None = None,
+        documentation: str | None = None,
+        examples: list[dict[str, str]] | None = None,
+        project_context: str | None = None,
+        context: str | None = None,
+    ) -> PromptLayout:
+        """Build the cached system prompt as an ordered PromptLayout.
+
+        Role, guidelines, documentation, examples and instructions are
+        static; ``project_context`` follows them and ``context`` comes last,
+        so run- and call-specific data never invalidates the cached prefix.
+        Pass the layout itself as ``system`` to ``_call_llm`` to have cache
+        breakpoints placed per segment group.
+
+        Args:
+            role: The role for the AI (e.g., "expert code reviewer")
+            guidelines: List of static guidelines/rules
+            documentation: Static documentation or reference material
+            examples: Static examples for few-shot learning
+            project_context: Context shared by every stage of this run
+            context: Per-call data (timestamps, run ids, file details)
+
+        Returns:
+            PromptLayout ordered from stable to volatile
+        """
+        layout = PromptLayout()
 
         # 1. Role definition (static)
-        parts.append(f"You are a {role}.")
+        layout.add(f"You are a {role}.", Stability.STATIC, "role")
 
         # 2. Guidelines (static - most important for caching)
         if guidelines:
-            parts.append("\n# Guidelines\n")
-            for i, guideline in enumerate(guidelines, 1):
-                parts.append(f"{i}. {guideline}")
+            lines = [f"{i}. {guideline}" for i, guideline in enumerate(guidelines, 1)]
+            layout.add("\n".join(["\n# Guidelines\n", *lines]), Stability.STATIC, "guidelines")
 
         # 3. Documentation (static - good caching candidate)
         if documentation:
-            parts.append("\n# Reference Documentation\n")
-            parts.append(documentation)
+            layout.add(
+                f"\n# Reference Documentation\n\n{documentation}", Stability.STATIC, "documentation"
+            )
 
         # 4. Examples (static - excellent for few-shot learning)
         if examples:
-            parts.append("\n# Examples\n")
+            lines = ["\n# Examples\n"]
             for i, example in enumerate(examples, 1):
-                input_text = example.get("input", "")
-                output_text = example.get("output", "")
-                parts.append(f"\nExample {i}:")
-                parts.append(f"Input: {input_text}")
-                parts.append(f"Output: {output_text}")
+                lines.append(f"\nExample {i}:")
+                lines.append(f"Input: {example.get('input', '')}")
+                lines.append(f"Output: {example.get('output', '')}")
+            layout.add("\n".join(lines), Stability.STATIC, "examples")
 
         # Dynamic content (user-specific context, current task) should go
         # in the user message, NOT in system prompt
-        parts.append(
+        layout.add(
             "\n# Instructions\n"
             "The user will provide the specific task context in their message. "
-            "Apply the above guidelines and reference documentation to their request."
+            "Apply the above guidelines and reference documentation to their request.",
+            Stability.STATIC,
+            "instructions",
         )
 
-        return "\n".join(parts)
+        # Run- and call-specific context goes after everything cacheable
+        layout.add(project_context, Stability.SESSION, "project_context")
+        layout.add(context, Stability.VOLATILE, "context")
+        return layout
+
+    # =========================================================================
+    # Code Context Packing
+    # =========================================================================
+
+    def _get_context_packer(self) -> ContextPacker:
+        """Get the context packer for the current project (created on first use)."""
+        if self._context_packer is None:
+            from .context_packer import ContextPacker
+
+            self._context_packer = ContextPacker(Path.cwd())
+        return self._context_packer
+
+    def _pack_context(
+        self,
+        stage: str,
+        *,
+        source: str | None = None,
+        paths: list[str] | None = None,
+        task: str = "",
+        budget: int | None = None,
+    ) -> str:
+        """Pack code for a prompt into the stage's token budget.
+
+        Symbols are ranked by impact and relevance to ``task`` and rendered as
+        signatures and docstrings instead of bodies where the budget requires.
+        Tokens used and saved are accumulated per stage and reported in the
+        workflow result's ``metadata["context_packing"]``.
+
+        Args:
+            stage: Stage the prompt is for (selects the budget)
+            source: Code, diff or text to pack
+            paths: Files to pack (ignored when ``source`` is given)
+            task: What the prompt asks for, used to rank symbols
+            budget: Token budget overriding ``context_budgets``
+
+        Returns:
+            Packed context text
+        """
+        if budget is None:
+            budget = self.context_budgets.get(stage, self.default_context_budget)
+        packer = self._get_context_packer()
+        if source is not None:
+            packed = packer.pack_source(source, budget, task)
+        else:
+            packed = packer.pack_files(list(paths or []), budget, task)
+
+        stats = self._context_packing.setdefault(
+            stage, {"calls": 0, "tokens": 0, "raw_tokens": 0, "tokens_saved": 0}
+        )
+        stats["calls"] += 1
+        stats["tokens"] += packed.tokens
+        stats["raw_tokens"] += packed.raw_tokens
+        stats["tokens_saved"] += packed.tokens_saved
+        stats["budget"] = budget
+        if packed.tokens_saved:
+            logger.info(
+                f"{self.name}/{stage}: packed context into {packed.tokens}/{budget} tokens "
+                f"({packed.tokens_saved} saved)"
+            )
+        return packed.text
 
     # =========================================================================
     # XML Prompt Integration (Phase 4)
@@ -16,11 +16,14 @@ Licensed under the Apache License, Version 2.0
 import json
 import subprocess
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .base import BaseWorkflow, ModelTier
 from .step_config import WorkflowStepConfig
 
+if TYPE_CHECKING:
+    from attune.agents.release.artifact_bus import ToolOutput
+
 # Define step configurations for executor-based execution
 RELEASE_PREP_STEPS = {
     "approve": WorkflowStepConfig(
@@ -33,6 +36,27 @@ RELEASE_PREP_STEPS = {
 }
 
 
+def _run_check(cmd: list[str], timeout: float, cwd: str = ".") -> "ToolOutput":
+    """Run a check tool, reusing its output from the current artifact bus.
+
+    Inside ``artifact_scope()`` (e.g. SecureReleasePipeline) each command runs
+    once per tree; otherwise it runs directly.
+
+    Raises:
+        FileNotFoundError: If the tool is not installed
+        subprocess.TimeoutExpired: If the tool timed out
+    """
+    from attune.agents.release.artifact_bus import get_artifact_bus, run_tool
+
+    bus = get_artifact_bus()
+    output = bus.run(cmd, cwd, timeout) if bus is not None else run_tool(cmd, cwd, timeout)
+    if output.returncode == -1:
+        raise FileNotFoundError(output.stderr)
+    if output.returncode == -2:
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return output
+
+
 class ReleasePreparationWorkflow(BaseWorkflow):
     """Pre-release quality gate workflow.
 
@@ -195,13 +219,7 @@ class ReleasePreparationWorkflow(BaseWorkflow):
 
         # Lint check (ruff)
         try:
-            result = subprocess.run(
-                ["python", "-m", "ruff", "check", target_path],
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
+            result = _run_check(["python", "-m", "ruff", "check", target_path], timeout=60)
             lint_errors = result.stdout.count("error") + result.stderr.count("error")
             checks["lint"] = {
                 "passed": result.returncode == 0,
@@ -213,12 +231,8 @@ class ReleasePreparationWorkflow(BaseWorkflow):
 
         # Type check (mypy)
         try:
-            result = subprocess.run(
-                ["python", "-m", "mypy", target_path, "--ignore-missing-imports"],
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=120,
+            result = _run_check(
+                ["python", "-m", "mypy", target_path, "--ignore-missing-imports"], timeout=120
             )
             type_errors = result.stdout.count("error:")
             checks["types"] = {
@@ -231,13 +245,8 @@ class ReleasePreparationWorkflow(BaseWorkflow):
 
         # Test check (pytest)
         try:
-            result = subprocess.run(
-                ["python", "-m", "pytest", "--co", "-q"],
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                cwd=target_path,
+            result = _run_check(
+                ["python", "-m", "pytest", "--co", "-q"], timeout=60, cwd=target_path
             )
             # Count collected tests
             test_count = 0
@@ -292,7 +301,7 @@ class ReleasePreparationWorkflow(BaseWorkflow):
 
         # Run Bandit security scanner
         try:
-            result = subprocess.run(
+            result = _run_check(
                 [
                     "python",
                     "-m",
@@ -304,9 +313,6 @@ class ReleasePreparationWorkflow(BaseWorkflow):
                     "--format",
                     "json",
                 ],
-                check=False,
-                capture_output=True,
-                text=True,
                 timeout=120,
             )
 
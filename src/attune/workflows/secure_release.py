@@ -189,88 +189,96 @@ class SecureReleasePipeline:
         warnings: list[str] = []
         recommendations: list[str] = []
 
-        try:
-            # Step 1: SecurityAuditCrew (parallel or first)
-            crew_task = None
-            crew_enabled = self.use_crew and adapters_available and _check_crew_available()
-
-            if crew_enabled:
-                if self.parallel_crew:
-                    # Start crew in parallel
-                    crew_task = asyncio.create_task(_get_crew_audit(path, self.crew_config))
-                else:
-                    # Run crew first, then proceed
-                    crew_report_obj = await _get_crew_audit(path, self.crew_config)
-                    if crew_report_obj:
-                        crew_report = crew_report_to_workflow_format(crew_report_obj)
-
-            # Step 2: SecurityAuditWorkflow
-            from .security_audit import SecurityAuditWorkflow
-
-            security_workflow = SecurityAuditWorkflow(**self.kwargs)
-            security_result = await security_workflow.execute(path=path)
-            total_cost += security_result.cost_report.total_cost
-
-            # Collect crew results if running in parallel
-            if crew_task:
-                try:
-                    crew_report_obj = await asyncio.wait_for(crew_task, timeout=300.0)
-                    if crew_report_obj:
-                        crew_report = crew_report_to_workflow_format(crew_report_obj)
-                except asyncio.TimeoutError:
-                    logger.warning("SecurityAuditCrew timed out")
-                    warnings.append("SecurityAuditCrew timed out - results not included")
-
-            # Step 3: CodeReviewWorkflow (if diff provided)
-            if diff:
-                from .code_review import CodeReviewWorkflow
-
-                code_workflow = CodeReviewWorkflow(**self.kwargs)
-
-                # Pass crew findings as external audit if available
-                code_input: dict = {
-                    "diff": diff,
-                    "files_changed": files_changed or [],
-                }
-                if crew_report:
-                    code_input["external_audit_results"] = crew_report
-
-                code_review_result = await code_workflow.execute(**code_input)
-                total_cost += code_review_result.cost_report.total_cost
-
-            # Step 4: ReleasePreparationWorkflow
-            from .release_prep import ReleasePreparationWorkflow
-
-            release_workflow = ReleasePreparationWorkflow(**self.kwargs)
-            release_result = await release_workflow.execute(path=path, since=since)
-            total_cost += release_result.cost_report.total_cost
-
-            # Aggregate results
-            combined_risk_score = self._calculate_combined_risk(
-                crew_report,
-                security_result,
-                code_review_result,
-                release_result,
-            )
-
-            findings = self._aggregate_findings(crew_report, security_result, code_review_result)
-
-            # Determine go/no-go
-            go_no_go = self._determine_go_no_go(combined_risk_score, findings, release_result)
-
-            blockers, warnings, recommendations = self._generate_recommendations(
-                crew_report,
-                security_result,
-                code_review_result,
-                release_result,
-            )
-
-        except Exception as e:
-            logger.error(f"Secure release pipeline failed: {e}")
-            blockers.append(f"Pipeline failed: {e!s}")
-            go_no_go = "NO_GO"
-            combined_risk_score = 100.0
-            findings = {"critical": 0, "high": 0, "total": 0}
+        # Share tool output (bandit, ruff, pytest) between the composed workflows
+        from attune.agents.release.artifact_bus import artifact_scope
+
+        with artifact_scope() as bus:
+            try:
+                # Step 1: SecurityAuditCrew (parallel or first)
+                crew_task = None
+                crew_enabled = self.use_crew and adapters_available and _check_crew_available()
+
+                if crew_enabled:
+                    if self.parallel_crew:
+                        # Start crew in parallel
+                        crew_task = asyncio.create_task(_get_crew_audit(path, self.crew_config))
+                    else:
+                        # Run crew first, then proceed
+                        crew_report_obj = await _get_crew_audit(path, self.crew_config)
+                        if crew_report_obj:
+                            crew_report = crew_report_to_workflow_format(crew_report_obj)
+
+                # Step 2: SecurityAuditWorkflow
+                from .security_audit import SecurityAuditWorkflow
+
+                security_workflow = SecurityAuditWorkflow(**self.kwargs)
+                security_result = await security_workflow.execute(path=path)
+                total_cost += security_result.cost_report.total_cost
+
+                # Collect crew results if running in parallel
+                if crew_task:
+                    try:
+                        crew_report_obj = await asyncio.wait_for(crew_task, timeout=300.0)
+                        if crew_report_obj:
+                            crew_report = crew_report_to_workflow_format(crew_report_obj)
+                    except asyncio.TimeoutError:
+                        logger.warning("SecurityAuditCrew timed out")
+                        warnings.append("SecurityAuditCrew timed out - results not included")
+
+                # Step 3: CodeReviewWorkflow (if diff provided)
+                if diff:
+                    from .code_review import CodeReviewWorkflow
+
+                    code_workflow = CodeReviewWorkflow(**self.kwargs)
+
+                    # Pass crew findings as external audit if available
+                    code_input: dict = {
+                        "diff": diff,
+                        "files_changed": files_changed or [],
+                    }
+                    if crew_report:
+                        code_input["external_audit_results"] = crew_report
+
+                    code_review_result = await code_workflow.execute(**code_input)
+                    total_cost += code_review_result.cost_report.total_cost
+
+                # Step 4: ReleasePreparationWorkflow
+                from .release_prep import ReleasePreparationWorkflow
+
+                release_workflow = ReleasePreparationWorkflow(**self.kwargs)
+                release_result = await release_workflow.execute(path=path, since=since)
+                total_cost += release_result.cost_report.total_cost
+
+                # Aggregate results
+                combined_risk_score = self._calculate_combined_risk(
+                    crew_report,
+                    security_result,
+                    code_review_result,
+                    release_result,
+                )
+
+                findings = self._aggregate_findings(
+                    crew_report, security_result, code_review_result
+                )
+
+                # Determine go/no-go
+                go_no_go = self._determine_go_no_go(combined_risk_score, findings, release_result)
+
+                blockers, warnings, recommendations = self._generate_recommendations(
+                    crew_report,
+                    security_result,
+                    code_review_result,
+                    release_result,
+                )
+
+            except Exception as e:
+                logger.error(f"Secure release pipeline failed: {e}")
+                blockers.append(f"Pipeline failed: {e!s}")
+                go_no_go = "NO_GO"
+                combined_risk_score = 100.0
+                findings = {"critical": 0, "high": 0, "total": 0}
+
+        logger.info(f"Secure release tool runs: {bus.stats()}")
 
         completed_at = datetime.now()
         duration_ms = int((completed_at - started_at).total_seconds() * 1000)
@@ -169,6 +169,49 @@ class CacheService:
 
         return False
 
+    async def wait_for_fill(
+        self,
+        stage: str,
+        system: str,
+        user_message: str,
+        model: str,
+    ) -> tuple[CachedResponse | None, bool]:
+        """Coordinate with other callers computing the same response.
+
+        Args:
+            stage: Stage name for cache key
+            system: System prompt
+            user_message: User message
+            model: Model ID
+
+        Returns:
+            Tuple of (response stored by another caller or None, whether this
+            caller holds the lease and should release it if it fails)
+        """
+        if not self._enable or not hasattr(self._cache, "acquire_or_wait"):
+            return None, False
+
+        try:
+            full_prompt = self.make_key(system, user_message)
+            cached_data, owns_lease = await self._cache.acquire_or_wait(  # type: ignore[union-attr]
+                self._workflow_name, stage, full_prompt, model
+            )
+            if cached_data is not None:
+                return CachedResponse.from_dict(cached_data), False
+            return None, owns_lease
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Cache fill wait failed (malformed data): {e}")
+        except (OSError, ConnectionError) as e:
+            logger.debug(f"Cache fill wait failed (connection error): {e}")
+
+        return None, False
+
+    def release(self, stage: str, system: str, user_message: str, model: str) -> None:
+        """Release a lease taken by wait_for_fill without storing a response."""
+        if self._cache is None or not hasattr(self._cache, "release"):
+            return
+        self._cache.release(self._workflow_name, stage, self.make_key(system, user_message), model)
+
     def get_cache_type(self) -> str:
         """Get the cache type for telemetry tracking.
 
@@ -11,6 +11,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from attune.models.prompt_layout import PromptLayout, Stability
+
 
 class PromptService:
     """Service for building and rendering prompts.
@@ -62,6 +64,8 @@ class PromptService:
         guidelines: list[str] | None = None,
         documentation: str | None = None,
         examples: list[dict[str, str]] | None = None,
+        project_context: str | None = None,
+        context: str | None = None,
     ) -> str:
         """Build system prompt optimized for Anthropic prompt caching.
 
@@ -72,39 +76,70 @@ class PromptService:
             guidelines: List of static guidelines/rules
             documentation: Static documentation or reference material
             examples: Static examples for few-shot learning
+            project_context: Context shared by every stage of this run
+            context: Per-call data (timestamps, run ids, file details)
 
         Returns:
             System prompt with static content first for optimal caching
         """
-        parts = []
+        return self.build_prompt_layout(
+            role, guidelines, documentation, examples, project_context, context
+        ).render()
+
+    def build_prompt_layout(
+        self,
+        role: str,
+        guidelines: list[str] | None = None,
+        documentation: str | None = None,
+        examples: list[dict[str, str]] | None = None,
+        project_context: str | None = None,
+        context: str | None = None,
+    ) -> PromptLayout:
+        """Build the cached system prompt as a PromptLayout, stable to volatile.
+
+        Args:
+            role: The role for the AI (e.g., "expert code reviewer")
+            guidelines: List of static guidelines/rules
+            documentation: Static documentation or reference material
+            examples: Static examples for few-shot learning
+            project_context: Context shared by every stage of this run
+            context: Per-call data (timestamps, run ids, file details)
+
+        Returns:
+            PromptLayout with static segments first
+        """
+        layout = PromptLayout()
 
-        parts.append(f"You are a {role}.")
+        layout.add(f"You are a {role}.", Stability.STATIC, "role")
 
         if guidelines:
-            parts.append("\n# Guidelines\n")
-            for i, guideline in enumerate(guidelines, 1):
-                parts.append(f"{i}. {guideline}")
+            lines = [f"{i}. {guideline}" for i, guideline in enumerate(guidelines, 1)]
+            layout.add("\n".join(["\n# Guidelines\n", *lines]), Stability.STATIC, "guidelines")
 
         if documentation:
-            parts.append("\n# Reference Documentation\n")
-            parts.append(documentation)
+            layout.add(
+                f"\n# Reference Documentation\n\n{documentation}", Stability.STATIC, "documentation"
+            )
 
         if examples:
-            parts.append("\n# Examples\n")
+            lines = ["\n# Examples\n"]
             for i, example in enumerate(examples, 1):
-                input_text = example.get("input", "")
-                output_text = example.get("output", "")
-                parts.append(f"\nExample {i}:")
-                parts.append(f"Input: {input_text}")
-                parts.append(f"Output: {output_text}")
+                lines.append(f"\nExample {i}:")
+                lines.append(f"Input: {example.get('input', '')}")
+                lines.append(f"Output: {example.get('output', '')}")
+            layout.add("\n".join(lines), Stability.STATIC, "examples")
 
-        parts.append(
+        layout.add(
             "\n# Instructions\n"
             "The user will provide the specific task context in their message. "
-            "Apply the above guidelines and reference documentation to their request."
+            "Apply the above guidelines and reference documentation to their request.",
+            Stability.STATIC,
+            "instructions",
         )
 
-        return "\n".join(parts)
+        layout.add(project_context, Stability.SESSION, "project_context")
+        layout.add(context, Stability.VOLATILE, "context")
+        return layout
 
     def render_xml(
         self,
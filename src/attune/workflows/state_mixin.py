@@ -45,6 +45,7 @@ class StatePersistenceMixin:
     _state_completed_stages: list[str]
     _state_stage_costs: dict[str, float]
     _state_last_output: Any
+    _state_batch_jobs: dict[str, dict[str, Any]]
 
     # ------------------------------------------------------------------
     # Workflow lifecycle
@@ -70,6 +71,7 @@ class StatePersistenceMixin:
             self._state_completed_stages = []
             self._state_stage_costs = {}
             self._state_last_output = None
+            self._state_batch_jobs = {}
             return exec_id
         except Exception as e:  # noqa: BLE001
             # INTENTIONAL: State persistence is best-effort; must not crash workflow
@@ -148,6 +150,7 @@ class StatePersistenceMixin:
                 "stage_costs": dict(getattr(self, "_state_stage_costs", {})),
                 "started_at": datetime.now().isoformat(),
             }
+            self._state_add_batch_jobs(checkpoint)
             self._state_store.save_checkpoint(agent_id, checkpoint)
         except Exception as e:  # noqa: BLE001
             # INTENTIONAL: Best-effort persistence
@@ -184,6 +187,12 @@ class StatePersistenceMixin:
         stage_costs[stage_name] = cost
         self._state_stage_costs = stage_costs
 
+        # Batches of a completed stage no longer need resuming
+        batch_jobs = getattr(self, "_state_batch_jobs", {})
+        self._state_batch_jobs = {
+            batch_id: job for batch_id, job in batch_jobs.items() if job.get("stage") != stage_name
+        }
+
         agent_id = self._agent_id or f"{self.name}-unknown"
 
         try:
@@ -197,6 +206,7 @@ class StatePersistenceMixin:
                 "last_duration_ms": duration_ms,
                 "updated_at": datetime.now().isoformat(),
             }
+            self._state_add_batch_jobs(checkpoint)
             self._state_store.save_checkpoint(agent_id, checkpoint)
         except Exception as e:  # noqa: BLE001
             # INTENTIONAL: Best-effort persistence
@@ -206,6 +216,60 @@ class StatePersistenceMixin:
                 e,
             )
 
+    def _state_record_batch_submitted(
+        self,
+        stage_name: str,
+        batch_id: str,
+        custom_ids: list[str],
+    ) -> None:
+        """Checkpoint a Message Batch submitted on behalf of a stage.
+
+        The batch stays in every checkpoint until the stage completes, so
+        an interrupted run can collect its results instead of resubmitting.
+
+        Args:
+            stage_name: Stage whose requests are in the batch.
+            batch_id: ID of the submitted batch.
+            custom_ids: ``custom_id`` of each request in the batch.
+        """
+        if self._state_store is None:
+            return
+
+        batch_jobs = getattr(self, "_state_batch_jobs", {})
+        batch_jobs[batch_id] = {
+            "stage": stage_name,
+            "custom_ids": list(custom_ids),
+            "submitted_at": datetime.now().isoformat(),
+        }
+        self._state_batch_jobs = batch_jobs
+
+        agent_id = self._agent_id or f"{self.name}-unknown"
+
+        try:
+            checkpoint = {
+                "workflow_name": self.name,
+                "run_id": self._run_id,
+                "current_stage": stage_name,
+                "completed_stages": list(getattr(self, "_state_completed_stages", [])),
+                "stage_costs": dict(getattr(self, "_state_stage_costs", {})),
+                "updated_at": datetime.now().isoformat(),
+            }
+            self._state_add_batch_jobs(checkpoint)
+            self._state_store.save_checkpoint(agent_id, checkpoint)
+        except Exception as e:  # noqa: BLE001
+            # INTENTIONAL: Best-effort persistence
+            logger.debug(
+                "State persistence: failed to save batch checkpoint for %s: %s",
+                batch_id,
+                e,
+            )
+
+    def _state_add_batch_jobs(self, checkpoint: dict[str, Any]) -> None:
+        """Add pending Message Batches to a checkpoint, if there are any."""
+        batch_jobs = getattr(self, "_state_batch_jobs", {})
+        if batch_jobs:
+            checkpoint["batch_jobs"] = {batch_id: dict(job) for batch_id, job in batch_jobs.items()}
+
     # ------------------------------------------------------------------
     # Recovery helpers
     # ------------------------------------------------------------------
@@ -150,6 +150,8 @@ class TelemetryMixin:
         success: bool = True,
         error_message: str | None = None,
         fallback_used: bool = False,
+        cache_creation_input_tokens: int = 0,
+        cache_read_input_tokens: int = 0,
     ) -> None:
         """Emit an LLMCallRecord to the telemetry backend.
 
@@ -165,6 +167,8 @@ class TelemetryMixin:
             success: Whether the call succeeded
             error_message: Error message if failed
             fallback_used: Whether fallback was used
+            cache_creation_input_tokens: Prompt tokens written to the provider cache
+            cache_read_input_tokens: Prompt tokens read from the provider cache
         """
         from attune.models import LLMCallRecord
 
@@ -179,6 +183,8 @@ class TelemetryMixin:
             model_id=model_id,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            cache_creation_input_tokens=cache_creation_input_tokens,
+            cache_read_input_tokens=cache_read_input_tokens,
             estimated_cost=cost,
             latency_ms=latency_ms,
             success=success,
@@ -24,6 +24,7 @@ from pathlib import Path
 from typing import Any
 
 from ..config import _validate_file_path
+from ..models.scheduler import Priority, llm_priority
 from ..workflows.base import BaseWorkflow, ModelTier, WorkflowResult, WorkflowStage
 
 
@@ -40,6 +41,9 @@ class TestGenerationTask:
 class ParallelTestGenerationWorkflow(BaseWorkflow):
     """Generate and complete behavioral tests in parallel using multi-tier LLMs."""
 
+    # Token budget for the module source placed in completion prompts
+    context_budgets = {"complete_tests": 3000}
+
     def __init__(self):
         super().__init__(
             name="parallel-test-generation",
@@ -173,14 +177,18 @@ Output ONLY the Python code, no explanations."""
         return result.get("content", "")
 
     async def complete_test_with_ai(self, template: str, module_path: str) -> str:
-        """Complete test implementation using capable tier AI."""
-        source_code = Path(module_path).read_text()
+        """Complete test implementation using capable tier AI.
+
+        The module source is packed into the ``complete_tests`` token budget,
+        keeping full bodies of the symbols the template tests.
+        """
+        source_code = self._pack_context("complete_tests", paths=[module_path], task=template)
 
         prompt = f"""Complete this behavioral test implementation.
 
 MODULE SOURCE CODE:
 ```python
-{source_code[:5000]}  # First 5000 chars
+{source_code}
 ```
 
 TEST TEMPLATE:
@@ -207,7 +215,17 @@ Output the COMPLETE test file, no TODOs remaining."""
     async def process_module_batch(
         self, modules: list[tuple[str, float]], output_dir: Path, batch_size: int = 10
     ) -> list[TestGenerationTask]:
-        """Process modules in parallel batches."""
+        """Process modules in parallel batches.
+
+        LLM calls run at batch priority, so the shared LLM scheduler admits
+        interactive calls ahead of them and paces them to the rate limits.
+        """
+        with llm_priority(Priority.BATCH):
+            return await self._process_module_batch(modules, output_dir, batch_size)
+
+    async def _process_module_batch(
+        self, modules: list[tuple[str, float]], output_dir: Path, batch_size: int
+    ) -> list[TestGenerationTask]:
         tasks = []
 
         # Create tasks
@@ -0,0 +1,321 @@
+"""Test Impact Selection for Tier 1 Test Tracking.
+
+Selects the tests affected by a set of changed files using the ProjectIndex
+dependency graph, instead of running the whole suite for every change:
+
+1. Walk ``imported_by`` edges transitively from each changed source file
+2. Collect test files reached by the walk plus the source->test mapping
+   built by the scanner (``FileRecord.test_file_path``)
+3. Order tests by past failure rate from ``FileTestRecord`` history, so
+   likely failures surface first
+4. Split the ordered list round-robin into shards for parallel CI jobs
+
+When the index cannot be trusted (missing, or files outside the change set
+modified or deleted since it was generated), or when a change touches shared
+test configuration, the plan falls back to the full suite.
+
+Copyright 2025 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+import logging
+import subprocess
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from attune.models import get_telemetry_store
+
+if TYPE_CHECKING:
+    from attune.project_index import ProjectIndex
+
+logger = logging.getLogger(__name__)
+
+# Changes to these files can affect any test
+FULL_SUITE_TRIGGERS = frozenset(
+    {"conftest.py", "pyproject.toml", "setup.cfg", "setup.py", "pytest.ini", "tox.ini"}
+)
+
+
+@dataclass
+class TestImpactPlan:
+    """Tests selected for a change set.
+
+    Attributes:
+        changed_files: Changed files the plan was computed from
+        test_files: Selected test files for this shard, most failure-prone first
+        affected_sources: Source files transitively affected by the change
+        full_suite: True when the plan fell back to the full suite
+        reason: Why the full suite was selected (empty for impact runs)
+        shard_index: Zero-based shard this plan covers
+        shard_count: Total number of shards
+        total_selected: Selected test files across all shards
+    """
+
+    __test__ = False  # Not a pytest test class
+
+    changed_files: list[str]
+    test_files: list[str] = field(default_factory=list)
+    affected_sources: list[str] = field(default_factory=list)
+    full_suite: bool = False
+    reason: str = ""
+    shard_index: int = 0
+    shard_count: int = 1
+    total_selected: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "changed_files": self.changed_files,
+            "test_files": self.test_files,
+            "affected_sources": self.affected_sources,
+            "full_suite": self.full_suite,
+            "reason": self.reason,
+            "shard_index": self.shard_index,
+            "shard_count": self.shard_count,
+            "total_selected": self.total_selected,
+        }
+
+
+def select_impacted_tests(
+    changed_files: list[str],
+    project_root: str = ".",
+    index: "ProjectIndex | None" = None,
+    test_dir: str | None = None,
+    shard_index: int = 0,
+    shard_count: int = 1,
+) -> TestImpactPlan:
+    """Select the tests affected by changed files.
+
+    Args:
+        changed_files: Paths of changed files, relative to project_root
+        project_root: Project root directory
+        index: Loaded ProjectIndex (loaded from project_root if not provided)
+        test_dir: Only select tests under this directory (e.g. "tests/unit")
+        shard_index: Zero-based shard to return
+        shard_count: Total number of shards
+
+    Returns:
+        TestImpactPlan for the requested shard
+
+    Raises:
+        ValueError: If shard_count < 1 or shard_index is out of range
+
+    Example:
+        >>> from attune.workflows.test_impact import select_impacted_tests
+        >>> plan = select_impacted_tests(["src/attune/config.py"])
+        >>> print(plan.test_files)
+
+    """
+    if shard_count < 1:
+        raise ValueError(f"shard_count must be >= 1, got {shard_count}")
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"shard_index must be in [0, {shard_count}), got {shard_index}")
+
+    root = Path(project_root)
+    changed = sorted({_normalize(path) for path in changed_files})
+    plan = TestImpactPlan(changed_files=changed, shard_index=shard_index, shard_count=shard_count)
+
+    if index is None:
+        from attune.project_index import ProjectIndex
+
+        index = ProjectIndex(str(root))
+        if not index.load():
+            index = None
+
+    reason = _full_suite_reason(changed, root, index)
+    if reason:
+        logger.info(f"Test impact: running full suite ({reason})")
+        plan.full_suite = True
+        plan.reason = reason
+        selected = _all_test_files(root, index.config.test_dir if index else "tests")
+    else:
+        assert index is not None  # Guaranteed by _full_suite_reason
+        selected, plan.affected_sources = _affected_tests(changed, index)
+
+    if test_dir:
+        prefix = _normalize(test_dir).rstrip("/") + "/"
+        selected = [path for path in selected if path.startswith(prefix)]
+
+    ordered = order_by_failure_rate(selected)
+    plan.total_selected = len(ordered)
+    plan.test_files = ordered[shard_index::shard_count]
+    return plan
+
+
+def order_by_failure_rate(test_files: list[str]) -> list[str]:
+    """Order test files by historical failure rate, highest first.
+
+    Failure rates come from ``FileTestRecord`` history. Files without history
+    keep their relative (path) order after files with recorded failures.
+
+    Args:
+        test_files: Test file paths
+
+    Returns:
+        Reordered list of test files
+    """
+    rates = get_failure_rates()
+    return sorted(sorted(set(test_files)), key=lambda path: -rates.get(path, 0.0))
+
+
+def get_failure_rates(limit: int = 100000) -> dict[str, float]:
+    """Compute per-test-file failure rates from FileTestRecord history.
+
+    Args:
+        limit: Maximum history records to read
+
+    Returns:
+        Mapping of test file path to failed runs / total runs
+    """
+    try:
+        records = get_telemetry_store().get_file_tests(limit=limit)
+    except Exception as e:
+        logger.warning(f"Failed to read file test history: {e}")
+        return {}
+
+    runs: dict[str, int] = {}
+    failures: dict[str, int] = {}
+    for record in records:
+        if not record.test_file_path or record.last_test_result in ("no_tests", "skipped"):
+            continue
+        path = _normalize(record.test_file_path)
+        runs[path] = runs.get(path, 0) + 1
+        if record.last_test_result in ("failed", "error"):
+            failures[path] = failures.get(path, 0) + 1
+
+    return {path: failures.get(path, 0) / count for path, count in runs.items()}
+
+
+def get_changed_files(project_root: str = ".", base_ref: str = "HEAD") -> list[str]:
+    """List files changed relative to a git ref, including untracked files.
+
+    Args:
+        project_root: Project root directory (inside a git repository)
+        base_ref: Git ref to diff against
+
+    Returns:
+        Changed file paths relative to project_root
+
+    Raises:
+        RuntimeError: If git fails (e.g. not a git repository)
+    """
+    try:
+        modified = subprocess.run(
+            ["git", "diff", "--name-only", "--relative", base_ref],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        untracked = subprocess.run(
+            ["git", "ls-files", "--others", "--exclude-standard"],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        raise RuntimeError(f"Failed to list changed files: {e}") from e
+
+    lines = modified.stdout.splitlines() + untracked.stdout.splitlines()
+    return sorted({line.strip() for line in lines if line.strip()})
+
+
+# Helper functions
+
+
+def _normalize(path: str) -> str:
+    """Normalize a relative path to the index's forward-slash form."""
+    normalized = path.replace("\\", "/")
+    while normalized.startswith("./"):
+        normalized = normalized[2:]
+    return normalized
+
+
+def _is_test_path(path: str) -> bool:
+    """Check if a relative path is a pytest test module."""
+    name = Path(path).name
+    return name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py"))
+
+
+def _full_suite_reason(changed: list[str], root: Path, index: "ProjectIndex | None") -> str:
+    """Return why the dependency graph cannot be used, or "" if it can."""
+    if index is None or index.generated_at is None:
+        return "no project index"
+
+    for path in changed:
+        if Path(path).name in FULL_SUITE_TRIGGERS:
+            return f"shared test configuration changed: {path}"
+        if path.endswith(".py") and not _is_test_path(path):
+            if index.get_file(path) is None and (root / path).exists():
+                return f"file not in project index: {path}"
+
+    # Edges out of unchanged files must still match the tree
+    changed_set = set(changed)
+    generated_at = index.generated_at.timestamp()
+    for record in index.iter_all_files():
+        if record.path in changed_set or record.language != "python":
+            continue
+        try:
+            if (root / record.path).stat().st_mtime > generated_at:
+                return f"index older than {record.path}"
+        except OSError:
+            return f"indexed file removed: {record.path}"
+
+    return ""
+
+
+def _affected_tests(changed: list[str], index: "ProjectIndex") -> tuple[list[str], list[str]]:
+    """Walk imported_by edges from the changed files.
+
+    Returns:
+        Tuple of (test files, affected source files)
+    """
+    tests: set[str] = set()
+    sources: set[str] = set()
+    seen: set[str] = set()
+    queue: deque[str] = deque()
+
+    for path in changed:
+        if _is_test_path(path):
+            if index.get_file(path) is not None or (index.project_root / path).exists():
+                tests.add(path)
+        elif index.get_file(path) is not None:
+            seen.add(path)
+            queue.append(path)
+
+    while queue:
+        path = queue.popleft()
+        if _is_test_path(path):
+            tests.add(path)
+            continue
+
+        record = index.get_file(path)
+        if record is None:
+            continue
+        sources.add(path)
+        if record.test_file_path:
+            tests.add(_normalize(record.test_file_path))
+        for dependent in record.imported_by:
+            if dependent not in seen:
+                seen.add(dependent)
+                queue.append(dependent)
+
+    return sorted(tests), sorted(sources)
+
+
+def _all_test_files(root: Path, test_dir: str) -> list[str]:
+    """List every test file under test_dir (globbed, since the index may be stale)."""
+    tests_path = root / test_dir
+    if not tests_path.exists():
+        return []
+    return sorted(
+        {
+            str(path.relative_to(root)).replace("\\", "/")
+            for pattern in ("test_*.py", "*_test.py")
+            for path in tests_path.rglob(pattern)
+            if "__pycache__" not in path.parts
+        }
+    )
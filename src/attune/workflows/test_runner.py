@@ -30,6 +30,7 @@ from attune.models import (
     TestExecutionRecord,
     get_telemetry_store,
 )
+from attune.workflows.test_impact import TestImpactPlan, select_impacted_tests
 
 logger = logging.getLogger(__name__)
 
@@ -40,15 +41,26 @@ def run_tests_with_tracking(
     command: str | None = None,
     workflow_id: str | None = None,
     triggered_by: str = "manual",
+    changed_files: list[str] | None = None,
+    shard_index: int = 0,
+    shard_count: int = 1,
 ) -> TestExecutionRecord:
     """Run tests with explicit tracking (opt-in for Tier 1 monitoring).
 
+    Passing ``changed_files`` enables test-impact mode: only tests affected by
+    the change (per the ProjectIndex dependency graph) are run, most
+    failure-prone first, and split across ``shard_count`` shards. The plan
+    falls back to the full suite when the index is stale.
+
     Args:
         test_suite: Test suite name (unit, integration, e2e, all)
         test_files: Specific test files to run (optional)
         command: Custom test command (defaults to pytest)
         workflow_id: Optional workflow ID to link this execution
         triggered_by: Who/what triggered this (manual, workflow, ci, pre_commit)
+        changed_files: Changed files to select impacted tests for (optional)
+        shard_index: Zero-based shard to run in test-impact mode
+        shard_count: Total number of shards in test-impact mode
 
     Returns:
         TestExecutionRecord with execution results
@@ -60,12 +72,34 @@ def run_tests_with_tracking(
         ...     test_files=["tests/unit/test_config.py"],
         ... )
         >>> print(f"Tests passed: {result.success}")
+        >>> impacted = run_tests_with_tracking(
+        ...     changed_files=["src/attune/config.py"],
+        ...     shard_index=0,
+        ...     shard_count=4,
+        ... )
 
     """
     execution_id = f"test-{uuid.uuid4()}"
     timestamp = datetime.utcnow().isoformat() + "Z"
     started_at = datetime.utcnow()
 
+    # Select impacted tests
+    impact_plan: TestImpactPlan | None = None
+    if command is None and test_files is None and changed_files is not None:
+        impact_plan = select_impacted_tests(
+            changed_files,
+            test_dir=None if test_suite == "all" else f"tests/{test_suite}",
+            shard_index=shard_index,
+            shard_count=shard_count,
+        )
+        if not (impact_plan.full_suite and shard_count == 1):
+            test_files = impact_plan.test_files
+        if not impact_plan.full_suite and not test_files:
+            logger.info("No tests affected by changed files")
+            return _empty_impact_record(
+                execution_id, timestamp, test_suite, triggered_by, workflow_id, impact_plan
+            )
+
     # Build command
     if command is None:
         if test_files:
@@ -140,6 +174,7 @@ def run_tests_with_tracking(
         exit_code=exit_code,
         failed_tests=failed_tests,
         workflow_id=workflow_id,
+        metadata={"test_impact": impact_plan.to_dict()} if impact_plan else {},
     )
 
     # Log to telemetry store
@@ -251,6 +286,36 @@ def track_coverage(
 # Helper functions
 
 
+def _empty_impact_record(
+    execution_id: str,
+    timestamp: str,
+    test_suite: str,
+    triggered_by: str,
+    workflow_id: str | None,
+    impact_plan: TestImpactPlan,
+) -> TestExecutionRecord:
+    """Record a test-impact run that selected no tests (nothing executed).
+
+    Returns:
+        Successful TestExecutionRecord with zero tests
+    """
+    record = TestExecutionRecord(
+        execution_id=execution_id,
+        timestamp=timestamp,
+        test_suite=test_suite,
+        triggered_by=triggered_by,
+        working_directory=str(Path.cwd()),
+        success=True,
+        workflow_id=workflow_id,
+        metadata={"test_impact": impact_plan.to_dict()},
+    )
+    try:
+        get_telemetry_store().log_test_execution(record)
+    except Exception as e:
+        logger.warning(f"Failed to log test execution: {e}")
+    return record
+
+
 def _parse_pytest_output(output: str) -> tuple[int, int, int, int, int]:
     """Parse pytest output for test counts.
 
@@ -368,6 +433,7 @@ def track_file_tests(
     source_file: str,
     test_file: str | None = None,
     workflow_id: str | None = None,
+    include_dependents: bool = False,
 ) -> FileTestRecord:
     """Track test execution for a specific source file.
 
@@ -377,6 +443,8 @@ def track_file_tests(
         source_file: Path to the source file to test
         test_file: Path to the test file (auto-detected if not provided)
         workflow_id: Optional workflow ID to link this execution
+        include_dependents: Also run tests of modules that transitively
+            import the source file (per the ProjectIndex dependency graph)
 
     Returns:
         FileTestRecord with per-file test results
@@ -425,7 +493,10 @@ def track_file_tests(
         return record
 
     # Run pytest for this specific test file
-    command = f"pytest {test_file} -v --tb=short"
+    run_files = [test_file]
+    if include_dependents:
+        run_files.extend(_dependent_test_files(source_file, test_file))
+    command = f"pytest {' '.join(run_files)} -v --tb=short"
 
     logger.info(f"Running tests for {source_file}: {command}")
     try:
@@ -608,6 +679,24 @@ def _find_test_file(source_file: str) -> str | None:
     return None
 
 
+def _dependent_test_files(source_file: str, test_file: str) -> list[str]:
+    """Find tests of modules that transitively import source_file.
+
+    Args:
+        source_file: Path to the source file
+        test_file: The file's own test file (excluded from the result)
+
+    Returns:
+        Dependent test files, or an empty list if the index is stale
+    """
+    plan = select_impacted_tests([source_file])
+    if plan.full_suite:
+        logger.info(f"Skipping dependent tests for {source_file}: {plan.reason}")
+        return []
+    own = Path(test_file).as_posix()
+    return [path for path in plan.test_files if path != own]
+
+
 def _log_file_test(record: FileTestRecord) -> None:
     """Log a FileTestRecord to the telemetry store.
 
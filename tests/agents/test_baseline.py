@@ -5,6 +5,7 @@ Tests the Baseline and Suppression System for managing finding suppressions.
 
 import json
 import tempfile
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -1013,3 +1014,104 @@ z = 3  # empathy:disable B002
         result = manager.filter_findings(findings)
 
         assert len(result) == 1
+
+
+class TestSuppressionIndex:
+    """Tests for the compiled SuppressionIndex used by filter_findings."""
+
+    @pytest.fixture
+    def temp_project(self):
+        """Create a temporary project with inline suppressions."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a.py").write_text(
+                "# empathy:disable-file W100\n"
+                "x = 1  # empathy:disable B001\n"
+                "# empathy:disable-next-line B002\n"
+                "y = 2\n",
+            )
+            (root / "b.py").write_text("z = 3  # empathy:disable B001\n")
+            yield root
+
+    @pytest.fixture
+    def manager(self, temp_project):
+        """Create a BaselineManager with suppressions at every scope."""
+        manager = BaselineManager(temp_project)
+        manager.load()
+        expired = (datetime.now() - timedelta(days=1)).isoformat()
+        suppressions = manager.baseline["suppressions"]
+        suppressions["files"]["a.py"] = [
+            {"rule_code": "E501", "reason": "line", "line_number": 4},
+            {"rule_code": "E501", "reason": "lint only", "tool": "lint"},
+            {"rule_code": "E502", "reason": "expired", "expires_at": expired},
+        ]
+        suppressions["project"] += [
+            {"rule_code": "S101", "reason": "security", "tool": "security"},
+            {"rule_code": "S101", "reason": "any tool"},
+            {"rule_code": "E502", "reason": "project"},
+        ]
+        suppressions["rules"]["R001"] = {"reason": "rule", "tool": "lint"}
+        suppressions["rules"]["R002"] = {"reason": "gone", "expires_at": expired}
+        return manager
+
+    def test_matches_is_suppressed(self, manager):
+        """Test every combination gives the same answer as is_suppressed."""
+        index = manager.build_index()
+        rules = ["B001", "B002", "W100", "E501", "E502", "S101", "R001", "R002", "X000"]
+
+        for rule in rules:
+            for file_path in ["a.py", "b.py", "missing.py", None]:
+                for line in [None, 1, 2, 4]:
+                    for tool in [None, "lint", "security"]:
+                        expected = manager.is_suppressed(rule, file_path, line, tool)
+                        actual = index.match(rule, file_path, line, tool)
+                        assert (actual.is_suppressed, actual.match_type) == (
+                            expected.is_suppressed,
+                            expected.match_type,
+                        ), (rule, file_path, line, tool)
+                        if expected.suppression:
+                            assert actual.suppression.reason == expected.suppression.reason
+
+    def test_reads_each_file_once(self, manager, monkeypatch):
+        """Test filtering many findings reads and parses each file once."""
+        monkeypatch.setattr("agents.code_inspection.baseline._INLINE_CACHE", OrderedDict())
+        parsed = []
+        original = manager.parse_inline_suppressions
+        monkeypatch.setattr(
+            manager,
+            "parse_inline_suppressions",
+            lambda path, content: parsed.append(path) or original(path, content),
+        )
+        findings = [
+            {"code": "B001", "file_path": f"{name}.py", "line_number": i}
+            for i in range(500)
+            for name in ("a", "b")
+        ]
+
+        manager.filter_findings(findings)
+        assert sorted(parsed) == ["a.py", "b.py"]
+
+        parsed.clear()
+        manager.filter_findings(findings)
+        assert parsed == []
+
+    def test_changed_file_is_reparsed(self, manager, temp_project):
+        """Test inline suppressions follow the file's content, not its path."""
+        assert manager.build_index().match("B001", "b.py", 1).is_suppressed
+
+        (temp_project / "b.py").write_text("z = 3\n")
+        assert not manager.build_index().match("B001", "b.py", 1).is_suppressed
+
+    def test_expiry_evaluated_at_build(self, manager):
+        """Test the build time decides which suppressions are active."""
+        manager.baseline["suppressions"]["project"].append(
+            {
+                "rule_code": "T900",
+                "reason": "ttl",
+                "expires_at": (datetime.now() + timedelta(days=1)).isoformat(),
+            },
+        )
+
+        assert manager.build_index().match("T900").is_suppressed
+        later = manager.build_index(now=datetime.now() + timedelta(days=2))
+        assert not later.match("T900").is_suppressed
@@ -4,6 +4,7 @@ Copyright 2025 Smart AI Memory, LLC
 Licensed under the Apache License, Version 2.0
 """
 
+import asyncio
 import json
 import shutil
 import tempfile
@@ -314,6 +315,91 @@ class TestHealthCheckRunner:
         assert result.issues[0].code == "W291"
 
 
+def _ruff_output(*filenames):
+    return MagicMock(
+        stdout=json.dumps(
+            [
+                {"filename": name, "location": {"row": 1}, "code": "F401", "message": "unused"}
+                for name in filenames
+            ],
+        ),
+        returncode=1,
+    )
+
+
+class TestHealthCheckCache:
+    """Tests for cached and incremental health checks."""
+
+    @pytest.fixture
+    def project(self, temp_dir):
+        root = Path(temp_dir)
+        (root / "a.py").write_text("import os\n")
+        (root / "b.py").write_text("x = 1\n")
+        return root
+
+    def _runner(self, root):
+        config = {"checks": {"lint": {"enabled": True, "tool": "ruff"}}}
+        return HealthCheckRunner(project_root=str(root), config=config)
+
+    @patch("attune_llm.code_health.subprocess.run")
+    def test_unchanged_tree_returns_cached_result(self, mock_run, project):
+        """Test a second run on an unchanged tree does not invoke the tool."""
+        mock_run.return_value = _ruff_output(str(project / "a.py"))
+
+        with patch.object(HealthCheckRunner, "_is_tool_available", return_value=True):
+            first = asyncio.run(self._runner(project).run_quick())
+            second = asyncio.run(self._runner(project).run_quick())
+
+        assert mock_run.call_count == 1
+        assert second.get_result(CheckCategory.LINT).details["cached"] is True
+        assert second.total_issues == first.total_issues == 1
+
+    @patch("attune_llm.code_health.subprocess.run")
+    def test_changed_file_rechecked_incrementally(self, mock_run, project):
+        """Test only changed files are passed to ruff and results are merged."""
+        mock_run.return_value = _ruff_output(str(project / "a.py"))
+        with patch.object(HealthCheckRunner, "_is_tool_available", return_value=True):
+            asyncio.run(self._runner(project).run_quick())
+
+            (project / "b.py").write_text("import sys\n")
+            mock_run.return_value = _ruff_output(str(project / "b.py"))
+            report = asyncio.run(self._runner(project).run_quick())
+
+        command = mock_run.call_args.args[0]
+        assert command[-1] == str(project / "b.py")
+        assert str(project) not in command[:-1]
+        lint = report.get_result(CheckCategory.LINT)
+        assert sorted(Path(i.file_path).name for i in lint.issues) == ["a.py", "b.py"]
+        assert lint.details["incremental_files"] == 1
+
+    @patch("attune_llm.code_health.subprocess.run")
+    def test_config_change_forces_full_run(self, mock_run, project):
+        """Test tool configuration changes invalidate cached results."""
+        mock_run.return_value = _ruff_output()
+        with patch.object(HealthCheckRunner, "_is_tool_available", return_value=True):
+            asyncio.run(self._runner(project).run_quick())
+            (project / "pyproject.toml").write_text("[tool.ruff]\nline-length = 80\n")
+            asyncio.run(self._runner(project).run_quick())
+
+        assert mock_run.call_count == 2
+        assert mock_run.call_args.args[0][-1] == str(project)
+
+    def test_skipped_checks_not_cached(self, project):
+        """Test results for unavailable tools are not cached."""
+        runner = self._runner(project)
+        with patch.object(HealthCheckRunner, "_is_tool_available", return_value=False):
+            asyncio.run(runner.run_quick())
+
+        assert runner.cache.get("lint") is None
+
+    def test_concurrency_bounded_by_cpu_count(self, temp_dir):
+        """Test default concurrency follows the CPU count."""
+        with patch("attune_llm.code_health.os.cpu_count", return_value=8):
+            assert HealthCheckRunner(project_root=temp_dir).max_concurrency == 4
+        with patch("attune_llm.code_health.os.cpu_count", return_value=None):
+            assert HealthCheckRunner(project_root=temp_dir).max_concurrency == 1
+
+
 class TestAutoFixer:
     """Tests for AutoFixer class."""
 
@@ -0,0 +1,210 @@
+"""Tests for the shared Anthropic client registry.
+
+Tests cover:
+- Providers sharing one pooled client per event loop
+- Connection reuse against a local mock Messages API server
+- Closing clients when their event loop shuts down
+- Coalescing of identical concurrent requests
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under the Apache License, Version 2.0
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from attune_llm.client_pool import ClientRegistry
+from attune_llm.providers import AnthropicProvider
+
+pytest.importorskip("anthropic")
+
+
+class _MockMessagesServer(ThreadingHTTPServer):
+    """Local Messages API server counting connections and requests."""
+
+    daemon_threads = True
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _MockMessagesHandler)
+        self.delay = delay
+        self.connections = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _MockMessagesHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.requests += 1
+        time.sleep(self.server.delay)
+
+        payload = json.dumps(
+            {
+                "id": "msg_test",
+                "type": "message",
+                "role": "assistant",
+                "model": body["model"],
+                "content": [{"type": "text", "text": body["messages"][-1]["content"]}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {"input_tokens": 3, "output_tokens": 2},
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = _MockMessagesServer(delay=0.2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = ClientRegistry()
+    monkeypatch.setattr("attune_llm.providers.get_client_registry", lambda: registry)
+    return registry
+
+
+def _provider(server, **kwargs):
+    return AnthropicProvider(api_key="sk-ant-test", base_url=server.base_url, **kwargs)
+
+
+async def _async(func):
+    return func()
+
+
+class TestClientRegistry:
+    """Test client sharing."""
+
+    def test_providers_share_client(self, server, registry):
+        """Test providers with the same credentials share one client."""
+
+        async def run():
+            first, second = _provider(server), _provider(server)
+            return first._get_client(), second._get_client()
+
+        first, second = asyncio.run(run())
+
+        assert first is second
+        assert registry.stats["clients_created"] == 1
+
+    def test_clients_are_per_event_loop(self, server, registry):
+        """Test each event loop gets its own client."""
+        provider = _provider(server)
+
+        async def call(text):
+            return await provider.generate([{"role": "user", "content": text}])
+
+        assert asyncio.run(call("one")).content == "one"
+        assert asyncio.run(call("two")).content == "two"
+        assert server.requests == 2
+
+    def test_clients_closed_with_their_loop(self, server, registry):
+        """Test repeated asyncio.run calls do not keep loops, clients or connections."""
+        provider = _provider(server)
+
+        for i in range(5):
+            asyncio.run(provider.generate([{"role": "user", "content": f"q{i}"}]))
+
+        assert registry._loops == {}
+        # The client created at construction is adopted by the first loop
+        assert registry.stats["clients_created"] == 5
+        assert registry.stats["clients_closed"] == 5
+
+    def test_closed_loop_state_is_pruned(self, server, registry):
+        """Test state of a loop closed without shutting down is dropped on next use."""
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(_async(_provider(server)._get_client))
+        loop.close()
+
+        asyncio.run(_async(_provider(server)._get_client))
+
+        assert loop not in registry._loops
+
+
+class TestConnectionReuse:
+    """Test pooled connections against the mock server."""
+
+    def test_sequential_requests_reuse_connection(self, server, registry):
+        """Test many providers issue requests over a single kept-alive connection."""
+
+        async def run():
+            for i in range(5):
+                await _provider(server).generate([{"role": "user", "content": f"q{i}"}])
+
+        asyncio.run(run())
+
+        assert server.requests == 5
+        assert server.connections == 1
+
+    def test_concurrent_identical_requests_coalesce(self, server, registry):
+        """Test identical concurrent deterministic calls share one API request."""
+        messages = [{"role": "user", "content": "same"}]
+
+        async def run():
+            providers = [_provider(server) for _ in range(4)]
+            return await asyncio.gather(*(p.generate(messages, temperature=0) for p in providers))
+
+        responses = asyncio.run(run())
+
+        assert [r.content for r in responses] == ["same"] * 4
+        assert server.requests == 1
+        assert registry.stats["coalesced"] == 3
+        assert sum(bool(r.metadata.get("coalesced")) for r in responses) == 3
+        # Usage is reported once, by the caller that sent the request
+        assert sum(r.tokens_used for r in responses) == 5
+        assert sum(r.metadata["input_tokens"] for r in responses) == 3
+
+    def test_sampled_requests_not_coalesced_by_default(self, server, registry):
+        """Test calls with temperature > 0 each get their own sample."""
+        messages = [{"role": "user", "content": "same"}]
+
+        async def run():
+            provider = _provider(server)
+            await asyncio.gather(*(provider.generate(messages, temperature=0.7) for _ in range(3)))
+
+        asyncio.run(run())
+
+        assert server.requests == 3
+        assert registry.stats["coalesced"] == 0
+
+    def test_coalescing_can_be_disabled(self, server, registry):
+        """Test coalesce_requests=False sends every request."""
+        messages = [{"role": "user", "content": "same"}]
+
+        async def run():
+            provider = _provider(server, coalesce_requests=False)
+            await asyncio.gather(*(provider.generate(messages, temperature=0) for _ in range(3)))
+
+        asyncio.run(run())
+
+        assert server.requests == 3
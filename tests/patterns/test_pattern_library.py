@@ -902,3 +902,116 @@ class TestPatternLibrary:
         # Relevance should be clamped to 1.0
         if matches:
             assert matches[0].relevance_score <= 1.0
+
+
+class TestPatternQueryIndex:
+    """Tests for the inverted index behind query_patterns"""
+
+    @staticmethod
+    def _scan(library, context, min_confidence=0.5, limit=10):
+        """Reference implementation: score every pattern and sort"""
+        matches = []
+        for pattern in library.patterns.values():
+            if pattern.confidence < min_confidence:
+                continue
+            score, _ = library._calculate_relevance(pattern, context)
+            if score > 0.3:
+                matches.append((pattern.id, score))
+        matches.sort(key=lambda m: m[1], reverse=True)
+        return matches[:limit]
+
+    def test_matches_full_scan(self):
+        """Test indexed results equal a full scan, including tie order"""
+        import random
+
+        rng = random.Random(7)
+        library = PatternLibrary()
+        for i in range(500):
+            pattern = Pattern(
+                id=f"pat_{i:03d}",
+                agent_id="agent1",
+                pattern_type=rng.choice(["sequential", "conditional"]),
+                name=f"P{i}",
+                description="Test",
+                confidence=rng.choice([0.4, 0.6, 0.9]),
+                context={k: rng.randint(0, 3) for k in rng.sample("abcde", 3)},
+                tags=rng.sample(["x", "y", "z", "w"], 2),
+            )
+            library.contribute_pattern("agent1", pattern)
+            for _ in range(rng.randint(0, 6)):
+                library.record_pattern_outcome(pattern.id, success=rng.random() < 0.7)
+
+        for _ in range(50):
+            context = {k: rng.randint(0, 3) for k in rng.sample("abcde", 2)}
+            if rng.random() < 0.5:
+                context["tags"] = rng.sample(["x", "y", "z", "w"], 1)
+            limit = rng.choice([1, 5, 20])
+
+            matches = library.query_patterns("agent2", context, limit=limit)
+
+            assert [(m.pattern.id, m.relevance_score) for m in matches] == self._scan(
+                library, context, limit=limit
+            )
+
+    def test_unhashable_context_values(self):
+        """Test list-valued context entries still match"""
+        library = PatternLibrary()
+        library.contribute_pattern(
+            "agent1",
+            Pattern(
+                id="pat_001",
+                agent_id="agent1",
+                pattern_type="sequential",
+                name="P1",
+                description="Test",
+                confidence=0.9,
+                context={"files": ["a.py", "b.py"]},
+            ),
+        )
+
+        matches = library.query_patterns("agent2", {"files": ["a.py", "b.py"]})
+        misses = library.query_patterns("agent2", {"files": ["c.py"]})
+
+        assert [m.pattern.id for m in matches] == ["pat_001"]
+        assert misses == []
+
+    def test_contributed_by_filter(self):
+        """Test filtering query results by contributing agent"""
+        library = PatternLibrary()
+        for agent in ("agent1", "agent2"):
+            library.contribute_pattern(
+                agent,
+                Pattern(
+                    id=f"pat_{agent}",
+                    agent_id=agent,
+                    pattern_type="sequential",
+                    name=agent,
+                    description="Test",
+                    confidence=0.9,
+                    context={"task": "debug"},
+                ),
+            )
+
+        matches = library.query_patterns("agent3", {"task": "debug"}, contributed_by="agent2")
+
+        assert [m.pattern.id for m in matches] == ["pat_agent2"]
+
+    def test_reset_clears_index(self):
+        """Test reset empties the context index"""
+        library = PatternLibrary()
+        library.contribute_pattern(
+            "agent1",
+            Pattern(
+                id="pat_001",
+                agent_id="agent1",
+                pattern_type="sequential",
+                name="P1",
+                description="Test",
+                confidence=0.9,
+                context={"task": "debug"},
+            ),
+        )
+        library.reset()
+
+        assert library.query_patterns("agent2", {"task": "debug"}) == []
+        assert library._patterns_by_context == {}
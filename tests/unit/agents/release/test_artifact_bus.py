@@ -0,0 +1,182 @@
+"""Tests for the run-scoped release artifact bus.
+
+Copyright 2026 Smart-AI-Memory
+Licensed under Apache 2.0
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from attune.agents.release import ArtifactBus, ReleasePrepTeam, ToolOutput, artifact_scope
+from attune.agents.release.artifact_bus import get_artifact_bus, tree_fingerprint
+from attune.agents.release.release_agents import CodeQualityAgent, SecurityAuditorAgent
+from attune.workflows import release_prep
+
+RUFF = ["uv", "run", "ruff", "check", "src/", "--statistics"]
+
+
+class FakeRunner:
+    """Records calls and returns canned output after an optional delay."""
+
+    def __init__(self, stdout: str = "", delay: float = 0.0):
+        self.stdout = stdout
+        self.delay = delay
+        self.calls: list[tuple[str, ...]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, cmd, cwd, timeout):
+        with self._lock:
+            self.calls.append(tuple(cmd))
+        time.sleep(self.delay)
+        return ToolOutput(0, self.stdout, "", duration=self.delay)
+
+
+def _bus(runner: FakeRunner, tree: str = "tree-1") -> ArtifactBus:
+    return ArtifactBus(runner=runner, fingerprint=lambda cwd: tree)
+
+
+class TestArtifactBus:
+    """Tests for ArtifactBus.run and ArtifactBus.parsed."""
+
+    def test_runs_each_command_once(self, tmp_path):
+        """Test repeated requests reuse the first output."""
+        runner = FakeRunner("out")
+        bus = _bus(runner)
+
+        first = bus.run(RUFF, str(tmp_path))
+        assert bus.run(RUFF, str(tmp_path)) is first
+        bus.run([*RUFF, "--fix"], str(tmp_path))
+
+        assert len(runner.calls) == 2
+        assert bus.stats()["tool_runs"] == 2
+        assert bus.stats()["reused"] == 1
+
+    def test_concurrent_requesters_share_in_flight_run(self, tmp_path):
+        """Test threads asking for the same tool wait on one run."""
+        runner = FakeRunner("out", delay=0.1)
+        bus = _bus(runner)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            outputs = list(pool.map(lambda _: bus.run(RUFF, str(tmp_path)), range(8)))
+
+        assert len(runner.calls) == 1
+        assert all(o is outputs[0] for o in outputs)
+        assert bus.stats()["saved_seconds"] == pytest.approx(0.7)
+
+    def test_tree_change_reruns(self, tmp_path):
+        """Test a new tree fingerprint gets its own run."""
+        runner = FakeRunner("out")
+        trees = iter(["tree-1", "tree-2"])
+        bus = ArtifactBus(runner=runner, fingerprint=lambda cwd: next(trees))
+
+        bus.run(RUFF, str(tmp_path))
+        bus.run(RUFF, str(tmp_path / "other"))
+
+        assert len(runner.calls) == 2
+
+    def test_parsed_is_memoized(self, tmp_path):
+        """Test a parser runs once per output and name."""
+        bus = _bus(FakeRunner("3 E501 Line too long"))
+        parses = []
+
+        def parse(output):
+            parses.append(output)
+            return {"lines": output.stdout.splitlines()}
+
+        first = bus.parsed(RUFF, str(tmp_path), parse)
+        assert bus.parsed(RUFF, str(tmp_path), parse) is first
+        assert len(parses) == 1
+
+    def test_failed_run_is_retried(self, tmp_path):
+        """Test an exception reaches the caller and is not cached."""
+        calls = []
+
+        def runner(cmd, cwd, timeout):
+            calls.append(cmd)
+            if len(calls) == 1:
+                raise OSError("boom")
+            return ToolOutput(0, "ok", "")
+
+        bus = ArtifactBus(runner=runner, fingerprint=lambda cwd: "tree")
+        with pytest.raises(OSError):
+            bus.run(RUFF, str(tmp_path))
+
+        assert bus.run(RUFF, str(tmp_path)).stdout == "ok"
+
+
+class TestTreeFingerprint:
+    """Tests for tree_fingerprint outside a git checkout."""
+
+    def test_changes_with_files(self, tmp_path):
+        """Test editing a file changes the fingerprint."""
+        source = tmp_path / "module.py"
+        source.write_text("x = 1\n")
+        before = tree_fingerprint(tmp_path)
+        assert tree_fingerprint(tmp_path) == before
+
+        source.write_text("x = 22\n")
+        assert tree_fingerprint(tmp_path) != before
+
+
+class TestReleaseAgents:
+    """Tests for agents sharing tool output."""
+
+    def test_escalated_tiers_reuse_tool_output(self, tmp_path):
+        """Test CHEAP -> CAPABLE -> PREMIUM runs ruff once."""
+        runner = FakeRunner("400 E501 Line too long")
+        agent = CodeQualityAgent(artifact_bus=_bus(runner))
+
+        result = agent.process(str(tmp_path))
+
+        assert result.escalated
+        assert result.tier_used.value == "premium"
+        assert runner.calls == [tuple(RUFF)]
+
+    def test_parsed_findings_are_copied(self, tmp_path):
+        """Test updating one agent's findings leaves the shared parse intact."""
+        bus = _bus(FakeRunner('{"results": []}'))
+        first = SecurityAuditorAgent(artifact_bus=bus).process(str(tmp_path))
+        second = SecurityAuditorAgent(artifact_bus=bus).process(str(tmp_path))
+
+        assert first.findings is not second.findings
+        assert first.findings["critical_issues"] == second.findings["critical_issues"] == 0
+        assert bus.stats()["parses"] == 1
+
+    def test_team_shares_one_bus(self):
+        """Test every agent of a team uses the team's bus."""
+        with artifact_scope() as bus:
+            team = ReleasePrepTeam()
+
+        assert team.artifact_bus is bus
+        assert all(agent.artifact_bus is bus for agent in team.agents)
+
+
+class TestArtifactScope:
+    """Tests for artifact_scope and workflow integration."""
+
+    def test_scope_is_reset(self):
+        """Test the bus is only current inside the block."""
+        assert get_artifact_bus() is None
+        with artifact_scope() as bus:
+            with artifact_scope() as inner:
+                assert inner is bus
+        assert get_artifact_bus() is None
+
+    def test_release_prep_checks_use_current_bus(self, tmp_path):
+        """Test ReleasePreparationWorkflow checks reuse output within a scope."""
+        runner = FakeRunner("collected")
+        cmd = ["python", "-m", "pytest", "--co", "-q"]
+
+        with artifact_scope(_bus(runner)):
+            release_prep._run_check(cmd, timeout=60, cwd=str(tmp_path))
+            release_prep._run_check(cmd, timeout=60, cwd=str(tmp_path))
+
+        assert len(runner.calls) == 1
+
+    def test_missing_tool_raises(self, tmp_path):
+        """Test _run_check keeps the FileNotFoundError contract."""
+        with pytest.raises(FileNotFoundError):
+            release_prep._run_check(["attune-no-such-tool"], timeout=5, cwd=str(tmp_path))
@@ -0,0 +1,253 @@
+"""Tests for the shared response cache tier.
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from attune.cache import HashOnlyCache, create_cache
+from attune.cache.shared import (
+    LocalBackend,
+    RedisBackend,
+    SharedCache,
+    SQLiteBackend,
+    create_shared_backend,
+)
+from attune.cost_tracker import CostTracker
+from attune.workflows.base import BaseWorkflow
+from attune.workflows.compat import ModelTier
+
+ARGS = ("code-review", "scan", "prompt", "model")
+
+
+@pytest.fixture(params=["local", "sqlite"])
+def backend(request, tmp_path):
+    """Each backend that runs without external services."""
+    if request.param == "local":
+        yield LocalBackend()
+        return
+    backend = SQLiteBackend(tmp_path / "shared.sqlite3")
+    yield backend
+    backend.close()
+
+
+def _shared(backend, **kwargs) -> SharedCache:
+    return SharedCache(HashOnlyCache(), backend, **kwargs)
+
+
+class TestBackends:
+    """Tests for the backend contract."""
+
+    def test_add_is_set_if_absent(self, backend):
+        """Test add only stores when the key is missing or expired."""
+        assert backend.add("k", b"a", 0.05)
+        assert not backend.add("k", b"b", 10)
+        assert backend.get("k") == b"a"
+
+        time.sleep(0.06)
+        assert backend.get("k") is None
+        assert backend.add("k", b"b", 10)
+
+    def test_delete_if_equal(self, backend):
+        """Test a lease is only released by the token that holds it."""
+        backend.set("k", b"mine", 10)
+
+        assert not backend.delete_if_equal("k", b"other")
+        assert backend.delete_if_equal("k", b"mine")
+        assert backend.get("k") is None
+
+    def test_sqlite_is_shared_between_processes(self, tmp_path):
+        """Test a value written by another process is visible here."""
+        path = tmp_path / "shared.sqlite3"
+        script = (
+            "import sys; from attune.cache.shared import SQLiteBackend; "
+            "SQLiteBackend(sys.argv[1]).set('k', b'from-child', 60)"
+        )
+        subprocess.run([sys.executable, "-c", script, str(path)], check=True)
+
+        assert SQLiteBackend(path).get("k") == b"from-child"
+
+
+class TestSharedCache:
+    """Tests for SharedCache lookups."""
+
+    def test_other_instance_hits(self, backend):
+        """Test a response stored by one cache is found by another."""
+        writer, reader = _shared(backend), _shared(backend)
+        writer.put(*ARGS, {"content": "x"})
+
+        assert reader.get(*ARGS) == {"content": "x"}
+        assert reader.shared_hits == 1
+        # Copied into the local tier
+        assert reader.local.get(*ARGS) == {"content": "x"}
+
+    def test_stale_served_while_revalidating(self, backend):
+        """Test an expired entry is served only while someone refreshes it."""
+        first, second = _shared(backend), _shared(backend)
+        first.put(*ARGS, {"content": "old"}, ttl=1)
+        first.local.clear()
+        time.sleep(1.05)
+
+        # Nobody revalidating: a miss, so this caller takes the lease
+        assert second.get(*ARGS) is None
+        response, owns_lease = asyncio.run(second.acquire_or_wait(*ARGS))
+        assert (response, owns_lease) == (None, True)
+
+        # Others are served the stale value meanwhile
+        assert first.get(*ARGS) == {"content": "old"}
+        assert first.stale_hits == 1
+
+        second.put(*ARGS, {"content": "new"})
+        assert first.get(*ARGS) == {"content": "new"}
+
+
+class TestSingleFlight:
+    """Tests for acquire_or_wait."""
+
+    async def test_concurrent_misses_compute_once(self, backend):
+        """Test one of many concurrent callers computes; the rest get its result."""
+        caches = [_shared(backend) for _ in range(4)]
+        computed = []
+
+        async def caller(cache: SharedCache) -> Any:
+            response = cache.get(*ARGS)
+            if response is None:
+                response, owns_lease = await cache.acquire_or_wait(*ARGS)
+                if response is None:
+                    assert owns_lease
+                    computed.append(1)
+                    await asyncio.sleep(0.1)
+                    response = {"content": "computed"}
+                    cache.put(*ARGS, response)
+            return response
+
+        results = await asyncio.gather(*(caller(caches[i % 4]) for i in range(20)))
+
+        assert computed == [1]
+        assert all(r == {"content": "computed"} for r in results)
+        assert sum(c.coalesced for c in caches) == 19
+
+    async def test_failed_leader_hands_over(self, backend):
+        """Test a released lease lets a waiter compute instead."""
+        leader, follower = _shared(backend), _shared(backend)
+        assert await leader.acquire_or_wait(*ARGS) == (None, True)
+
+        waiter = asyncio.create_task(follower.acquire_or_wait(*ARGS))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        leader.release(*ARGS)
+        assert await asyncio.wait_for(waiter, 2) == (None, True)
+
+    async def test_wait_times_out(self, backend):
+        """Test waiters give up after wait_timeout and compute themselves."""
+        leader = _shared(backend)
+        follower = _shared(backend, wait_timeout=0.1)
+        await leader.acquire_or_wait(*ARGS)
+
+        assert await follower.acquire_or_wait(*ARGS) == (None, False)
+
+
+class FakeRedis:
+    """Redis stand-in supporting SET NX PX, GET and the release script."""
+
+    def __init__(self):
+        self.backend = LocalBackend()
+
+    def get(self, key):
+        return self.backend.get(key)
+
+    def set(self, key, value, nx=False, px=None):
+        if nx:
+            return self.backend.add(key, value, px / 1000)
+        self.backend.set(key, value, px / 1000)
+        return True
+
+    def register_script(self, script):
+        assert "redis.call('del'" in script
+        return lambda keys, args: int(self.backend.delete_if_equal(keys[0], args[0]))
+
+
+class TestRedisBackend:
+    """Tests for RedisBackend command usage."""
+
+    async def test_single_flight_over_redis(self):
+        """Test leases and entries round-trip through the Redis commands."""
+        backend = RedisBackend(FakeRedis())
+        leader, follower = _shared(backend), _shared(backend)
+
+        assert await leader.acquire_or_wait(*ARGS) == (None, True)
+        waiter = asyncio.create_task(follower.acquire_or_wait(*ARGS))
+        await asyncio.sleep(0.05)
+        leader.put(*ARGS, {"content": "x"})
+
+        assert await asyncio.wait_for(waiter, 2) == ({"content": "x"}, False)
+
+
+class TestCreateCache:
+    """Tests for create_cache/create_shared_backend selection."""
+
+    def test_modes(self, monkeypatch, tmp_path):
+        """Test the environment picks the shared backend."""
+        monkeypatch.setenv("ATTUNE_SHARED_CACHE", "off")
+        assert isinstance(create_cache(cache_type="hash"), HashOnlyCache)
+
+        monkeypatch.setenv("ATTUNE_SHARED_CACHE", "sqlite")
+        monkeypatch.setenv("ATTUNE_SHARED_CACHE_PATH", str(tmp_path / "c.sqlite3"))
+        cache = create_cache(cache_type="hash")
+        assert isinstance(cache, SharedCache)
+        assert isinstance(cache.backend, SQLiteBackend)
+
+        monkeypatch.delenv("ATTUNE_SHARED_CACHE")
+        assert isinstance(create_shared_backend(), LocalBackend)
+
+
+class _FanOutWorkflow(BaseWorkflow):
+    """Workflow issuing the same LLM call from several tasks."""
+
+    name = "shared-cache-workflow"
+    description = "Concurrent identical calls"
+    stages = ["fanout"]
+    tier_map = {"fanout": ModelTier.CHEAP}
+
+    async def run_stage(self, stage_name: str, tier: ModelTier, input_data: Any):
+        calls = await asyncio.gather(
+            *(self._call_llm(tier, "Review code", "same prompt") for _ in range(5))
+        )
+        return {"contents": [c[0] for c in calls]}, 0, 0
+
+
+class TestWorkflowIntegration:
+    """Tests for _call_llm with a shared cache."""
+
+    async def test_identical_concurrent_calls_hit_api_once(self, tmp_path: Path):
+        """Test concurrent identical calls in a workflow make one LLM call."""
+        executor_calls = 0
+
+        async def slow_call(**kwargs):
+            nonlocal executor_calls
+            executor_calls += 1
+            await asyncio.sleep(0.1)
+            return ("reviewed", 10, 5, 0.001)
+
+        wf = _FanOutWorkflow(
+            cost_tracker=CostTracker(storage_dir=str(tmp_path / ".empathy")),
+            cache=SharedCache(HashOnlyCache(), LocalBackend()),
+            enable_tier_tracking=False,
+        )
+        wf.run_step_with_executor = AsyncMock(side_effect=slow_call)
+
+        result = await wf.execute()
+
+        assert result.success, result.error
+        assert result.stages[0].result["contents"] == ["reviewed"] * 5
+        assert executor_calls == 1
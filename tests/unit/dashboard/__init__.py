@@ -0,0 +1,5 @@
+"""Unit tests for dashboard package.
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
@@ -0,0 +1,319 @@
+"""Tests for the live dashboard server and shared snapshot aggregator.
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+import http.client
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from attune.dashboard.live_server import (
+    RedisStreamTail,
+    SnapshotAggregator,
+    StandaloneSnapshotSource,
+    create_live_server,
+)
+
+
+class FakeSource:
+    """In-memory snapshot source that counts collections."""
+
+    def __init__(self):
+        self.collect_calls = 0
+        self.responses: list[tuple[str, bool]] = []
+        self.sections = {
+            "health": {"status": "healthy", "redis_available": True, "active_agents": 1},
+            "agents": [{"agent_id": "a1", "status": "running", "metadata": {"k": 1}}],
+            "signals": [{"signal_type": f"s{i}"} for i in range(5)],
+            "events": [
+                {"event_id": "2-0", "event_type": "workflow_progress"},
+                {"event_id": "1-0", "event_type": "agent_heartbeat"},
+            ],
+            "approvals": [{"request_id": "r1"}],
+            "feedback_workflows": [],
+            "underperforming": [
+                {"stage_name": "analysis", "avg_quality": 0.4},
+                {"stage_name": "generation", "avg_quality": 0.8},
+            ],
+        }
+
+    def collect(self):
+        self.collect_calls += 1
+        return json.loads(json.dumps(self.sections))
+
+    def respond_to_approval(self, request_id, approved, reason):
+        self.responses.append((request_id, approved))
+        self.sections["approvals"] = []
+        return True
+
+
+@pytest.fixture
+def live_server():
+    """Run a live dashboard server on a free port with manual refreshes."""
+    source = FakeSource()
+    server = create_live_server(port=0, source=source, refresh_interval=3600)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, source
+    server.shutdown()
+    server.server_close()
+
+
+def _get(server, path, headers=None):
+    conn = http.client.HTTPConnection(*server.server_address, timeout=5)
+    conn.request("GET", path, headers=headers or {})
+    response = conn.getresponse()
+    body = response.read()
+    conn.close()
+    return response, body
+
+
+def _read_event(response) -> dict:
+    """Read one SSE message (skipping comments and retry lines)."""
+    fields = {}
+    while True:
+        line = response.fp.readline().decode("utf-8").rstrip("\n")
+        if not line:
+            if "data" in fields:
+                return fields
+            continue
+        if line.startswith(":") or line.startswith("retry:"):
+            continue
+        key, _, value = line.partition(": ")
+        fields[key] = value
+
+
+class TestSnapshotAggregator:
+    """Tests for SnapshotAggregator."""
+
+    def test_version_moves_only_for_changed_sections(self):
+        """Test unchanged refreshes keep the version and deltas hold only changes."""
+        source = FakeSource()
+        aggregator = SnapshotAggregator(source)
+
+        assert len(aggregator.refresh()) == 7
+        assert aggregator.version == 1
+        assert aggregator.refresh() == []
+        assert aggregator.version == 1
+
+        source.sections["agents"] = []
+        assert aggregator.refresh() == ["agents"]
+        version, delta = aggregator.changes_since(1)
+        assert version == 2
+        assert delta == {"agents": []}
+
+    def test_failed_refresh_keeps_last_snapshot(self):
+        """Test a source error leaves the previous snapshot in place."""
+        source = FakeSource()
+        aggregator = SnapshotAggregator(source)
+        aggregator.refresh()
+        source.collect = lambda: 1 / 0
+
+        assert aggregator.refresh() == []
+        assert aggregator.get("agents").data[0]["agent_id"] == "a1"
+
+
+class TestLiveDashboardHandler:
+    """Tests for the HTTP endpoints served from the snapshot."""
+
+    def test_concurrent_viewers_share_one_collection(self, live_server):
+        """Test many parallel requests never reach the source."""
+        server, source = live_server
+        paths = ["/api/agents", "/api/signals", "/api/events", "/api/health"] * 10
+
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            statuses = [r.status for r, _ in pool.map(lambda p: _get(server, p), paths)]
+
+        assert statuses == [200] * len(paths)
+        assert source.collect_calls == 1
+
+    def test_etag_returns_not_modified(self, live_server):
+        """Test If-None-Match with the current ETag yields 304 until data changes."""
+        server, source = live_server
+        response, _ = _get(server, "/api/agents")
+        etag = response.getheader("ETag")
+
+        response, body = _get(server, "/api/agents", {"If-None-Match": etag})
+        assert response.status == 304
+        assert body == b""
+
+        source.sections["agents"].append({"agent_id": "a2"})
+        server.aggregator.refresh()
+        response, body = _get(server, "/api/agents", {"If-None-Match": etag})
+        assert response.status == 200
+        assert len(json.loads(body)) == 2
+
+    def test_query_views(self, live_server):
+        """Test limit, event_type and threshold filters apply to the snapshot."""
+        server, _ = live_server
+
+        _, body = _get(server, "/api/signals?limit=2")
+        assert len(json.loads(body)) == 2
+
+        _, body = _get(server, "/api/events?event_type=agent_heartbeat")
+        assert [e["event_id"] for e in json.loads(body)] == ["1-0"]
+
+        _, body = _get(server, "/api/feedback/underperforming?threshold=0.5")
+        assert [s["stage_name"] for s in json.loads(body)] == ["analysis"]
+
+        response, body = _get(server, "/api/agents/a1")
+        assert json.loads(body)["metadata"] == {"k": 1}
+        assert _get(server, "/api/agents/missing")[0].status == 404
+
+    def test_malformed_query_params_return_400(self, live_server):
+        """Test non-numeric limit and threshold values are rejected, not crashed on."""
+        server, _ = live_server
+
+        for path in (
+            "/api/signals?limit=all",
+            "/api/events?limit=1.5",
+            "/api/feedback/underperforming?threshold=high",
+        ):
+            assert _get(server, path)[0].status == 400
+        assert _get(server, "/api/signals?limit=1")[0].status == 200
+
+    def test_approval_refreshes_snapshot(self, live_server):
+        """Test answering an approval goes to the source and wakes the refresher."""
+        server, source = live_server
+        conn = http.client.HTTPConnection(*server.server_address, timeout=5)
+        conn.request("POST", "/api/approvals/r1/approve", body=b"{}")
+        response = conn.getresponse()
+
+        assert json.loads(response.read())["status"] == "approved"
+        assert source.responses == [("r1", True)]
+        assert server.aggregator.wait_for_change(1, timeout=5) == 2
+        assert server.aggregator.get("approvals").data == []
+
+
+class TestServerSentEvents:
+    """Tests for the /api/stream endpoint."""
+
+    def test_snapshot_then_delta(self, live_server):
+        """Test a new client gets the full snapshot, then only changed sections."""
+        server, source = live_server
+        conn = http.client.HTTPConnection(*server.server_address, timeout=5)
+        conn.request("GET", "/api/stream")
+        response = conn.getresponse()
+        assert response.getheader("Content-Type") == "text/event-stream"
+
+        first = _read_event(response)
+        assert first["event"] == "snapshot"
+        assert set(json.loads(first["data"])) >= {"agents", "events", "health"}
+
+        source.sections["signals"] = []
+        server.aggregator.refresh()
+        second = _read_event(response)
+        assert second["event"] == "delta"
+        assert json.loads(second["data"]) == {"signals": []}
+        assert second["id"] == f"{server.aggregator.epoch}:2"
+        conn.close()
+
+    def test_resume_with_last_event_id(self, live_server):
+        """Test reconnecting with Last-Event-ID replays only the missed sections."""
+        server, source = live_server
+        last_id = f"{server.aggregator.epoch}:1"
+        source.sections["approvals"] = []
+        server.aggregator.refresh()
+
+        conn = http.client.HTTPConnection(*server.server_address, timeout=5)
+        conn.request("GET", "/api/stream", headers={"Last-Event-ID": last_id})
+        event = _read_event(conn.getresponse())
+
+        assert event["event"] == "delta"
+        assert json.loads(event["data"]) == {"approvals": []}
+        conn.close()
+
+
+class FakeStreamClient:
+    """Minimal Redis stream client recording the calls it receives."""
+
+    def __init__(self):
+        self.streams: dict[str, list] = {}
+        self.calls: list[str] = []
+
+    def add(self, stream, entry_id, event_type, timestamp):
+        fields = {
+            b"event_type": event_type.encode(),
+            b"timestamp": timestamp.encode(),
+            b"data": b"{}",
+        }
+        self.streams.setdefault(stream, []).append((entry_id.encode(), fields))
+
+    def xrevrange(self, key, count=None):
+        self.calls.append(f"xrevrange {key}")
+        return list(reversed(self.streams.get(key, [])))[:count]
+
+    def xread(self, streams, count=None):
+        self.calls.append("xread")
+        response = []
+        for key, last_id in streams.items():
+            entries = [
+                e
+                for e in self.streams.get(key, [])
+                if tuple(map(int, e[0].decode().split("-"))) > tuple(map(int, last_id.split("-")))
+            ]
+            if entries:
+                response.append((key.encode(), entries[:count]))
+        return response
+
+
+class TestRedisStreamTail:
+    """Tests for RedisStreamTail."""
+
+    def test_seeds_then_reads_incrementally(self):
+        """Test the first poll seeds with XREVRANGE and later polls use one XREAD."""
+        client = FakeStreamClient()
+        client.add("stream:workflow_progress", "1-0", "workflow_progress", "2026-01-01T00:00:01")
+        tail = RedisStreamTail(max_events=3)
+
+        assert [e["event_id"] for e in tail.poll(client)] == ["1-0"]
+        assert client.calls == [
+            "xrevrange stream:workflow_progress",
+            "xrevrange stream:agent_heartbeat",
+            "xrevrange stream:coordination_signal",
+        ]
+
+        client.calls.clear()
+        client.add("stream:agent_heartbeat", "2-0", "agent_heartbeat", "2026-01-01T00:00:02")
+        client.add("stream:workflow_progress", "3-0", "workflow_progress", "2026-01-01T00:00:03")
+        client.add("stream:workflow_progress", "4-0", "workflow_progress", "2026-01-01T00:00:04")
+
+        events = tail.poll(client)
+        assert client.calls == ["xread"]
+        assert [e["event_id"] for e in events] == ["4-0", "3-0", "2-0"]
+        assert tail.poll(client) == events
+
+    def test_reseeds_when_a_window_falls_behind(self):
+        """Test a burst of at least max_events entries returns the newest ones."""
+        client = FakeStreamClient()
+        tail = RedisStreamTail(max_events=3)
+        tail.poll(client)
+
+        for i in range(1, 8):
+            client.add(
+                "stream:workflow_progress", f"{i}-0", "workflow_progress", f"2026-01-01T00:00:0{i}"
+            )
+        client.calls.clear()
+
+        events = tail.poll(client)
+        assert [e["event_id"] for e in events] == ["7-0", "6-0", "5-0"]
+        assert client.calls == ["xread", "xrevrange stream:workflow_progress"]
+
+        client.add("stream:workflow_progress", "8-0", "workflow_progress", "2026-01-01T00:00:08")
+        assert [e["event_id"] for e in tail.poll(client)] == ["8-0", "7-0", "6-0"]
+
+
+class TestStandaloneSnapshotSource:
+    """Tests for StandaloneSnapshotSource without Redis."""
+
+    def test_degraded_without_client(self, monkeypatch):
+        """Test a missing Redis connection yields an empty degraded snapshot."""
+        monkeypatch.setattr("attune.dashboard.live_server.REDIS_AVAILABLE", False)
+        sections = StandaloneSnapshotSource().collect()
+
+        assert sections["health"]["redis_available"] is False
+        assert sections["agents"] == []
@@ -0,0 +1,201 @@
+"""Tests for AuditLogger group commit and segment indexes.
+
+Tests cover:
+- Group commit of concurrent events and durability modes
+- Queries across rotated segments using sidecar indexes
+- Compliance and violation reports from incremental rollups
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under the Apache License, Version 2.0
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from attune.memory.security.audit_index import SegmentIndex
+from attune.memory.security.audit_logger import AuditLogger
+
+
+def _llm(logger, user="user@example.com", secrets=0):
+    logger.log_llm_request(
+        user_id=user,
+        empathy_level=1,
+        provider="anthropic",
+        model="claude-sonnet-4",
+        memory_sources=["project"],
+        secrets_count=secrets,
+    )
+
+
+@pytest.fixture
+def audit(tmp_path):
+    logger = AuditLogger(log_dir=str(tmp_path), enable_rotation=False)
+    yield logger
+    logger.close()
+
+
+class TestGroupCommit:
+    """Test batched appends."""
+
+    def test_concurrent_events_share_writes(self, tmp_path):
+        """Test events logged concurrently are committed in fewer writes."""
+        logger = AuditLogger(log_dir=str(tmp_path), enable_rotation=False, commit_delay_ms=5)
+        commits = []
+        original = logger._commit_batch
+
+        def counting_commit(lines):
+            commits.append(len(lines))
+            original(lines)
+
+        logger._commit_batch = counting_commit
+        threads = [
+            threading.Thread(target=lambda i=i: [_llm(logger, f"u{i}") for _ in range(20)])
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        lines = logger.log_path.read_text().splitlines()
+        assert len(lines) == 160
+        assert all(json.loads(line)["event_type"] == "llm_request" for line in lines)
+        assert sum(commits) == 160
+        assert len(commits) < 160
+
+    def test_console_logging_covers_grouped_events(self, tmp_path):
+        """Test every event is console-logged, not only each group's leader."""
+        logger = AuditLogger(
+            log_dir=str(tmp_path),
+            enable_rotation=False,
+            enable_console_logging=True,
+            commit_delay_ms=5,
+        )
+        with patch("attune.memory.security.audit_logger.logger") as module_logger:
+            threads = [threading.Thread(target=_llm, args=(logger, f"u{i}")) for i in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        logger.close()
+
+        logged = [c for c in module_logger.debug.call_args_list if "Audit event" in c.args[0]]
+        assert len(logged) == 8
+
+    def test_fsync_durability(self, tmp_path):
+        """Test fsync mode syncs each commit."""
+        logger = AuditLogger(log_dir=str(tmp_path), durability="fsync")
+        with patch("attune.memory.security.audit_logger.os.fsync") as fsync:
+            _llm(logger)
+
+        assert fsync.call_count == 1
+
+    def test_invalid_durability(self, tmp_path):
+        """Test unknown durability modes are rejected."""
+        with pytest.raises(ValueError, match="durability"):
+            AuditLogger(log_dir=str(tmp_path), durability="eventually")
+
+
+class TestSegmentQueries:
+    """Test queries over rotated segments."""
+
+    def test_query_covers_rotated_segments(self, audit):
+        """Test events in rotated segments are still returned, oldest first."""
+        _llm(audit, "alice")
+        audit._rotate_log()
+        _llm(audit, "bob")
+        audit._rotate_log()
+        _llm(audit, "carol")
+
+        users = [e["user_id"] for e in audit.query(event_type="llm_request")]
+
+        assert users == ["alice", "bob", "carol"]
+        assert len(list(audit.index_dir.glob("*.json"))) == 2
+
+    def test_sidecar_index_skips_segments(self, audit, tmp_path):
+        """Test a fresh logger reuses sidecars and skips non-matching segments."""
+        _llm(audit, "alice")
+        audit._rotate_log()
+        _llm(audit, "bob")
+
+        reopened = AuditLogger(log_dir=str(tmp_path), enable_rotation=False)
+        with patch.object(AuditLogger, "_read_segment", wraps=AuditLogger._read_segment) as read:
+            events = reopened.query(user_id="bob")
+
+        assert [e["user_id"] for e in events] == ["bob"]
+        assert [call.args[0] for call in read.call_args_list] == [reopened.log_path]
+
+    def test_date_range_skips_old_segments(self, audit):
+        """Test segments entirely before start_date are not read."""
+        _llm(audit)
+        audit._rotate_log()
+        start = datetime.utcnow() + timedelta(seconds=1)
+
+        assert audit.query(start_date=start) == []
+
+    def test_active_index_follows_external_appends(self, audit):
+        """Test lines appended outside the logger are picked up incrementally."""
+        _llm(audit, "alice")
+        assert len(audit.query()) == 1
+
+        with open(audit.log_path, "a") as f:
+            f.write(json.dumps({"event_type": "custom", "user_id": "ext"}) + "\n")
+
+        assert [e["user_id"] for e in audit.query(event_type="custom")] == ["ext"]
+
+
+class TestRollups:
+    """Test reports built from segment rollups."""
+
+    def test_compliance_report_spans_segments(self, audit):
+        """Test report totals include rotated segments without re-reading them."""
+        _llm(audit)
+        audit.log_pattern_store(
+            user_id="user@example.com",
+            pattern_id="p1",
+            pattern_type="note",
+            classification="SENSITIVE",
+            encrypted=True,
+        )
+        audit._rotate_log()
+        _llm(audit, secrets=1)
+        audit.query(limit=0)  # Catch up the active segment's index
+
+        with patch.object(SegmentIndex, "extend", side_effect=AssertionError("re-indexed")):
+            report = audit.get_compliance_report()
+
+        assert report["llm_requests"]["total"] == 2
+        assert report["llm_requests"]["with_secrets_detected"] == 1
+        assert report["pattern_storage"]["by_classification"]["SENSITIVE"] == 1
+        assert report["security_violations"]["total"] == 1
+
+    def test_compliance_report_partial_period(self, audit):
+        """Test a period boundary inside a segment counts only events in range."""
+        _llm(audit)
+        end = datetime.utcnow()
+        with patch("attune.memory.security.audit_logger.datetime") as mock_dt:
+            mock_dt.utcnow.return_value = end + timedelta(hours=1)
+            _llm(audit)
+
+        report = audit.get_compliance_report(end_date=end + timedelta(minutes=1))
+
+        assert report["llm_requests"]["total"] == 1
+
+    def test_violation_summary_by_user(self, audit):
+        """Test violation summary merges per-user rollups across segments."""
+        _llm(audit, "alice", secrets=1)
+        audit._rotate_log()
+        _llm(audit, "alice", secrets=2)
+        _llm(audit, "bob", secrets=1)
+
+        summary = audit.get_violation_summary()
+        alice = audit.get_violation_summary(user_id="alice")
+
+        assert summary["total_violations"] == 3
+        assert summary["by_user"] == {"alice": 2, "bob": 1}
+        assert alice["total_violations"] == 2
+        assert alice["by_type"] == {"secrets_detected": 2}
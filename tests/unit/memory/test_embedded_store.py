@@ -0,0 +1,206 @@
+"""Tests for the embedded store backing short-term memory mock mode.
+
+Tests cover:
+- Mapping compatibility with the previous ``(value, expires)`` dict
+- Sorted-index glob scans and SCAN-style cursors
+- Expiry heap and active reaping
+- List, sorted set and stream types
+- Snapshot persistence through RedisShortTermMemory
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under the Apache License, Version 2.0
+"""
+
+import pytest
+
+from attune.memory import AccessTier, AgentCredentials, RedisShortTermMemory
+from attune.memory.short_term.embedded_store import EmbeddedStore
+from attune.memory.types import RedisConfig
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def store(clock):
+    return EmbeddedStore(clock=clock)
+
+
+class TestMappingCompatibility:
+    """Test that the store still behaves like the dict it replaced."""
+
+    def test_raw_tuple_access(self, store):
+        """Test raw (value, expires) get/set/delete."""
+        store["a"] = ("1", None)
+        store["b"] = ("2", 5.0)
+
+        assert store["b"] == ("2", 5.0)
+        assert "a" in store
+        assert list(store) == ["a", "b"]
+        del store["a"]
+        assert store == {"b": ("2", 5.0)}
+
+    def test_raw_access_ignores_expiry(self, store, clock):
+        """Test that expired raw entries stay until read through TTL-aware APIs."""
+        store["k"] = ("v", clock.now - 1)
+
+        assert "k" in store
+        assert store.get_value("k") is None
+        assert "k" not in store
+
+
+class TestScans:
+    """Test glob scans over the sorted key index."""
+
+    def test_keys_matching_uses_prefix_and_glob(self, store):
+        """Test prefix scans with wildcards after the literal prefix."""
+        for key in ["ns:a:1", "ns:a:2", "ns:b:1", "other:a:1"]:
+            store.set_value(key, "x")
+
+        assert store.keys_matching("ns:a:*") == ["ns:a:1", "ns:a:2"]
+        assert store.keys_matching("ns:*:1") == ["ns:a:1", "ns:b:1"]
+        assert store.keys_matching("ns:b:1") == ["ns:b:1"]
+        assert store.count_prefix("ns:") == 3
+
+    def test_scan_pages_are_complete_and_stable(self, store):
+        """Test that cursors survive inserts and deletes between pages."""
+        for i in range(10):
+            store.set_value(f"k:{i:02d}", i)
+
+        cursor, first = store.scan(match="k:*", count=4)
+        store.delete("k:00")
+        store.set_value("k:99", 99)
+
+        seen = list(first)
+        while cursor != "0":
+            cursor, page = store.scan(cursor=cursor, match="k:*", count=4)
+            seen.extend(page)
+
+        assert seen == [f"k:{i:02d}" for i in range(10)] + ["k:99"]
+
+    def test_scan_skips_expired(self, store, clock):
+        """Test that expired keys are not returned by scans."""
+        store.set_value("k:live", 1, ttl=100)
+        store.set_value("k:dead", 1, ttl=1)
+        clock.now += 10
+
+        assert store.scan(match="k:*") == ("0", ["k:live"])
+
+
+class TestExpiry:
+    """Test the expiry heap and reaping."""
+
+    def test_reap_expired_in_deadline_order(self, store, clock):
+        """Test that reaping removes only expired keys, respecting the limit."""
+        for i in range(5):
+            store.set_value(f"t:{i}", i, ttl=i + 1)
+        store.set_value("persistent", 1)
+        clock.now += 3.5
+
+        assert store.reap_expired(limit=2) == 2
+        assert store.reap_expired() == 1
+        assert sorted(store) == ["persistent", "t:3", "t:4"]
+
+    def test_reset_ttl_supersedes_old_deadline(self, store, clock):
+        """Test that re-setting a key is not reaped by its stale heap entry."""
+        store.set_value("k", "old", ttl=1)
+        store.set_value("k", "new", ttl=100)
+        clock.now += 5
+
+        assert store.reap_expired() == 0
+        assert store.get_value("k") == "new"
+
+    def test_active_reaping_on_write(self, store, clock):
+        """Test that writes reclaim expired keys without explicit reads."""
+        store.set_value("old", 1, ttl=1)
+        clock.now += store.REAP_INTERVAL + 5
+        store.set_value("new", 2)
+
+        assert "old" not in store
+
+
+class TestCollections:
+    """Test list, sorted set and stream types."""
+
+    def test_lists(self, store):
+        """Test FIFO and priority pushes."""
+        store.rpush("q", "a")
+        store.rpush("q", "b")
+        assert store.lpush("q", "urgent") == 3
+
+        assert store.lrange("q", 0, 1) == ["urgent", "a"]
+        assert store.lpop("q") == "urgent"
+        assert store.llen("q") == 2
+
+    def test_sorted_sets(self, store):
+        """Test score ranges, offsets and re-scoring."""
+        for i in range(10):
+            store.zadd("z", f"m{i}", float(i))
+        store.zadd("z", "m0", 20.0)
+
+        assert store.zrangebyscore("z", 2, 5) == ["m2", "m3", "m4", "m5"]
+        assert store.zrangebyscore("z", 2, 5, offset=1, limit=2) == ["m3", "m4"]
+        assert store.zcount("z", 9, 100) == 2
+        assert store.zcard("z") == 10
+
+    def test_streams(self, store, clock):
+        """Test monotonic IDs, exclusive reads and trimming."""
+        ids = [store.xadd("s", {"n": str(i)}, max_len=3) for i in range(5)]
+
+        assert ids[0] == "1000000-0"
+        assert ids[1] == "1000000-1"
+        assert store.xlen("s") == 3
+        entries = store.xread_after("s", ids[2])
+        assert [data["n"] for _, data in entries] == ["3", "4"]
+
+
+class TestPersistence:
+    """Test snapshot persistence."""
+
+    def test_snapshot_round_trip(self, tmp_path, clock):
+        """Test that all data types survive a save/load cycle."""
+        path = tmp_path / "store.json"
+        store = EmbeddedStore(snapshot_path=path, clock=clock)
+        store.set_value("str", "v", ttl=100)
+        store.set_value("gone", "v", ttl=1)
+        store["set"] = ({"a", "b"}, None)
+        store.rpush("list", "x")
+        store.zadd("zset", "m", 1.5)
+        store.xadd("stream", {"f": "1"})
+        clock.now += 10
+
+        assert store.save_snapshot() == 2
+
+        restored = EmbeddedStore(snapshot_path=path, clock=clock)
+        assert restored.get_value("str") == "v"
+        assert restored.get_value("set") == {"a", "b"}
+        assert "gone" not in restored
+        assert restored.lpop("list") == "x"
+        assert restored.zrangebyscore("zset", 0, 2) == ["m"]
+        assert restored.xread_after("stream") == [("1000000-0", {"f": "1"})]
+
+    def test_short_term_memory_persists_on_close(self, tmp_path):
+        """Test mock-mode RedisShortTermMemory snapshots on close."""
+        config = RedisConfig(use_mock=True, mock_snapshot_path=str(tmp_path / "mem.json"))
+        creds = AgentCredentials(agent_id="agent", tier=AccessTier.CONTRIBUTOR)
+
+        memory = RedisShortTermMemory(config=config)
+        memory.stash("key", {"value": 42}, creds)
+        memory.queue_push("tasks", {"n": 1}, creds)
+        memory.close()
+
+        reopened = RedisShortTermMemory(config=config)
+        assert reopened.retrieve("key", creds) == {"value": 42}
+        assert reopened.queue_length("tasks") == 1
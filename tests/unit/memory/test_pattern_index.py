@@ -0,0 +1,158 @@
+"""Tests for the MemDocs pattern metadata/full-text index.
+
+Tests cover:
+- Index maintenance on store/delete
+- Reconciliation with files written or removed outside MemDocsStorage
+- Indexed list/search matching the file-scan results
+- UnifiedMemory.search_patterns loading only the top results
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under the Apache License, Version 2.0
+"""
+
+import json
+
+import pytest
+
+from attune.memory.long_term import Classification, SecureMemDocsIntegration
+from attune.memory.pattern_index import FTS5_AVAILABLE, PatternIndex
+from attune.memory.storage_backend import MemDocsStorage
+
+pytestmark = pytest.mark.skipif(not FTS5_AVAILABLE, reason="SQLite FTS5 trigram unavailable")
+
+
+def _meta(classification="INTERNAL", created_by="alice", pattern_type="note", **extra):
+    return {
+        "classification": classification,
+        "created_by": created_by,
+        "pattern_type": pattern_type,
+        **extra,
+    }
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = MemDocsStorage(str(tmp_path / "patterns"))
+    storage.store("p1", "Retry the flaky workflow with backoff", _meta())
+    storage.store("p2", "Quick sort algorithm", _meta("PUBLIC", "bob", "algorithm"))
+    storage.store("p3", "Workflow timeout handling", _meta("PUBLIC", "alice", "note"))
+    return storage
+
+
+class TestIndexMaintenance:
+    """Test that the index follows store/delete and external changes."""
+
+    def test_store_and_delete_update_index(self, storage):
+        """Test list_patterns reflects stores and deletes."""
+        assert storage.index is not None
+        assert storage.list_patterns() == ["p1", "p2", "p3"]
+
+        storage.delete("p2")
+
+        assert storage.list_patterns() == ["p1", "p3"]
+
+    def test_sync_picks_up_external_files(self, storage):
+        """Test files written or removed directly are reconciled."""
+        external = {"pattern_id": "ext", "content": "x", "metadata": _meta("PUBLIC")}
+        (storage.storage_dir / "ext.json").write_text(json.dumps(external))
+        (storage.storage_dir / "broken.json").write_text("not json")
+        (storage.storage_dir / "p1.json").unlink()
+
+        assert storage.list_patterns(classification="PUBLIC") == ["ext", "p2", "p3"]
+        assert "p1" not in storage.list_patterns()
+        assert storage.index.sync() == 0  # Unchanged files are not re-parsed
+
+    def test_index_persists_across_instances(self, storage):
+        """Test a new storage instance reuses the existing index."""
+        reopened = MemDocsStorage(str(storage.storage_dir))
+
+        assert reopened.index.sync() == 0
+        assert reopened.list_patterns(created_by="bob") == ["p2"]
+
+
+class TestIndexedQueries:
+    """Test indexed listing and search."""
+
+    def test_list_metadata_filters(self, storage):
+        """Test metadata listing without loading content."""
+        results = storage.list_metadata(classification="PUBLIC", pattern_type="note")
+
+        assert [pid for pid, _ in results] == ["p3"]
+        assert results[0][1]["created_by"] == "alice"
+
+    def test_search_ranks_phrase_above_keywords(self, storage):
+        """Test exact phrase matches outrank single keyword matches."""
+        assert storage.search_patterns("flaky workflow") == ["p1", "p3"]
+        assert storage.search_patterns("workflow", classification="PUBLIC") == ["p3"]
+        assert storage.search_patterns("nonexistent") == []
+
+    def test_short_query_uses_substring_match(self, storage):
+        """Test queries shorter than a trigram still match phrases."""
+        assert storage.search_patterns("so") == ["p2"]
+
+    def test_search_matches_scan_fallback(self, storage, monkeypatch):
+        """Test indexed search returns the same ids as the file scan."""
+        indexed = storage.search_patterns("workflow algorithm")
+        monkeypatch.setattr(storage, "index", None)
+
+        assert storage.search_patterns("workflow algorithm") == indexed
+
+    def test_encrypted_content_not_searchable(self, tmp_path):
+        """Test ciphertext is excluded from full-text search."""
+        index = PatternIndex(tmp_path)
+        (tmp_path / "s.json").write_text(
+            json.dumps(
+                {"pattern_id": "s", "content": "secretword", "metadata": {"encrypted": True}}
+            )
+        )
+        index.sync()
+
+        assert index.search("secretword") == []
+
+
+class TestIntegrationUsesIndex:
+    """Test SecureMemDocsIntegration and UnifiedMemory use the index."""
+
+    def test_list_patterns_does_not_load_content(self, tmp_path, monkeypatch):
+        """Test list_patterns and get_statistics avoid retrieve()."""
+        integration = SecureMemDocsIntegration(
+            storage_dir=str(tmp_path / "s"),
+            audit_log_dir=str(tmp_path / "a"),
+            enable_encryption=False,
+        )
+        integration.store_pattern(
+            content="a",
+            pattern_type="note",
+            user_id="u",
+            explicit_classification=Classification.PUBLIC,
+        )
+        monkeypatch.setattr(integration.storage, "retrieve", pytest.fail)
+
+        patterns = integration.list_patterns(user_id="u", classification=Classification.PUBLIC)
+        stats = integration.get_statistics()
+
+        assert [p["pattern_type"] for p in patterns] == ["note"]
+        assert stats["by_classification"]["PUBLIC"] == 1
+
+    def test_unified_search_uses_index(self, tmp_path, monkeypatch):
+        """Test UnifiedMemory.search_patterns is served from the index."""
+        from attune.memory.unified import UnifiedMemory
+
+        storage_dir = tmp_path / "memory_storage"
+        storage_dir.mkdir()
+        for i, content in enumerate(["alpha workflow", "beta", "workflow gamma"]):
+            pattern = {
+                "pattern_id": f"p{i}",
+                "pattern_type": "note",
+                "classification": "INTERNAL",
+                "content": content,
+                "metadata": {},
+            }
+            (storage_dir / f"p{i}.json").write_text(json.dumps(pattern))
+        monkeypatch.setenv("EMPATHY_STORAGE_DIR", str(storage_dir))
+
+        memory = UnifiedMemory(user_id="test_user")
+        monkeypatch.setattr(memory, "_iter_all_patterns", pytest.fail)
+        results = memory.search_patterns("workflow", classification=Classification.INTERNAL)
+
+        assert [r["pattern_id"] for r in results] == ["p0", "p2"]
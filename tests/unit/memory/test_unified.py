@@ -547,7 +547,8 @@ class TestUnifiedMemorySearch:
         config = MemoryConfig(redis_mock=True)
         memory = UnifiedMemory(user_id="test_user", config=config)
 
-        # Mock _iter_all_patterns to return test data (generator)
+        # Mock _iter_all_patterns to return test data (generator), bypassing the index
+        memory._get_pattern_index = MagicMock(return_value=None)
         memory._iter_all_patterns = MagicMock(
             return_value=iter(
                 [
@@ -575,6 +576,7 @@ class TestUnifiedMemorySearch:
         config = MemoryConfig(redis_mock=True)
         memory = UnifiedMemory(user_id="test_user", config=config)
 
+        memory._get_pattern_index = MagicMock(return_value=None)
         memory._iter_all_patterns = MagicMock(
             return_value=iter(
                 [
@@ -10,10 +10,13 @@ Tests cover:
 Created: 2026-01-17
 """
 
+import pytest
+
 from attune.meta_workflows.agent_creator import (
     DynamicAgentCreator,
     estimate_agent_costs,
     group_agents_by_tier_strategy,
+    resolve_agent_dependencies,
     validate_agent_dependencies,
 )
 from attune.meta_workflows.models import (
@@ -447,3 +450,49 @@ class TestValidateAgentDependencies:
         warnings = validate_agent_dependencies(agents)
 
         assert len(warnings) == 0
+
+
+class TestResolveAgentDependencies:
+    """Test dependency resolution used for concurrent execution."""
+
+    @staticmethod
+    def _agent(role, **config):
+        return AgentSpec(
+            role=role,
+            base_template="generic",
+            tier_strategy=TierStrategy.CHEAP_ONLY,
+            config=config,
+            agent_id=f"agent-{role}",
+        )
+
+    def test_role_dependencies(self):
+        """Test built-in role dependencies map to agent ids."""
+        agents = [self._agent("publisher"), self._agent("package_builder")]
+
+        dependencies = resolve_agent_dependencies(agents)
+
+        assert dependencies == {
+            "agent-publisher": ["agent-package_builder"],
+            "agent-package_builder": [],
+        }
+
+    def test_missing_required_role_ignored(self):
+        """Test that absent prerequisites do not block an agent."""
+        dependencies = resolve_agent_dependencies([self._agent("publisher")])
+
+        assert dependencies == {"agent-publisher": []}
+
+    def test_declared_dependencies(self):
+        """Test config depends_on declarations."""
+        agents = [self._agent("reporter", depends_on=["scanner"]), self._agent("scanner")]
+
+        dependencies = resolve_agent_dependencies(agents)
+
+        assert dependencies["agent-reporter"] == ["agent-scanner"]
+
+    def test_cycle_raises(self):
+        """Test that circular dependencies are rejected."""
+        agents = [self._agent("a", depends_on=["b"]), self._agent("b", depends_on=["a"])]
+
+        with pytest.raises(ValueError, match="Circular"):
+            resolve_agent_dependencies(agents)
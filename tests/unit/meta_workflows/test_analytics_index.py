@@ -0,0 +1,171 @@
+"""Unit tests for the meta-workflow analytics index.
+
+Tests cover:
+- Execution summaries and rollups
+- Append-only persistence, replacement and tombstones
+- Incremental refresh and compaction
+- PatternLearner analytics served from the index
+
+Created: 2026-10-18
+"""
+
+from unittest.mock import patch
+
+from attune.meta_workflows import FormResponse, MetaWorkflow, PatternLearner, TemplateRegistry
+from attune.meta_workflows.analytics_index import ExecutionIndex, ExecutionSummary
+
+
+def _summary(run_id, template_id="tmpl", success=True, cost=0.1, agents=None):
+    return ExecutionSummary(
+        run_id=run_id,
+        template_id=template_id,
+        timestamp="2026-01-01T00:00:00",
+        success=success,
+        total_cost=cost,
+        total_duration=1.0,
+        agent_count=len(agents or []),
+        agents=agents or [],
+    )
+
+
+class TestExecutionIndex:
+    """Test ExecutionIndex storage and rollups."""
+
+    def test_record_and_reload(self, tmp_path):
+        """Test that recorded summaries are visible to a new index instance."""
+        index = ExecutionIndex(tmp_path)
+        index.record(_summary("run-1", agents=[("linter", "cheap", True, 0.05)]))
+        index.record(_summary("run-2", template_id="other", success=False, cost=0.3))
+
+        reloaded = ExecutionIndex(tmp_path)
+        reloaded.refresh()
+
+        assert reloaded.run_ids() == {"run-1", "run-2"}
+        assert reloaded.get("run-1").agents == [("linter", "cheap", True, 0.05)]
+        assert reloaded.rollup("other").successful_runs == 0
+        assert reloaded.rollup().runs == 2
+
+    def test_rollup_aggregates(self, tmp_path):
+        """Test per-template rollup values."""
+        index = ExecutionIndex(tmp_path)
+        index.record(_summary("run-1", cost=0.1, agents=[("a", "cheap", True, 0.1)]))
+        index.record(_summary("run-2", cost=0.3, agents=[("a", "cheap", False, 0.3)]))
+
+        rollup = index.rollup("tmpl")
+
+        assert rollup.runs == 2
+        assert rollup.min_cost == 0.1
+        assert rollup.max_cost == 0.3
+        assert rollup.tier_stats["a:cheap"] == {"success": 1, "total": 2, "cost": 0.4}
+        assert rollup.role_stats["a"] == {"total": 2, "failures": 1}
+
+    def test_replace_and_remove(self, tmp_path):
+        """Test that replacements and tombstones rebuild the affected rollup."""
+        index = ExecutionIndex(tmp_path)
+        index.record(_summary("run-1", cost=0.1))
+        index.record(_summary("run-2", cost=0.2))
+        index.record(_summary("run-1", cost=0.5))
+        index.remove("run-2")
+
+        reloaded = ExecutionIndex(tmp_path)
+        reloaded.refresh()
+        rollup = reloaded.rollup("tmpl")
+
+        assert reloaded.run_ids() == {"run-1"}
+        assert rollup.runs == 1
+        assert rollup.total_cost == 0.5
+
+    def test_refresh_is_incremental(self, tmp_path):
+        """Test that a reader picks up lines appended by another writer."""
+        reader = ExecutionIndex(tmp_path)
+        ExecutionIndex(tmp_path).record(_summary("run-1"))
+        reader.refresh()
+        ExecutionIndex(tmp_path).record(_summary("run-2"))
+        reader.refresh()
+
+        assert reader.rollup().runs == 2
+
+    def test_partial_line_ignored_until_complete(self, tmp_path):
+        """Test that a half-written trailing line is not consumed."""
+        index = ExecutionIndex(tmp_path)
+        index.record(_summary("run-1"))
+        with index.index_path.open("a") as f:
+            f.write('{"run_id": "run-2"')
+
+        reader = ExecutionIndex(tmp_path)
+        reader.refresh()
+
+        assert reader.run_ids() == {"run-1"}
+
+    def test_compaction(self, tmp_path):
+        """Test that superseded lines are compacted away."""
+        index = ExecutionIndex(tmp_path)
+        for i in range(150):
+            index.record(_summary("run-1", cost=float(i)))
+
+        assert len(index.index_path.read_text().splitlines()) < 150
+
+        reloaded = ExecutionIndex(tmp_path)
+        reloaded.refresh()
+        assert reloaded.get("run-1").total_cost == 149.0
+
+
+class TestPatternLearnerIndex:
+    """Test that PatternLearner analytics come from the index."""
+
+    @staticmethod
+    def _run_workflows(tmp_path, count=3):
+        registry = TemplateRegistry(storage_dir=".attune/meta_workflows/templates")
+        template = registry.load_template("release-prep")
+        workflow = MetaWorkflow(template=template, storage_dir=str(tmp_path))
+        for _ in range(count):
+            response = FormResponse(template_id="release-prep", responses={"security_scan": "Yes"})
+            workflow.execute(form_response=response, mock_execution=True)
+
+    def test_saved_runs_are_indexed(self, tmp_path):
+        """Test that _save_execution appends a summary to the index."""
+        self._run_workflows(tmp_path, count=1)
+
+        index = ExecutionIndex(tmp_path)
+        index.refresh()
+
+        assert len(index.run_ids()) == 1
+
+    def test_analytics_without_loading_results(self, tmp_path):
+        """Test that insights and reports never reload indexed result files."""
+        self._run_workflows(tmp_path)
+        learner = PatternLearner(executions_dir=str(tmp_path))
+
+        with patch(
+            "attune.meta_workflows.pattern_learner.load_execution_result",
+            side_effect=AssertionError("result file loaded"),
+        ):
+            insights = learner.analyze_patterns(min_confidence=0.0)
+            report = learner.generate_analytics_report(template_id="release-prep")
+
+        assert {i.insight_type for i in insights} >= {"agent_count", "cost_analysis"}
+        assert report["summary"]["total_runs"] == len(list(tmp_path.glob("*/result.json")))
+
+    def test_unindexed_runs_are_backfilled(self, tmp_path):
+        """Test that runs saved before the index existed are indexed once."""
+        self._run_workflows(tmp_path, count=2)
+        (tmp_path / ExecutionIndex.INDEX_FILE).unlink()
+
+        PatternLearner(executions_dir=str(tmp_path)).analyze_patterns()
+
+        index = ExecutionIndex(tmp_path)
+        index.refresh()
+        assert len(index.run_ids()) == len(list(tmp_path.glob("*/result.json")))
+
+    def test_deleted_run_dropped(self, tmp_path):
+        """Test that a removed run directory disappears from analytics."""
+        import shutil
+
+        self._run_workflows(tmp_path, count=1)
+        learner = PatternLearner(executions_dir=str(tmp_path))
+        assert learner.generate_analytics_report()["summary"]["total_runs"] == 1
+
+        for run_dir in tmp_path.glob("*/"):
+            shutil.rmtree(run_dir)
+
+        assert learner.generate_analytics_report()["summary"]["total_runs"] == 0
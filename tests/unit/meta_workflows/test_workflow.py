@@ -355,3 +355,144 @@ class TestAgentExecution:
         agent_ids = {agent.agent_id for agent in result.agents_created}
         result_agent_ids = {result.agent_id for result in result.agent_results}
         assert agent_ids == result_agent_ids
+
+
+class TestConcurrentAgentExecution:
+    """Test concurrent real agent execution."""
+
+    @staticmethod
+    def _agents(*roles):
+        from attune.meta_workflows.models import AgentSpec, TierStrategy
+
+        return [
+            AgentSpec(
+                role=role,
+                base_template="generic",
+                tier_strategy=TierStrategy.CHEAP_ONLY,
+                agent_id=f"agent-{role}",
+            )
+            for role in roles
+        ]
+
+    @staticmethod
+    def _workflow(tmp_path, **kwargs):
+        registry = TemplateRegistry(storage_dir=".attune/meta_workflows/templates")
+        template = registry.load_template("release-prep")
+        return MetaWorkflow(template=template, storage_dir=str(tmp_path), **kwargs)
+
+    @staticmethod
+    def _fake_escalation(timeline, delay=0.2):
+        import time
+
+        from attune.meta_workflows.models import AgentExecutionResult
+
+        def execute(agent, router, tracker):
+            timeline.append(("start", agent.role, time.monotonic()))
+            time.sleep(delay)
+            tracker.track_llm_call(stage=agent.role)
+            timeline.append(("end", agent.role, time.monotonic()))
+            return AgentExecutionResult(
+                agent_id=agent.agent_id,
+                role=agent.role,
+                success=True,
+                cost=0.01,
+                duration=delay,
+                tier_used="cheap",
+                output={},
+            )
+
+        return execute
+
+    def test_independent_agents_run_concurrently(self, tmp_path):
+        """Test that independent agents overlap and results keep input order."""
+        import time
+
+        workflow = self._workflow(tmp_path, max_concurrent_agents=6)
+        agents = self._agents("a", "b", "c", "d", "e", "f")
+        timeline = []
+        tracker = Mock()
+
+        with (
+            patch.object(
+                workflow,
+                "_execute_single_agent_with_escalation",
+                side_effect=self._fake_escalation(timeline),
+            ),
+            patch("attune.meta_workflows.workflow.ModelRouter"),
+            patch("attune.meta_workflows.workflow.UsageTracker.get_instance", return_value=tracker),
+        ):
+            start = time.monotonic()
+            results = workflow._execute_agents_real(agents)
+            elapsed = time.monotonic() - start
+
+        assert [r.role for r in results] == ["a", "b", "c", "d", "e", "f"]
+        assert elapsed < 0.2 * 6 / 2
+        # Telemetry replayed in agent order, not completion order
+        stages = [c.kwargs["stage"] for c in tracker.track_llm_call.call_args_list]
+        assert stages == ["a", "b", "c", "d", "e", "f"]
+
+    def test_concurrency_limit(self, tmp_path):
+        """Test that no more than max_concurrent_agents run at once."""
+        workflow = self._workflow(tmp_path, max_concurrent_agents=2)
+        timeline = []
+
+        with (
+            patch.object(
+                workflow,
+                "_execute_single_agent_with_escalation",
+                side_effect=self._fake_escalation(timeline, delay=0.05),
+            ),
+            patch("attune.meta_workflows.workflow.ModelRouter"),
+            patch("attune.meta_workflows.workflow.UsageTracker.get_instance"),
+        ):
+            workflow._execute_agents_real(self._agents("a", "b", "c", "d", "e"))
+
+        running = 0
+        peak = 0
+        for event, _role, _at in sorted(timeline, key=lambda e: (e[2], e[0] == "start")):
+            running += 1 if event == "start" else -1
+            peak = max(peak, running)
+        assert peak <= 2
+
+    def test_dependencies_respected(self, tmp_path):
+        """Test that dependent agents start after their prerequisites finish."""
+        workflow = self._workflow(tmp_path)
+        agents = self._agents("publisher", "package_builder", "linter")
+        timeline = []
+
+        with (
+            patch.object(
+                workflow,
+                "_execute_single_agent_with_escalation",
+                side_effect=self._fake_escalation(timeline, delay=0.05),
+            ),
+            patch("attune.meta_workflows.workflow.ModelRouter"),
+            patch("attune.meta_workflows.workflow.UsageTracker.get_instance"),
+        ):
+            results = workflow._execute_agents_real(agents)
+
+        times = {(event, role): at for event, role, at in timeline}
+        assert times[("start", "publisher")] >= times[("end", "package_builder")]
+        assert [r.role for r in results] == ["publisher", "package_builder", "linter"]
+
+    def test_agent_error_becomes_failed_result(self, tmp_path):
+        """Test that an exception in one agent does not affect the others."""
+        workflow = self._workflow(tmp_path)
+        timeline = []
+        fake = self._fake_escalation(timeline, delay=0.0)
+
+        def flaky(agent, router, tracker):
+            if agent.role == "b":
+                raise RuntimeError("boom")
+            return fake(agent, router, tracker)
+
+        with (
+            patch.object(workflow, "_execute_single_agent_with_escalation", side_effect=flaky),
+            patch("attune.meta_workflows.workflow.ModelRouter"),
+            patch("attune.meta_workflows.workflow.UsageTracker.get_instance"),
+        ):
+            results = workflow._execute_agents_real(self._agents("a", "b", "c"))
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].tier_used == "error"
+        assert results[1].error == "boom"
@@ -0,0 +1,185 @@
+"""Tests for cache-aware prompt assembly and prompt cache telemetry.
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from attune.cost_tracker import CostTracker
+from attune.models import MockLLMExecutor, PromptLayout, Stability
+from attune.models.telemetry import LLMCallRecord, TelemetryAnalytics, TelemetryStore
+from attune.orchestration.agent_templates import get_template
+from attune.orchestration.execution_strategies import PromptCachedSequentialStrategy
+from attune.workflows.base import BaseWorkflow
+from attune.workflows.compat import ModelTier
+from attune_llm.core import EmpathyLLM
+from attune_llm.providers import AnthropicProvider
+
+GUIDELINES = "Follow the house style. " * 400
+
+
+class TestPromptLayout:
+    """Tests for segment ordering and cache breakpoints."""
+
+    def test_segments_ordered_stable_to_volatile(self):
+        """Test segments render by stability, keeping insertion order within a group."""
+        layout = PromptLayout()
+        layout.add("per-file data", Stability.VOLATILE, "file")
+        layout.add("role", Stability.STATIC, "role")
+        layout.add("stage rules", Stability.STAGE, "stage")
+        layout.add("guidelines", Stability.STATIC, "guidelines")
+        layout.add("", Stability.STATIC, "empty")
+
+        assert layout.render() == "role\nguidelines\nstage rules\nper-file data"
+
+    def test_run_specific_fragments_moved_last(self):
+        """Test a segment with a timestamp or UUID cannot precede cacheable content."""
+        layout = PromptLayout()
+        layout.add("Run 4f0c2a1e-9b7d-4c3e-8a2f-0123456789ab", Stability.STATIC, "run")
+        layout.add("Started 2026-03-01T12:30:00", Stability.SESSION, "time")
+        layout.add("guidelines", Stability.STAGE, "guidelines")
+
+        assert layout.render().startswith("guidelines\n")
+        assert layout.cacheable_prefix() == "guidelines"
+
+    def test_breakpoints_on_long_stable_groups_only(self):
+        """Test cache_control marks stable groups that reach the cacheable minimum."""
+        layout = PromptLayout(model="claude-sonnet-4-5-20250929")
+        layout.add(GUIDELINES, Stability.STATIC, "guidelines")
+        layout.add("Review stage rules", Stability.STAGE, "stage")
+        layout.add("Files: a.py", Stability.VOLATILE, "files")
+
+        blocks = layout.system_blocks()
+
+        assert [b.get("cache_control") for b in blocks] == [
+            {"type": "ephemeral"},
+            {"type": "ephemeral"},
+            None,
+        ]
+        assert "".join(b["text"] for b in blocks) == layout.render()
+        assert all("cache_control" not in b for b in PromptLayout().add("short").system_blocks())
+
+    def test_cached_prefix_independent_of_volatile_data(self):
+        """Test calls differing only in volatile data send identical cached blocks."""
+
+        def blocks(files: str) -> list[dict[str, Any]]:
+            layout = PromptLayout().add(GUIDELINES).add(files, Stability.VOLATILE)
+            return layout.system_blocks()
+
+        first, second = blocks("Files: a.py"), blocks("Files: b.py, c.py")
+
+        assert first[0] == second[0]
+        assert first[1] != second[1]
+
+
+class _LayoutWorkflow(BaseWorkflow):
+    name = "layout-workflow"
+    description = "Uses a prompt layout"
+    stages = ["review"]
+    tier_map = {"review": ModelTier.CHEAP}
+
+    async def run_stage(self, stage_name: str, tier: ModelTier, input_data: Any):
+        return {}, 0, 0
+
+
+class TestWorkflowPrompts:
+    """Tests for the workflow prompt builders."""
+
+    def test_cached_system_prompt_puts_context_last(self, tmp_path: Path):
+        """Test per-call context follows the static guidelines and instructions."""
+        wf = _LayoutWorkflow(
+            cost_tracker=CostTracker(storage_dir=str(tmp_path / ".empathy")),
+            enable_tier_tracking=False,
+        )
+
+        prompt = wf._build_cached_system_prompt(
+            role="code reviewer",
+            guidelines=["Check types"],
+            project_context="Project: attune",
+            context="Reviewed at 2026-03-01T12:30:00",
+        )
+
+        assert prompt.startswith("You are a code reviewer.\n\n# Guidelines\n\n1. Check types")
+        assert prompt.index("# Instructions") < prompt.index("Project: attune")
+        assert prompt.endswith("\nReviewed at 2026-03-01T12:30:00")
+
+
+class TestEmpathyLLMSystemPrompt:
+    """Tests for forwarding workflow system prompts to the provider."""
+
+    async def test_anthropic_receives_cached_blocks(self):
+        """Test a workflow layout reaches Anthropic as blocks after the level prompt."""
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        usage = SimpleNamespace(
+            input_tokens=20,
+            output_tokens=5,
+            cache_creation_input_tokens=0,
+            cache_read_input_tokens=1500,
+        )
+        response = SimpleNamespace(
+            content=[SimpleNamespace(type="text", text="ok")],
+            model=provider.model,
+            usage=usage,
+            stop_reason="end_turn",
+        )
+        provider.client = MagicMock()
+        provider.client.messages.create = AsyncMock(return_value=response)
+        llm = EmpathyLLM(provider="anthropic", api_key="sk-ant-test")
+        llm.provider = provider
+        layout = PromptLayout().add(GUIDELINES).add("Files: a.py", Stability.VOLATILE)
+
+        result = await llm.interact("user", "Review", context={"system_prompt": layout})
+
+        system = provider.client.messages.create.call_args.kwargs["system"]
+        assert "cache_control" in system[0]
+        assert system[-1] == {"type": "text", "text": "\nFiles: a.py"}
+        assert result["metadata"]["cache_read_tokens"] == 1500
+
+
+class TestPromptCacheTelemetry:
+    """Tests for recording and reporting prompt cache usage."""
+
+    def test_report_per_workflow_and_stage(self, tmp_path: Path):
+        """Test hit rate and savings are aggregated per workflow stage."""
+        store = TelemetryStore(str(tmp_path))
+        for i, (read, creation) in enumerate([(0, 1000), (1000, 0), (1000, 0)]):
+            store.log_call(
+                LLMCallRecord(
+                    call_id=str(i),
+                    timestamp="2026-03-01T12:00:00",
+                    workflow_name="code-review",
+                    step_name="scan",
+                    model_id="claude-sonnet-4-5-20250929",
+                    input_tokens=200,
+                    cache_creation_input_tokens=creation,
+                    cache_read_input_tokens=read,
+                )
+            )
+
+        (report,) = TelemetryAnalytics(store).prompt_cache_report()
+
+        assert (report["workflow_name"], report["stage"]) == ("code-review", "scan")
+        assert report["calls"] == 3 and report["calls_with_hits"] == 2
+        assert report["hit_rate"] == 2000 / 3600
+        # Two reads at 90% off, one write at a 25% markup, $3/M input
+        assert abs(report["savings"] - 3e-6 * (2000 * 0.9 - 1000 * 0.25)) < 1e-12
+
+    async def test_strategy_shares_cached_context(self):
+        """Test every agent's system prompt starts with the shared context."""
+        executor = MockLLMExecutor()
+        strategy = PromptCachedSequentialStrategy(cached_context=GUIDELINES, executor=executor)
+        agents = [get_template("code_reviewer"), get_template("security_auditor")]
+
+        result = await strategy.execute(agents, {"task": "Review the release"})
+
+        assert result.success
+        systems = [call["system"] for call in executor.call_history]
+        assert all(s.system_blocks()[0]["text"] == GUIDELINES for s in systems)
+        assert systems[0].render() != systems[1].render()
+        assert "Review the release" in executor.call_history[1]["prompt"]
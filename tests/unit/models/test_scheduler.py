@@ -0,0 +1,282 @@
+"""Unit Tests for the LLM Scheduler
+
+Tests cover:
+- Token buckets for requests/minute and tokens/minute
+- Priority admission when the concurrency window is full
+- AIMD window reaction to successes and 429s
+- EmpathyLLMExecutor admission through the scheduler
+
+Copyright 2025 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from attune.models import ExecutionContext
+from attune.models.empathy_executor import EmpathyLLMExecutor
+from attune.models.scheduler import (
+    LLMScheduler,
+    ModelLimits,
+    Priority,
+    TokenBucket,
+    current_priority,
+    is_rate_limit_error,
+    llm_priority,
+    load_limits,
+)
+
+
+class RateLimitError(Exception):
+    """Stand-in for anthropic.RateLimitError."""
+
+    def __init__(self, retry_after=None):
+        super().__init__("rate limited")
+        self.response = MagicMock(headers={"retry-after": retry_after} if retry_after else {})
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_refills_over_time(self):
+        """Test consumed tokens refill at the per-minute rate."""
+        now = [0.0]
+        bucket = TokenBucket(capacity=2, per_minute=60, clock=lambda: now[0])
+
+        bucket.consume(2)
+        assert bucket.wait_time(1) == pytest.approx(1.0)
+
+        now[0] = 0.5
+        assert bucket.wait_time(1) == pytest.approx(0.5)
+
+        now[0] = 10.0
+        assert bucket.tokens == 2  # Capped at capacity
+
+    def test_oversized_request_waits_for_full_bucket(self):
+        """Test requests larger than capacity are clamped instead of blocking forever."""
+        bucket = TokenBucket(capacity=100, per_minute=6000, clock=time.monotonic)
+
+        assert bucket.wait_time(1000) == 0.0
+
+
+class TestSchedulerAdmission:
+    """Tests for queueing and admission."""
+
+    @pytest.mark.asyncio
+    async def test_interactive_jumps_ahead_of_batch(self):
+        """Test queued interactive calls are admitted before earlier batch calls."""
+        scheduler = LLMScheduler(initial_window=1, max_window=1)
+        order = []
+        release = asyncio.Event()
+
+        async def call(name, priority):
+            async with scheduler.slot("m", priority=priority):
+                order.append(name)
+                if name == "first":
+                    await release.wait()
+
+        first = asyncio.create_task(call("first", Priority.NORMAL))
+        await asyncio.sleep(0)
+        batch = [asyncio.create_task(call(f"batch{i}", Priority.BATCH)) for i in range(2)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(call("interactive", Priority.INTERACTIVE))
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(first, interactive, *batch)
+
+        assert order == ["first", "interactive", "batch0", "batch1"]
+
+    @pytest.mark.asyncio
+    async def test_tokens_per_minute_paces_calls(self):
+        """Test a drained tokens/minute bucket delays the next call."""
+        scheduler = LLMScheduler(
+            default_limits=ModelLimits(requests_per_minute=1000, tokens_per_minute=60_000)
+        )
+
+        async with scheduler.slot("m", estimated_tokens=60_000):
+            pass
+        start = time.monotonic()
+        async with scheduler.slot("m", estimated_tokens=300):
+            pass
+
+        assert time.monotonic() - start >= 0.25
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Test cancelling a queued call does not leak its slot."""
+        scheduler = LLMScheduler(initial_window=1, max_window=1)
+
+        async with scheduler.slot("m"):
+            waiter = asyncio.create_task(scheduler.slot("m").__aenter__())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        async with scheduler.slot("m"):
+            assert scheduler.get_stats()["m"]["in_flight"] == 1
+
+
+class TestAdaptiveWindow:
+    """Tests for the AIMD concurrency window."""
+
+    @pytest.mark.asyncio
+    async def test_success_increases_window(self):
+        """Test successful calls grow the window additively."""
+        scheduler = LLMScheduler(initial_window=2)
+
+        for _ in range(4):
+            async with scheduler.slot("m"):
+                pass
+
+        assert 3.0 < scheduler.get_stats()["m"]["window"] < 4.0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_halves_window_and_pauses(self):
+        """Test a 429 halves the window and honors retry-after."""
+        scheduler = LLMScheduler(initial_window=8)
+
+        with pytest.raises(RateLimitError):
+            async with scheduler.slot("m"):
+                raise RateLimitError(retry_after="0.3")
+
+        stats = scheduler.get_stats()["m"]
+        assert stats["window"] == 4.0
+        assert stats["rate_limited"] == 1
+
+        start = time.monotonic()
+        async with scheduler.slot("m"):
+            pass
+        assert time.monotonic() - start >= 0.25
+
+
+class TestEventLoops:
+    """Tests for sharing one scheduler between event loops."""
+
+    def test_successive_and_threaded_loops(self):
+        """Test calls from separate loops never wait on another loop's futures."""
+        scheduler = LLMScheduler(initial_window=1, max_window=1)
+
+        async def calls():
+            for _ in range(3):
+                async with scheduler.slot("m"):
+                    await asyncio.sleep(0.01)
+
+        for _ in range(2):
+            asyncio.run(calls())
+        threads = [threading.Thread(target=asyncio.run, args=(calls(),)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert not any(thread.is_alive() for thread in threads)
+        stats = scheduler.get_stats()["m"]
+        assert (stats["in_flight"], stats["queued"]) == (0, 0)
+        assert stats["requests_available"] < ModelLimits().requests_per_minute - 14
+
+
+class TestLimits:
+    """Tests for limit configuration."""
+
+    def test_limits_from_file_and_env(self, tmp_path, monkeypatch):
+        """Test the limits file sets model/provider limits and env overrides the default."""
+        path = tmp_path / "llm_limits.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "default": {"requests_per_minute": 10},
+                    "anthropic": {"requests_per_minute": 1000, "tokens_per_minute": 400000},
+                    "claude-opus-4-6": {"tokens_per_minute": None},
+                    "broken": {"requests_per_minute": "fast"},
+                }
+            )
+        )
+        monkeypatch.setenv("ATTUNE_LLM_LIMITS", str(path))
+        monkeypatch.setenv("ATTUNE_LLM_TOKENS_PER_MINUTE", "5000")
+
+        limits, default = load_limits()
+        scheduler = LLMScheduler(limits=limits, default_limits=default)
+
+        assert default == ModelLimits(requests_per_minute=10, tokens_per_minute=5000)
+        assert "broken" not in limits
+        assert scheduler.limits_for("claude-sonnet-4-5", "anthropic").requests_per_minute == 1000
+        assert scheduler.limits_for("claude-opus-4-6", "anthropic").tokens_per_minute is None
+        assert scheduler.limits_for("gpt-4o", "openai") == default
+
+    @pytest.mark.asyncio
+    async def test_local_provider_has_no_buckets(self):
+        """Test ollama calls skip the rate limit buckets."""
+        scheduler = LLMScheduler(default_limits=ModelLimits(requests_per_minute=1))
+
+        for _ in range(3):
+            async with scheduler.slot("llama3.1:8b", 10_000_000, provider="ollama"):
+                pass
+
+        stats = scheduler.get_stats()["llama3.1:8b"]
+        assert stats["requests_available"] is None
+        assert stats["tokens_available"] is None
+
+    def test_rate_limit_detection(self):
+        """Test 429s are matched by status or wording, not by a stray "429"."""
+        assert is_rate_limit_error(RateLimitError())
+        status_error = RuntimeError("Too many requests")
+        status_error.status_code = 429
+        assert is_rate_limit_error(status_error)
+        assert is_rate_limit_error(RuntimeError("Rate limit exceeded"))
+        assert not is_rate_limit_error(ValueError("Parsed 1429 lines"))
+        assert not is_rate_limit_error(KeyError("req_4291ab"))
+
+
+class TestPriorityScope:
+    """Tests for llm_priority."""
+
+    @pytest.mark.asyncio
+    async def test_scope_propagates_to_tasks(self):
+        """Test tasks created inside the scope inherit its priority."""
+
+        async def read():
+            return current_priority()
+
+        with llm_priority(Priority.BATCH):
+            inner = await asyncio.create_task(read())
+
+        assert inner == Priority.BATCH
+        assert current_priority() == Priority.NORMAL
+
+
+class TestExecutorIntegration:
+    """Tests for EmpathyLLMExecutor admission."""
+
+    @pytest.mark.asyncio
+    async def test_executor_uses_context_priority_and_actual_tokens(self):
+        """Test executor calls are admitted per model with the context priority."""
+        scheduler = LLMScheduler()
+        llm = MagicMock()
+        llm.interact = AsyncMock(
+            return_value={"content": "ok", "metadata": {"tokens_used": 1234, "output_tokens": 5}}
+        )
+        executor = EmpathyLLMExecutor(empathy_llm=llm, provider="anthropic")
+
+        with (
+            patch("attune.models.empathy_executor.get_llm_scheduler", return_value=scheduler),
+            patch.object(scheduler, "slot", wraps=scheduler.slot) as slot,
+        ):
+            response = await executor.run(
+                "summarize",
+                "Summarize this",
+                context=ExecutionContext(priority=Priority.INTERACTIVE),
+            )
+
+        assert response.content == "ok"
+        model, _, priority = slot.call_args.args
+        assert priority == Priority.INTERACTIVE
+        stats = scheduler.get_stats()[model]
+        assert stats["in_flight"] == 0
+        assert stats["tokens_available"] < ModelLimits().tokens_per_minute - 1000
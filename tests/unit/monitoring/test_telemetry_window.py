@@ -0,0 +1,217 @@
+"""Tests for incremental sliding-window telemetry metrics.
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+import json
+import random
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from attune.monitoring.alerts import AlertEngine, AlertMetric
+from attune.monitoring.telemetry_window import (
+    LatencySketch,
+    SlidingWindowMetrics,
+    TelemetryTailer,
+)
+
+NOW = 1_700_000_040.0  # Fixed past epoch seconds, aligned to a minute
+
+
+def _append(path: Path, *entries: dict) -> None:
+    with open(path, "a") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def _entry(ts: float, cost: float = 1.0, duration_ms: int = 100, **extra) -> dict:
+    return {
+        "timestamp": datetime.fromtimestamp(ts).isoformat(),
+        "cost": cost,
+        "tokens": {"total": 10},
+        "duration_ms": duration_ms,
+        **extra,
+    }
+
+
+class TestLatencySketch:
+    """Tests for LatencySketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test quantiles of a skewed distribution stay within 1%."""
+        values = sorted(random.Random(42).lognormvariate(6, 1) for _ in range(10_000))
+        sketch = LatencySketch(relative_accuracy=0.01)
+        for v in values:
+            sketch.add(v)
+
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+    def test_merge_and_subtract(self):
+        """Test subtracting a merged sketch restores the original."""
+        base, other = LatencySketch(), LatencySketch()
+        for v in (10, 20, 30):
+            base.add(v)
+        for v in (5000, 6000):
+            other.add(v)
+
+        base.merge(other)
+        assert base.quantile(1.0) == pytest.approx(6000, rel=0.01)
+
+        base.subtract(other)
+        assert base.count == 3
+        assert base.quantile(1.0) == pytest.approx(30, rel=0.01)
+
+
+class TestSlidingWindowMetrics:
+    """Tests for SlidingWindowMetrics."""
+
+    def test_hour_and_day_windows_expire(self):
+        """Test calls leave the 1h window after an hour and the 24h window after a day."""
+        window = SlidingWindowMetrics()
+        window.add(NOW, cost=2.0, tokens=100, latency_ms=200)
+        window.add(NOW + 30 * 60, cost=1.0, tokens=50, latency_ms=400, error=True)
+
+        metrics = window.metrics(NOW + 45 * 60)
+        assert metrics["hourly_cost"] == 3.0
+        assert metrics["daily_cost"] == 3.0
+        assert metrics["error_rate"] == 50.0
+
+        metrics = window.metrics(NOW + 70 * 60)
+        assert metrics["hourly_cost"] == 1.0
+        assert metrics["hourly_error_rate"] == 100.0
+        assert metrics["daily_cost"] == 3.0
+
+        metrics = window.metrics(NOW + 24 * 3600 + 60)
+        assert metrics["daily_cost"] == 1.0
+        assert metrics["token_usage"] == 50
+
+        metrics = window.metrics(NOW + 3 * 24 * 3600)
+        assert metrics["daily_cost"] == 0.0
+        assert metrics["p99_latency"] == 0.0
+
+    def test_out_of_order_and_stale_entries(self):
+        """Test late entries count in their own minute and stale ones are dropped."""
+        window = SlidingWindowMetrics()
+        window.add(NOW, cost=1.0)
+
+        assert window.add(NOW - 2 * 3600, cost=4.0)
+        assert not window.add(NOW - 25 * 3600, cost=100.0)
+
+        metrics = window.metrics(NOW)
+        assert metrics["daily_cost"] == 5.0
+        assert metrics["hourly_cost"] == 1.0
+
+
+class TestTelemetryTailer:
+    """Tests for TelemetryTailer."""
+
+    def test_reads_only_appended_lines(self, tmp_path):
+        """Test each poll parses only new complete lines."""
+        path = tmp_path / "usage.jsonl"
+        tailer = TelemetryTailer(path)
+        assert tailer.poll() == 0  # Missing file
+
+        _append(path, _entry(NOW), _entry(NOW))
+        assert tailer.poll() == 2
+
+        _append(path, _entry(NOW))
+        with open(path, "a") as f:
+            f.write('{"timestamp": "partial')
+        assert tailer.poll() == 1
+        assert tailer.lines_read == 3
+
+        with open(path, "a") as f:
+            f.write(f'", "cost": 1}}\n{json.dumps(_entry(NOW))}\n')
+        tailer.poll()
+        assert tailer.lines_read == 5
+
+    def test_follows_rotation(self, tmp_path):
+        """Test lines written before a rotation are read from the rotated file."""
+        path = tmp_path / "usage.jsonl"
+        tailer = TelemetryTailer(path)
+        _append(path, _entry(NOW, cost=1.0))
+        tailer.poll()
+
+        _append(path, _entry(NOW, cost=2.0))
+        path.rename(tmp_path / "usage.2026-01-01.jsonl")
+        _append(path, _entry(NOW, cost=4.0))
+
+        assert tailer.poll() == 2
+        assert tailer.window.metrics(NOW)["daily_cost"] == 7.0
+
+    def test_truncated_file_is_reread(self, tmp_path):
+        """Test a file that shrinks is followed from the start."""
+        path = tmp_path / "usage.jsonl"
+        tailer = TelemetryTailer(path)
+        _append(path, *[_entry(NOW)] * 5)
+        tailer.poll()
+
+        path.write_text(json.dumps(_entry(NOW, cost=3.0)) + "\n")
+
+        assert tailer.poll() == 1
+
+    def test_usage_tracker_entries(self, tmp_path):
+        """Test UsageTracker entries (UTC ``ts``, input/output tokens) are counted."""
+        path = tmp_path / "usage.jsonl"
+        ts = datetime.fromtimestamp(NOW, tz=timezone.utc).replace(tzinfo=None)
+        _append(
+            path,
+            {
+                "ts": ts.isoformat() + "Z",
+                "cost": 0.5,
+                "tokens": {"input": 30, "output": 12},
+                "duration_ms": 900,
+            },
+        )
+        tailer = TelemetryTailer(path)
+        tailer.poll()
+
+        metrics = tailer.window.metrics(NOW)
+        assert metrics["daily_cost"] == 0.5
+        assert metrics["token_usage"] == 42
+
+
+class TestAlertEngineIncremental:
+    """Tests for AlertEngine using the incremental window."""
+
+    def test_metrics_update_without_rescan(self, tmp_path):
+        """Test repeated checks parse each telemetry line once."""
+        path = tmp_path / "usage.jsonl"
+        now = datetime.now().timestamp()
+        _append(path, *[_entry(now, duration_ms=100)] * 99, _entry(now, duration_ms=9000))
+        engine = AlertEngine(db_path=tmp_path / "alerts.db", telemetry_dir=tmp_path)
+
+        first = engine.get_metrics()
+        engine.get_metrics()
+        assert engine._tailer.lines_read == 100
+        assert first["p50_latency"] == pytest.approx(100, rel=0.01)
+        assert first["p99_latency"] == pytest.approx(100, rel=0.01)
+        assert first["daily_cost"] == 100.0
+
+        _append(path, _entry(now, cost=5.0))
+        assert engine.get_metrics()["daily_cost"] == 105.0
+        assert engine._tailer.lines_read == 101
+
+    def test_percentile_alert_triggers(self, tmp_path):
+        """Test an alert on p95 latency fires from window metrics."""
+        path = tmp_path / "usage.jsonl"
+        now = datetime.now().timestamp()
+        _append(path, *[_entry(now, duration_ms=ms) for ms in range(100, 10_100, 100)])
+        engine = AlertEngine(db_path=tmp_path / "alerts.db", telemetry_dir=tmp_path)
+        engine.add_alert(
+            alert_id="p95",
+            name="P95 Latency",
+            metric=AlertMetric.P95_LATENCY,
+            threshold=9000,
+            channel="stdout",
+        )
+
+        events = engine.check_and_trigger()
+
+        assert [e.alert_id for e in events] == ["p95"]
+        assert events[0].current_value == pytest.approx(9500, rel=0.02)
@@ -803,6 +803,82 @@ class TestConfigurationStore:
         assert result is None
 
 
+class TestConfigurationManifest:
+    """Test the manifest index used by queries"""
+
+    @pytest.fixture
+    def storage_dir(self, tmp_path):
+        """Storage directory with three saved configurations."""
+        storage_dir = tmp_path / "compositions"
+        store = ConfigurationStore(storage_dir=str(storage_dir))
+        for config_id, task, rate, quality in [
+            ("a", "release_prep", 0.7, 90.0),
+            ("b", "release_prep", 0.95, 80.0),
+            ("c", "test_coverage", 0.9, 85.0),
+        ]:
+            store.save(
+                AgentConfiguration(
+                    id=config_id,
+                    task_pattern=task,
+                    agents=[],
+                    strategy="sequential",
+                    quality_gates={},
+                    success_rate=rate,
+                    avg_quality_score=quality,
+                )
+            )
+        return storage_dir
+
+    def test_manifest_maintained_by_save_and_delete(self, storage_dir):
+        """Test save and delete keep the manifest in sync."""
+        store = ConfigurationStore(storage_dir=str(storage_dir))
+        store.delete("a")
+
+        manifest = json.loads((storage_dir / ".manifest").read_text())
+
+        assert [entry["id"] for entry in manifest["configs"]] == ["b", "c"]
+        assert manifest["configs"][0]["task_pattern"] == "release_prep"
+        assert manifest["configs"][0]["success_rate"] == 0.95
+
+    def test_reopen_queries_without_parsing(self, storage_dir, monkeypatch):
+        """Test a fresh store answers from the manifest and hydrates only results."""
+        store = ConfigurationStore(storage_dir=str(storage_dir))
+        parsed = []
+        original = store._read_config
+        monkeypatch.setattr(
+            store, "_read_config", lambda path: parsed.append(path.name) or original(path)
+        )
+
+        best = store.get_best_for_task("release_prep")
+        results = store.search(min_success_rate=0.8, min_quality_score=84.0)
+
+        assert best.id == "b"
+        assert [c.id for c in results] == ["c"]
+        assert parsed == ["b.json", "c.json"]
+
+    def test_external_changes_reconciled(self, storage_dir):
+        """Test files added, edited or removed outside the store are picked up."""
+        data = json.loads((storage_dir / "a.json").read_text())
+        data["success_rate"] = 0.99
+        (storage_dir / "a.json").write_text(json.dumps(data))
+        (storage_dir / "b.json").unlink()
+
+        store = ConfigurationStore(storage_dir=str(storage_dir))
+
+        assert store.get_best_for_task("release_prep").id == "a"
+        assert [c.id for c in store.search()] == ["a", "c"]
+
+    def test_resave_reranks(self, storage_dir):
+        """Test saving updated metrics re-ranks the configuration."""
+        store = ConfigurationStore(storage_dir=str(storage_dir))
+        config = store.load("a")
+        config.success_rate = 1.0
+        store.save(config)
+
+        assert store.get_best_for_task("release_prep").id == "a"
+        assert [c.id for c in store.search(task_pattern="release_prep")] == ["a", "b"]
+
+
 class TestPathValidation:
     """Test _validate_file_path security function"""
 
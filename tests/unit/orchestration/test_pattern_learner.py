@@ -355,6 +355,84 @@ class TestLearningStore:
         patterns = [r.pattern for r, _ in similar]
         assert "sequential" in patterns or "conditional" in patterns
 
+    def test_save_appends_to_log(self, temp_storage):
+        """Test that save() appends new records instead of rewriting the snapshot."""
+        store = LearningStore(temp_storage)
+        store.add_record(ExecutionRecord(pattern="sequential", success=True, duration_seconds=1.0))
+        store.save()
+        store.add_record(ExecutionRecord(pattern="parallel", success=False, duration_seconds=2.0))
+        store.save()
+
+        assert not store.file_path.exists()
+        assert len(store.log_path.read_text().splitlines()) == 2
+
+        reloaded = LearningStore(temp_storage)
+        assert len(reloaded._records) == 2
+        assert reloaded.get_stats("parallel").total_executions == 1
+
+    def test_compaction(self, temp_storage):
+        """Test that the log is folded into the snapshot past the threshold."""
+        store = LearningStore(temp_storage, compact_threshold=5)
+        for i in range(12):
+            store.add_record(
+                ExecutionRecord(pattern="sequential", success=i % 2 == 0, duration_seconds=1.0)
+            )
+        store.save()
+
+        assert store.file_path.exists()
+
+        reloaded = LearningStore(temp_storage)
+        stats = reloaded.get_stats("sequential")
+        assert len(reloaded._records) == 12
+        assert stats.total_executions == 12
+        assert stats.success_count == 6
+
+    def test_replay_skips_records_already_in_snapshot(self, temp_storage):
+        """Test that a log left behind by an interrupted compaction is not double counted."""
+        store = LearningStore(temp_storage)
+        store.add_record(ExecutionRecord(pattern="sequential", success=True, duration_seconds=1.0))
+        store.save()
+        stale_log = store.log_path.read_text()
+        store.compact()
+        store.log_path.write_text(stale_log + "{not json\n")
+
+        reloaded = LearningStore(temp_storage)
+        assert len(reloaded._records) == 1
+        assert reloaded.get_stats("sequential").total_executions == 1
+
+    def test_find_similar_matches_full_scan(self, temp_storage):
+        """Test that bucketed search returns the same matches as scoring every record."""
+        store = LearningStore(temp_storage)
+        task_types = ["code_review", "code_analysis", "test_gen", "security_scan", ""]
+        for i in range(200):
+            store.add_record(
+                ExecutionRecord(
+                    pattern=f"p{i % 4}",
+                    success=True,
+                    duration_seconds=1.0,
+                    context_features={
+                        "task_type": task_types[i % len(task_types)],
+                        "agent_count": i % 6,
+                        "has_conditions": i % 3 == 0,
+                        "has_nesting": i % 7 == 0,
+                        "priority": "high" if i % 2 else "normal",
+                    },
+                )
+            )
+
+        signature = ContextSignature(task_type="code_review", agent_count=3, priority="high")
+        expected = [
+            (record, signature.similarity(ContextSignature.from_features(record.context_features)))
+            for record in store._records
+        ]
+        expected = [item for item in expected if item[1] > 0.3]
+        expected.sort(key=lambda x: x[1], reverse=True)
+
+        result = store.find_similar_records(signature, limit=15)
+
+        assert [score for _, score in result] == [score for _, score in expected[:15]]
+        assert [r for r, _ in result] == [r for r, _ in expected[:15]]
+
 
 # =============================================================================
 # PatternRecommender Tests
@@ -71,6 +71,130 @@ class TestTFIDFEmbeddingProvider:
         assert len(embedding) == 64
 
 
+class TestEmbeddingMatrix:
+    """Tests for the NumPy-backed EmbeddingMatrix."""
+
+    def test_search_matches_pure_python(self, vector_store):
+        """Test matrix search ranks goals like the pure-Python cosine path."""
+        for text in [
+            "Automate code reviews",
+            "Security scanning",
+            "Code quality checks",
+            "Cooking",
+        ]:
+            vector_store.add(goal_text=text)
+
+        fast = vector_store.search("code review quality", top_k=3)
+        vector_store._matrix = None
+        slow = vector_store.search("code review quality", top_k=3)
+
+        assert [r.goal.goal_id for r in fast] == [r.goal.goal_id for r in slow]
+        for f, s in zip(fast, slow, strict=True):
+            assert math.isclose(f.similarity, s.similarity, abs_tol=1e-5)
+
+    def test_remove_and_grow(self):
+        """Test swap-removal keeps IDs and rows aligned while growing."""
+        from attune.socratic.embeddings import EmbeddingMatrix
+
+        matrix = EmbeddingMatrix(dimension=2, capacity=1)
+        matrix.add_batch(["a", "b", "c"], [[1, 0], [0, 1], [1, 1]])
+        assert matrix.remove("a") is True
+
+        assert matrix.ids == ["c", "b"]
+        assert matrix.search([0, 1], top_k=1)[0][0] == "b"
+        assert [m[0] for m in matrix.search([1, 0], top_k=5, mask=[False, True])] == ["b"]
+
+    def test_batch_embedding_matches_single(self):
+        """Test vectorized embed_batch equals per-text embed."""
+        from attune.socratic.embeddings import TFIDFEmbeddingProvider
+
+        provider = TFIDFEmbeddingProvider(dimension=32)
+        texts = ["Code review code", "", "security scan"]
+
+        for batch, single in zip(
+            provider.embed_batch(texts), map(provider.embed, texts), strict=True
+        ):
+            assert all(math.isclose(a, b, abs_tol=1e-6) for a, b in zip(batch, single, strict=True))
+
+    def test_persistence_round_trip(self, storage_path):
+        """Test embeddings persist to a memory-mapped sidecar matrix."""
+        from attune.socratic.embeddings import TFIDFEmbeddingProvider, VectorStore
+
+        path = storage_path / "goals.json"
+        store = VectorStore(provider=TFIDFEmbeddingProvider(dimension=16), storage_path=path)
+        store.add_batch([{"goal_text": "Automate code reviews"}, {"goal_text": "Write docs"}])
+
+        reopened = VectorStore(provider=TFIDFEmbeddingProvider(dimension=16), storage_path=path)
+        assert reopened.matrix_path == store.matrix_path
+        assert reopened.matrix_path.exists()
+        assert len(reopened) == 2
+        assert reopened.search("code reviews", top_k=1)[0].goal.goal_text == "Automate code reviews"
+        for goal in store:
+            loaded = reopened.get(goal.goal_id).embedding
+            assert not isinstance(loaded, list)  # Read from the mapped matrix on access
+            pairs = zip(loaded, goal.embedding, strict=True)
+            assert all(math.isclose(a, b, abs_tol=1e-6) for a, b in pairs)
+
+        reopened.add(goal_text="Run tests")  # Copies the read-only mapped matrix on write
+        assert len(reopened._matrix) == 3
+        assert not store.matrix_path.exists()  # Replaced by the new sidecar
+
+    def test_missing_sidecar_reembeds_goals(self, storage_path):
+        """Test losing the sidecar re-embeds stored goals instead of dropping them."""
+        from attune.socratic.embeddings import TFIDFEmbeddingProvider, VectorStore
+
+        path = storage_path / "goals.json"
+        store = VectorStore(provider=TFIDFEmbeddingProvider(dimension=16), storage_path=path)
+        store.add_batch([{"goal_text": "Automate code reviews"}, {"goal_text": "Write docs"}])
+        store.matrix_path.unlink()
+
+        reopened = VectorStore(provider=TFIDFEmbeddingProvider(dimension=16), storage_path=path)
+        assert len(reopened) == 2
+        assert reopened.search("code reviews", top_k=1)[0].goal.goal_text == "Automate code reviews"
+
+        reopened.add(goal_text="Run tests")
+        assert len(VectorStore(TFIDFEmbeddingProvider(dimension=16), storage_path=path)) == 3
+
+    def test_dimension_change_reembeds_goals(self, storage_path):
+        """Test a store saved with another dimension is re-embedded, not zero-filled."""
+        from attune.socratic.embeddings import TFIDFEmbeddingProvider, VectorStore
+
+        path = storage_path / "goals.json"
+        VectorStore(TFIDFEmbeddingProvider(dimension=16), storage_path=path).add("Write docs")
+
+        reopened = VectorStore(TFIDFEmbeddingProvider(dimension=32), storage_path=path)
+
+        assert reopened._matrix.dimension == 32
+        assert reopened.search("docs", top_k=1)[0].similarity > 0.5
+
+    def test_batch_saves_once(self, storage_path):
+        """Test adds inside batch() are written when the block exits."""
+        from attune.socratic.embeddings import TFIDFEmbeddingProvider, VectorStore
+
+        path = storage_path / "goals.json"
+        store = VectorStore(provider=TFIDFEmbeddingProvider(dimension=16), storage_path=path)
+
+        with store.batch():
+            store.add(goal_text="Automate code reviews")
+            store.add(goal_text="Write docs")
+            assert not path.exists()
+
+        assert len(VectorStore(TFIDFEmbeddingProvider(dimension=16), storage_path=path)) == 2
+
+    def test_unreadable_store_is_kept(self, storage_path):
+        """Test a corrupt store is backed up rather than overwritten."""
+        from attune.socratic.embeddings import VectorStore
+
+        path = storage_path / "goals.json"
+        path.write_text("{not json")
+
+        store = VectorStore(storage_path=path)
+        store.add(goal_text="Write docs")
+
+        assert path.with_name("goals.json.bak").read_text() == "{not json"
+        assert len(VectorStore(storage_path=path)) == 1
+
+
 class TestVectorStore:
     """Tests for VectorStore class."""
 
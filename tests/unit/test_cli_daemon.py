@@ -0,0 +1,213 @@
+"""Tests for the warm CLI daemon and its forwarding client.
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from attune import cli_daemon
+from attune.project_index import index as index_module
+
+pytestmark = pytest.mark.skipif(not cli_daemon.SUPPORTED, reason="requires fork and AF_UNIX")
+
+RUNNER = """
+import os
+import sys
+
+
+def main(argv):
+    print(" ".join(argv))
+    print(os.getcwd())
+    print(os.environ.get("DAEMON_TEST_MARK", ""))
+    print("to-stderr", file=sys.stderr)
+    return int(argv[0]) if argv and argv[0].isdigit() else 0
+"""
+
+
+@pytest.fixture
+def workdir():
+    """Short temporary directory (Unix socket paths are length-limited)."""
+    path = Path(tempfile.mkdtemp(prefix="attd", dir="/tmp"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _start_daemon(workdir: Path, idle_timeout: float = 60.0) -> tuple[subprocess.Popen, Path]:
+    (workdir / "daemon_runner.py").write_text(RUNNER)
+    watch = workdir / "watched"
+    watch.mkdir()
+    (watch / "module.py").write_text("x = 1\n")
+    sock = workdir / "d.sock"
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(workdir), *sys.path])
+    env.pop(cli_daemon.ENV_VAR, None)
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "attune.cli_daemon",
+            "--socket",
+            str(sock),
+            "--idle-timeout",
+            str(idle_timeout),
+            "--watch",
+            str(watch),
+            "--runner",
+            "daemon_runner:main",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while cli_daemon.request("status", sock) is None:
+        assert process.poll() is None, "daemon exited during start-up"
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.05)
+    return process, sock
+
+
+@pytest.fixture
+def daemon(workdir):
+    """Run a daemon subprocess with a test runner instead of the real CLI."""
+    process, sock = _start_daemon(workdir)
+    yield process, sock, workdir
+    if process.poll() is None:
+        process.kill()
+    process.wait()
+
+
+def _run(sock: Path, argv: list[str], workdir: Path) -> tuple[int | None, str, str]:
+    out_path, err_path = workdir / "out.txt", workdir / "err.txt"
+    with (
+        open(os.devnull) as stdin,
+        open(out_path, "w") as stdout,
+        open(err_path, "w") as stderr,
+    ):
+        code = cli_daemon.forward(argv, sock, (stdin.fileno(), stdout.fileno(), stderr.fileno()))
+    return code, out_path.read_text(), err_path.read_text()
+
+
+class TestForward:
+    """Tests for running commands through the daemon."""
+
+    def test_forwards_argv_cwd_env_and_exit_code(self, daemon, monkeypatch):
+        """Test the command sees the caller's context and its output reaches the caller."""
+        process, sock, workdir = daemon
+        project = workdir / "project"
+        project.mkdir()
+        monkeypatch.chdir(project)
+        monkeypatch.setenv("DAEMON_TEST_MARK", "from-client")
+
+        code, out, err = _run(sock, ["3", "--flag"], workdir)
+
+        assert code == 3
+        assert out.splitlines() == ["3 --flag", str(project), "from-client"]
+        assert err.strip() == "to-stderr"
+        assert cli_daemon.request("status", sock)["requests_served"] == 1
+
+    def test_no_daemon_runs_locally(self, workdir):
+        """Test forward reports None when nothing is listening."""
+        assert cli_daemon.forward(["version"], workdir / "missing.sock") is None
+        assert cli_daemon.request("status", workdir / "missing.sock") is None
+
+    def test_package_change_invalidates_daemon(self, daemon):
+        """Test a modified watched file makes the client fall back and the daemon exit."""
+        process, sock, workdir = daemon
+        module = workdir / "watched" / "module.py"
+        module.write_text("x = 2  # changed\n")
+
+        assert _run(sock, ["0"], workdir)[0] is None
+        assert process.wait(timeout=10) == 0
+        assert not sock.exists()
+
+    def test_stop(self, daemon):
+        """Test the stop command shuts the daemon down."""
+        process, sock, _ = daemon
+
+        assert cli_daemon.request("stop", sock) == {"status": "stopping"}
+        assert process.wait(timeout=10) == 0
+        assert cli_daemon.request("status", sock) is None
+
+    def test_survives_clients_that_disconnect(self, daemon):
+        """Test a client closing before reading its reply does not stop the daemon."""
+        process, sock, _ = daemon
+
+        for _ in range(5):
+            client = cli_daemon._connect(sock, timeout=5.0)
+            cli_daemon._send_message(client, {"command": "status"})
+            client.close()
+
+        assert cli_daemon.request("status", sock)["pid"] == process.pid
+
+    def test_idle_timeout(self, workdir):
+        """Test the daemon exits on its own when unused."""
+        process, sock = _start_daemon(workdir, idle_timeout=0.5)
+        try:
+            assert process.wait(timeout=30) == 0
+            assert not sock.exists()
+        finally:
+            if process.poll() is None:
+                process.kill()
+
+
+class TestMaybeForward:
+    """Tests for the opt-in switch used by ``attune`` main()."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test nothing is forwarded unless ATTUNE_DAEMON is set."""
+        monkeypatch.delenv(cli_daemon.ENV_VAR, raising=False)
+        assert cli_daemon.maybe_forward(["version"]) is None
+
+    def test_daemon_commands_never_forwarded(self, monkeypatch, workdir):
+        """Test ``attune daemon ...`` always runs locally."""
+        monkeypatch.setenv(cli_daemon.ENV_VAR, "1")
+        monkeypatch.setenv(cli_daemon.SOCKET_ENV_VAR, str(workdir / "missing.sock"))
+        assert cli_daemon.maybe_forward(["daemon", "status"]) is None
+        assert cli_daemon.maybe_forward(["version"]) is None
+
+
+class TestIndexFileCache:
+    """Tests for the parsed project index cache kept warm by the daemon."""
+
+    def test_reuses_parse_until_file_changes(self, tmp_path):
+        """Test the same file is parsed once and re-read after it changes."""
+        path = tmp_path / "project_index.json"
+        path.write_text(json.dumps({"files": {}, "version": 1}))
+
+        first = index_module._read_index_file(path)
+        assert index_module._read_index_file(path) is first
+
+        path.write_text(json.dumps({"files": {}, "version": 22}))
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+        assert index_module._read_index_file(path)["version"] == 22
+
+
+class TestAccessControl:
+    """Tests for restricting the daemon to its owner."""
+
+    def test_socket_is_owner_only(self, daemon):
+        """Test the listening socket is created without group/other access."""
+        _, sock, _ = daemon
+        assert sock.stat().st_mode & 0o077 == 0
+
+    @pytest.mark.skipif(not hasattr(cli_daemon.socket, "SO_PEERCRED"), reason="Linux only")
+    def test_rejects_other_users(self, daemon, monkeypatch):
+        """Test a peer with a different UID gets no reply."""
+        _, sock, _ = daemon
+        conn = cli_daemon._connect(sock, timeout=5.0)
+        with conn:
+            assert cli_daemon._peer_is_owner(conn)
+            monkeypatch.setattr(cli_daemon.os, "getuid", lambda: os.geteuid() + 1)
+            assert not cli_daemon._peer_is_owner(conn)
@@ -0,0 +1,139 @@
+"""Tests for the shared token counting service.
+
+A whitespace-splitting fake encoding stands in for tiktoken so the tests
+don't depend on downloading BPE files.
+"""
+
+import pytest
+
+from attune.cache_monitor import CacheMonitor
+from attune.models.token_estimator import estimate_workflow_cost
+from attune.utils.token_counter import CACHE_NAME, TokenCounter, get_token_counter
+from attune.utils.tokens import count_message_tokens
+
+
+class FakeEncoding:
+    """Minimal tiktoken-compatible encoding that counts encode calls."""
+
+    name = "fake"
+
+    def __init__(self):
+        self.encoded = 0
+        self.batch_calls = 0
+
+    def encode(self, text, disallowed_special=()):
+        self.encoded += 1
+        return text.split()
+
+    def encode_batch(self, texts, num_threads=1, disallowed_special=()):
+        self.batch_calls += 1
+        self.encoded += len(texts)
+        return [text.split() for text in texts]
+
+
+@pytest.fixture
+def monitor():
+    CacheMonitor.reset_instance()
+    yield CacheMonitor.get_instance()
+    CacheMonitor.reset_instance()
+
+
+@pytest.fixture
+def encoding():
+    return FakeEncoding()
+
+
+class TestTokenCounter:
+    """Test TokenCounter caching and batching."""
+
+    def test_repeated_text_is_encoded_once(self, monitor, encoding):
+        """Test that identical content hits the cache and is reported."""
+        counter = TokenCounter(encoding=encoding)
+
+        assert counter.count("one two three") == 3
+        assert counter.count("one two three") == 3
+
+        stats = monitor.get_stats(CACHE_NAME)
+        assert encoding.encoded == 1
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_batch_matches_individual_counts(self, monitor, encoding):
+        """Test that batch counts match single counts and dedupe work."""
+        counter = TokenCounter(encoding=encoding)
+        texts = ["a b", "", "c d e", "a b"]
+
+        assert counter.count_batch(texts) == [2, 0, 3, 2]
+        assert encoding.batch_calls == 1
+        assert encoding.encoded == 2
+
+        counter.count_batch(texts)
+        assert encoding.batch_calls == 1  # Fully served from cache
+
+    def test_lru_eviction(self, monitor, encoding):
+        """Test that the least recently used entry is evicted."""
+        counter = TokenCounter(max_size=2, encoding=encoding)
+        counter.count("a")
+        counter.count("b")
+        counter.count("a")
+        counter.count("c")
+
+        assert len(counter) == 2
+        assert monitor.get_stats(CACHE_NAME).evictions == 1
+        counter.count("a")
+        assert encoding.encoded == 3  # "a" survived, only "c" added
+
+    def test_heuristic_without_encoding(self, monitor):
+        """Test fallback to ~4 chars/token when tiktoken is unavailable."""
+        counter = TokenCounter()
+        counter._encoding_loaded = True  # Simulate missing tiktoken data
+
+        assert counter.count_batch(["x" * 40, ""]) == [10, 0]
+        assert len(counter) == 0
+
+    def test_estimate_directory(self, monitor, encoding, tmp_path):
+        """Test streaming directory estimation with filters and limits."""
+        (tmp_path / "a.py").write_text("one two")
+        (tmp_path / "b.txt").write_text("ignored words here")
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "c.ts").write_text("three four five")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "d.js").write_text("skipped")
+
+        counter = TokenCounter(encoding=encoding)
+
+        assert counter.estimate_directory(tmp_path, batch_size=1) == 5
+        assert counter.estimate_directory(tmp_path, max_files=1) == 2
+
+    def test_content_block_lists(self, monitor, encoding):
+        """Test that lists of message content blocks are counted by their text."""
+        counter = TokenCounter(encoding=encoding)
+        blocks = [{"type": "text", "text": "one two"}, {"type": "image", "source": {}}, "three"]
+
+        assert counter.count(blocks) == 3
+        assert counter.count_batch([blocks, "four five", None]) == [3, 2, 0]
+
+    def test_message_tokens_with_content_blocks(self, monkeypatch, encoding):
+        """Test that count_message_tokens accepts Anthropic content block lists."""
+        monkeypatch.setattr("attune.utils.token_counter._counter", TokenCounter(encoding=encoding))
+        messages = [
+            {"role": "user", "content": [{"type": "text", "text": "alpha beta"}]},
+            {"role": "assistant", "content": "gamma"},
+        ]
+
+        assert count_message_tokens(messages)["messages"] == 3 + 4 * 2
+
+    def test_shared_instance(self):
+        """Test that get_token_counter returns a process-wide singleton."""
+        assert get_token_counter() is get_token_counter()
+
+
+def test_workflow_cost_uses_directory_estimator(tmp_path, monkeypatch, encoding):
+    """Test that estimate_workflow_cost counts directories with the shared counter."""
+    (tmp_path / "mod.py").write_text("alpha beta gamma delta")
+    monkeypatch.setattr("attune.utils.token_counter._counter", TokenCounter(encoding=encoding))
+
+    base = estimate_workflow_cost("code-review", "")
+    result = estimate_workflow_cost("code-review", "", target_path=str(tmp_path))
+
+    assert result["input_tokens"] - base["input_tokens"] == 4
@@ -0,0 +1,387 @@
+"""Tests for the workflow batch execution mode.
+
+Tests run against a local fake Message Batches endpoint (an HTTP server
+speaking the batches API) through the real ``AnthropicBatchProvider``.
+
+Tests cover:
+- Adaptive polling backoff
+- Accumulating concurrent requests into one batch
+- Routing batchable stages through the collector
+- Resuming a submitted batch from a StatePersistenceMixin checkpoint
+
+Copyright 2026 Smart-AI-Memory
+Licensed under Apache 2.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from attune.agents.state.store import AgentStateStore
+from attune.cost_tracker import CostTracker
+from attune.workflows.base import BaseWorkflow
+from attune.workflows.batch_mode import (
+    BATCH_DISCOUNT,
+    AdaptiveBackoff,
+    BatchCollector,
+    batch_custom_id,
+)
+from attune.workflows.compat import ModelTier
+from attune_llm.providers import AnthropicBatchProvider
+
+pytest.importorskip("anthropic")
+
+
+# ---------------------------------------------------------------------------
+# Local fake Message Batches endpoint
+# ---------------------------------------------------------------------------
+
+
+class _FakeBatchServer(ThreadingHTTPServer):
+    """Message Batches API that ends each batch after a number of polls."""
+
+    daemon_threads = True
+
+    def __init__(self, polls_to_end: int = 3):
+        super().__init__(("127.0.0.1", 0), _FakeBatchHandler)
+        self.polls_to_end = polls_to_end
+        self.batches: dict[str, dict[str, Any]] = {}
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def batch_json(self, batch_id: str) -> dict[str, Any]:
+        batch = self.batches[batch_id]
+        total = len(batch["requests"])
+        done = min(total, total * batch["polls"] // self.polls_to_end)
+        ended = batch["polls"] >= self.polls_to_end
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {
+                "processing": total - done,
+                "succeeded": done,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "results_url": (
+                f"{self.base_url}/v1/messages/batches/{batch_id}/results" if ended else None
+            ),
+            "created_at": "2026-01-01T00:00:00Z",
+            "expires_at": "2026-01-02T00:00:00Z",
+            "ended_at": "2026-01-01T00:01:00Z" if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+        }
+
+
+def _result(request: dict[str, Any]) -> dict[str, Any]:
+    """Echo the user message back, or fail it when it asks to."""
+    params = request["params"]
+    text = params["messages"][-1]["content"]
+    if "FAIL" in text:
+        result = {
+            "type": "errored",
+            "error": {
+                "type": "error",
+                "error": {"type": "invalid_request_error", "message": "bad"},
+            },
+        }
+    else:
+        result = {
+            "type": "succeeded",
+            "message": {
+                "id": "msg_test",
+                "type": "message",
+                "role": "assistant",
+                "model": params["model"],
+                "content": [{"type": "text", "text": f"echo: {text}"}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {"input_tokens": 10, "output_tokens": 5},
+            },
+        }
+    return {"custom_id": request["custom_id"], "result": result}
+
+
+class _FakeBatchHandler(BaseHTTPRequestHandler):
+    def _send(self, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            batch_id = f"msgbatch_{len(self.server.batches) + 1}"
+            self.server.batches[batch_id] = {"requests": body["requests"], "polls": 0}
+            payload = self.server.batch_json(batch_id)
+        self._send(json.dumps(payload).encode())
+
+    def do_GET(self):
+        parts = self.path.split("?")[0].strip("/").split("/")
+        batch_id = parts[3]
+        with self.server.lock:
+            batch = self.server.batches[batch_id]
+            if parts[-1] == "results":
+                lines = [json.dumps(_result(r)) for r in batch["requests"]]
+                self._send("\n".join(lines).encode(), "application/binary")
+                return
+            batch["polls"] += 1
+            payload = self.server.batch_json(batch_id)
+        self._send(json.dumps(payload).encode())
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = _FakeBatchServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def endpoint(server):
+    return AnthropicBatchProvider(api_key="sk-ant-test", base_url=server.base_url)
+
+
+def _params(text: str) -> dict[str, Any]:
+    return {
+        "model": "claude-test",
+        "max_tokens": 64,
+        "messages": [{"role": "user", "content": text}],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Minimal workflow with a fan-out stage
+# ---------------------------------------------------------------------------
+
+
+class _FanOutWorkflow(BaseWorkflow):
+    """Workflow whose ``fanout`` stage issues one LLM call per item."""
+
+    name = "fanout-workflow"
+    description = "Fan-out stage for batch mode tests"
+    stages = ["fanout", "summarize"]
+    tier_map = {"fanout": ModelTier.CHEAP, "summarize": ModelTier.CHEAP}
+    batchable_stages = ["fanout"]
+
+    batch_flush_delay = 0.01
+    batch_poll_initial = 0.01
+    batch_poll_max = 0.05
+
+    async def run_stage(
+        self, stage_name: str, tier: ModelTier, input_data: Any
+    ) -> tuple[Any, int, int]:
+        if stage_name == "fanout":
+            calls = await asyncio.gather(
+                *(
+                    self._call_llm(tier, "Review code", f"module {item}", max_tokens=64)
+                    for item in input_data["items"]
+                )
+            )
+            return (
+                {"reviews": [c[0] for c in calls]},
+                sum(c[1] for c in calls),
+                sum(c[2] for c in calls),
+            )
+        return {"count": len(input_data["reviews"])}, 0, 0
+
+
+def _workflow(tmp_path: Path, **kwargs: Any) -> _FanOutWorkflow:
+    return _FanOutWorkflow(
+        cost_tracker=CostTracker(storage_dir=str(tmp_path / ".empathy")),
+        enable_cache=False,
+        enable_tier_tracking=False,
+        **kwargs,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestAdaptiveBackoff:
+    """Tests for AdaptiveBackoff."""
+
+    def test_grows_to_maximum_while_idle(self):
+        """Test the delay grows geometrically and is capped."""
+        backoff = AdaptiveBackoff(initial=5, maximum=12, factor=2)
+
+        delays = [backoff.next_delay(progressed=False) for _ in range(4)]
+
+        assert delays == [5, 10, 12, 12]
+
+    def test_shrinks_on_progress(self):
+        """Test observed progress shortens the delay, never below initial."""
+        backoff = AdaptiveBackoff(initial=5, maximum=300, factor=2)
+        for _ in range(4):
+            backoff.next_delay(progressed=False)
+
+        assert backoff.next_delay(progressed=True) == 20
+        assert backoff.next_delay(progressed=True) == 10
+        assert backoff.next_delay(progressed=True) == 5
+        assert backoff.next_delay(progressed=True) == 5
+
+
+class TestBatchCollector:
+    """Tests for BatchCollector against the fake endpoint."""
+
+    async def test_concurrent_requests_share_one_batch(self, server, endpoint):
+        """Test concurrent requests are accumulated into a single batch."""
+        collector = BatchCollector(endpoint, flush_delay=0.01, poll_initial=0.01)
+
+        results = await asyncio.gather(*(collector.submit(_params(f"q{i}")) for i in range(20)))
+
+        assert [r[0] for r in results] == [f"echo: q{i}" for i in range(20)]
+        assert results[0][1:] == (10, 5)
+        assert len(server.batches) == 1
+        assert len(server.batches["msgbatch_1"]["requests"]) == 20
+        assert collector.stats.polls == server.polls_to_end
+
+    async def test_identical_requests_are_deduplicated(self, server, endpoint):
+        """Test identical concurrent requests occupy one batch entry."""
+        collector = BatchCollector(endpoint, flush_delay=0.01, poll_initial=0.01)
+
+        results = await asyncio.gather(*(collector.submit(_params("same")) for _ in range(3)))
+
+        assert {r[0] for r in results} == {"echo: same"}
+        assert len(server.batches["msgbatch_1"]["requests"]) == 1
+        assert collector.stats.deduplicated == 2
+
+    async def test_errored_request_fails_alone(self, server, endpoint):
+        """Test an errored result fails its caller without affecting others."""
+        collector = BatchCollector(endpoint, flush_delay=0.01, poll_initial=0.01)
+
+        ok, failed = await asyncio.gather(
+            collector.submit(_params("fine")),
+            collector.submit(_params("FAIL please")),
+            return_exceptions=True,
+        )
+
+        assert ok[0] == "echo: fine"
+        assert isinstance(failed, RuntimeError)
+        assert "invalid_request_error" in str(failed)
+
+    async def test_timeout_fails_requests(self, server, endpoint):
+        """Test a batch that does not end in time raises TimeoutError."""
+        server.polls_to_end = 1000
+        collector = BatchCollector(endpoint, flush_delay=0.01, poll_initial=0.05, timeout=0.2)
+
+        with pytest.raises(TimeoutError):
+            await collector.submit(_params("slow"))
+
+    async def test_resume_uses_existing_batch(self, server, endpoint):
+        """Test requests mapped to a submitted batch are not resubmitted."""
+        first = BatchCollector(endpoint, flush_delay=0.01, poll_initial=0.01)
+        await first.submit(_params("q"))
+
+        resumed = BatchCollector(
+            endpoint,
+            flush_delay=0.01,
+            poll_initial=0.01,
+            resume={batch_custom_id(_params("q")): "msgbatch_1"},
+        )
+        content, _, _ = await resumed.submit(_params("q"))
+
+        assert content == "echo: q"
+        assert len(server.batches) == 1
+        assert resumed.stats.batches_resumed == 1
+
+
+class TestWorkflowBatchMode:
+    """Tests for batch mode in BaseWorkflow execution."""
+
+    async def test_batchable_stage_runs_as_one_batch(self, tmp_path, server, endpoint):
+        """Test a batchable fan-out stage submits one batch at the batch discount."""
+        wf = _workflow(tmp_path, enable_batch_mode=True, batch_endpoint=endpoint)
+        wf.run_step_with_executor = AsyncMock()
+        wf._track_telemetry = MagicMock()
+
+        result = await wf.execute(items=list(range(8)))
+
+        assert result.success, result.error
+        assert result.final_output == {"count": 8}
+        assert result.stages[0].result["reviews"][0] == "echo: module 0"
+        assert len(server.batches) == 1
+        wf.run_step_with_executor.assert_not_called()
+
+        call_costs = [
+            c.kwargs["cost"]
+            for c in wf._track_telemetry.call_args_list
+            if c.kwargs["stage"] == "llm_call_cheap"
+        ]
+        full_price = wf._calculate_cost(ModelTier.CHEAP, 10, 5)
+        assert call_costs == [pytest.approx(full_price * BATCH_DISCOUNT)] * 8
+
+    async def test_batch_mode_disabled_uses_executor(self, tmp_path, server, endpoint):
+        """Test stages use the synchronous path unless batch mode is enabled."""
+        wf = _workflow(tmp_path, batch_endpoint=endpoint)
+        wf.run_step_with_executor = AsyncMock(return_value=("sync", 1, 1, 0.0))
+
+        result = await wf.execute(items=[1, 2])
+
+        assert result.success, result.error
+        assert result.stages[0].result["reviews"] == ["sync", "sync"]
+        assert server.batches == {}
+
+    async def test_interrupted_run_resumes_batch(self, tmp_path, server, endpoint):
+        """Test a re-run resumes the checkpointed batch instead of resubmitting."""
+        store = AgentStateStore(storage_dir=str(tmp_path / "state"))
+        server.polls_to_end = 1000
+
+        first = _workflow(
+            tmp_path,
+            enable_batch_mode=True,
+            batch_endpoint=endpoint,
+            state_store=store,
+            agent_id="fanout-agent",
+        )
+        run = asyncio.create_task(first.execute(items=[1, 2, 3]))
+        while not server.batches:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+
+        checkpoint = store.get_last_checkpoint("fanout-agent")
+        assert list(checkpoint["batch_jobs"]) == ["msgbatch_1"]
+        assert checkpoint["batch_jobs"]["msgbatch_1"]["stage"] == "fanout"
+
+        server.polls_to_end = 1
+        second = _workflow(
+            tmp_path,
+            enable_batch_mode=True,
+            batch_endpoint=endpoint,
+            state_store=store,
+            agent_id="fanout-agent",
+        )
+        result = await second.execute(items=[1, 2, 3])
+
+        assert result.success, result.error
+        assert result.stages[0].result["reviews"] == [f"echo: module {i}" for i in (1, 2, 3)]
+        assert len(server.batches) == 1
+        assert second._batch_collector.stats.batches_resumed == 1
+        assert "batch_jobs" not in store.get_last_checkpoint("fanout-agent")
@@ -0,0 +1,148 @@
+"""Tests for token-budgeted code context packing.
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from attune.cost_tracker import CostTracker
+from attune.utils.tokens import count_tokens
+from attune.workflows.base import BaseWorkflow
+from attune.workflows.compat import ModelTier
+from attune.workflows.context_packer import ContextPacker
+
+
+def _function(name: str, lines: int = 12) -> str:
+    body = "\n".join(f"    total += item_{i} * {i}  # step {i}" for i in range(lines))
+    return (
+        f"def {name}(items: list[int], scale: float = 1.0) -> float:\n"
+        f'    """Compute the {name.replace("_", " ")} of the items.\n\n'
+        f'    Longer explanation that is not part of the summary.\n    """\n'
+        f"    total = 0\n{body}\n    return total * scale\n"
+    )
+
+
+MODULE = '"""Example module."""\n\nimport os\n\n\n' + "\n\n".join(
+    _function(name)
+    for name in ("parse_config", "render_report", "send_email", "load_cache", "merge_rows")
+)
+
+
+class TestPackSource:
+    """Tests for packing a single source."""
+
+    def test_fitting_source_is_unchanged(self):
+        """Test content within the budget is passed through."""
+        packed = ContextPacker().pack_source(MODULE, budget=100_000)
+
+        assert packed.text == MODULE
+        assert packed.tokens_saved == 0
+
+    def test_fills_budget_without_exceeding_it(self):
+        """Test packed text stays within and close to the budget."""
+        for budget in (120, 400, 900):
+            packed = ContextPacker().pack_source(MODULE, budget=budget)
+
+            assert packed.tokens == count_tokens(packed.text) <= budget
+            assert packed.tokens >= budget * 0.85
+            assert packed.tokens_saved == packed.raw_tokens - packed.tokens
+
+    def test_signatures_and_docstrings_replace_bodies(self):
+        """Test a tight budget keeps every signature and summary but no bodies."""
+        packed = ContextPacker().pack_source(MODULE, budget=150)
+
+        assert "def parse_config(items: list[int], scale: float=1.0) -> float:" in packed.text
+        assert "def merge_rows(" in packed.text
+        assert "total += item_0" not in packed.text
+        assert packed.symbols_full == 0
+        assert packed.symbols_omitted == 0
+
+    def test_task_relevant_symbol_keeps_its_body(self):
+        """Test the symbol the task mentions is the one shown in full."""
+        budget = count_tokens(_function("send_email")) + 180
+
+        packed = ContextPacker().pack_source(MODULE, budget=budget, task="Why does sendEmail fail?")
+
+        assert packed.tokens <= budget
+        assert "    return total * scale" in packed.text.split("def send_email")[1].split("def ")[0]
+        assert packed.text.count("return total * scale") == 1
+
+    def test_text_is_truncated_to_budget(self):
+        """Test unparseable input (a diff) keeps its opening lines within budget."""
+        diff = "\n".join(f"+ line {i} of the change" for i in range(400))
+
+        packed = ContextPacker().pack_source(diff, budget=200)
+
+        assert packed.tokens <= 200
+        assert packed.text.startswith("+ line 0 of the change")
+
+
+class TestPackFiles:
+    """Tests for packing several files."""
+
+    def test_shared_imports_listed_once(self, tmp_path: Path):
+        """Test imports common to several files are deduplicated."""
+        for name in ("a.py", "b.py"):
+            (tmp_path / name).write_text(
+                f"import json\nimport os\nimport {name[0]}lib\n\n\n{_function(name[0] + '_run')}"
+            )
+
+        packed = ContextPacker(tmp_path, index=None).pack_files(["a.py", "b.py"], budget=150)
+
+        assert packed.text.count("import os") == 1
+        assert packed.text.index("# Shared imports") < packed.text.index("# a.py")
+        assert "import alib" in packed.text and "import blib" in packed.text
+
+    def test_high_impact_file_ranked_first(self, tmp_path: Path):
+        """Test the ProjectIndex impact score decides which body fits."""
+        (tmp_path / "core.py").write_text(_function("core_step"))
+        (tmp_path / "leaf.py").write_text(_function("leaf_step"))
+        records = {
+            "core.py": SimpleNamespace(impact_score=9.0, imported_by_count=12),
+            "leaf.py": SimpleNamespace(impact_score=0.5, imported_by_count=0),
+        }
+        index = SimpleNamespace(get_file=records.get)
+        budget = count_tokens(_function("core_step")) + 60
+
+        packed = ContextPacker(tmp_path, index=index).pack_files(["leaf.py", "core.py"], budget)
+
+        assert "    return total * scale" in packed.text.split("# core.py")[1]
+        assert "    return total * scale" not in packed.text.split("# core.py")[0]
+
+
+class _PackingWorkflow(BaseWorkflow):
+    """Workflow packing a large source into its prompt."""
+
+    name = "packing-workflow"
+    description = "Packs context"
+    stages = ["scan"]
+    tier_map = {"scan": ModelTier.CHEAP}
+    context_budgets = {"scan": 200}
+
+    async def run_stage(self, stage_name: str, tier: ModelTier, input_data: Any):
+        return {"context": self._pack_context(stage_name, source=MODULE)}, 0, 0
+
+
+class TestWorkflowIntegration:
+    """Tests for BaseWorkflow._pack_context."""
+
+    async def test_savings_reported_in_result(self, tmp_path: Path):
+        """Test the stage budget is applied and the savings reported."""
+        wf = _PackingWorkflow(
+            cost_tracker=CostTracker(storage_dir=str(tmp_path / ".empathy")),
+            enable_tier_tracking=False,
+        )
+
+        result = await wf.execute()
+
+        assert result.success, result.error
+        stats = result.metadata["context_packing"]["scan"]
+        assert stats["calls"] == 1
+        assert stats["budget"] == 200
+        assert 0 < stats["tokens"] <= 200
+        assert stats["tokens_saved"] == stats["raw_tokens"] - stats["tokens"] > 0
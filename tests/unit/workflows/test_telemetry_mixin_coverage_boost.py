@@ -304,6 +304,8 @@ class TestEmitCallTelemetry:
             model_id="claude-3",
             input_tokens=100,
             output_tokens=50,
+            cache_creation_input_tokens=0,
+            cache_read_input_tokens=0,
             estimated_cost=0.015,
             latency_ms=250,
             success=True,
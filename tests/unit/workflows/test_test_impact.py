@@ -0,0 +1,199 @@
+"""Tests for test impact selection.
+
+Tests cover:
+- Transitive selection over the ProjectIndex dependency graph
+- Ordering by FileTestRecord failure history and sharding
+- Full-suite fallback when the index is stale
+- run_tests_with_tracking in test-impact mode
+
+Copyright 2025 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from attune.models import FileTestRecord
+from attune.models.telemetry import TelemetryStore
+from attune.project_index import ProjectIndex
+from attune.workflows.test_impact import select_impacted_tests
+from attune.workflows.test_runner import run_tests_with_tracking
+
+MODULES = {
+    "a": "X = 1\n",
+    "b": "from pkg.a import X\n",
+    "c": "from pkg.b import X\n",
+    "d": "Y = 2\n",
+}
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project where c imports b imports a, and d stands alone."""
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "tests" / "unit").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "__init__.py").write_text("")
+    for name, source in MODULES.items():
+        (tmp_path / "src" / "pkg" / f"{name}.py").write_text(source)
+        (tmp_path / "tests" / "unit" / f"test_{name}.py").write_text(f"from pkg.{name} import *\n")
+
+    index = ProjectIndex(str(tmp_path), use_parallel=False)
+    index.refresh()
+    return tmp_path, index
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Isolated telemetry store for failure history."""
+    store = TelemetryStore(storage_dir=str(tmp_path / "telemetry"))
+    with patch("attune.workflows.test_impact.get_telemetry_store", return_value=store):
+        yield store
+
+
+def _history(store, test_file, results):
+    for result in results:
+        store.log_file_test(
+            FileTestRecord(
+                file_path="src/x.py",
+                timestamp="2026-01-22T10:00:00Z",
+                last_test_result=result,
+                test_count=1,
+                test_file_path=test_file,
+            )
+        )
+
+
+class TestImpactSelection:
+    """Test selection over the dependency graph."""
+
+    def test_transitive_dependents(self, project, store):
+        """Test a change selects tests of every transitive importer."""
+        root, index = project
+
+        plan = select_impacted_tests(["src/pkg/a.py"], project_root=str(root), index=index)
+
+        assert not plan.full_suite
+        assert plan.affected_sources == ["src/pkg/a.py", "src/pkg/b.py", "src/pkg/c.py"]
+        assert plan.test_files == [
+            "tests/unit/test_a.py",
+            "tests/unit/test_b.py",
+            "tests/unit/test_c.py",
+        ]
+
+    def test_changed_test_file_selected_directly(self, project, store):
+        """Test changed test files run without pulling in sources."""
+        root, index = project
+
+        plan = select_impacted_tests(
+            ["./tests/unit/test_d.py"], project_root=str(root), index=index
+        )
+
+        assert plan.test_files == ["tests/unit/test_d.py"]
+        assert plan.affected_sources == []
+
+    def test_orders_by_failure_rate_and_shards(self, project, store):
+        """Test failure-prone tests come first and shards partition the plan."""
+        root, index = project
+        _history(store, "tests/unit/test_c.py", ["failed", "failed", "passed"])
+        _history(store, "tests/unit/test_b.py", ["failed", "passed", "passed"])
+        _history(store, "tests/unit/test_a.py", ["passed"])
+
+        plan = select_impacted_tests(["src/pkg/a.py"], project_root=str(root), index=index)
+        shards = [
+            select_impacted_tests(
+                ["src/pkg/a.py"], project_root=str(root), index=index, shard_index=i, shard_count=2
+            ).test_files
+            for i in range(2)
+        ]
+
+        assert plan.test_files == [
+            "tests/unit/test_c.py",
+            "tests/unit/test_b.py",
+            "tests/unit/test_a.py",
+        ]
+        assert shards == [
+            ["tests/unit/test_c.py", "tests/unit/test_a.py"],
+            ["tests/unit/test_b.py"],
+        ]
+
+    def test_invalid_shard(self, project):
+        """Test out-of-range shards are rejected."""
+        root, index = project
+
+        with pytest.raises(ValueError, match="shard_index"):
+            select_impacted_tests([], project_root=str(root), index=index, shard_index=2)
+
+
+class TestFullSuiteFallback:
+    """Test fallback when the graph cannot be trusted."""
+
+    def test_modified_unchanged_file_makes_index_stale(self, project, store):
+        """Test edits outside the change set fall back to every test."""
+        root, index = project
+        later = time.time() + 60
+        os.utime(root / "src" / "pkg" / "d.py", (later, later))
+
+        plan = select_impacted_tests(["src/pkg/a.py"], project_root=str(root), index=index)
+
+        assert plan.full_suite
+        assert "d.py" in plan.reason
+        assert len(plan.test_files) == 4
+
+    def test_new_source_and_conftest_trigger_full_suite(self, project, store):
+        """Test unindexed sources and shared config fall back."""
+        root, index = project
+        (root / "src" / "pkg" / "e.py").write_text("")
+
+        assert select_impacted_tests(
+            ["src/pkg/e.py"], project_root=str(root), index=index
+        ).full_suite
+        assert select_impacted_tests(
+            ["tests/conftest.py"], project_root=str(root), index=index
+        ).full_suite
+
+    def test_missing_index(self, tmp_path, store):
+        """Test a project without an index globs the whole test tree."""
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_x.py").write_text("")
+
+        plan = select_impacted_tests(["src/x.py"], project_root=str(tmp_path))
+
+        assert plan.full_suite
+        assert plan.test_files == ["tests/test_x.py"]
+
+
+class TestRunnerImpactMode:
+    """Test run_tests_with_tracking with changed_files."""
+
+    @patch("attune.workflows.test_runner.get_telemetry_store")
+    @patch("attune.workflows.test_runner.subprocess.run")
+    @patch("attune.workflows.test_runner.select_impacted_tests")
+    def test_runs_selected_shard(self, mock_select, mock_run, mock_store):
+        """Test only the selected files are passed to pytest."""
+        plan = MagicMock(full_suite=False, test_files=["tests/unit/test_b.py"])
+        plan.to_dict.return_value = {"full_suite": False}
+        mock_select.return_value = plan
+        mock_run.return_value = MagicMock(returncode=0, stdout="1 passed in 0.1s", stderr="")
+
+        record = run_tests_with_tracking(changed_files=["src/pkg/b.py"], shard_count=2)
+
+        assert mock_select.call_args.kwargs["shard_count"] == 2
+        assert mock_run.call_args.args[0][:2] == ["pytest", "tests/unit/test_b.py"]
+        assert record.passed == 1
+        assert record.metadata["test_impact"] == {"full_suite": False}
+
+    @patch("attune.workflows.test_runner.get_telemetry_store")
+    @patch("attune.workflows.test_runner.subprocess.run")
+    @patch("attune.workflows.test_runner.select_impacted_tests")
+    def test_no_affected_tests_skips_pytest(self, mock_select, mock_run, mock_store):
+        """Test an empty impact set records success without running pytest."""
+        mock_select.return_value = MagicMock(full_suite=False, test_files=[])
+
+        record = run_tests_with_tracking(changed_files=["README.md"])
+
+        mock_run.assert_not_called()
+        assert record.success
+        assert record.total_tests == 0
@@ -10,6 +10,7 @@ Copyright 2025 Smart-AI-Memory
 Licensed under the Apache License, Version 2.0
 """
 
+import asyncio
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -485,6 +486,141 @@ class TestDocumentGenerationWriteChunked:
             assert "warning" in result
 
 
+class TestDocumentGenerationWriteChunkedParallel:
+    """Tests for parallel chunked write functionality."""
+
+    SOURCE = "class UserStore:\n    def get_user(self, user_id):\n        pass\n\ndef connect():\n    pass\n"
+
+    @staticmethod
+    def _fake_llm(delays: dict[str, float] | None = None, replacements: str = "{}"):
+        """Fake _call_llm: writes "## <sections>" and tracks concurrency."""
+        state = {"active": 0, "max_active": 0, "prompts": []}
+
+        async def call(tier, system, user_message, max_tokens=4096):
+            if tier == ModelTier.CHEAP:
+                return replacements, 50, 10
+            section = user_message.split("Sections to write: ")[1].split("\n")[0]
+            state["prompts"].append(user_message)
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+            await asyncio.sleep((delays or {}).get(section, 0.05))
+            state["active"] -= 1
+            return f"## {section}\nUses getUser.", 100, 50
+
+        return call, state
+
+    @pytest.mark.asyncio
+    async def test_chunks_run_concurrently_under_limit(self):
+        """Test chunks overlap, respect the limiter and keep outline order."""
+        workflow = DocumentGenerationWorkflow(
+            sections_per_chunk=1, max_concurrent_chunks=3, max_cost=100
+        )
+        sections = [f"Section {i}" for i in range(6)]
+        # Later sections finish first
+        call, state = self._fake_llm({s: 0.02 * (6 - i) for i, s in enumerate(sections)})
+
+        with patch.object(workflow, "_call_llm", side_effect=call):
+            result, _, _ = await workflow._write_chunked_parallel(
+                sections, "outline", "guide", "developers", self.SOURCE, ModelTier.CAPABLE
+            )
+
+        assert state["max_active"] == 3
+        assert result["parallel"] is True
+        assert result["chunks_completed"] == 6
+        headings = [ln for ln in result["draft_document"].splitlines() if ln.startswith("## ")]
+        assert headings == [f"## {s}" for s in sections]
+        stats = result["parallel_stats"]
+        assert stats["wall_clock_seconds"] < stats["sequential_estimate_seconds"]
+
+    @pytest.mark.asyncio
+    async def test_prompts_use_shared_contract_not_outline(self):
+        """Test chunk prompts carry the contract and glossary instead of the outline."""
+        workflow = DocumentGenerationWorkflow(sections_per_chunk=1, max_cost=100)
+        sections = [f"Section {i}" for i in range(4)]
+        outline = "\n".join(f"{i + 1}. {s}\n   - {'details ' * 80}" for i, s in enumerate(sections))
+        call, state = self._fake_llm()
+
+        with patch.object(workflow, "_call_llm", side_effect=call):
+            result, _, _ = await workflow._write_chunked_parallel(
+                sections, outline, "guide", "developers", self.SOURCE, ModelTier.CAPABLE
+            )
+
+        assert all("SECTION CONTRACT" in p and "Full outline" not in p for p in state["prompts"])
+        assert "`UserStore` (class)" in state["prompts"][0]
+        assert "`get_user()` (method)" in state["prompts"][0]
+        stats = result["parallel_stats"]
+        assert stats["prompt_tokens_saved"] == (
+            stats["sequential_prompt_tokens"] - stats["prompt_tokens"]
+        )
+        assert stats["prompt_tokens_saved"] > 0
+
+    @pytest.mark.asyncio
+    async def test_consistency_pass_applies_replacements(self):
+        """Test term replacements returned by the CHEAP pass are applied."""
+        workflow = DocumentGenerationWorkflow(sections_per_chunk=1, max_cost=100)
+        call, _ = self._fake_llm(replacements='Here: {"getUser": "get_user"}')
+
+        with patch.object(workflow, "_call_llm", side_effect=call):
+            result, _, _ = await workflow._write_chunked_parallel(
+                ["A", "B"], "outline", "guide", "developers", self.SOURCE, ModelTier.CAPABLE
+            )
+
+        assert "getUser" not in result["draft_document"]
+        assert result["draft_document"].count("get_user") == 2
+        assert result["parallel_stats"]["consistency_replacements"] == 2
+
+    @pytest.mark.asyncio
+    async def test_streams_draft_to_export_path(self, tmp_path):
+        """Test finished chunks are written to the draft file in order."""
+        workflow = DocumentGenerationWorkflow(
+            sections_per_chunk=1, max_cost=100, export_path=tmp_path
+        )
+        call, _ = self._fake_llm({"A": 0.1, "B": 0.01, "C": 0.05})
+
+        with patch.object(workflow, "_call_llm", side_effect=call):
+            result, _, _ = await workflow._write_chunked_parallel(
+                ["A", "B", "C"], "outline", "guide", "developers", "", ModelTier.CAPABLE
+            )
+
+        draft = Path(result["draft_path"]).read_text()
+        assert [ln for ln in draft.splitlines() if ln.startswith("## ")] == ["## A", "## B", "## C"]
+
+    @pytest.mark.asyncio
+    async def test_cost_limit_stops_new_chunks(self):
+        """Test no new chunks start once the cost limit is reached."""
+        workflow = DocumentGenerationWorkflow(
+            sections_per_chunk=1, max_concurrent_chunks=1, max_cost=0.001
+        )
+        call, state = self._fake_llm()
+
+        with patch.object(workflow, "_call_llm", side_effect=call):
+            result, _, _ = await workflow._write_chunked_parallel(
+                ["A", "B", "C"], "outline", "guide", "developers", "", ModelTier.CAPABLE
+            )
+
+        assert len(state["prompts"]) == 1
+        assert result["stopped_early"] is True
+        assert "warning" in result
+
+    @pytest.mark.asyncio
+    async def test_write_uses_parallel_mode(self):
+        """Test _write dispatches to parallel mode with the outline's shared context."""
+        workflow = DocumentGenerationWorkflow(sections_per_chunk=2, parallel_chunks=True)
+        outline = "\n".join([f"{i}. Section {i}" for i in range(1, 8)])
+
+        with patch.object(
+            workflow, "_write_chunked_parallel", new_callable=AsyncMock
+        ) as mock_parallel:
+            mock_parallel.return_value = ({"draft_document": "...", "parallel": True}, 500, 300)
+
+            await workflow._write(
+                {"outline": outline, "doc_type": "guide", "shared_context": "CONTRACT"},
+                ModelTier.CAPABLE,
+            )
+
+            assert mock_parallel.call_args.kwargs["shared_context"] == "CONTRACT"
+
+
 class TestDocumentGenerationPolish:
     """Tests for polish stage."""
 
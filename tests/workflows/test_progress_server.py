@@ -0,0 +1,197 @@
+"""Tests for coalescing, delta-encoded progress broadcasting.
+
+Copyright 2025-2026 Smart-AI-Memory
+Licensed under the Apache License, Version 2.0
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from attune.workflows.progress import ProgressTracker
+from attune.workflows.progress_server import (
+    ProgressBroadcaster,
+    apply_delta,
+    diff_state,
+)
+
+
+class SimulatedClient:
+    """WebSocket stand-in that rebuilds workflow state from frames."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.closed = False
+        self.messages: list[str] = []
+
+    async def send(self, message: str) -> None:
+        if self.closed:
+            raise ConnectionError("closed")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.messages.append(message)
+
+    @property
+    def frames(self) -> list[dict]:
+        return [json.loads(message) for message in self.messages]
+
+    @property
+    def states(self) -> dict[str, dict]:
+        states: dict[str, dict] = {}
+        for frame in self.frames:
+            if frame["type"] == "snapshot":
+                states = frame["workflows"]
+                continue
+            for entry in frame["updates"]:
+                workflow_id = entry["workflow_id"]
+                states[workflow_id] = apply_delta(states.get(workflow_id), entry)
+        return states
+
+
+def _tracker(broadcaster: ProgressBroadcaster, workflow_id: str, stages: int = 4):
+    tracker = ProgressTracker("load", workflow_id, [f"stage{i}" for i in range(stages)])
+    tracker.add_callback(broadcaster.publish)
+    return tracker
+
+
+async def _drain(broadcaster: ProgressBroadcaster, timeout: float = 5.0) -> None:
+    """Wait until every channel has flushed its queue."""
+    deadline = time.monotonic() + timeout
+    while not all(channel.flushed for channel in broadcaster.channels):
+        assert time.monotonic() < deadline, "channels did not drain"
+        await asyncio.sleep(0.01)
+
+
+class TestDeltaEncoding:
+    """Tests for diff_state and apply_delta."""
+
+    def test_round_trip_sends_only_changes(self):
+        """Test a delta carries changed fields and rebuilds the new state."""
+        tracker = ProgressTracker("wf", "wf-1", ["a", "b"])
+        states = []
+        tracker.add_callback(lambda u: states.append(u.to_dict()))
+        tracker.start_stage("a")
+        tracker.complete_stage("a", cost=0.5)
+
+        entry = diff_state(states[0], states[1])
+
+        assert "workflow" not in entry["changes"]
+        assert set(entry["stages"]) == {"0"}
+        assert entry["changes"]["cost_so_far"] == 0.5
+        assert apply_delta(states[0], entry) == states[1]
+
+    def test_unknown_base_sends_full_state(self):
+        """Test the first entry for a workflow carries the full state."""
+        tracker = ProgressTracker("wf", "wf-1", ["a"])
+        states = []
+        tracker.add_callback(lambda u: states.append(u.to_dict()))
+        tracker.start_workflow()
+
+        entry = diff_state(None, states[0])
+        assert entry["full"] == states[0]
+        with pytest.raises(ValueError):
+            apply_delta(None, {"workflow_id": "wf-1", "changes": {}})
+
+
+class TestClientChannel:
+    """Tests for per-client queues."""
+
+    async def test_same_stage_updates_are_merged(self):
+        """Test queued updates for one workflow/stage collapse to the latest."""
+        broadcaster = ProgressBroadcaster(frame_rate=1)
+        client = SimulatedClient()
+        channel = broadcaster.add_client(client)
+        await _drain(broadcaster)
+
+        tracker = _tracker(broadcaster, "wf-1")
+        tracker.start_stage("stage0")
+        for attempt in range(1, 6):
+            tracker.retry_occurred("stage0", attempt, 5)
+
+        assert channel.pending_count == 1
+        assert channel.updates_merged == 5
+        await asyncio.sleep(1.1)
+        await _drain(broadcaster)
+
+        assert client.frames[0]["type"] == "snapshot"
+        assert len(client.frames) == 2
+        assert client.states["wf-1"]["message"].startswith("Retrying stage0")
+        await broadcaster.close()
+
+    async def test_overflow_falls_back_to_snapshot(self):
+        """Test a full queue of distinct workflows is replaced by a snapshot."""
+        broadcaster = ProgressBroadcaster(frame_rate=1, max_pending=3)
+        client = SimulatedClient()
+        channel = broadcaster.add_client(client)
+        await _drain(broadcaster)
+
+        for i in range(5):
+            _tracker(broadcaster, f"wf-{i}").start_workflow()
+
+        assert channel.updates_dropped == 3
+        await asyncio.sleep(1.1)
+        await _drain(broadcaster)
+
+        assert channel.snapshots_sent == 2
+        assert client.frames[-1]["type"] == "snapshot"
+        assert client.states == broadcaster.snapshot()[1]
+        await broadcaster.close()
+
+    async def test_reconnect_receives_snapshot(self):
+        """Test a new connection starts from the current state."""
+        broadcaster = ProgressBroadcaster(frame_rate=0)
+        _tracker(broadcaster, "wf-1").start_workflow()
+
+        client = SimulatedClient()
+        broadcaster.add_client(client)
+        await _drain(broadcaster)
+
+        assert client.frames[0]["type"] == "snapshot"
+        assert set(client.states) == {"wf-1"}
+        await broadcaster.close()
+
+    async def test_closed_client_is_discarded(self):
+        """Test a send failure removes the client."""
+        broadcaster = ProgressBroadcaster(frame_rate=0)
+        client = SimulatedClient()
+        client.closed = True
+        broadcaster.add_client(client)
+        await asyncio.sleep(0.05)
+
+        assert broadcaster.channels == []
+
+
+class TestBroadcastLoad:
+    """Load test with hundreds of clients and thousands of updates per second."""
+
+    async def test_slow_clients_do_not_block_publishers(self):
+        """Test 300 clients (some slow) converge on the final state at the frame rate."""
+        frame_rate = 20
+        broadcaster = ProgressBroadcaster(frame_rate=frame_rate)
+        clients = [SimulatedClient(delay=0.2 if i % 10 == 0 else 0.0) for i in range(300)]
+        for client in clients:
+            broadcaster.add_client(client)
+
+        trackers = [_tracker(broadcaster, f"wf-{i}", stages=5) for i in range(20)]
+        published = 0
+        started = time.monotonic()
+        while published < 5000:
+            for tracker in trackers:
+                stage = f"stage{published % 5}"
+                tracker.start_stage(stage)
+                tracker.retry_occurred(stage, 1, 3)
+                tracker.complete_stage(stage, cost=0.001, tokens_in=10, tokens_out=5)
+                published += 3
+            await asyncio.sleep(0)
+        elapsed = time.monotonic() - started
+
+        assert published / elapsed > 1000
+        await _drain(broadcaster)
+
+        final = broadcaster.snapshot()[1]
+        for client in clients:
+            assert client.states == final
+            assert len(client.messages) <= elapsed * frame_rate + 3
+        await broadcaster.close()